@@ -0,0 +1,191 @@
+"""
+Endpoint Load Benchmark - 주요 API 응답 시간 / 요청당 쿼리 수 측정
+ASGI 앱을 in-process (httpx ASGITransport) 로 호출하므로 네트워크 비용 없이 앱 비용만 측정
+결과는 JSON 파일로 저장되어 릴리스 간 diff 가능
+
+Usage:
+    python seed_synthetic.py --scale medium --db-url sqlite:///bench.db
+    python benchmarks/bench_endpoints.py --db-url sqlite:///bench.db --iterations 50 --output bench_results.json
+    python benchmarks/bench_endpoints.py --only bidding_list,bidding_stats
+
+Note:
+    요청당 쿼리 수는 sql_metrics 미들웨어의 Server-Timing 헤더에서 읽음
+"""
+
+import sys
+import os
+import re
+import json
+import math
+import time
+import asyncio
+import argparse
+import platform
+from datetime import datetime
+
+QUOTE_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, QUOTE_BACKEND_DIR)
+
+_QUERY_COUNT_RE = re.compile(r'desc="(\d+) queries"')
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile (sorted_values는 오름차순 정렬 상태)"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct * len(sorted_values) / 100.0))  # 곱셈 먼저 (0.07 * 100 = 7.000000000000001)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies_ms, query_counts, statuses):
+    latencies = sorted(latencies_ms)
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "max_ms": round(latencies[-1], 3),
+        "queries_per_request": round(sum(query_counts) / len(query_counts), 2) if query_counts else None,
+        "max_queries": max(query_counts) if query_counts else None,
+        "non_2xx": sum(1 for s in statuses if s >= 300),
+    }
+
+
+def load_samples(limit=20):
+    """벤치마크 파라미터로 사용할 실제 ID / 구간을 DB에서 결정적으로 추출"""
+    from sqlalchemy import func
+    from database import SessionLocal
+    from models import Customer, Forwarder, QuoteRequest, Bid
+
+    db = SessionLocal()
+    try:
+        # 활동량이 많은 화주 / 포워더 / 구간 우선 (부하가 큰 케이스)
+        customers = [r[0] for r in db.query(QuoteRequest.customer_id).group_by(
+            QuoteRequest.customer_id
+        ).order_by(func.count(QuoteRequest.id).desc(), QuoteRequest.customer_id).limit(limit).all()]
+        forwarders = [r[0] for r in db.query(Bid.forwarder_id).group_by(
+            Bid.forwarder_id
+        ).order_by(func.count(Bid.id).desc(), Bid.forwarder_id).limit(limit).all()]
+        routes = [(r[0], r[1]) for r in db.query(QuoteRequest.pol, QuoteRequest.pod).group_by(
+            QuoteRequest.pol, QuoteRequest.pod
+        ).order_by(func.count(QuoteRequest.id).desc(), QuoteRequest.pol, QuoteRequest.pod).limit(limit).all()]
+        return {
+            "customers": customers or [db.query(Customer.id).order_by(Customer.id).limit(1).scalar() or 1],
+            "forwarders": forwarders or [db.query(Forwarder.id).order_by(Forwarder.id).limit(1).scalar() or 1],
+            "routes": routes or [("KRPUS", "USLAX")],
+        }
+    finally:
+        db.close()
+
+
+def build_scenarios(samples):
+    """시나리오 이름 → (i번째 반복의 URL 생성 함수)"""
+    customers, forwarders, routes = samples["customers"], samples["forwarders"], samples["routes"]
+
+    def pick(pool, i):
+        return pool[i % len(pool)]
+
+    return {
+        "bidding_list": lambda i: f"/api/bidding/list?page={1 + i % 5}&limit=20&forwarder_id={pick(forwarders, i)}",
+        "bidding_list_open": lambda i: f"/api/bidding/list?status=open&limit=20&forwarder_id={pick(forwarders, i)}",
+        "bidding_stats": lambda i: "/api/bidding/stats",
+        "shipper_bidding_stats": lambda i: f"/api/shipper/biddings/stats?customer_id={pick(customers, i)}",
+        "shipper_analytics_summary": lambda i: f"/api/analytics/shipper/summary?customer_id={pick(customers, i)}",
+        "shipper_monthly_trend": lambda i: f"/api/analytics/shipper/monthly-trend?customer_id={pick(customers, i)}",
+        "forwarder_analytics_summary": lambda i: f"/api/analytics/forwarder/summary?forwarder_id={pick(forwarders, i)}",
+        "price_guide": lambda i: "/api/price-guide/{}/{}".format(*pick(routes, i)),
+        "recommend_forwarders": lambda i: "/api/recommend/forwarders?customer_id={}&pol={}&pod={}".format(
+            pick(customers, i), *pick(routes, i)
+        ),
+        "recommend_biddings": lambda i: f"/api/recommend/biddings?forwarder_id={pick(forwarders, i)}",
+        "freight_estimate": lambda i: "/api/freight/estimate?pol={}&pod={}&container_type=20DC".format(*pick(routes, i)),
+    }
+
+
+async def run_scenario(client, url_for, iterations, warmup, concurrency):
+    latencies, query_counts, statuses = [], [], []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i, record):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(url_for(i))
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        if not record:
+            return
+        latencies.append(elapsed_ms)
+        statuses.append(response.status_code)
+        match = _QUERY_COUNT_RE.search(response.headers.get("server-timing", ""))
+        if match:
+            query_counts.append(int(match.group(1)))
+
+    for i in range(warmup):
+        await one(i, record=False)
+    await asyncio.gather(*(one(i, record=True) for i in range(iterations)))
+    return summarize(latencies, query_counts, statuses)
+
+
+async def run_benchmark(scenarios, iterations, warmup, concurrency):
+    from httpx import AsyncClient, ASGITransport
+    from main import app
+
+    results = {}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, url_for in scenarios.items():
+            results[name] = {"example_url": url_for(0)}
+            results[name].update(await run_scenario(client, url_for, iterations, warmup, concurrency))
+            r = results[name]
+            print(f"  {name:<30} p50={r['p50_ms']:>8.2f}ms  p95={r['p95_ms']:>8.2f}ms  "
+                  f"p99={r['p99_ms']:>8.2f}ms  queries={r['queries_per_request']}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hot quote_backend endpoints in-process")
+    parser.add_argument("--db-url", help="대상 DB (기본값: DATABASE_URL / quote.db)")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--only", help="쉼표로 구분된 시나리오 이름")
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    if args.db_url:
+        os.environ["DATABASE_URL"] = args.db_url
+    # 쿼리 수 집계에는 basic 모드면 충분 (dev 모드의 SQL 정규화 비용 제외)
+    os.environ.setdefault("SQL_METRICS_MODE", "basic")
+
+    samples = load_samples()
+    scenarios = build_scenarios(samples)
+    if args.only:
+        wanted = [name.strip() for name in args.only.split(",")]
+        unknown = [name for name in wanted if name not in scenarios]
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(unknown)}")
+        scenarios = {name: scenarios[name] for name in wanted}
+
+    print(f"[*] Benchmarking {len(scenarios)} endpoints x {args.iterations} requests "
+          f"(concurrency={args.concurrency})")
+    results = asyncio.run(run_benchmark(scenarios, args.iterations, args.warmup, args.concurrency))
+
+    from database import DATABASE_URL
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "database_url": DATABASE_URL,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+        },
+        "endpoints": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Matching Benchmark - 상품 10만 건 기준 RFQ 공급사 매칭 시간 측정
+in-memory SQLite 에 합성 카탈로그를 넣고 색인 로드 / 매칭 / 증분 갱신 비용 비교
+
+- reload: products 테이블 전체 로드 (프로세스당 최초 1회)
+- match: RFQ 1건 매칭 (publish_rfq 경로, 색인 로드 이후)
+- upsert: 상품 1건 등록 / 수정 반영
+
+Usage:
+    python benchmarks/bench_matching.py --products 100000 --repeat 20 --output bench_matching.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import platform
+from datetime import datetime
+from types import SimpleNamespace
+
+QUOTE_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, QUOTE_BACKEND_DIR)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from commerce_models import Company, Category, Product
+from category_tree import category_tree_cache
+from commerce_matching import MatchingIndex
+
+COUNTRIES = ["KR", "CN", "VN", "US", "DE", "JP", "IN", "TH"]
+CERTS = ["ISO9001", "CE", "KC", "FDA", "HALAL", "RoHS"]
+PRICE_TYPES = ["public", "range", "private"]
+
+
+def build_catalog(engine, products, companies, rng):
+    """카테고리 3단계 (10 × 10 × 5) + 합성 상품"""
+    categories, leaves = [], []
+    for a in range(10):
+        categories.append({"id": f"c{a}", "code": f"C{a}", "name_ko": f"대분류{a}", "parent_id": None, "level": 1})
+        for b in range(10):
+            categories.append({"id": f"c{a}-{b}", "code": f"C{a}{b}", "name_ko": f"중분류{a}{b}",
+                               "parent_id": f"c{a}", "level": 2})
+            for c in range(5):
+                leaf = f"c{a}-{b}-{c}"
+                categories.append({"id": leaf, "code": f"C{a}{b}{c}", "name_ko": f"소분류{a}{b}{c}",
+                                   "parent_id": f"c{a}-{b}", "level": 3})
+                leaves.append(leaf)
+
+    with engine.begin() as conn:
+        conn.execute(Company.__table__.insert(), [
+            {"id": f"s{i}", "company_name": f"셀러 {i}", "company_type": "seller", "country_code": "KR"}
+            for i in range(companies)
+        ])
+        conn.execute(Category.__table__.insert(), categories)
+        conn.execute(Product.__table__.insert(), [
+            {
+                "id": f"p{i}", "company_id": f"s{rng.randrange(companies)}", "category_id": rng.choice(leaves),
+                "name_ko": f"상품 {i}", "origin_country": rng.choice(COUNTRIES),
+                "certifications": rng.sample(CERTS, rng.randint(0, 3)), "price_type": rng.choice(PRICE_TYPES),
+                "is_active": True,
+            }
+            for i in range(products)
+        ])
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark RFQ supplier matching")
+    parser.add_argument("--products", type=int, default=100000)
+    parser.add_argument("--companies", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_matching.json")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    print(f"[*] Building catalog: {args.products:,} products / {args.companies:,} companies")
+    build_catalog(engine, args.products, args.companies, rng)
+    db = sessionmaker(bind=engine)()
+
+    index = MatchingIndex()
+    category_tree_cache.get(db)
+    reload_ms = best_of(lambda: index.reload(db), 3)
+
+    rfqs = {
+        # 소분류 (상품 약 200건) / 중분류 (약 1,000건) / 대분류 (약 10,000건)
+        "leaf": SimpleNamespace(id="r1", company_id="buyer", category_id="c1-2-3", items=[],
+                                target_countries=["KR", "VN"], required_certs=["ISO9001", "CE"]),
+        "mid": SimpleNamespace(id="r2", company_id="buyer", category_id="c1-2", items=[],
+                               target_countries=["KR"], required_certs=["CE"]),
+        "top": SimpleNamespace(id="r3", company_id="buyer", category_id="c1", items=[],
+                               target_countries=None, required_certs=None),
+    }
+    match_ms = {}
+    for name, rfq in rfqs.items():
+        matches = index.match(db, rfq)
+        match_ms[name] = round(best_of(lambda: index.match(db, rfq), args.repeat), 3)
+        print(f"  match[{name:<4}] {match_ms[name]:>8.3f}ms  ({len(matches)} suppliers)")
+
+    product = SimpleNamespace(id="p1", company_id="s1", category_id="c2-2-2", origin_country="KR",
+                              certifications=["CE"], price_type="public", is_active=True)
+    upsert_ms = round(best_of(lambda: index.upsert(product), args.repeat), 4)
+    print(f"  reload      {reload_ms:>8.1f}ms")
+    print(f"  upsert      {upsert_ms:>8.4f}ms")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "products": args.products,
+            "companies": args.companies,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+        },
+        "reload_ms": round(reload_ms, 1),
+        "match_ms": match_ms,
+        "upsert_ms": upsert_ms,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Serialization Benchmark - 핫 스키마 1,000 항목당 직렬화 비용 측정
+DB 접근 없이 ORM row 와 같은 속성을 가진 객체로 직렬화 단계만 비교
+
+- pydantic: FastAPI 기본 경로 (response_model 검증 + Pydantic JSON 직렬화)
+- legacy_json: 검증 + jsonable_encoder + json.dumps
+- fast_json: 미리 만든 변환 함수 + orjson (FAST_JSON_RESPONSES=true 경로)
+
+Usage:
+    python benchmarks/bench_serialization.py --items 1000 --repeat 20 --output bench_serialization.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import platform
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+QUOTE_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, QUOTE_BACKEND_DIR)
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+import fast_json
+from schemas import PortResponse, BiddingListItem, MonthlyTrendItem
+from commerce_schemas import ProductListItem
+
+
+def make_ports(n, rng):
+    return [SimpleNamespace(
+        id=i, code=f"KR{i:03d}", name=f"Port {i}", name_ko=f"항구 {i}",
+        country="South Korea", country_code="KR",
+        port_type=rng.choice(["ocean", "air", "both"]), is_active=True,
+    ) for i in range(n)]
+
+
+def make_biddings(n, rng):
+    anchor = datetime(2026, 1, 15, 9, 30)
+    return [SimpleNamespace(
+        id=i, bidding_no=f"EXSEA{i:08d}", customer_company=f"고객사 {i % 97}",
+        pol="KRPUS", pod="USLAX", pol_name="BUSAN, SOUTH KOREA", pod_name="LOS ANGELES, UNITED STATES",
+        shipping_type="ocean", load_type="FCL", cargo_summary="20'GP × 3",
+        etd=anchor + timedelta(days=i % 30), deadline=anchor + timedelta(hours=i % 72),
+        status="open", bid_count=rng.randint(0, 12),
+        avg_bid_price=round(rng.uniform(800, 4000), 2) if i % 3 else None, my_bid_status=None,
+    ) for i in range(n)]
+
+
+def make_trend(n, rng):
+    return [SimpleNamespace(
+        month=f"{2000 + i // 12:04d}-{i % 12 + 1:02d}", request_count=rng.randint(0, 50),
+        bid_count=rng.randint(0, 300), awarded_count=rng.randint(0, 40),
+        total_cost_krw=float(rng.randint(0, 10 ** 9)), avg_bid_price_krw=float(rng.randint(0, 10 ** 7)),
+    ) for i in range(n)]
+
+
+def make_products(n, rng):
+    return [SimpleNamespace(
+        id=f"prod-{i}", company_id=f"comp-{i % 50}", category_id=f"cat-{i % 20}", sku=f"SKU-{i}",
+        name_ko=f"상품 {i}", name_en=f"Product {i}", price_type="public",
+        price=Decimal(f"{rng.randint(1, 99999)}.{rng.randint(0, 99):02d}"), price_min=None, price_max=None,
+        price_currency="USD", moq=Decimal("100.00"), origin_country="KR",
+        images=[{"url": f"/img/{i}.jpg", "is_primary": True}], view_count=rng.randint(0, 500),
+        is_featured=bool(i % 7 == 0),
+    ) for i in range(n)]
+
+
+HOT_SCHEMAS = {
+    "ports": (PortResponse, make_ports),
+    "bidding_list": (BiddingListItem, make_biddings),
+    "monthly_trend": (MonthlyTrendItem, make_trend),
+    "product_list": (ProductListItem, make_products),
+}
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def bench_schema(model, rows, repeat):
+    adapter = TypeAdapter(List[model])
+    serialize = fast_json.serializer_for(List[model])
+
+    def pydantic_path():
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    def legacy_json_path():
+        return json.dumps(
+            jsonable_encoder(adapter.validate_python(rows, from_attributes=True)),
+            ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+        ).encode("utf-8")
+
+    def fast_json_path():
+        return fast_json.dumps(serialize(rows))
+
+    # 세 경로의 결과가 같은지 먼저 확인
+    expected = json.loads(pydantic_path())
+    assert json.loads(fast_json_path()) == expected, f"{model.__name__}: fast_json output differs"
+
+    per_1000 = 1000.0 / len(rows)
+    result = {
+        "pydantic_ms": round(best_of(pydantic_path, repeat) * per_1000, 3),
+        "legacy_json_ms": round(best_of(legacy_json_path, repeat) * per_1000, 3),
+        "fast_json_ms": round(best_of(fast_json_path, repeat) * per_1000, 3),
+    }
+    result["speedup_vs_pydantic"] = round(result["pydantic_ms"] / result["fast_json_ms"], 2)
+    result["speedup_vs_legacy_json"] = round(result["legacy_json_ms"] / result["fast_json_ms"], 2)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark response serialization for hot schemas")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_serialization.json")
+    args = parser.parse_args(argv)
+
+    print(f"[*] Serialization cost per 1,000 items (best of {args.repeat}, "
+          f"orjson={'yes' if fast_json.orjson else 'no'})")
+    results = {}
+    for name, (model, factory) in HOT_SCHEMAS.items():
+        rows = factory(args.items, random.Random(args.seed))
+        results[name] = bench_schema(model, rows, args.repeat)
+        r = results[name]
+        print(f"  {name:<16} pydantic={r['pydantic_ms']:>8.3f}ms  legacy_json={r['legacy_json_ms']:>8.3f}ms  "
+              f"fast_json={r['fast_json_ms']:>8.3f}ms  (x{r['speedup_vs_legacy_json']} vs legacy)")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "items": args.items,
+            "repeat": args.repeat,
+            "orjson": getattr(fast_json.orjson, "__version__", None),
+            "python": platform.python_version(),
+        },
+        "schemas": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
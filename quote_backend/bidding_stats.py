@@ -0,0 +1,183 @@
+"""
+Bidding Stats - 비딩 현황 카운트 (대시보드 폴링용)
+/api/bidding/stats, /api/shipper/biddings/stats 가 상태별 COUNT 쿼리를 5~6번 실행하던 것을
+SUM(CASE ...) 조건부 집계 쿼리 1회로 계산하고, 짧은 마이크로 캐시로 폴링 부하를 흡수
+
+- 시간 조건 (마감 24시간 이내, 마감일 경과) 은 계산 시점의 now 를 바인딩 → 같은 now 면 기존 결과와 동일
+- 결과는 STATS_TTL 초 (1~5초) 동안 캐시, 만료 직후 동시에 들어온 요청은 계산 1회를 공유
+  (먼저 온 요청이 계산하고 나머지는 그 결과를 기다림, 계산 실패는 캐시하지 않고 대기자에게 전달)
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Hashable, Optional
+
+from sqlalchemy import and_, case, func, or_, select
+
+from models import Bidding, QuoteRequest
+
+STATS_TTL = min(5.0, max(1.0, float(os.getenv("BIDDING_STATS_TTL", "2"))))
+MAX_ENTRIES = 1024
+
+FAILED_STATUSES = ("closed", "cancelled", "expired")
+
+
+def current_time() -> datetime:
+    """통계 기준 시각 (테스트에서 고정)"""
+    return datetime.now()
+
+
+class _Flight:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class MicroCache:
+    """
+    짧은 TTL 캐시 + 요청 병합 (키별 계산은 동시에 1번만)
+
+    Usage:
+        cache = MicroCache(ttl=2)
+        value = cache.get_or_compute(("all",), lambda: compute(db))
+    """
+
+    def __init__(self, ttl: float = STATS_TTL, max_entries: int = MAX_ENTRIES, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.clock() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            with self._lock:
+                self._entries[key] = (self.clock(), flight.value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+        return flight.value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+
+stats_cache = MicroCache()
+
+
+def _total(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _counts(db, query) -> dict:
+    row = db.execute(query).mappings().one()
+    return {name: int(value) for name, value in row.items()}
+
+
+# ==========================================
+# QUERIES
+# ==========================================
+
+def compute_bidding_stats(db, now: datetime) -> dict:
+    """
+    전체 비딩 현황 (/api/bidding/stats)
+
+    - open: 마감일이 없거나 아직 지나지 않은 open
+    - failed: closed / cancelled / expired + 마감일이 지난 open
+    """
+    tomorrow = now + timedelta(hours=24)
+    is_open = Bidding.status == "open"
+    past_deadline = and_(is_open, Bidding.deadline != None, Bidding.deadline <= now)
+    query = select(
+        func.count(Bidding.id).label("total_count"),
+        _total(and_(is_open, or_(Bidding.deadline == None, Bidding.deadline > now))).label("open_count"),
+        _total(and_(is_open, Bidding.deadline <= tomorrow, Bidding.deadline > now)).label("closing_soon_count"),
+        _total(Bidding.status == "awarded").label("awarded_count"),
+        _total(or_(Bidding.status.in_(FAILED_STATUSES), past_deadline)).label("failed_count"),
+    )
+    return _counts(db, query)
+
+
+def compute_shipper_stats(db, customer_id: int, now: datetime) -> dict:
+    """
+    화주 비딩 현황 (/api/shipper/biddings/stats)
+
+    - open: status 가 open 인 전체 (마감일 무관)
+    - failed: closed / cancelled / expired
+    """
+    tomorrow = now + timedelta(hours=24)
+    is_open = Bidding.status == "open"
+    query = select(
+        func.count(Bidding.id).label("total_count"),
+        _total(is_open).label("open_count"),
+        _total(and_(is_open, Bidding.deadline != None, Bidding.deadline <= tomorrow,
+                    Bidding.deadline > now)).label("closing_soon_count"),
+        _total(Bidding.status == "awarded").label("awarded_count"),
+        _total(Bidding.status.in_(FAILED_STATUSES)).label("failed_count"),
+    ).join(
+        QuoteRequest, Bidding.quote_request_id == QuoteRequest.id
+    ).where(QuoteRequest.customer_id == customer_id)
+    return _counts(db, query)
+
+
+# ==========================================
+# CACHED ACCESS
+# ==========================================
+
+def bidding_stats(db) -> dict:
+    return stats_cache.get_or_compute(("all",), lambda: compute_bidding_stats(db, current_time()))
+
+
+def shipper_stats(db, customer_id: int) -> dict:
+    return stats_cache.get_or_compute(
+        ("customer", customer_id), lambda: compute_shipper_stats(db, customer_id, current_time())
+    )
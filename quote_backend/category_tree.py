@@ -0,0 +1,101 @@
+"""
+Category Tree - 버전 기반 메모리 카테고리 트리
+/categories/tree 요청마다 전체 카테고리를 읽어 트리를 다시 만들지 않도록
+data_versions 의 categories 버전이 바뀔 때만 재구성
+
+- 카테고리 생성 / 수정 시 bump_data_version(db, CATEGORIES) 로 무효화
+  (다른 프로세스의 변경은 response_cache.VERSION_TTL 이내 반영)
+- 카테고리별 하위 카테고리 ID 집합 (자기 자신 포함) 을 미리 계산
+  → 상위 카테고리 필터를 재귀 쿼리 없이 category_id IN (...) 으로 처리
+"""
+
+import threading
+from typing import Dict, FrozenSet, List, Optional
+
+from response_cache import reference_cache, CATEGORIES
+
+
+class CategoryTree:
+    """활성 카테고리 스냅샷 (생성 후 변경하지 않음)"""
+
+    def __init__(self, version: int, categories):
+        self.version = version
+        # level, sort_order 순으로 정렬된 상태로 받음
+        self.nodes: Dict[str, dict] = {
+            c.id: {
+                "id": c.id,
+                "code": c.code,
+                "name_ko": c.name_ko,
+                "name_en": c.name_en,
+                "level": c.level,
+                "children": [],
+            }
+            for c in categories
+        }
+        self.parents: Dict[str, Optional[str]] = {c.id: c.parent_id for c in categories}
+
+        self.roots: List[dict] = []
+        for c in categories:
+            if c.parent_id and c.parent_id in self.nodes:
+                self.nodes[c.parent_id]["children"].append(self.nodes[c.id])
+            elif not c.parent_id:
+                self.roots.append(self.nodes[c.id])
+
+        self.descendants: Dict[str, FrozenSet[str]] = {}
+        for root in self.roots:
+            self._collect(root)
+        # 부모가 비활성이라 트리에 붙지 못한 카테고리도 자기 자신은 포함
+        for category_id in self.nodes:
+            self.descendants.setdefault(category_id, frozenset((category_id,)))
+
+    def _collect(self, node) -> FrozenSet[str]:
+        ids = {node["id"]}
+        for child in node["children"]:
+            ids |= self._collect(child)
+        self.descendants[node["id"]] = frozenset(ids)
+        return self.descendants[node["id"]]
+
+    def as_tree(self) -> List[dict]:
+        return self.roots
+
+    def descendant_ids(self, category_id: str) -> FrozenSet[str]:
+        """category_id 와 모든 하위 카테고리 ID (알 수 없는 ID 는 자기 자신만)"""
+        return self.descendants.get(category_id, frozenset((category_id,)))
+
+    def name(self, category_id: Optional[str]) -> Optional[str]:
+        node = self.nodes.get(category_id) if category_id else None
+        return node["name_ko"] if node else None
+
+
+class CategoryTreeCache:
+    """categories 데이터 버전 단위 CategoryTree 캐시"""
+
+    def __init__(self):
+        self._tree: Optional[CategoryTree] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self, db) -> CategoryTree:
+        from commerce_models import Category
+
+        (version,) = reference_cache.current_versions((CATEGORIES,))
+        tree = self._tree
+        if tree is not None and tree.version == version:
+            return tree
+
+        with self._lock:
+            tree = self._tree
+            if tree is None or tree.version != version:
+                categories = db.query(Category).filter(
+                    Category.is_active == True
+                ).order_by(Category.level, Category.sort_order).all()
+                tree = CategoryTree(version, categories)
+                self._tree = tree
+                self.builds += 1
+        return tree
+
+    def invalidate(self):
+        self._tree = None
+
+
+category_tree_cache = CategoryTreeCache()
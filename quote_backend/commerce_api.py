@@ -5,14 +5,25 @@ FastAPI 라우터 모듈
 Company, Product, RFQ, Quotation, Transaction API 제공
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, File
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func, or_, and_, desc
 from typing import List, Optional
 from datetime import datetime, timedelta
+from decimal import Decimal
 import uuid
 
 from database import get_db
+import fast_json
+import commerce_search
+import commerce_facets
+from commerce_matching import matching_index, invite_matched_suppliers
+from commerce_comparison import comparison_cache
+import commerce_comparison
+import commerce_counters
+from commerce_counters import CounterDelta, rfq_counts, quotation_counts, transaction_counts
+from category_tree import category_tree_cache
+from response_cache import bump_data_version, CATEGORIES, PRODUCTS
 from commerce_models import (
     Company, CompanyCertification, CommerceUser, Category, Product,
     ProductRFQ, ProductRFQItem, ProductRFQInvitation,
@@ -27,17 +38,18 @@ from commerce_schemas import (
     # User
     CommerceUserCreate, CommerceUserUpdate, CommerceUserResponse,
     # Category
-    CategoryCreate, CategoryResponse, CategoryTreeItem,
+    CategoryCreate, CategoryUpdate, CategoryResponse, CategoryTreeItem,
     # Product
     ProductCreate, ProductUpdate, ProductResponse, ProductListItem, ProductListResponse,
+    ProductFacetResponse,
     # RFQ
     ProductRFQCreate, ProductRFQUpdate, ProductRFQResponse, ProductRFQListItem, ProductRFQListResponse,
-    RFQItemCreate, RFQItemResponse,
+    RFQItemCreate, RFQItemResponse, SupplierMatchItem, RFQMatchResponse,
     # Quotation
     ProductQuotationCreate, ProductQuotationUpdate, ProductQuotationResponse,
     ProductQuotationListItem, ProductQuotationListResponse,
     QuotationItemCreate, QuotationItemResponse,
-    QuotationComparisonItem, QuotationComparisonResponse,
+    QuotationComparisonItem, QuotationComparisonResponse, QuotationComparisonMatrixResponse,
     # Transaction
     ProductTransactionCreate, ProductTransactionResponse,
     ProductTransactionListItem, ProductTransactionListResponse,
@@ -103,6 +115,18 @@ def verify_password(password: str, hashed: str) -> bool:
         return False
 
 
+def invalidate_category_tree(db: Session):
+    """카테고리 생성 / 수정 후 메모리 트리 무효화 (다른 프로세스는 데이터 버전으로 반영)"""
+    bump_data_version(db, CATEGORIES)
+    category_tree_cache.invalidate()
+
+
+def category_filter_ids(db: Session, category_id: str, include_subcategories: bool):
+    if not include_subcategories:
+        return [category_id]
+    return list(category_tree_cache.get(db).descendant_ids(category_id))
+
+
 # ==========================================
 # COMPANY ENDPOINTS
 # ==========================================
@@ -262,6 +286,32 @@ def create_category(data: CategoryCreate, db: Session = Depends(get_db)):
     )
     db.add(category)
     db.commit()
+    invalidate_category_tree(db)
+    db.refresh(category)
+    return category
+
+
+@router.put("/categories/{category_id}", response_model=CategoryResponse)
+def update_category(category_id: str, data: CategoryUpdate, db: Session = Depends(get_db)):
+    """카테고리 수정"""
+    category = db.query(Category).filter(Category.id == category_id).first()
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    
+    update_data = data.model_dump(exclude_unset=True)
+    if "code" in update_data and update_data["code"] != category.code:
+        if db.query(Category).filter(Category.code == update_data["code"]).first():
+            raise HTTPException(status_code=400, detail="Category code already exists")
+    if update_data.get("parent_id"):
+        # 자기 자신 / 하위 카테고리를 부모로 지정하면 순환 발생
+        if update_data["parent_id"] in category_tree_cache.get(db).descendant_ids(category_id):
+            raise HTTPException(status_code=400, detail="Category cannot be moved under itself")
+    
+    for key, value in update_data.items():
+        setattr(category, key, value)
+    
+    db.commit()
+    invalidate_category_tree(db)
     db.refresh(category)
     return category
 
@@ -285,29 +335,8 @@ def list_categories(
 
 @router.get("/categories/tree", response_model=List[CategoryTreeItem])
 def get_category_tree(db: Session = Depends(get_db)):
-    """카테고리 트리 조회"""
-    categories = db.query(Category).filter(
-        Category.is_active == True
-    ).order_by(Category.level, Category.sort_order).all()
-    
-    # Build tree structure
-    category_map = {c.id: {
-        "id": c.id,
-        "code": c.code,
-        "name_ko": c.name_ko,
-        "name_en": c.name_en,
-        "level": c.level,
-        "children": []
-    } for c in categories}
-    
-    tree = []
-    for cat in categories:
-        if cat.parent_id and cat.parent_id in category_map:
-            category_map[cat.parent_id]["children"].append(category_map[cat.id])
-        elif not cat.parent_id:
-            tree.append(category_map[cat.id])
-    
-    return tree
+    """카테고리 트리 조회 (카테고리 버전이 바뀔 때만 재구성)"""
+    return category_tree_cache.get(db).as_tree()
 
 
 @router.get("/categories/{category_id}", response_model=CategoryResponse)
@@ -336,11 +365,37 @@ def create_product(data: ProductCreate, db: Session = Depends(get_db)):
         **data.model_dump()
     )
     db.add(product)
-    db.commit()
+    version = bump_data_version(db, PRODUCTS)[PRODUCTS]  # 상품과 같은 트랜잭션으로 커밋
+    commerce_facets.facet_cache.clear()
     db.refresh(product)
+    matching_index.upsert(product, version)
     return product
 
 
+@router.post("/products/import")
+def import_products(
+    company_id: str = Query(...),
+    file: UploadFile = File(...),
+    dry_run: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    상품 카탈로그 (CSV / XLSX) 일괄 등록
+    
+    - SKU 기준 신규 등록 / 기존 상품 갱신 (chunk 단위 커밋)
+    - 오류 행은 건너뛰고 행 번호별 오류 목록 반환
+    - dry_run: 검증만 수행
+    """
+    from commerce_product_import import import_products as run_import, ProductFileError
+    
+    try:
+        result = run_import(db, company_id, file.file.read(), file.filename, dry_run=dry_run)
+    except ProductFileError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {"success": True, "filename": file.filename, **result}
+
+
 @router.get("/products", response_model=ProductListResponse)
 def list_products(
     page: int = Query(1, ge=1),
@@ -349,10 +404,13 @@ def list_products(
     category_id: Optional[str] = None,
     price_type: Optional[str] = None,
     origin_country: Optional[str] = None,
+    stock_status: Optional[str] = None,
     search: Optional[str] = None,
+    include_subcategories: bool = False,
     is_featured: Optional[bool] = None,
-    sort: str = "created_at",
+    sort: Optional[str] = None,
     order: str = "desc",
+    include_facets: bool = False,
     db: Session = Depends(get_db)
 ):
     """상품 목록 조회"""
@@ -362,53 +420,100 @@ def list_products(
     if company_id:
         query = query.filter(Product.company_id == company_id)
     if category_id:
-        query = query.filter(Product.category_id == category_id)
+        query = query.filter(Product.category_id.in_(category_filter_ids(db, category_id, include_subcategories)))
     if price_type:
         query = query.filter(Product.price_type == price_type)
     if origin_country:
         query = query.filter(Product.origin_country == origin_country)
+    if stock_status:
+        query = query.filter(Product.stock_status == stock_status)
     if is_featured is not None:
         query = query.filter(Product.is_featured == is_featured)
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Product.name_ko.ilike(search_term),
-                Product.name_en.ilike(search_term),
-                Product.description.ilike(search_term),
-                Product.sku.ilike(search_term)
-            )
-        )
+    # Full-text search (FTS5 + BM25, 미지원 DB 는 ilike)
+    query, score = commerce_search.apply_search(query, commerce_search.PRODUCT_INDEX, search)
     
-    # Sorting
-    sort_column = getattr(Product, sort, Product.created_at)
-    if order == "desc":
-        query = query.order_by(desc(sort_column))
+    # Sorting (검색 시 기본 정렬은 관련도순)
+    if score is not None and sort in (None, "relevance"):
+        query = query.order_by(score, desc(Product.created_at))
     else:
-        query = query.order_by(sort_column)
+        sort_column = getattr(Product, sort or "created_at", Product.created_at)
+        if order == "desc":
+            query = query.order_by(desc(sort_column))
+        else:
+            query = query.order_by(sort_column)
     
     # Pagination
     total = query.count()
     total_pages = (total + page_size - 1) // page_size
-    products = query.offset((page - 1) * page_size).limit(page_size).all()
+    products = query.options(
+        selectinload(Product.company),
+        selectinload(Product.category)
+    ).offset((page - 1) * page_size).limit(page_size).all()
     
     # Add company and category names
+    # DB row 는 검증 없이 미리 만든 변환 함수로 dict 변환 (응답 검증은 response_model 이 담당)
+    to_item = fast_json.serializer_for(ProductListItem)
     result = []
     for p in products:
-        item = ProductListItem.model_validate(p)
+        item = to_item(p)
         if p.company:
-            item.company_name = p.company.company_name
+            item["company_name"] = p.company.company_name
         if p.category:
-            item.category_name = p.category.name_ko
+            item["category_name"] = p.category.name_ko
         result.append(item)
     
-    return ProductListResponse(
-        products=result,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    response = {
+        "products": result,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages
+    }
+    if include_facets:
+        _, response["facets"] = product_facets(
+            db, company_id, category_id, include_subcategories, price_type, origin_country,
+            stock_status, search, is_featured
+        )
+    return fast_json.fast_response(response, ProductListResponse)
+
+
+@router.get("/products/facets", response_model=ProductFacetResponse)
+def get_product_facets(
+    company_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    price_type: Optional[str] = None,
+    origin_country: Optional[str] = None,
+    stock_status: Optional[str] = None,
+    search: Optional[str] = None,
+    include_subcategories: bool = False,
+    is_featured: Optional[bool] = None,
+    db: Session = Depends(get_db)
+):
+    """상품 패싯 카운트 조회 (list_products 와 같은 필터)"""
+    total, facets = product_facets(
+        db, company_id, category_id, include_subcategories, price_type, origin_country,
+        stock_status, search, is_featured
     )
+    return {"total": total, "facets": facets}
+
+
+def product_facets(db: Session, company_id, category_id, include_subcategories, price_type,
+                   origin_country, stock_status, search, is_featured):
+    """(선택 조건을 만족하는 상품 수, ProductFacets dict) - 패싯 조합별 GROUP BY 1회 (캐시)"""
+    rows = commerce_facets.grouped_counts(db, company_id, is_featured, search)
+    tree = category_tree_cache.get(db)
+    total, counts = commerce_facets.count_facets(rows, {
+        "category": tree.descendant_ids(category_id) if category_id and include_subcategories
+        else ([category_id] if category_id else None),
+        "origin_country": [origin_country] if origin_country else None,
+        "price_type": [price_type] if price_type else None,
+        "stock_status": [stock_status] if stock_status else None,
+    })
+    category_labels = {value: tree.name(value) for value in counts["category"]}
+    return total, {
+        name: commerce_facets.facet_items(values, category_labels if name == "category" else None)
+        for name, values in counts.items()
+    }
 
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
@@ -440,8 +545,10 @@ def update_product(product_id: str, data: ProductUpdate, db: Session = Depends(g
     for key, value in update_data.items():
         setattr(product, key, value)
     
-    db.commit()
+    version = bump_data_version(db, PRODUCTS)[PRODUCTS]
+    commerce_facets.facet_cache.clear()
     db.refresh(product)
+    matching_index.upsert(product, version)
     return product
 
 
@@ -453,7 +560,9 @@ def delete_product(product_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Product not found")
     
     product.is_active = False
-    db.commit()
+    version = bump_data_version(db, PRODUCTS)[PRODUCTS]
+    commerce_facets.facet_cache.clear()
+    matching_index.remove(product_id, version)
     return {"message": "Product deactivated"}
 
 
@@ -501,6 +610,9 @@ def create_rfq(data: ProductRFQCreate, db: Session = Depends(get_db)):
             )
             db.add(invitation)
     
+    delta = CounterDelta()
+    delta.add(rfq_counts(rfq))
+    delta.apply(db)
     db.commit()
     db.refresh(rfq)
     return rfq
@@ -515,8 +627,9 @@ def list_rfqs(
     status: Optional[str] = None,
     visibility: Optional[str] = None,
     category_id: Optional[str] = None,
+    include_subcategories: bool = False,
     search: Optional[str] = None,
-    sort: str = "created_at",
+    sort: Optional[str] = None,
     order: str = "desc",
     db: Session = Depends(get_db)
 ):
@@ -533,28 +646,27 @@ def list_rfqs(
     if visibility:
         query = query.filter(ProductRFQ.visibility == visibility)
     if category_id:
-        query = query.filter(ProductRFQ.category_id == category_id)
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                ProductRFQ.title.ilike(search_term),
-                ProductRFQ.description.ilike(search_term),
-                ProductRFQ.rfq_number.ilike(search_term)
-            )
-        )
+        query = query.filter(ProductRFQ.category_id.in_(category_filter_ids(db, category_id, include_subcategories)))
+    # Full-text search (FTS5 + BM25, 미지원 DB 는 ilike)
+    query, score = commerce_search.apply_search(query, commerce_search.RFQ_INDEX, search)
     
-    # Sorting
-    sort_column = getattr(ProductRFQ, sort, ProductRFQ.created_at)
-    if order == "desc":
-        query = query.order_by(desc(sort_column))
+    # Sorting (검색 시 기본 정렬은 관련도순)
+    if score is not None and sort in (None, "relevance"):
+        query = query.order_by(score, desc(ProductRFQ.created_at))
     else:
-        query = query.order_by(sort_column)
+        sort_column = getattr(ProductRFQ, sort or "created_at", ProductRFQ.created_at)
+        if order == "desc":
+            query = query.order_by(desc(sort_column))
+        else:
+            query = query.order_by(sort_column)
     
     # Pagination
     total = query.count()
     total_pages = (total + page_size - 1) // page_size
-    rfqs = query.offset((page - 1) * page_size).limit(page_size).all()
+    rfqs = query.options(
+        selectinload(ProductRFQ.company),
+        selectinload(ProductRFQ.category)
+    ).offset((page - 1) * page_size).limit(page_size).all()
     
     # Build response
     result = []
@@ -626,8 +738,8 @@ def update_rfq(rfq_id: str, data: ProductRFQUpdate, db: Session = Depends(get_db
 
 
 @router.post("/rfqs/{rfq_id}/publish", response_model=ProductRFQResponse)
-def publish_rfq(rfq_id: str, db: Session = Depends(get_db)):
-    """RFQ 게시 (draft -> open)"""
+def publish_rfq(rfq_id: str, auto_invite: bool = True, db: Session = Depends(get_db)):
+    """RFQ 게시 (draft -> open) - 공개 RFQ 는 매칭된 공급사에 초대 생성"""
     rfq = db.query(ProductRFQ).filter(ProductRFQ.id == rfq_id).first()
     if not rfq:
         raise HTTPException(status_code=404, detail="RFQ not found")
@@ -639,13 +751,43 @@ def publish_rfq(rfq_id: str, db: Session = Depends(get_db)):
     if not rfq.items or len(rfq.items) == 0:
         raise HTTPException(status_code=400, detail="RFQ must have at least one item")
     
+    delta = CounterDelta()
+    delta.remove(rfq_counts(rfq))
     rfq.status = "open"
     rfq.published_at = datetime.utcnow()
+    delta.add(rfq_counts(rfq))
+    # private / invited RFQ 는 바이어가 지정한 회사에만 공개
+    if auto_invite and rfq.visibility == "public":
+        invite_matched_suppliers(db, rfq)
+    delta.apply(db)
     db.commit()
     db.refresh(rfq)
     return rfq
 
 
+@router.get("/rfqs/{rfq_id}/matches", response_model=RFQMatchResponse)
+def get_rfq_matches(rfq_id: str, limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
+    """RFQ 에 매칭되는 공급사 조회 (초대 생성 없음)"""
+    rfq = db.query(ProductRFQ).filter(ProductRFQ.id == rfq_id).first()
+    if not rfq:
+        raise HTTPException(status_code=404, detail="RFQ not found")
+    
+    matches = matching_index.match(db, rfq, limit=limit)
+    names = dict(db.query(Company.id, Company.company_name).filter(
+        Company.id.in_([m.company_id for m in matches])
+    ).all()) if matches else {}
+    
+    return RFQMatchResponse(
+        rfq_id=rfq.id,
+        matches=[
+            SupplierMatchItem(company_id=m.company_id, company_name=names.get(m.company_id),
+                              score=m.score, product_ids=m.product_ids)
+            for m in matches
+        ],
+        total=len(matches)
+    )
+
+
 @router.post("/rfqs/{rfq_id}/close", response_model=ProductRFQResponse)
 def close_rfq(rfq_id: str, db: Session = Depends(get_db)):
     """RFQ 마감 (open -> closed)"""
@@ -656,8 +798,12 @@ def close_rfq(rfq_id: str, db: Session = Depends(get_db)):
     if rfq.status != "open":
         raise HTTPException(status_code=400, detail="Can only close open RFQs")
     
+    delta = CounterDelta()
+    delta.remove(rfq_counts(rfq))
     rfq.status = "closed"
     rfq.closed_at = datetime.utcnow()
+    delta.add(rfq_counts(rfq))
+    delta.apply(db)
     db.commit()
     db.refresh(rfq)
     return rfq
@@ -673,8 +819,12 @@ def cancel_rfq(rfq_id: str, db: Session = Depends(get_db)):
     if rfq.status in ["completed", "cancelled"]:
         raise HTTPException(status_code=400, detail="Cannot cancel this RFQ")
     
+    delta = CounterDelta()
+    delta.remove(rfq_counts(rfq))
     rfq.status = "cancelled"
     rfq.closed_at = datetime.utcnow()
+    delta.add(rfq_counts(rfq))
+    delta.apply(db)
     db.commit()
     db.refresh(rfq)
     return rfq
@@ -735,6 +885,9 @@ def create_quotation(data: ProductQuotationCreate, db: Session = Depends(get_db)
     
     quotation.total_amount = total
     
+    delta = CounterDelta()
+    delta.add(quotation_counts(quotation, rfq.company_id))
+    delta.apply(db)
     db.commit()
     db.refresh(quotation)
     return quotation
@@ -772,7 +925,10 @@ def list_quotations(
     # Pagination
     total = query.count()
     total_pages = (total + page_size - 1) // page_size
-    quotations = query.offset((page - 1) * page_size).limit(page_size).all()
+    quotations = query.options(
+        selectinload(ProductQuotation.rfq),
+        selectinload(ProductQuotation.company)
+    ).offset((page - 1) * page_size).limit(page_size).all()
     
     # Build response
     result = []
@@ -852,15 +1008,22 @@ def submit_quotation(quotation_id: str, db: Session = Depends(get_db)):
     if not quotation.items or len(quotation.items) == 0:
         raise HTTPException(status_code=400, detail="Quotation must have at least one item")
     
+    rfq = db.query(ProductRFQ).filter(ProductRFQ.id == quotation.rfq_id).first()
+    rfq_company_id = rfq.company_id if rfq else None
+    delta = CounterDelta()
+    delta.remove(quotation_counts(quotation, rfq_company_id))
+    
     quotation.status = "submitted"
     quotation.submitted_at = datetime.utcnow()
+    delta.add(quotation_counts(quotation, rfq_company_id))
     
     # Update RFQ quotation count
-    rfq = db.query(ProductRFQ).filter(ProductRFQ.id == quotation.rfq_id).first()
     if rfq:
         rfq.quotation_count += 1
     
+    delta.apply(db)
     db.commit()
+    comparison_cache.invalidate(quotation.rfq_id)
     db.refresh(quotation)
     return quotation
 
@@ -929,9 +1092,14 @@ def accept_quotation(quotation_id: str, db: Session = Depends(get_db)):
         db.add(titem)
     
     # Update quotation status
+    delta = CounterDelta()
+    delta.add(transaction_counts(transaction))
+    delta.remove(quotation_counts(quotation, rfq.company_id))
     quotation.status = "accepted"
+    delta.add(quotation_counts(quotation, rfq.company_id))
     
     # Reject other quotations for this RFQ
+    # (submitted 이후 상태끼리의 변경이라 대시보드 카운터는 변하지 않음)
     other_quotations = db.query(ProductQuotation).filter(
         ProductQuotation.rfq_id == rfq.id,
         ProductQuotation.id != quotation.id,
@@ -941,8 +1109,10 @@ def accept_quotation(quotation_id: str, db: Session = Depends(get_db)):
         oq.status = "rejected"
     
     # Update RFQ status
+    delta.remove(rfq_counts(rfq))
     rfq.status = "completed"
     rfq.closed_at = datetime.utcnow()
+    delta.add(rfq_counts(rfq))
     
     # Add status log
     status_log = ProductTransactionStatusLog(
@@ -957,14 +1127,17 @@ def accept_quotation(quotation_id: str, db: Session = Depends(get_db)):
     # Update company stats
     buyer = db.query(Company).filter(Company.id == buyer_company_id).first()
     seller = db.query(Company).filter(Company.id == seller_company_id).first()
+    amount = Decimal(str(transaction.total_amount or 0))
     if buyer:
         buyer.total_transactions += 1
-        buyer.total_trade_volume += float(transaction.total_amount)
+        buyer.total_trade_volume = (buyer.total_trade_volume or 0) + amount
     if seller:
         seller.total_transactions += 1
-        seller.total_trade_volume += float(transaction.total_amount)
+        seller.total_trade_volume = (seller.total_trade_volume or 0) + amount
     
+    delta.apply(db)
     db.commit()
+    comparison_cache.invalidate(rfq.id)
     db.refresh(transaction)
     return transaction
 
@@ -981,6 +1154,7 @@ def reject_quotation(quotation_id: str, db: Session = Depends(get_db)):
     
     quotation.status = "rejected"
     db.commit()
+    comparison_cache.invalidate(quotation.rfq_id)
     return {"message": "Quotation rejected"}
 
 
@@ -992,11 +1166,10 @@ def get_quotation_comparison(rfq_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="RFQ not found")
     
     quotations = db.query(ProductQuotation).options(
-        joinedload(ProductQuotation.items),
-        joinedload(ProductQuotation.company)
+        selectinload(ProductQuotation.company)
     ).filter(
         ProductQuotation.rfq_id == rfq_id,
-        ProductQuotation.status.in_(["submitted", "viewed", "negotiating"])
+        ProductQuotation.status.in_(commerce_comparison.COMPARABLE_STATUSES)
     ).order_by(ProductQuotation.total_amount).all()
     
     if not quotations:
@@ -1015,6 +1188,7 @@ def get_quotation_comparison(rfq_id: str, db: Session = Depends(get_db)):
     lowest = min(prices) if prices else 0
     highest = max(prices) if prices else 0
     avg_price = sum(prices) / len(prices) if prices else 0
+    item_counts = commerce_comparison.item_counts(db, [q.id for q in quotations])
     
     comparison_items = []
     for i, q in enumerate(quotations, start=1):
@@ -1034,7 +1208,7 @@ def get_quotation_comparison(rfq_id: str, db: Session = Depends(get_db)):
             delivery_date=q.delivery_date,
             lead_time=q.lead_time,
             valid_until=q.valid_until,
-            item_count=len(q.items) if q.items else 0,
+            item_count=item_counts.get(q.id, 0),
             price_rank=i,
             price_diff_pct=round(price_diff, 2)
         )
@@ -1052,6 +1226,16 @@ def get_quotation_comparison(rfq_id: str, db: Session = Depends(get_db)):
     )
 
 
+@router.get("/rfqs/{rfq_id}/comparison/matrix", response_model=QuotationComparisonMatrixResponse)
+def get_quotation_comparison_matrix(rfq_id: str, db: Session = Depends(get_db)):
+    """RFQ 품목 × 공급사 단가 비교 매트릭스 (품목별 최저가 / 순위)"""
+    rfq = db.query(ProductRFQ).filter(ProductRFQ.id == rfq_id).first()
+    if not rfq:
+        raise HTTPException(status_code=404, detail="RFQ not found")
+    
+    return commerce_comparison.get_matrix(db, rfq)
+
+
 # ==========================================
 # TRANSACTION ENDPOINTS
 # ==========================================
@@ -1096,7 +1280,11 @@ def list_transactions(
     # Pagination
     total = query.count()
     total_pages = (total + page_size - 1) // page_size
-    transactions = query.offset((page - 1) * page_size).limit(page_size).all()
+    transactions = query.options(
+        selectinload(ProductTransaction.rfq),
+        selectinload(ProductTransaction.buyer_company),
+        selectinload(ProductTransaction.seller_company)
+    ).offset((page - 1) * page_size).limit(page_size).all()
     
     # Build response
     result = []
@@ -1167,13 +1355,17 @@ def update_transaction_status(
     db.add(status_log)
     
     # Update status
+    delta = CounterDelta()
+    delta.remove(transaction_counts(transaction))
     old_status = transaction.status
     transaction.status = data.status.value
+    delta.add(transaction_counts(transaction))
     
     # Handle completion
     if data.status.value == "completed":
         transaction.completed_at = datetime.utcnow()
     
+    delta.apply(db)
     db.commit()
     db.refresh(transaction)
     return transaction
@@ -1190,54 +1382,11 @@ def get_dashboard_stats(company_id: str, db: Session = Depends(get_db)):
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    # RFQ stats
-    total_rfqs = db.query(ProductRFQ).filter(ProductRFQ.company_id == company_id).count()
-    open_rfqs = db.query(ProductRFQ).filter(
-        ProductRFQ.company_id == company_id,
-        ProductRFQ.status == "open"
-    ).count()
-    
-    # Quotation stats
-    total_quotations_sent = db.query(ProductQuotation).filter(
-        ProductQuotation.company_id == company_id
-    ).count()
-    
-    # Quotations received (for RFQs owned by this company)
-    rfq_ids = db.query(ProductRFQ.id).filter(ProductRFQ.company_id == company_id).subquery()
-    total_quotations_received = db.query(ProductQuotation).filter(
-        ProductQuotation.rfq_id.in_(rfq_ids)
-    ).count()
-    
-    pending_quotations = db.query(ProductQuotation).filter(
-        ProductQuotation.company_id == company_id,
-        ProductQuotation.status == "draft"
-    ).count()
-    
-    # Transaction stats
-    active_transactions = db.query(ProductTransaction).filter(
-        or_(
-            ProductTransaction.buyer_company_id == company_id,
-            ProductTransaction.seller_company_id == company_id
-        ),
-        ProductTransaction.status.in_(["confirmed", "contract_pending", "payment_pending", "paid", "shipping"])
-    ).count()
-    
-    completed_transactions = db.query(ProductTransaction).filter(
-        or_(
-            ProductTransaction.buyer_company_id == company_id,
-            ProductTransaction.seller_company_id == company_id
-        ),
-        ProductTransaction.status == "completed"
-    ).count()
+    # 카운터 테이블 (없으면 조건부 집계 쿼리 1회)
+    counters = commerce_counters.get_counters(db, company_id)
     
     return CompanyDashboardStats(
-        total_rfqs=total_rfqs,
-        open_rfqs=open_rfqs,
-        total_quotations_sent=total_quotations_sent,
-        total_quotations_received=total_quotations_received,
-        pending_quotations=pending_quotations,
-        active_transactions=active_transactions,
-        completed_transactions=completed_transactions,
+        **counters,
         total_trade_volume=float(company.total_trade_volume),
         trust_score=float(company.trust_score),
         response_rate=float(company.response_rate)
@@ -1311,6 +1460,13 @@ def send_message(data: CommerceMessageCreate, sender_user_id: str = Query(...),
     return CommerceMessageResponse.model_validate(message)
 
 
+def message_response(message: CommerceMessage) -> CommerceMessageResponse:
+    response = CommerceMessageResponse.model_validate(message)
+    response.sender_company_name = message.sender_company.company_name if message.sender_company else None
+    response.sender_user_name = message.sender_user.name if message.sender_user else None
+    return response
+
+
 @router.get("/messages/thread", response_model=CommerceMessageThreadResponse)
 def get_message_thread(
     rfq_id: Optional[str] = None,
@@ -1339,17 +1495,22 @@ def get_message_thread(
         )
     )
     
-    messages = query.order_by(CommerceMessage.created_at).all()
+    messages = query.options(
+        selectinload(CommerceMessage.sender_company),
+        selectinload(CommerceMessage.sender_user)
+    ).order_by(CommerceMessage.created_at).all()
     
     # Mark received messages as read
     for msg in messages:
         if msg.recipient_company_id == company_id and not msg.is_read:
             msg.is_read = True
             msg.read_at = datetime.utcnow()
+    # 커밋 전에 응답 구성 (커밋 후에는 expire_on_commit 으로 메시지 / 발신자를 한 건씩 다시 조회)
+    responses = [message_response(m) for m in messages]
     db.commit()
     
     return CommerceMessageThreadResponse(
-        messages=[CommerceMessageResponse.model_validate(m) for m in messages],
+        messages=responses,
         total=len(messages)
     )
 
@@ -0,0 +1,272 @@
+"""
+Commerce Comparison - RFQ 견적 품목별 비교 매트릭스
+RFQ 품목 × 공급사 단가 / 리드타임 표를 견적마다 items 를 로드하지 않고
+견적 품목 조인 쿼리 1회로 읽어 메모리에서 피벗
+
+- 행 = RFQ 품목 (item_number 순), 열 = 비교 대상 견적 (총액 오름차순)
+- 견적 품목은 rfq_item_id 로 RFQ 품목에 매칭 (없으면 같은 item_number)
+- 행별 최저가 / 순위 / 최저가 대비 % 를 numpy 배열 연산으로 한 번에 계산
+  (같은 단가는 같은 순위, 견적이 없는 칸은 None)
+- 결과는 (rfq, 견적 스탬프) 단위로 캐시
+  스탬프 = 비교 대상 견적 수 / 최종 수정 시각 / 최신 리비전 → 견적 제출 / 거절 / 리비전 시 자동으로 새 키
+  (같은 프로세스의 견적 상태 변경은 invalidate() 로 즉시 비움)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+
+from commerce_models import (
+    Company, ProductRFQItem, ProductQuotation, ProductQuotationItem, ProductQuotationRevision
+)
+
+COMPARABLE_STATUSES = ("submitted", "viewed", "negotiating")
+MAX_ENTRIES = 256
+
+
+class ComparisonCache:
+    """(rfq_id, 스탬프) → 비교 매트릭스 (LRU)"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, tuple], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+
+    def get(self, rfq_id: str, stamp: tuple) -> Optional[dict]:
+        with self._lock:
+            matrix = self._entries.get((rfq_id, stamp))
+            if matrix is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((rfq_id, stamp))
+            self.hits += 1
+            return matrix
+
+    def put(self, rfq_id: str, stamp: tuple, matrix: dict):
+        with self._lock:
+            # 같은 RFQ 의 이전 스탬프는 다시 쓰이지 않음
+            for key in [key for key in self._entries if key[0] == rfq_id]:
+                del self._entries[key]
+            self._entries[(rfq_id, stamp)] = matrix
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, rfq_id: Optional[str] = None):
+        with self._lock:
+            if rfq_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == rfq_id]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "builds": self.builds}
+
+
+comparison_cache = ComparisonCache()
+
+
+def quotation_stamp(db, rfq) -> tuple:
+    """비교 대상 견적 집합 / 최신 리비전을 나타내는 값 (쿼리 1회)"""
+    row = db.query(
+        func.count(func.distinct(ProductQuotation.id)),
+        func.max(ProductQuotation.updated_at),
+        func.max(ProductQuotation.submitted_at),
+        func.count(ProductQuotationRevision.id),
+        func.max(ProductQuotationRevision.created_at),
+    ).outerjoin(
+        ProductQuotationRevision, ProductQuotationRevision.quotation_id == ProductQuotation.id
+    ).filter(
+        ProductQuotation.rfq_id == rfq.id,
+        ProductQuotation.status.in_(COMPARABLE_STATUSES)
+    ).one()
+    return (rfq.updated_at,) + tuple(row)
+
+
+def _load_rows(db, rfq_id: str):
+    """비교 대상 견적 + 품목 (견적 품목 없는 견적도 1행)"""
+    return db.query(
+        ProductQuotation.id,
+        ProductQuotation.quotation_number,
+        ProductQuotation.company_id,
+        Company.company_name,
+        Company.trust_score,
+        ProductQuotation.total_amount,
+        ProductQuotation.currency,
+        ProductQuotation.incoterms,
+        ProductQuotation.lead_time,
+        ProductQuotationItem.rfq_item_id,
+        ProductQuotationItem.item_number,
+        ProductQuotationItem.unit_price,
+        ProductQuotationItem.lead_time,
+        ProductQuotationItem.moq,
+    ).outerjoin(
+        Company, Company.id == ProductQuotation.company_id
+    ).outerjoin(
+        ProductQuotationItem, ProductQuotationItem.quotation_id == ProductQuotation.id
+    ).filter(
+        ProductQuotation.rfq_id == rfq_id,
+        ProductQuotation.status.in_(COMPARABLE_STATUSES)
+    ).order_by(
+        ProductQuotation.total_amount, ProductQuotation.id, ProductQuotationItem.item_number
+    ).all()
+
+
+def _rank_rows(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    행별 최솟값 / 순위 / 최솟값 대비 % (NaN = 값 없음)
+
+    순위는 1 + 같은 행에서 더 작은 값의 수 (동률은 같은 순위)
+    """
+    filled = np.where(np.isnan(values), np.inf, values)
+    best = filled.min(axis=1, initial=np.inf)
+    best = np.where(np.isinf(best), np.nan, best)
+    ranks = 1 + (filled[:, None, :] < filled[:, :, None]).sum(axis=2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff = np.where(best[:, None] > 0, (values - best[:, None]) / best[:, None] * 100, 0.0)
+    return best, ranks, diff
+
+
+def _number(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def build_matrix(db, rfq) -> dict:
+    """RFQ 품목 × 견적 매트릭스 계산 (캐시 미사용)"""
+    rfq_items = db.query(
+        ProductRFQItem.id, ProductRFQItem.item_number, ProductRFQItem.name,
+        ProductRFQItem.quantity, ProductRFQItem.unit, ProductRFQItem.target_price
+    ).filter(ProductRFQItem.rfq_id == rfq.id).order_by(ProductRFQItem.item_number).all()
+
+    row_by_id = {item.id: i for i, item in enumerate(rfq_items)}
+    row_by_number = {item.item_number: i for i, item in enumerate(rfq_items)}
+
+    suppliers: Dict[str, dict] = {}
+    offers: Dict[Tuple[int, int], Tuple[float, Optional[int], Optional[float]]] = {}
+    for row in _load_rows(db, rfq.id):
+        (quotation_id, quotation_number, company_id, company_name, trust_score, total_amount, currency,
+         incoterms, quotation_lead_time, rfq_item_id, item_number, unit_price, item_lead_time, moq) = row
+        column = suppliers.get(quotation_id)
+        if column is None:
+            column = suppliers[quotation_id] = {
+                "index": len(suppliers),
+                "quotation_id": quotation_id,
+                "quotation_number": quotation_number,
+                "company_id": company_id,
+                "company_name": company_name or "",
+                "trust_score": float(trust_score) if trust_score is not None else 3.0,
+                "currency": currency,
+                "incoterms": incoterms,
+                "lead_time": quotation_lead_time,
+                "total_amount": float(total_amount or 0),
+                "unmatched_items": 0,
+            }
+        if unit_price is None:
+            continue
+        target = row_by_id.get(rfq_item_id) if rfq_item_id else row_by_number.get(item_number)
+        if target is None:
+            column["unmatched_items"] += 1
+            continue
+        key = (target, column["index"])
+        price = float(unit_price)
+        # 같은 RFQ 품목에 여러 줄을 낸 경우 최저 단가 사용
+        if key not in offers or price < offers[key][0]:
+            lead_time = item_lead_time if item_lead_time is not None else quotation_lead_time
+            offers[key] = (price, lead_time, _number(moq))
+
+    n_rows, n_cols = len(rfq_items), len(suppliers)
+    prices = np.full((n_rows, n_cols), np.nan)
+    lead_times = np.full((n_rows, n_cols), np.nan)
+    if offers:
+        index = np.array(list(offers.keys()))
+        values = np.array([(price, np.nan if lead is None else lead) for price, lead, _ in offers.values()])
+        prices[index[:, 0], index[:, 1]] = values[:, 0]
+        lead_times[index[:, 0], index[:, 1]] = values[:, 1]
+
+    best_price, ranks, diff_pct = _rank_rows(prices)
+    fastest, _, _ = _rank_rows(lead_times)
+    offered = ~np.isnan(prices)
+    is_best = offered & (prices == best_price[:, None])
+    is_fastest = offered & (lead_times == fastest[:, None])
+    quantities = np.array([float(item.quantity or 0) for item in rfq_items])
+    aligned_totals = np.where(offered, prices * quantities[:, None], 0.0).sum(axis=0)
+    covered = offered.sum(axis=0)
+    best_counts = is_best.sum(axis=0)
+
+    rows = []
+    for i, item in enumerate(rfq_items):
+        cells = []
+        for j in range(n_cols):
+            if not offered[i, j]:
+                cells.append(None)
+                continue
+            _, lead_time, moq = offers[(i, j)]
+            cells.append({
+                "unit_price": float(prices[i, j]),
+                "amount": round(float(prices[i, j]) * float(quantities[i]), 2),
+                "lead_time": lead_time,
+                "moq": moq,
+                "price_rank": int(ranks[i, j]),
+                "price_diff_pct": round(float(diff_pct[i, j]), 2),
+                "is_best_price": bool(is_best[i, j]),
+                "is_fastest": bool(is_fastest[i, j]),
+            })
+        rows.append({
+            "rfq_item_id": item.id,
+            "item_number": item.item_number,
+            "name": item.name,
+            "quantity": float(quantities[i]),
+            "unit": item.unit,
+            "target_price": _number(item.target_price),
+            "best_unit_price": None if np.isnan(best_price[i]) else float(best_price[i]),
+            "offer_count": int(offered[i].sum()),
+            "cells": cells,
+        })
+
+    columns = []
+    for column in suppliers.values():
+        j = column.pop("index")
+        column.update({
+            "covered_items": int(covered[j]),
+            "best_price_items": int(best_counts[j]),
+            "aligned_total": round(float(aligned_totals[j]), 2),
+        })
+        columns.append(column)
+
+    return {
+        "rfq_id": rfq.id,
+        "rfq_number": rfq.rfq_number,
+        "rfq_title": rfq.title,
+        "suppliers": columns,
+        "items": rows,
+        "total_items": n_rows,
+        "total_quotations": n_cols,
+    }
+
+
+def get_matrix(db, rfq) -> dict:
+    """비교 매트릭스 (스탬프가 같으면 캐시 사용)"""
+    stamp = quotation_stamp(db, rfq)
+    matrix = comparison_cache.get(rfq.id, stamp)
+    if matrix is None:
+        matrix = build_matrix(db, rfq)
+        comparison_cache.builds += 1
+        comparison_cache.put(rfq.id, stamp, matrix)
+    return matrix
+
+
+def item_counts(db, quotation_ids: List[str]) -> Dict[str, int]:
+    """견적별 품목 수 (GROUP BY 1회)"""
+    if not quotation_ids:
+        return {}
+    rows = db.query(ProductQuotationItem.quotation_id, func.count()).filter(
+        ProductQuotationItem.quotation_id.in_(quotation_ids)
+    ).group_by(ProductQuotationItem.quotation_id).all()
+    return dict(rows)
@@ -0,0 +1,242 @@
+"""
+Commerce Counters - 기업 대시보드 카운터
+대시보드 요청마다 RFQ / 견적 / 거래 테이블을 7번 COUNT 하지 않고
+company_dashboard_counters 테이블의 미리 집계된 값을 읽음
+
+- RFQ / 견적 / 거래를 만들거나 상태를 바꾸는 API 에서 변경 전후 기여분 차이만큼 증감
+  (UPDATE ... SET col = col + :delta → 동시 요청에서도 값 유실 없음)
+- 카운터 행이 없는 회사는 조건부 집계 쿼리 1회로 계산해 행 생성
+  (기존 데이터 / seed 스크립트로 넣은 데이터도 첫 조회 시 반영)
+- COMMERCE_DASHBOARD_COUNTERS=false 이면 카운터 테이블 없이 매번 조건부 집계 쿼리 사용
+- 직접 SQL / seed 로 데이터를 바꾼 뒤에는 재계산:
+    python commerce_counters.py --rebuild [--company COMPANY_ID]
+"""
+
+import os
+import sys
+import argparse
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import case, delete, func, literal, select, union_all, update
+
+from commerce_models import (
+    ProductRFQ, ProductQuotation, ProductTransaction, CompanyDashboardCounter
+)
+
+COUNTERS_ENABLED = os.getenv("COMMERCE_DASHBOARD_COUNTERS", "true").lower() in ("1", "true", "yes")
+
+COUNTER_FIELDS = (
+    "total_rfqs",
+    "open_rfqs",
+    "total_quotations_sent",
+    "total_quotations_received",
+    "pending_quotations",
+    "active_transactions",
+    "completed_transactions",
+)
+
+ACTIVE_TRANSACTION_STATUSES = ("confirmed", "contract_pending", "payment_pending", "paid", "shipping")
+
+Counts = Dict[str, Dict[str, int]]  # company_id → {field: 0/1}
+
+
+# ==========================================
+# CONTRIBUTIONS (엔티티 하나가 카운터에 더하는 값)
+# ==========================================
+
+def rfq_counts(rfq) -> Counts:
+    return {rfq.company_id: {"total_rfqs": 1, "open_rfqs": int(rfq.status == "open")}}
+
+
+def quotation_counts(quotation, rfq_company_id: Optional[str]) -> Counts:
+    counts: Counts = defaultdict(dict)
+    counts[quotation.company_id].update({
+        "total_quotations_sent": 1,
+        "pending_quotations": int(quotation.status == "draft"),
+    })
+    if rfq_company_id:
+        counts[rfq_company_id]["total_quotations_received"] = 1
+    return counts
+
+
+def transaction_counts(transaction) -> Counts:
+    # 구매 / 판매 회사가 같으면 한 번만 집계
+    values = {
+        "active_transactions": int(transaction.status in ACTIVE_TRANSACTION_STATUSES),
+        "completed_transactions": int(transaction.status == "completed"),
+    }
+    return {company_id: dict(values) for company_id in {transaction.buyer_company_id, transaction.seller_company_id}}
+
+
+class CounterDelta:
+    """
+    한 요청 안의 카운터 변경 누적
+
+    Usage:
+        delta = CounterDelta()
+        delta.remove(rfq_counts(rfq))   # 변경 전
+        rfq.status = "open"
+        delta.add(rfq_counts(rfq))      # 변경 후
+        delta.apply(db)                 # commit 전에 호출
+    """
+
+    def __init__(self):
+        self.changes: Dict[str, Counter] = defaultdict(Counter)
+
+    def add(self, counts: Counts, sign: int = 1):
+        for company_id, fields in counts.items():
+            for field, value in fields.items():
+                if value:
+                    self.changes[company_id][field] += sign * value
+
+    def remove(self, counts: Counts):
+        self.add(counts, -1)
+
+    def apply(self, db):
+        """변경분 반영 (카운터 행이 없는 회사는 flush 된 현재 상태로 집계해 생성)"""
+        if not COUNTERS_ENABLED:
+            return
+        table = CompanyDashboardCounter.__table__
+        db.flush()
+        for company_id, fields in self.changes.items():
+            values = {field: table.c[field] + value for field, value in fields.items() if value}
+            if not values:
+                continue
+            result = db.execute(
+                update(table).where(table.c.company_id == company_id).values(updated_at=func.now(), **values)
+            )
+            if result.rowcount == 0:
+                seed_counters(db, company_id)
+        self.changes.clear()
+
+
+# ==========================================
+# AGGREGATION
+# ==========================================
+
+def _counter_query(company_ids: Optional[Iterable[str]] = None):
+    """
+    회사별 7개 카운터를 조건부 집계 쿼리 1회로 계산
+
+    (company_id, kind, status) 행을 UNION ALL 로 모은 뒤 SUM(CASE ...) 로 집계
+    거래는 구매 / 판매 회사를 각각 한 행씩 (같은 회사면 한 번만)
+    """
+    ids = list(company_ids) if company_ids is not None else None
+
+    def scoped(query, column):
+        return query.where(column.in_(ids)) if ids is not None else query
+
+    parts = union_all(
+        scoped(select(ProductRFQ.company_id.label("company_id"), literal("rfq").label("kind"),
+                      ProductRFQ.status.label("status")), ProductRFQ.company_id),
+        scoped(select(ProductQuotation.company_id, literal("sent"), ProductQuotation.status),
+               ProductQuotation.company_id),
+        scoped(select(ProductRFQ.company_id, literal("received"), ProductQuotation.status)
+               .select_from(ProductQuotation)
+               .join(ProductRFQ, ProductRFQ.id == ProductQuotation.rfq_id), ProductRFQ.company_id),
+        scoped(select(ProductTransaction.buyer_company_id, literal("tx"), ProductTransaction.status),
+               ProductTransaction.buyer_company_id),
+        scoped(select(ProductTransaction.seller_company_id, literal("tx"), ProductTransaction.status)
+               .where(ProductTransaction.seller_company_id != ProductTransaction.buyer_company_id),
+               ProductTransaction.seller_company_id),
+    ).subquery()
+
+    def total(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    kind, status = parts.c.kind, parts.c.status
+    return select(
+        parts.c.company_id,
+        total(kind == "rfq").label("total_rfqs"),
+        total((kind == "rfq") & (status == "open")).label("open_rfqs"),
+        total(kind == "sent").label("total_quotations_sent"),
+        total(kind == "received").label("total_quotations_received"),
+        total((kind == "sent") & (status == "draft")).label("pending_quotations"),
+        total((kind == "tx") & status.in_(ACTIVE_TRANSACTION_STATUSES)).label("active_transactions"),
+        total((kind == "tx") & (status == "completed")).label("completed_transactions"),
+    ).group_by(parts.c.company_id)
+
+
+def aggregate_counters(db, company_id: str) -> Dict[str, int]:
+    """회사 하나의 카운터 (카운터 테이블 미사용 경로)"""
+    row = db.execute(_counter_query([company_id])).mappings().first()
+    return {field: int(row[field]) if row else 0 for field in COUNTER_FIELDS}
+
+
+def _insert(dialect_name):
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def seed_counters(db, company_id: str) -> Dict[str, int]:
+    """집계 결과로 카운터 행 생성 (이미 있으면 유지)"""
+    values = aggregate_counters(db, company_id)
+    insert = _insert(db.get_bind().dialect.name)
+    db.execute(
+        insert(CompanyDashboardCounter.__table__)
+        .values(company_id=company_id, **values)
+        .on_conflict_do_nothing(index_elements=["company_id"])
+    )
+    return values
+
+
+def get_counters(db, company_id: str) -> Dict[str, int]:
+    """대시보드 카운터 조회 (행이 없으면 집계 후 저장)"""
+    if not COUNTERS_ENABLED:
+        return aggregate_counters(db, company_id)
+    row = db.get(CompanyDashboardCounter, company_id)
+    if row is not None:
+        return {field: getattr(row, field) for field in COUNTER_FIELDS}
+    values = seed_counters(db, company_id)
+    db.commit()
+    return values
+
+
+def rebuild_counters(db, company_ids: Optional[Iterable[str]] = None) -> int:
+    """
+    카운터 재계산 (company_ids 가 없으면 전체) - 커밋은 호출 측에서
+
+    Returns:
+        int: 저장된 카운터 행 수
+    """
+    ids = list(company_ids) if company_ids is not None else None
+    table = CompanyDashboardCounter.__table__
+    rows = [dict(row) for row in db.execute(_counter_query(ids)).mappings()]
+
+    clear = delete(table)
+    if ids is not None:
+        clear = clear.where(table.c.company_id.in_(ids))
+    db.execute(clear)
+    if rows:
+        db.execute(table.insert(), rows)
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage commerce dashboard counters")
+    parser.add_argument("--rebuild", action="store_true", help="RFQ / 견적 / 거래 테이블에서 카운터 재계산")
+    parser.add_argument("--company", action="append", help="재계산할 회사 ID (여러 번 지정 가능, 기본 전체)")
+    args = parser.parse_args(argv)
+
+    if not args.rebuild:
+        parser.print_help()
+        sys.exit(1)
+
+    from database import SessionLocal, engine
+
+    CompanyDashboardCounter.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        count = rebuild_counters(db, args.company)
+        db.commit()
+    finally:
+        db.close()
+    print(f"[OK] Rebuilt dashboard counters for {count} companies")
+
+
+if __name__ == "__main__":
+    main()
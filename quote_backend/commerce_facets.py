@@ -0,0 +1,150 @@
+"""
+Commerce Facets - 상품 검색 패싯 카운트
+카테고리 / 원산지 / 가격 유형 / 재고 상태별 상품 수를 값마다 count() 하지 않고
+GROUP BY 한 번으로 계산
+
+- 패싯이 아닌 조건 (회사, 추천 여부, 검색어) 만 SQL 에 적용하고
+  4개 패싯 컬럼 조합별 건수를 한 번에 조회 → 패싯 선택은 메모리에서 적용
+- 각 패싯의 카운트는 자기 자신을 제외한 나머지 선택 조건만 적용
+  (선택한 원산지 외 다른 원산지를 골랐을 때의 건수도 표시)
+- 조합별 건수는 정규화된 비패싯 조건 단위로 FACET_TTL 초 동안 캐시
+  → 패싯을 바꿔가며 탐색해도 추가 쿼리 없음
+  (같은 프로세스의 상품 등록 / 수정 / 삭제 시 즉시 비움, 다른 프로세스 변경은 TTL 이내 반영)
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+
+import commerce_search
+from commerce_models import Product
+
+FACET_TTL = float(os.getenv("COMMERCE_FACET_TTL", "30"))
+MAX_ENTRIES = 512
+
+# 패싯 이름 → 상품 컬럼 (순서 = GROUP BY 컬럼 순서)
+FACET_COLUMNS = OrderedDict([
+    ("category", Product.category_id),
+    ("origin_country", Product.origin_country),
+    ("price_type", Product.price_type),
+    ("stock_status", Product.stock_status),
+])
+
+GroupRows = List[Tuple]
+CacheKey = Tuple[Optional[str], Optional[bool], str]
+
+
+class FacetCache:
+    """비패싯 조건 → 패싯 컬럼 조합별 건수 (TTL + LRU)"""
+
+    def __init__(self, ttl: float = FACET_TTL, max_entries: int = MAX_ENTRIES, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, GroupRows]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> Optional[GroupRows]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self.clock() - entry[0] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: CacheKey, rows: GroupRows):
+        with self._lock:
+            self._entries[key] = (self.clock(), rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+facet_cache = FacetCache()
+
+
+def normalize_search(search: Optional[str]) -> str:
+    """공백 / 대소문자만 다른 검색어는 같은 캐시 키 사용 (FTS trigram, ilike 모두 대소문자 무시)"""
+    return " ".join(commerce_search.split_terms(search)).lower()
+
+
+def grouped_counts(db, company_id: Optional[str] = None, is_featured: Optional[bool] = None,
+                   search: Optional[str] = None) -> GroupRows:
+    """
+    (category_id, origin_country, price_type, stock_status, count) 목록
+
+    활성 상품 중 비패싯 조건을 만족하는 상품을 패싯 컬럼 조합별로 집계 (캐시 사용)
+    """
+    key = (company_id or None, is_featured, normalize_search(search))
+    rows = facet_cache.get(key)
+    if rows is not None:
+        return rows
+
+    columns = list(FACET_COLUMNS.values())
+    query = db.query(*columns, func.count()).filter(Product.is_active == True)
+    if company_id:
+        query = query.filter(Product.company_id == company_id)
+    if is_featured is not None:
+        query = query.filter(Product.is_featured == is_featured)
+    query, _ = commerce_search.apply_search(query, commerce_search.PRODUCT_INDEX, key[2])
+    rows = [tuple(row) for row in query.group_by(*columns).all()]
+
+    facet_cache.put(key, rows)
+    return rows
+
+
+def count_facets(rows: GroupRows, selected: Dict[str, Optional[Iterable[str]]]) -> Tuple[int, Dict[str, Dict[str, int]]]:
+    """
+    조합별 건수에 패싯 선택 적용
+
+    Args:
+        rows: grouped_counts() 결과
+        selected: 패싯 이름 → 허용 값 집합 (None 이면 선택 없음)
+
+    Returns:
+        (선택 조건을 모두 만족하는 상품 수, 패싯 이름 → {값: 건수})
+    """
+    names = list(FACET_COLUMNS)
+    allowed: List[Optional[FrozenSet[str]]] = [
+        frozenset(selected[name]) if selected.get(name) is not None else None for name in names
+    ]
+    total = 0
+    counts: Dict[str, Dict[str, int]] = {name: defaultdict(int) for name in names}
+
+    for row in rows:
+        values, count = row[:-1], row[-1]
+        misses = [i for i, value in enumerate(values) if allowed[i] is not None and value not in allowed[i]]
+        if not misses:
+            total += count
+            for name, value in zip(names, values):
+                if value is not None:
+                    counts[name][value] += count
+        elif len(misses) == 1:
+            # 이 패싯 선택만 바꾸면 포함되는 조합
+            i = misses[0]
+            if values[i] is not None:
+                counts[names[i]][values[i]] += count
+
+    return total, {name: dict(values) for name, values in counts.items()}
+
+
+def facet_items(counts: Dict[str, int], labels: Optional[Dict[str, Optional[str]]] = None) -> List[dict]:
+    """건수 내림차순 [{value, label, count}]"""
+    ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [{"value": value, "label": (labels or {}).get(value), "count": count} for value, count in ordered]
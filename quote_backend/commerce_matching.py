@@ -0,0 +1,249 @@
+"""
+Commerce Matching - RFQ ↔ 공급사 매칭
+RFQ 게시 시 관련 상품을 가진 셀러를 찾아 ProductRFQInvitation 을 일괄 생성
+
+- 활성 상품을 메모리 역색인으로 보관 (카테고리 / 원산지 / 인증 / 가격 유형)
+  → 게시마다 products 테이블을 스캔하지 않음
+- 최초 사용 시 한 번 전체 로드, 이후 상품 등록 / 수정 / 삭제 API 에서 증분 반영
+- data_versions 의 products 버전에 묶음: 다른 프로세스 (워커 / import) 가 버전을 올리면
+  response_cache.VERSION_TTL 이내에 다음 매칭에서 전체 재로드
+- 카테고리는 RFQ 카테고리와 그 하위 카테고리를 모두 매칭 (category_tree 의 하위 ID 집합 사용)
+
+점수 (상품 단위, 공급사 점수 = 최고 상품 점수):
+    카테고리 일치 40 (하위 카테고리 30) + 원산지가 target_countries 에 포함 20
+    + 요구 인증 충족 비율 × 30 + 가격 공개 (public / range) 10
+"""
+
+import uuid
+import threading
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+from sqlalchemy import insert
+
+from category_tree import category_tree_cache
+from commerce_models import Company, Product, ProductRFQInvitation
+from response_cache import reference_cache, PRODUCTS
+
+CATEGORY_SCORE = 40.0
+SUBCATEGORY_SCORE = 30.0
+COUNTRY_SCORE = 20.0
+CERT_SCORE = 30.0
+PRICE_SCORE = 10.0
+
+MIN_SCORE = 40.0
+MAX_INVITATIONS = 50
+OPEN_PRICE_TYPES = ("public", "range")
+
+
+class ProductEntry(NamedTuple):
+    company_id: str
+    category_id: Optional[str]
+    origin_country: Optional[str]
+    certifications: FrozenSet[str]
+    price_type: Optional[str]
+
+
+class SupplierMatch(NamedTuple):
+    company_id: str
+    score: float
+    product_ids: List[str]
+
+
+def _normalize_codes(values) -> FrozenSet[str]:
+    """["iso9001", " CE "] → {"ISO9001", "CE"} (JSON 컬럼 값이 list 가 아니면 빈 집합)"""
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        return frozenset()
+    return frozenset(str(v).strip().upper() for v in values if v)
+
+
+def _entry(product) -> ProductEntry:
+    return ProductEntry(
+        company_id=product.company_id,
+        category_id=product.category_id,
+        origin_country=(product.origin_country or "").upper() or None,
+        certifications=_normalize_codes(product.certifications),
+        price_type=product.price_type,
+    )
+
+
+class MatchingIndex:
+    """활성 상품 역색인 (product_id → ProductEntry, category_id → product_ids)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.loaded = False
+        self.version: Optional[int] = None  # 로드 / 반영한 products 데이터 버전
+        self.products: Dict[str, ProductEntry] = {}
+        self.by_category: Dict[Optional[str], Set[str]] = defaultdict(set)
+
+    # ---------- maintenance ----------
+
+    def reload(self, db):
+        """products 테이블 전체 로드 (필요한 컬럼만 조회)"""
+        # 버전을 먼저 읽음 → 로드 중에 바뀐 경우 다음 매칭에서 다시 로드
+        (version,) = reference_cache.current_versions((PRODUCTS,))
+        rows = db.query(
+            Product.id, Product.company_id, Product.category_id, Product.origin_country,
+            Product.certifications, Product.price_type
+        ).filter(Product.is_active == True).all()
+        with self._lock:
+            self.products = {}
+            self.by_category = defaultdict(set)
+            for row in rows:
+                self._add(row.id, _entry(row))
+            self.version = version
+            self.loaded = True
+
+    def ensure_loaded(self, db):
+        """처음 사용하거나 products 데이터 버전이 바뀌었으면 (다른 프로세스의 변경) 전체 로드"""
+        (version,) = reference_cache.current_versions((PRODUCTS,))
+        if self.loaded and self.version == version:
+            return
+        with self._lock:
+            if not self.loaded or self.version != version:
+                self.reload(db)
+
+    def reset(self):
+        with self._lock:
+            self.products = {}
+            self.by_category = defaultdict(set)
+            self.version = None
+            self.loaded = False
+
+    def _advance(self, version: Optional[int]):
+        """이 프로세스의 변경으로 올라간 버전 반영 - 직전 버전을 반영한 상태일 때만 (아니면 재로드 필요)"""
+        if version is not None and self.version is not None and version == self.version + 1:
+            self.version = version
+
+    def _add(self, product_id: str, entry: ProductEntry):
+        self.products[product_id] = entry
+        self.by_category[entry.category_id].add(product_id)
+
+    def _discard(self, product_id: str):
+        entry = self.products.pop(product_id, None)
+        if entry is not None:
+            ids = self.by_category.get(entry.category_id)
+            if ids is not None:
+                ids.discard(product_id)
+                if not ids:
+                    del self.by_category[entry.category_id]
+
+    def upsert(self, product, version: Optional[int] = None):
+        """
+        상품 등록 / 수정 반영 (비활성 상품은 제거)
+
+        Args:
+            version: 이 변경으로 올린 products 데이터 버전 (bump_data_version 반환값)
+        """
+        if not self.loaded:
+            return  # 아직 로드 전이면 첫 매칭 때 전체 로드에 포함됨
+        with self._lock:
+            self._discard(product.id)
+            if product.is_active:
+                self._add(product.id, _entry(product))
+            self._advance(version)
+
+    def remove(self, product_id: str, version: Optional[int] = None):
+        if not self.loaded:
+            return
+        with self._lock:
+            self._discard(product_id)
+            self._advance(version)
+
+    # ---------- matching ----------
+
+    def candidate_ids(self, category_ids: Iterable[Optional[str]]) -> List[str]:
+        with self._lock:
+            result = []
+            for category_id in category_ids:
+                result.extend(self.by_category.get(category_id, ()))
+            return result
+
+    def match(self, db, rfq, limit: Optional[int] = MAX_INVITATIONS,
+              min_score: float = MIN_SCORE) -> List[SupplierMatch]:
+        """
+        RFQ 에 맞는 공급사 목록 (점수 내림차순, limit=None 이면 전체)
+
+        RFQ 카테고리가 없으면 품목에 연결된 상품의 카테고리를 사용
+        RFQ 작성 회사 자신은 제외
+        """
+        self.ensure_loaded(db)
+        tree = category_tree_cache.get(db)
+
+        category_ids: Set[str] = set()
+        if rfq.category_id:
+            category_ids.add(rfq.category_id)
+        else:
+            for item in rfq.items:
+                entry = self.products.get(item.product_id) if item.product_id else None
+                if entry is not None and entry.category_id:
+                    category_ids.add(entry.category_id)
+        if not category_ids:
+            return []
+
+        scope: Set[str] = set()
+        for category_id in category_ids:
+            scope |= tree.descendant_ids(category_id)
+
+        countries = {c.upper() for c in rfq.target_countries or [] if c}
+        required = _normalize_codes(rfq.required_certs)
+
+        best: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = defaultdict(list)
+        products = self.products
+        for product_id in self.candidate_ids(scope):
+            entry = products.get(product_id)
+            if entry is None or entry.company_id == rfq.company_id:
+                continue
+            score = CATEGORY_SCORE if entry.category_id in category_ids else SUBCATEGORY_SCORE
+            if countries and entry.origin_country in countries:
+                score += COUNTRY_SCORE
+            if required:
+                score += CERT_SCORE * len(required & entry.certifications) / len(required)
+            if entry.price_type in OPEN_PRICE_TYPES:
+                score += PRICE_SCORE
+            if score < min_score:
+                continue
+            matched[entry.company_id].append(product_id)
+            if score > best.get(entry.company_id, 0.0):
+                best[entry.company_id] = score
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+        return [SupplierMatch(company_id, score, sorted(matched[company_id])) for company_id, score in ranked[:limit]]
+
+
+matching_index = MatchingIndex()
+
+
+def invite_matched_suppliers(db, rfq, limit: int = MAX_INVITATIONS) -> List[SupplierMatch]:
+    """
+    매칭된 공급사에 RFQ 초대 일괄 생성 (커밋은 호출 측에서)
+
+    비활성 회사 / 바이어 전용 회사 / 이미 초대된 회사는 제외한 뒤 상위 limit 개
+    (먼저 자르면 제외된 회사만큼 초대 수가 줄어듦)
+    """
+    matches = matching_index.match(db, rfq, limit=None)
+    if not matches:
+        return []
+
+    company_ids = [m.company_id for m in matches]
+    eligible = {
+        row.id for row in db.query(Company.id).filter(
+            Company.id.in_(company_ids),
+            Company.is_active == True,
+            Company.company_type != "buyer"
+        )
+    }
+    invited = {
+        row.company_id for row in db.query(ProductRFQInvitation.company_id).filter(
+            ProductRFQInvitation.rfq_id == rfq.id
+        )
+    }
+    matches = [m for m in matches if m.company_id in eligible and m.company_id not in invited][:limit]
+    if matches:
+        db.execute(insert(ProductRFQInvitation), [
+            {"id": str(uuid.uuid4()), "rfq_id": rfq.id, "company_id": m.company_id, "status": "pending"}
+            for m in matches
+        ])
+    return matches
@@ -895,3 +895,30 @@ class CommerceMessage(Base):
     def __repr__(self):
         return f"<CommerceMessage {self.id}>"
 
+
+
+# ==========================================
+# DASHBOARD MODELS
+# ==========================================
+
+class CompanyDashboardCounter(Base):
+    """
+    기업 대시보드 카운터
+    RFQ / 견적 / 거래 상태 변경 시 증감 (commerce_counters 참조)
+    """
+    __tablename__ = "company_dashboard_counters"
+    
+    company_id = Column(String(36), ForeignKey("companies.id"), primary_key=True)
+    
+    total_rfqs = Column(Integer, nullable=False, default=0)
+    open_rfqs = Column(Integer, nullable=False, default=0)
+    total_quotations_sent = Column(Integer, nullable=False, default=0)
+    total_quotations_received = Column(Integer, nullable=False, default=0)
+    pending_quotations = Column(Integer, nullable=False, default=0)
+    active_transactions = Column(Integer, nullable=False, default=0)
+    completed_transactions = Column(Integer, nullable=False, default=0)
+    
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<CompanyDashboardCounter {self.company_id}>"
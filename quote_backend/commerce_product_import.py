@@ -0,0 +1,392 @@
+"""
+Commerce Product Import - 셀러 상품 카탈로그 (CSV / XLSX) 일괄 등록
+POST /products 로 한 건씩 커밋하는 대신 파일 하나로 수천 ~ 수만 건 등록 / 갱신
+
+파일 형식 (한 행 = 상품 하나):
+    sku, name_ko, name_en, category, description, price_type, price, price_min, price_max,
+    price_currency, price_unit, moq, moq_unit, lead_time_min, lead_time_max, stock_status,
+    origin_country, hs_code, certifications
+
+    - 필수: sku, name_ko
+    - category: 카테고리 코드 (ELEC) 또는 ID
+    - price_type / stock_status / price_currency 생략 시 private / in_stock / USD (신규 상품만)
+    - 기존 SKU 갱신 시 파일에 없는 컬럼은 그대로 두고, 위 세 컬럼은 빈 칸이어도 기존 값 유지
+    - certifications: 쉼표 / 세미콜론 구분 ("ISO9001, CE")
+
+처리 순서:
+    1. 회사 / 카테고리 / 기존 SKU 는 시작 시 한 번씩 조회해 메모리 lookup 으로 검증
+    2. CSV 는 CHUNK_SIZE 행씩 스트리밍 (XLSX 는 읽은 뒤 같은 크기로 분할)
+    3. chunk 마다 검증 → 오류 행만 제외하고 신규는 bulk insert, 기존 SKU 는 bulk update
+       (chunk 단위 커밋, 오류가 있어도 나머지 행은 계속 처리)
+    4. 같은 SKU 가 파일에 여러 번 나오면 처음 행만 사용하고 이후 행은 오류로 보고
+    5. 끝난 뒤 매칭 색인 / 패싯 캐시를 한 번만 갱신
+       (검색 색인은 FTS 트리거가 같은 INSERT / UPDATE 문 안에서 갱신)
+
+Usage:
+    python commerce_product_import.py catalog.xlsx --company COMPANY_ID
+    python commerce_product_import.py catalog.csv --company COMPANY_ID --dry-run
+"""
+
+import io
+import re
+import sys
+import time
+import uuid
+import argparse
+from typing import Dict
+
+import pandas as pd
+from sqlalchemy import bindparam, func, select, update, insert
+
+from commerce_models import Company, Category, Product, PriceTypeEnum, StockStatusEnum
+
+CHUNK_SIZE = 2000
+MAX_ERRORS = 200
+
+REQUIRED_COLUMNS = ["sku", "name_ko"]
+OPTIONAL_COLUMNS = [
+    "name_en", "category", "description", "price_type", "price", "price_min", "price_max",
+    "price_currency", "price_unit", "moq", "moq_unit", "lead_time_min", "lead_time_max",
+    "stock_status", "origin_country", "hs_code", "certifications",
+]
+
+# 파일 헤더 별칭 → 표준 컬럼명
+COLUMN_ALIASES = {
+    "product_code": "sku", "code": "sku",
+    "name": "name_ko", "product_name": "name_ko",
+    "category_code": "category", "category_id": "category",
+    "currency": "price_currency",
+    "origin": "origin_country", "country": "origin_country",
+    "certs": "certifications",
+}
+
+MAX_LENGTHS = {
+    "sku": 50, "name_ko": 200, "name_en": 200, "price_unit": 20, "moq_unit": 20,
+    "origin_country": 3, "hs_code": 20,
+}
+DECIMAL_COLUMNS = ["price", "price_min", "price_max", "moq"]
+INTEGER_COLUMNS = ["lead_time_min", "lead_time_max"]
+PRICE_TYPES = {e.value for e in PriceTypeEnum}
+STOCK_STATUSES = {e.value for e in StockStatusEnum}
+
+# DB 에 기록하는 컬럼 (update 시 파일에 없는 컬럼은 건드리지 않음 - write_columns)
+WRITE_COLUMNS = [
+    "sku", "name_ko", "name_en", "category_id", "description", "price_type", "price", "price_min",
+    "price_max", "price_currency", "price_unit", "moq", "moq_unit", "lead_time_min", "lead_time_max",
+    "stock_status", "origin_country", "hs_code", "certifications",
+]
+# 파일 컬럼명과 DB 컬럼명이 다른 경우
+SOURCE_COLUMNS = {"category_id": "category"}
+# 빈 값일 때 insert 에만 쓰는 기본값 (update 는 기존 값 유지)
+INSERT_DEFAULTS = {"price_type": "private", "stock_status": "in_stock", "price_currency": "USD"}
+
+
+class ProductFileError(Exception):
+    """파일 자체를 처리할 수 없는 경우 (형식 / 필수 컬럼 / 회사)"""
+
+
+# ==========================================
+# READ & NORMALIZE
+# ==========================================
+
+def _normalize_columns(df):
+    df.columns = [str(c).strip().lower().replace(" ", "_").replace("-", "_") for c in df.columns]
+    return df.rename(columns={c: COLUMN_ALIASES.get(c, c) for c in df.columns})
+
+
+def iter_product_chunks(source, filename=None, chunk_size=CHUNK_SIZE):
+    """
+    CSV / XLSX → 문자열 DataFrame chunk (index = 파일 행 번호, 헤더 = 1행)
+
+    Args:
+        source: 파일 경로 또는 bytes
+        filename: bytes 로 전달할 때 확장자 판별용 파일명
+    """
+    name = (filename or (source if isinstance(source, str) else "")).lower()
+    handle = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+    if name.endswith((".xlsx", ".xlsm", ".xls")):
+        df = pd.read_excel(handle, dtype=str)
+        chunks = (df.iloc[start:start + chunk_size] for start in range(0, max(len(df), 1), chunk_size))
+    elif name.endswith((".csv", ".txt")) or not name:
+        chunks = pd.read_csv(handle, dtype=str, encoding="utf-8-sig", skipinitialspace=True, chunksize=chunk_size)
+    else:
+        raise ProductFileError(f"Unsupported file type: {filename or source}")
+
+    first_row = 2
+    for chunk in chunks:
+        chunk = _normalize_columns(chunk)
+        file_columns = [c for c in REQUIRED_COLUMNS + OPTIONAL_COLUMNS if c in chunk.columns]
+        missing = [c for c in REQUIRED_COLUMNS if c not in chunk.columns]
+        if missing:
+            raise ProductFileError(f"Missing required columns: {', '.join(missing)}")
+        for column in OPTIONAL_COLUMNS:
+            if column not in chunk.columns:
+                chunk[column] = None
+        chunk = chunk[REQUIRED_COLUMNS + OPTIONAL_COLUMNS].copy()
+        chunk.index = pd.RangeIndex(first_row, first_row + len(chunk), name="row")
+        first_row += len(chunk)
+        chunk = chunk.apply(lambda s: s.str.strip() if s.dtype == object else s)
+        chunk.attrs["file_columns"] = file_columns  # 채워 넣은 컬럼과 구분 (write_columns)
+        yield chunk
+
+
+def write_columns(file_columns):
+    """파일에 실제로 있는 컬럼에 해당하는 WRITE_COLUMNS (기존 상품 update 대상)"""
+    file_columns = set(file_columns)
+    return [c for c in WRITE_COLUMNS if SOURCE_COLUMNS.get(c, c) in file_columns]
+
+
+# ==========================================
+# LOOKUPS & VALIDATION
+# ==========================================
+
+class ProductLookups:
+    """검증용 참조 데이터 (import 시작 시 1회 조회)"""
+
+    def __init__(self, categories: Dict[str, str], existing: Dict[str, str]):
+        self.categories = categories  # 코드 (대문자) / ID → category_id
+        self.existing = existing      # 회사의 기존 SKU → product_id
+        self.seen: Dict[str, int] = {}  # 이번 파일에서 처리한 SKU → 처음 나온 행 번호
+
+    @classmethod
+    def load(cls, db, company_id):
+        categories = {}
+        for category_id, code in db.execute(select(Category.id, Category.code).where(Category.is_active == True)):
+            categories[category_id] = category_id
+            categories.setdefault(code.upper(), category_id)
+        existing = dict(db.execute(
+            select(Product.sku, Product.id).where(Product.company_id == company_id, Product.sku.isnot(None))
+        ).all())
+        return cls(categories, existing)
+
+
+def _collect_errors(errors, mask, df, column, message):
+    for row in df.index[mask]:
+        value = df.at[row, column]
+        errors.append({"row": int(row), "column": column, "value": None if pd.isna(value) else value,
+                       "message": message})
+
+
+def _blank(series):
+    return series.isna() | (series == "")
+
+
+def _split_codes(value):
+    if value is None or pd.isna(value) or value == "":
+        return None
+    codes = [code.strip() for code in re.split(r"[,;|]", value) if code.strip()]
+    return codes or None
+
+
+def prepare_products(df, lookups: ProductLookups):
+    """
+    문자열 DataFrame chunk → 기록할 상품 DataFrame
+
+    Returns:
+        (frame, errors) - frame 에는 오류가 없는 행만 남음
+    """
+    errors = []
+    out = pd.DataFrame(index=df.index)
+
+    for column in REQUIRED_COLUMNS:
+        _collect_errors(errors, _blank(df[column]), df, column, "required")
+    for column, limit in MAX_LENGTHS.items():
+        _collect_errors(errors, df[column].fillna("").str.len() > limit, df, column, f"longer than {limit}")
+
+    for column in ["sku", "name_ko", "name_en", "description", "price_unit", "moq_unit", "hs_code"]:
+        out[column] = df[column].where(~_blank(df[column]), None)
+
+    category = df["category"]
+    out["category_id"] = category.map(lookups.categories).fillna(category.str.upper().map(lookups.categories))
+    _collect_errors(errors, ~_blank(category) & out["category_id"].isna(), df, "category", "unknown category")
+
+    # 빈 값은 None 으로 두고 기본값은 write_products 에서 insert 할 때만 적용
+    out["price_type"] = df["price_type"].str.lower().where(~_blank(df["price_type"]), None)
+    _collect_errors(errors, out["price_type"].notna() & ~out["price_type"].isin(PRICE_TYPES), df, "price_type",
+                    f"must be one of {', '.join(sorted(PRICE_TYPES))}")
+    out["stock_status"] = df["stock_status"].str.lower().where(~_blank(df["stock_status"]), None)
+    _collect_errors(errors, out["stock_status"].notna() & ~out["stock_status"].isin(STOCK_STATUSES), df,
+                    "stock_status", f"must be one of {', '.join(sorted(STOCK_STATUSES))}")
+
+    for column in DECIMAL_COLUMNS + INTEGER_COLUMNS:
+        text = df[column].fillna("").str.replace(",", "", regex=False)
+        out[column] = pd.to_numeric(text.where(text != ""), errors="coerce")
+        _collect_errors(errors, (text != "") & out[column].isna(), df, column, "invalid number")
+        _collect_errors(errors, out[column] < 0, df, column, "must not be negative")
+    for column in INTEGER_COLUMNS:
+        _collect_errors(errors, out[column].notna() & (out[column] % 1 != 0), df, column, "must be an integer")
+
+    out["price_currency"] = df["price_currency"].str.upper().where(~_blank(df["price_currency"]), None)
+    _collect_errors(errors, out["price_currency"].notna() & ~out["price_currency"].str.fullmatch(r"[A-Z]{3}",
+                                                                                               na=False),
+                    df, "price_currency", "invalid currency")
+    out["origin_country"] = df["origin_country"].str.upper().where(~_blank(df["origin_country"]), None)
+    out["certifications"] = df["certifications"].map(_split_codes)
+
+    # 파일 안 SKU 중복: 처음 나온 행만 사용 (이전 chunk 포함)
+    sku = out["sku"]
+    duplicated = sku.notna() & (sku.duplicated(keep="first") | sku.isin(lookups.seen))
+    for row in df.index[duplicated]:
+        first = lookups.seen.get(sku[row]) or int(sku[sku == sku[row]].index[0])
+        errors.append({"row": int(row), "column": "sku", "value": sku[row],
+                       "message": f"duplicate sku (first seen in row {first})"})
+
+    invalid_rows = {e["row"] for e in errors}
+    frame = out.loc[[row not in invalid_rows for row in out.index]]
+    for row, value in frame["sku"].items():
+        lookups.seen.setdefault(value, int(row))
+
+    errors.sort(key=lambda e: (e["row"], e["column"]))
+    return frame, errors
+
+
+# ==========================================
+# WRITE
+# ==========================================
+
+def _records(frame):
+    """NaN → None 변환된 dict 목록 (executemany 용)"""
+    records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    for record in records:
+        for column in INTEGER_COLUMNS:
+            if record[column] is not None:
+                record[column] = int(record[column])
+    return records
+
+
+def write_products(db, company_id, frame, lookups: ProductLookups, columns=None):
+    """
+    검증된 chunk 기록 - 신규 SKU 는 insert, 기존 SKU 는 update (비활성 상품은 재활성화)
+
+    Args:
+        columns: 기존 상품에 update 할 컬럼 (파일에 있는 컬럼, write_columns) - 생략 시 WRITE_COLUMNS 전체
+
+    Returns:
+        (created, updated)
+    """
+    columns = list(columns or WRITE_COLUMNS)
+    if "sku" not in columns:
+        columns.insert(0, "sku")
+    records = _records(frame[WRITE_COLUMNS])
+    new_rows, changed_rows = [], []
+    for record in records:
+        product_id = lookups.existing.get(record["sku"])
+        if product_id is None:
+            product_id = str(uuid.uuid4())
+            lookups.existing[record["sku"]] = product_id
+            defaults = {c: default for c, default in INSERT_DEFAULTS.items() if record[c] is None}
+            new_rows.append({"id": product_id, "company_id": company_id, "is_active": True, **record, **defaults})
+        else:
+            changed_rows.append({"product_id": product_id, "is_active": True, **{c: record[c] for c in columns}})
+
+    table = Product.__table__
+    if new_rows:
+        db.execute(insert(table), new_rows)
+    if changed_rows:
+        # 기본값이 있는 컬럼은 빈 칸이면 기존 값 유지
+        values = {c: func.coalesce(bindparam(c), table.c[c]) if c in INSERT_DEFAULTS else bindparam(c)
+                  for c in columns + ["is_active"]}
+        db.execute(
+            update(table).where(table.c.id == bindparam("product_id")).values(updated_at=func.now(), **values),
+            changed_rows,
+        )
+    return len(new_rows), len(changed_rows)
+
+
+def refresh_product_indexes(db):
+    """import 후 상품 색인 / 캐시 1회 갱신 (products 데이터 버전 증가 → 다른 프로세스의 매칭 색인도 재로드)"""
+    import commerce_facets
+    from commerce_matching import matching_index
+    from response_cache import bump_data_version, PRODUCTS
+
+    bump_data_version(db, PRODUCTS)
+    commerce_facets.facet_cache.clear()
+    if matching_index.loaded:
+        matching_index.reload(db)
+
+
+def import_products(db, company_id, source, filename=None, chunk_size=CHUNK_SIZE, dry_run=False):
+    """
+    상품 파일 import (chunk 단위 검증 / 기록, 오류 행은 건너뜀)
+
+    Args:
+        db: SQLAlchemy Session (chunk 마다 commit)
+        company_id: 상품을 등록할 셀러 회사 ID
+        source: 파일 경로 또는 bytes
+        filename: 원본 파일명 (bytes 인 경우 형식 판별용)
+        dry_run: 검증만 수행
+
+    Raises:
+        ProductFileError: 회사 없음 / 바이어 전용 회사 / 파일 형식 / 필수 컬럼 누락
+    """
+    started = time.perf_counter()
+    company = db.get(Company, company_id)
+    if company is None or not company.is_active:
+        raise ProductFileError(f"Company not found: {company_id}")
+    if company.company_type == "buyer":
+        raise ProductFileError("Buyer companies cannot register products")
+
+    lookups = ProductLookups.load(db, company_id)
+    result = {"rows": 0, "created": 0, "updated": 0, "skipped": 0, "error_count": 0}
+    errors = []
+
+    for chunk in iter_product_chunks(source, filename, chunk_size):
+        frame, chunk_errors = prepare_products(chunk, lookups)
+        result["rows"] += len(chunk)
+        result["skipped"] += len(chunk) - len(frame)
+        result["error_count"] += len(chunk_errors)
+        errors.extend(chunk_errors[:MAX_ERRORS - len(errors)])
+        if dry_run or frame.empty:
+            continue
+        try:
+            created, updated = write_products(db, company_id, frame, lookups,
+                                              write_columns(chunk.attrs.get("file_columns", chunk.columns)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        result["created"] += created
+        result["updated"] += updated
+
+    if result["created"] or result["updated"]:
+        refresh_product_indexes(db)
+
+    result.update({
+        "errors": errors,
+        "dry_run": dry_run,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    })
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import a seller product catalog from CSV/XLSX")
+    parser.add_argument("path", help="상품 파일 경로 (.csv / .xlsx)")
+    parser.add_argument("--company", required=True, help="셀러 회사 ID")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="검증만 수행")
+    args = parser.parse_args(argv)
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        result = import_products(db, args.company, args.path, chunk_size=args.chunk_size, dry_run=args.dry_run)
+    except ProductFileError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print(f"[OK] {result['rows']} rows ({'dry run' if result['dry_run'] else 'imported'}) "
+          f"in {result['elapsed_ms']}ms")
+    print(f"  - Created: {result['created']}")
+    print(f"  - Updated: {result['updated']}")
+    print(f"  - Skipped: {result['skipped']}")
+    for error in result["errors"][:50]:
+        print(f"  row {error['row']}: {error['column']}={error['value']!r} - {error['message']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -271,6 +271,19 @@ class CategoryCreate(CategoryBase):
     parent_id: Optional[str] = None
 
 
+class CategoryUpdate(BaseModel):
+    parent_id: Optional[str] = None
+    code: Optional[str] = Field(None, max_length=20)
+    name_ko: Optional[str] = Field(None, max_length=100)
+    name_en: Optional[str] = Field(None, max_length=100)
+    level: Optional[int] = None
+    path: Optional[str] = Field(None, max_length=500)
+    description: Optional[str] = None
+    icon_url: Optional[str] = Field(None, max_length=500)
+    sort_order: Optional[int] = None
+    is_active: Optional[bool] = None
+
+
 class CategoryResponse(CategoryBase):
     id: str
     parent_id: Optional[str] = None
@@ -395,12 +408,31 @@ class ProductListItem(BaseModel):
         from_attributes = True
 
 
+class FacetCount(BaseModel):
+    value: str
+    label: Optional[str] = None
+    count: int
+
+
+class ProductFacets(BaseModel):
+    category: List[FacetCount] = []
+    origin_country: List[FacetCount] = []
+    price_type: List[FacetCount] = []
+    stock_status: List[FacetCount] = []
+
+
 class ProductListResponse(BaseModel):
     products: List[ProductListItem]
     total: int
     page: int
     page_size: int
     total_pages: int
+    facets: Optional[ProductFacets] = None
+
+
+class ProductFacetResponse(BaseModel):
+    total: int
+    facets: ProductFacets
 
 
 # ==========================================
@@ -494,6 +526,19 @@ class ProductRFQResponse(ProductRFQBase):
         from_attributes = True
 
 
+class SupplierMatchItem(BaseModel):
+    company_id: str
+    company_name: Optional[str] = None
+    score: float
+    product_ids: List[str] = []
+
+
+class RFQMatchResponse(BaseModel):
+    rfq_id: str
+    matches: List[SupplierMatchItem]
+    total: int
+
+
 class ProductRFQListItem(BaseModel):
     id: str
     rfq_number: str
@@ -670,6 +715,55 @@ class QuotationComparisonResponse(BaseModel):
     avg_price: float
 
 
+class ComparisonMatrixCell(BaseModel):
+    unit_price: float
+    amount: float  # RFQ 수량 × 단가
+    lead_time: Optional[int] = None
+    moq: Optional[float] = None
+    price_rank: int
+    price_diff_pct: float = 0.0  # 품목 최저가 대비 %
+    is_best_price: bool = False
+    is_fastest: bool = False
+
+
+class ComparisonMatrixSupplier(BaseModel):
+    quotation_id: str
+    quotation_number: str
+    company_id: str
+    company_name: str
+    trust_score: float
+    currency: str
+    incoterms: Optional[str] = None
+    lead_time: Optional[int] = None
+    total_amount: float
+    aligned_total: float  # 견적한 RFQ 품목의 RFQ 수량 × 단가 합계
+    covered_items: int
+    best_price_items: int
+    unmatched_items: int = 0
+
+
+class ComparisonMatrixRow(BaseModel):
+    rfq_item_id: str
+    item_number: int
+    name: str
+    quantity: float
+    unit: Optional[str] = None
+    target_price: Optional[float] = None
+    best_unit_price: Optional[float] = None
+    offer_count: int
+    cells: List[Optional[ComparisonMatrixCell]]  # suppliers 순서
+
+
+class QuotationComparisonMatrixResponse(BaseModel):
+    rfq_id: str
+    rfq_number: str
+    rfq_title: str
+    suppliers: List[ComparisonMatrixSupplier]
+    items: List[ComparisonMatrixRow]
+    total_items: int
+    total_quotations: int
+
+
 # ==========================================
 # TRANSACTION SCHEMAS
 # ==========================================
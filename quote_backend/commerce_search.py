@@ -0,0 +1,226 @@
+"""
+Commerce Search - 상품 / RFQ 전문 검색 (SQLite FTS5)
+ilike '%term%' 전체 스캔 대신 FTS5 인덱스 + BM25 랭킹 사용
+
+- 인덱스: product_fts (products), product_rfq_fts (product_rfqs)
+  contentless 테이블 (content='') → 텍스트 중복 저장 없음
+- 문서 번호: <인덱스>_docs (docid INTEGER PRIMARY KEY ↔ 원본 id)
+  원본 PK 가 문자열이라 암묵적 rowid 는 VACUUM 때 바뀔 수 있음 → rowid 대신 id 로 원본과 연결
+- 동기화: INSERT / UPDATE / DELETE 트리거 (ORM / bulk insert / 직접 SQL 모두 반영)
+- 토크나이저: trigram (한국어는 띄어쓰기 없이 붙여 쓰는 경우가 많아 단어 단위
+  토크나이저로는 부분 일치가 안 됨 → 3글자 단위 색인으로 한/영 모두 부분 일치 지원)
+- 3글자 미만 검색어는 trigram 으로 찾을 수 없으므로 해당 단어만 ilike 로 처리
+- FTS5 를 쓸 수 없는 DB (PostgreSQL / MySQL, FTS5 / trigram 미지원 SQLite < 3.34) 에서는 기존 ilike 검색
+
+Note:
+    이전 형식 (원본 rowid 를 쓰는 external content) 인덱스는 설치 시 삭제 후 재색인
+"""
+
+import sys
+import argparse
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, String, or_, text
+from sqlalchemy.exc import OperationalError
+
+from commerce_models import Product, ProductRFQ
+
+TOKENIZER = "trigram"
+MIN_TERM_LENGTH = 3
+
+# FTS 인덱스가 설치된 engine
+_installed_engines = weakref.WeakSet()
+
+
+class SearchIndex:
+    """원본 테이블 하나에 대한 FTS5 인덱스 정의"""
+
+    def __init__(self, model, name: str, columns: Sequence[str], weights: Sequence[float]):
+        self.model = model
+        self.table = model.__tablename__
+        self.name = name
+        self.columns = tuple(columns)
+        self.weights = tuple(weights)
+        self.docs = f"{name}_docs"
+
+    # ---------- DDL ----------
+
+    def ddl(self) -> List[str]:
+        cols = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{c}" for c in self.columns)
+        old_values = ", ".join(f"old.{c}" for c in self.columns)
+        # contentless 인덱스는 삭제 시 색인했던 값을 그대로 넘겨야 함 (트리거의 old.* 값)
+        delete_old = (f"INSERT INTO {self.name}({self.name}, rowid, {cols}) "
+                      f"SELECT 'delete', docid, {old_values} FROM {self.docs} WHERE id = old.id; "
+                      f"DELETE FROM {self.docs} WHERE id = old.id;")
+        insert_new = (f"INSERT INTO {self.docs}(id) VALUES (new.id); "
+                      f"INSERT INTO {self.name}(rowid, {cols}) "
+                      f"SELECT docid, {new_values} FROM {self.docs} WHERE id = new.id;")
+        return [
+            f"CREATE TABLE IF NOT EXISTS {self.docs} (docid INTEGER PRIMARY KEY, id VARCHAR(36) NOT NULL UNIQUE)",
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5("
+            f"{cols}, content='', tokenize='{TOKENIZER}')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ai AFTER INSERT ON {self.table} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ad AFTER DELETE ON {self.table} BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_au AFTER UPDATE OF id, {cols} ON {self.table} "
+            f"BEGIN {delete_old} {insert_new} END",
+        ]
+
+    def drop(self, conn):
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {self.name}_{suffix}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {self.name}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {self.docs}"))
+
+    def exists(self, conn) -> bool:
+        """현재 형식 인덱스 설치 여부 (문서 번호 테이블이 없으면 이전 형식)"""
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": self.docs}
+        ).first() is not None
+
+    def rebuild(self, conn):
+        cols = ", ".join(self.columns)
+        source_values = ", ".join(f"t.{c}" for c in self.columns)
+        conn.execute(text(f"INSERT INTO {self.name}({self.name}) VALUES ('delete-all')"))
+        conn.execute(text(f"DELETE FROM {self.docs}"))
+        conn.execute(text(f"INSERT INTO {self.docs}(id) SELECT id FROM {self.table}"))
+        conn.execute(text(
+            f"INSERT INTO {self.name}(rowid, {cols}) "
+            f"SELECT d.docid, {source_values} FROM {self.table} t JOIN {self.docs} d ON d.id = t.id"
+        ))
+
+    # ---------- query ----------
+
+    def hits(self, match: str):
+        """MATCH 결과 (hit_id = 원본 id, score) 서브쿼리 - score 는 BM25 (낮을수록 관련도 높음)"""
+        weights = ", ".join(str(w) for w in self.weights)
+        return text(
+            f"SELECT d.id AS hit_id, bm25({self.name}, {weights}) AS score "
+            f"FROM {self.name} JOIN {self.docs} d ON d.docid = {self.name}.rowid "
+            f"WHERE {self.name} MATCH :match"
+        ).bindparams(match=match).columns(hit_id=String, score=Float).subquery(f"{self.name}_hits")
+
+    def ilike(self, term: str):
+        pattern = f"%{term}%"
+        return or_(*[getattr(self.model, c).ilike(pattern) for c in self.columns])
+
+
+# 컬럼 가중치: 이름 / 코드 일치가 설명 일치보다 우선
+PRODUCT_INDEX = SearchIndex(Product, "product_fts", ("name_ko", "name_en", "sku", "description"),
+                            (10.0, 10.0, 8.0, 1.0))
+RFQ_INDEX = SearchIndex(ProductRFQ, "product_rfq_fts", ("title", "rfq_number", "description"),
+                        (10.0, 8.0, 1.0))
+
+SEARCH_INDEXES: Dict[str, SearchIndex] = {
+    PRODUCT_INDEX.name: PRODUCT_INDEX,
+    RFQ_INDEX.name: RFQ_INDEX,
+}
+
+
+def fts5_available(conn) -> bool:
+    """FTS5 + trigram 토크나이저 (SQLite 3.34+) 사용 가능 여부 - 임시 테이블을 만들어 확인"""
+    if conn.dialect.name != "sqlite":
+        return False
+    options = {row[0] for row in conn.execute(text("PRAGMA compile_options"))}
+    if "ENABLE_FTS5" not in options:
+        return False
+    try:
+        with conn.begin_nested():
+            conn.execute(text(f"CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x, tokenize='{TOKENIZER}')"))
+            conn.execute(text("DROP TABLE temp.fts5_probe"))
+    except OperationalError:
+        return False
+    return True
+
+
+def install_search_indexes(engine, rebuild: bool = False) -> bool:
+    """
+    FTS 인덱스 / 동기화 트리거 생성 (이미 있으면 유지)
+
+    새로 만든 인덱스는 기존 데이터로 채움 (rebuild=True 이면 전체 재색인)
+
+    Returns:
+        bool: FTS 검색 사용 가능 여부
+    """
+    try:
+        with engine.begin() as conn:
+            if not fts5_available(conn):
+                return False
+            for index in SEARCH_INDEXES.values():
+                created = not index.exists(conn)
+                if created:
+                    index.drop(conn)  # 이전 형식 인덱스 / 트리거
+                for statement in index.ddl():
+                    conn.execute(text(statement))
+                if created or rebuild:
+                    index.rebuild(conn)
+    except OperationalError as e:
+        # 인덱스를 만들 수 없어도 API 는 기존 ilike 검색으로 동작
+        print(f"[Search] FTS5 search indexes unavailable, using ilike search: {e}")
+        return False
+    _installed_engines.add(engine)
+    return True
+
+
+def is_enabled(db) -> bool:
+    return db.get_bind() in _installed_engines
+
+
+def split_terms(search: Optional[str]) -> List[str]:
+    return [term for term in (search or "").split() if term]
+
+
+def match_expression(terms: Sequence[str]) -> str:
+    """검색어 → FTS5 MATCH 식 (각 단어를 phrase 로 감싸 AND 검색, 특수문자 무력화)"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def apply_search(query, index: SearchIndex, search: Optional[str]) -> Tuple[object, Optional[object]]:
+    """
+    검색 조건 적용
+
+    Args:
+        query: 원본 모델 ORM Query (구조 필터 적용 여부 무관)
+        index: PRODUCT_INDEX / RFQ_INDEX
+        search: 사용자 검색어 (공백 구분 단어는 모두 포함되어야 함)
+
+    Returns:
+        (query, score) - FTS 를 사용한 경우 score 는 정렬용 BM25 컬럼, 아니면 None
+    """
+    terms = split_terms(search)
+    if not terms:
+        return query, None
+
+    if not is_enabled(query.session):
+        for term in terms:
+            query = query.filter(index.ilike(term))
+        return query, None
+
+    indexed = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+    for term in terms:
+        if len(term) < MIN_TERM_LENGTH:
+            query = query.filter(index.ilike(term))
+    if not indexed:
+        return query, None
+
+    hits = index.hits(match_expression(indexed))
+    query = query.join(hits, hits.c.hit_id == index.model.id)
+    return query, hits.c.score
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage commerce full-text search indexes")
+    parser.add_argument("--rebuild", action="store_true", help="모든 인덱스를 원본 테이블에서 재색인")
+    args = parser.parse_args(argv)
+
+    from database import engine
+
+    if not install_search_indexes(engine, rebuild=args.rebuild):
+        print("[SKIP] FTS5 is not available for this database")
+        sys.exit(1)
+    print(f"[OK] Search indexes ready: {', '.join(SEARCH_INDEXES)}" + (" (rebuilt)" if args.rebuild else ""))
+
+
+if __name__ == "__main__":
+    main()
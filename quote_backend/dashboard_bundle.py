@@ -0,0 +1,590 @@
+"""
+Dashboard Bundle - 화주 / 운송사 대시보드 위젯 일괄 조회
+대시보드 화면이 위젯마다 API 를 따로 호출하면서 매번 고객 조회와
+Contract / Bid / Bidding / QuoteRequest / CargoDetail 조인을 반복하던 것을 요청 1회로 묶음
+
+- 화주: 고객의 견적 요청 + 비딩 목록을 기본 쿼리 1회로 읽고
+  수출국 / 수입국 TOP N, 비딩 통계, 분석 요약을 메모리에서 계산
+  (분석 요약의 입찰 금액은 해당 비딩들의 입찰을 한 번에 조회)
+- 운송사: 기간 내 입찰 + 같은 비딩의 경쟁 입찰을 쿼리 1회로 읽어 요약 / 월별 추이 / 순위 계산
+  구간별 Sparkline 은 월별 쿼리 6 × 구간 수 대신 계약 목록 1회 조회로 계산
+- 서로 독립적인 집계 (물량 추이, 컨테이너 효율, 구간 통계) 는 스레드 풀에서 동시에 실행
+  (각 작업은 별도 Session 사용, in-memory SQLite 처럼 연결을 나눌 수 없으면 순차 실행)
+- 결과는 요청 파라미터 단위로 BUNDLE_TTL 초 동안 캐시
+- 각 위젯의 응답 형식 / 기본 기간 / 데이터 없을 때의 예시 데이터는 개별 API 와 동일
+"""
+
+import os
+import time
+import random
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, extract, func
+from sqlalchemy.orm import Session
+
+from models import (
+    Customer, Forwarder, QuoteRequest, CargoDetail, Bidding, Bid, Contract, ContainerType
+)
+from schemas import (
+    AnalyticsPeriod, ShipperAnalyticsSummary, ShipperBiddingStatsResponse,
+    ForwarderAnalyticsSummary, ForwarderMonthlyTrendItem
+)
+
+BUNDLE_TTL = float(os.getenv("DASHBOARD_BUNDLE_TTL", "15"))
+BUNDLE_WORKERS = int(os.getenv("DASHBOARD_BUNDLE_WORKERS", "4"))
+MAX_ENTRIES = 512
+
+EXPORT_INCOTERMS = ('EXW', 'FCA', 'FAS', 'FOB', 'CFR', 'CIF', 'CPT', 'CIP', 'DAP', 'DPU', 'DDP')
+RANKED_BID_STATUSES = ("submitted", "awarded", "rejected")
+FAILED_BIDDING_STATUSES = ("closed", "cancelled", "expired")
+
+# Container max weights (typical values in kg)
+CONTAINER_MAX_WEIGHT = {
+    "20GP": 21800, "20'GP": 21800, "20FT": 21800,
+    "40GP": 26500, "40'GP": 26500, "40FT": 26500,
+    "40HC": 26500, "40'HC": 26500,
+    "20RF": 20000, "20'RF": 20000,
+    "40RF": 26000, "40'RF": 26000,
+    "45HC": 25500, "45'HC": 25500
+}
+
+
+# ==========================================
+# DEMO DATA (데이터가 없을 때 위젯 예시)
+# ==========================================
+
+def demo_volume_trend() -> List[dict]:
+    data = []
+    for i in range(6):
+        month = datetime.now() - timedelta(days=30 * (5 - i))
+        data.append({
+            "month": month.strftime("%Y-%m"),
+            "teu": random.randint(20, 80),
+            "cbm": random.randint(200, 500),
+            "kgs": random.randint(20000, 50000)
+        })
+    return data
+
+
+DEMO_TOP_EXPORT = [
+    {"country": "중국", "count": 15, "volume": 120},
+    {"country": "미국", "count": 12, "volume": 95},
+    {"country": "일본", "count": 8, "volume": 65},
+    {"country": "베트남", "count": 6, "volume": 48},
+    {"country": "태국", "count": 4, "volume": 32}
+]
+
+DEMO_TOP_IMPORT = [
+    {"country": "독일", "count": 10, "volume": 85},
+    {"country": "미국", "count": 8, "volume": 72},
+    {"country": "중국", "count": 7, "volume": 58},
+    {"country": "일본", "count": 5, "volume": 42},
+    {"country": "프랑스", "count": 3, "volume": 25}
+]
+
+DEMO_CONTAINER_EFFICIENCY = [
+    {"container_type": "20'GP", "efficiency": 82, "count": 15},
+    {"container_type": "40'GP", "efficiency": 75, "count": 12},
+    {"container_type": "40'HC", "efficiency": 88, "count": 8},
+    {"container_type": "20'RF", "efficiency": 65, "count": 3}
+]
+
+DEMO_ROUTE_STATS = [
+    {"route": "부산 → LA", "bids": 15, "awards": 8, "award_rate": 53.3, "total_revenue_krw": 120000000, "sparkline": [3, 5, 2, 4, 6, 3]},
+    {"route": "부산 → 상하이", "bids": 12, "awards": 5, "award_rate": 41.7, "total_revenue_krw": 45000000, "sparkline": [2, 3, 4, 3, 5, 4]},
+    {"route": "인천 → 나리타", "bids": 8, "awards": 4, "award_rate": 50.0, "total_revenue_krw": 32000000, "sparkline": [1, 2, 1, 2, 1, 2]},
+    {"route": "부산 → 싱가포르", "bids": 10, "awards": 2, "award_rate": 20.0, "total_revenue_krw": 28000000, "sparkline": [0, 1, 0, 1, 0, 1]},
+    {"route": "광양 → 로테르담", "bids": 6, "awards": 3, "award_rate": 50.0, "total_revenue_krw": 54000000, "sparkline": [1, 1, 0, 2, 1, 1]}
+]
+
+
+# ==========================================
+# DATE RANGES (개별 API 와 같은 기본값)
+# ==========================================
+
+def dashboard_range(from_date: Optional[str], to_date: Optional[str]) -> Tuple[datetime, datetime]:
+    """/api/dashboard/* 기간 (기본: 최근 180일, 형식 오류 시 기본값)"""
+    try:
+        start_date = datetime.strptime(from_date, "%Y-%m-%d") if from_date else datetime.now() - timedelta(days=180)
+        end_date = datetime.strptime(to_date, "%Y-%m-%d") if to_date else datetime.now()
+    except ValueError:
+        start_date = datetime.now() - timedelta(days=180)
+        end_date = datetime.now()
+    return start_date, end_date
+
+
+def analytics_range(from_date: Optional[str], to_date: Optional[str]) -> Tuple[datetime, datetime]:
+    """/api/analytics/* 기간 (기본: 최근 12개월)"""
+    end_date = datetime.strptime(to_date, "%Y-%m-%d") if to_date else datetime.now()
+    start_date = datetime.strptime(from_date, "%Y-%m-%d") if from_date else end_date - timedelta(days=365)
+    return start_date, end_date
+
+
+def _period(start_date: datetime, end_date: datetime) -> AnalyticsPeriod:
+    return AnalyticsPeriod(from_date=start_date.strftime("%Y-%m-%d"), to_date=end_date.strftime("%Y-%m-%d"))
+
+
+# ==========================================
+# CACHE / EXECUTION
+# ==========================================
+
+class BundleCache:
+    """요청 파라미터 → 번들 (TTL + LRU)"""
+
+    def __init__(self, ttl: float = BUNDLE_TTL, max_entries: int = MAX_ENTRIES, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self.clock() - entry[0] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, bundle: dict):
+        with self._lock:
+            self._entries[key] = (self.clock(), bundle)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+bundle_cache = BundleCache()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=BUNDLE_WORKERS, thread_name_prefix="dashboard-bundle")
+        return _executor
+
+
+def can_run_concurrently(bind) -> bool:
+    """작업마다 별도 연결을 쓸 수 있는지 (in-memory SQLite 는 연결 하나를 공유하므로 불가)"""
+    if BUNDLE_WORKERS <= 1:
+        return False
+    if bind.dialect.name == "sqlite":
+        return bind.url.database not in (None, "", ":memory:")
+    return True
+
+
+def run_tasks(db, tasks: Dict[str, Callable]) -> Dict[str, object]:
+    """
+    독립 작업들을 실행 (가능하면 스레드 풀에서 동시에)
+
+    Args:
+        db: 요청 Session (동시 실행 시 bind 만 사용)
+        tasks: 이름 → fn(session)
+    """
+    bind = db.get_bind()
+    if len(tasks) < 2 or not can_run_concurrently(bind):
+        return {name: fn(db) for name, fn in tasks.items()}
+
+    def run(fn):
+        session = Session(bind=bind)
+        try:
+            return fn(session)
+        finally:
+            session.close()
+
+    executor = _get_executor()
+    futures = {name: executor.submit(run, fn) for name, fn in tasks.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def _amount_krw(total_amount_krw, total_amount, to_krw) -> float:
+    return float(total_amount_krw) if total_amount_krw else to_krw(float(total_amount))
+
+
+# ==========================================
+# SHIPPER WIDGETS
+# ==========================================
+
+def shipper_volume_trend(db, customer_id: int, start_date: datetime, end_date: datetime) -> List[dict]:
+    """월별 TEU / CBM / KGS (확정 계약 기준)"""
+    rows = db.query(
+        extract('year', Contract.confirmed_at).label('year'),
+        extract('month', Contract.confirmed_at).label('month'),
+        func.sum(CargoDetail.qty).label('total_qty'),
+        func.sum(CargoDetail.cbm).label('total_cbm'),
+        func.sum(CargoDetail.gross_weight).label('total_kgs')
+    ).join(Bid, Contract.awarded_bid_id == Bid.id
+    ).join(Bidding, Bid.bidding_id == Bidding.id
+    ).join(QuoteRequest, Bidding.quote_request_id == QuoteRequest.id
+    ).join(CargoDetail, CargoDetail.quote_request_id == QuoteRequest.id
+    ).filter(
+        QuoteRequest.customer_id == customer_id,
+        Contract.confirmed_at >= start_date,
+        Contract.confirmed_at <= end_date
+    ).group_by(
+        extract('year', Contract.confirmed_at),
+        extract('month', Contract.confirmed_at)
+    ).order_by('year', 'month').all()
+
+    data = [{
+        "month": f"{int(row.year)}-{int(row.month):02d}",
+        "teu": int(row.total_qty or 0),
+        "cbm": float(row.total_cbm or 0),
+        "kgs": float(row.total_kgs or 0)
+    } for row in rows]
+    return data or demo_volume_trend()
+
+
+def shipper_container_efficiency(db, customer_id: int) -> List[dict]:
+    """FCL 컨테이너 타입별 평균 적재 효율 (약어는 같은 쿼리에서 조인)"""
+    rows = db.query(
+        CargoDetail.container_type,
+        ContainerType.abbreviation,
+        func.count(CargoDetail.id).label('count'),
+        func.avg(CargoDetail.gross_weight).label('avg_weight')
+    ).join(QuoteRequest, CargoDetail.quote_request_id == QuoteRequest.id
+    ).outerjoin(ContainerType, ContainerType.code == CargoDetail.container_type
+    ).filter(
+        QuoteRequest.customer_id == customer_id,
+        QuoteRequest.load_type == 'FCL',
+        CargoDetail.container_type.isnot(None)
+    ).group_by(CargoDetail.container_type, ContainerType.abbreviation).all()
+
+    data = []
+    for row in rows:
+        max_weight = CONTAINER_MAX_WEIGHT.get(row.container_type, 25000)
+        avg_weight = float(row.avg_weight or 0)
+        data.append({
+            "container_type": row.abbreviation or row.container_type,
+            "efficiency": min(100, int((avg_weight / max_weight) * 100)),
+            "count": row.count
+        })
+    return data or list(DEMO_CONTAINER_EFFICIENCY)
+
+
+def shipper_base(db, customer_id: int) -> List[tuple]:
+    """고객의 견적 요청 + 비딩 (비딩 없는 요청도 1행)"""
+    return db.query(
+        QuoteRequest.id, QuoteRequest.pol, QuoteRequest.pod, QuoteRequest.incoterms, QuoteRequest.created_at,
+        Bidding.id, Bidding.status, Bidding.deadline, Bidding.awarded_bid_id
+    ).outerjoin(
+        Bidding, Bidding.quote_request_id == QuoteRequest.id
+    ).filter(QuoteRequest.customer_id == customer_id).order_by(QuoteRequest.id, Bidding.id).all()
+
+
+def top_countries(base: List[tuple], column: int, limit: int, incoterms: Optional[tuple] = None) -> List[dict]:
+    """POL / POD 별 견적 요청 수 TOP N"""
+    requests = {row[0]: row for row in base}
+    counts = Counter(
+        row[column] for row in requests.values()
+        if incoterms is None or row[3] in incoterms
+    )
+    return [{"country": port or "Unknown", "count": count, "volume": count * 10}
+            for port, count in counts.most_common(limit)]
+
+
+def bidding_stats(base: List[tuple], now: datetime) -> dict:
+    """비딩 상태별 건수 (/api/shipper/biddings/stats 와 동일)"""
+    biddings = {row[5]: row for row in base if row[5] is not None}
+    closing_soon_deadline = now + timedelta(hours=24)
+    statuses = Counter(row[6] for row in biddings.values())
+    closing_soon = sum(
+        1 for row in biddings.values()
+        if row[6] == "open" and row[7] is not None and now < row[7] <= closing_soon_deadline
+    )
+    return ShipperBiddingStatsResponse(
+        total_count=len(biddings),
+        open_count=statuses["open"],
+        closing_soon_count=closing_soon,
+        awarded_count=statuses["awarded"],
+        failed_count=sum(statuses[status] for status in FAILED_BIDDING_STATUSES)
+    ).model_dump()
+
+
+def shipper_summary(db, base: List[tuple], start_date: datetime, end_date: datetime, to_krw) -> dict:
+    """분석 요약 KPI (/api/analytics/shipper/summary 와 동일)"""
+    in_range = [row for row in base if row[4] is not None and start_date <= row[4] <= end_date]
+    total_requests = len({row[0] for row in in_range})
+    biddings = {row[5]: row for row in in_range if row[5] is not None}
+    total_biddings = len(biddings)
+
+    avg_bids = award_rate = total_cost_krw = avg_saving_rate = 0
+    if biddings:
+        bids = db.query(
+            Bid.id, Bid.bidding_id, Bid.status, Bid.total_amount_krw, Bid.total_amount
+        ).filter(Bid.bidding_id.in_(list(biddings))).all()
+        by_id = {bid.id: bid for bid in bids}
+        ranked: Dict[int, List[float]] = defaultdict(list)
+        for bid in bids:
+            if bid.status in RANKED_BID_STATUSES:
+                ranked[bid.bidding_id].append(_amount_krw(bid.total_amount_krw, bid.total_amount, to_krw))
+
+        total_bids = sum(1 for bid in bids if bid.status == "submitted")
+        awarded_count = sum(1 for row in biddings.values() if row[6] == "awarded")
+        avg_bids = total_bids / total_biddings
+        award_rate = awarded_count / total_biddings * 100
+
+        saving_rates = []
+        for bidding_id, row in biddings.items():
+            awarded_bid = by_id.get(row[8]) if row[6] == "awarded" and row[8] else None
+            if awarded_bid is None:
+                continue
+            bid_amount = _amount_krw(awarded_bid.total_amount_krw, awarded_bid.total_amount, to_krw)
+            total_cost_krw += bid_amount
+            if ranked[bidding_id]:
+                max_bid = max(ranked[bidding_id])
+                if max_bid > 0:
+                    saving_rates.append((max_bid - bid_amount) / max_bid * 100)
+        avg_saving_rate = sum(saving_rates) / len(saving_rates) if saving_rates else 0
+
+    return ShipperAnalyticsSummary(
+        period=_period(start_date, end_date),
+        total_requests=total_requests,
+        total_biddings=total_biddings,
+        avg_bids_per_request=round(avg_bids, 1),
+        award_rate=round(award_rate, 1),
+        total_cost_krw=round(total_cost_krw, 0),
+        avg_saving_rate=round(avg_saving_rate, 1)
+    ).model_dump()
+
+
+def build_shipper_bundle(db, customer_id: int, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                         limit: int = 5, to_krw=None, now: Optional[datetime] = None) -> dict:
+    """화주 대시보드 위젯 전체 (캐시 미사용)"""
+    now = now or datetime.now()
+    start_date, end_date = dashboard_range(from_date, to_date)
+    summary_start, summary_end = analytics_range(from_date, to_date)
+
+    def overview(session):
+        base = shipper_base(session, customer_id)
+        return {
+            "top_export": top_countries(base, 1, limit, EXPORT_INCOTERMS) or list(DEMO_TOP_EXPORT),
+            "top_import": top_countries(base, 2, limit) or list(DEMO_TOP_IMPORT),
+            "bidding_stats": bidding_stats(base, now),
+            "summary": shipper_summary(session, base, summary_start, summary_end, to_krw),
+        }
+
+    results = run_tasks(db, {
+        "overview": overview,
+        "volume_trend": lambda session: shipper_volume_trend(session, customer_id, start_date, end_date),
+        "container_efficiency": lambda session: shipper_container_efficiency(session, customer_id),
+    })
+    widgets = results.pop("overview")
+    widgets.update(results)
+    return widgets
+
+
+# ==========================================
+# FORWARDER WIDGETS
+# ==========================================
+
+def forwarder_ranked_bids(db, forwarder_id: int, start_date: datetime, end_date: datetime, to_krw):
+    """
+    기간 내 운송사 입찰 + 각 입찰의 비딩 내 가격 순위 (쿼리 1회)
+
+    Returns:
+        list of (bid row, rank)
+    """
+    own = db.query(Bid.bidding_id).filter(
+        Bid.forwarder_id == forwarder_id,
+        Bid.created_at >= start_date,
+        Bid.created_at <= end_date,
+        Bid.status.in_(RANKED_BID_STATUSES)
+    )
+    rows = db.query(
+        Bid.id, Bid.bidding_id, Bid.forwarder_id, Bid.status, Bid.created_at,
+        Bid.total_amount_krw, Bid.total_amount
+    ).filter(
+        Bid.bidding_id.in_(own.scalar_subquery()),
+        Bid.status.in_(RANKED_BID_STATUSES)
+    ).order_by(Bid.id).all()
+
+    by_bidding = defaultdict(list)
+    for row in rows:
+        by_bidding[row.bidding_id].append(row)
+    ranks = {}
+    for bids in by_bidding.values():
+        ordered = sorted(bids, key=lambda b: _amount_krw(b.total_amount_krw, b.total_amount, to_krw))
+        for rank, bid in enumerate(ordered, 1):
+            ranks[bid.id] = rank
+
+    return [
+        (row, ranks[row.id]) for row in rows
+        if row.forwarder_id == forwarder_id and row.created_at is not None
+        and start_date <= row.created_at <= end_date
+    ]
+
+
+def forwarder_summary(ranked, rating, start_date: datetime, end_date: datetime, to_krw) -> dict:
+    """분석 요약 KPI (/api/analytics/forwarder/summary 와 동일)"""
+    total_bids = len(ranked)
+    awarded = [bid for bid, _ in ranked if bid.status == "awarded"]
+    rejected_count = sum(1 for bid, _ in ranked if bid.status == "rejected")
+    ranks = [rank for _, rank in ranked]
+    return ForwarderAnalyticsSummary(
+        period=_period(start_date, end_date),
+        total_bids=total_bids,
+        awarded_count=len(awarded),
+        rejected_count=rejected_count,
+        award_rate=round((len(awarded) / total_bids * 100) if total_bids > 0 else 0, 1),
+        avg_rank=round(sum(ranks) / len(ranks) if ranks else 0, 1),
+        total_revenue_krw=round(sum(_amount_krw(b.total_amount_krw, b.total_amount, to_krw) for b in awarded), 0),
+        avg_rating=float(rating) if rating else 3.0
+    ).model_dump()
+
+
+def forwarder_monthly_trend(ranked, to_krw) -> List[dict]:
+    """월별 입찰 / 낙찰 / 탈락 / 수주액 / 평균 순위"""
+    months = defaultdict(lambda: {"bid_count": 0, "awarded_count": 0, "rejected_count": 0,
+                                  "revenue_krw": 0, "ranks": []})
+    for bid, rank in ranked:
+        month = months[bid.created_at.strftime("%Y-%m")]
+        month["bid_count"] += 1
+        if bid.status == "awarded":
+            month["awarded_count"] += 1
+            month["revenue_krw"] += _amount_krw(bid.total_amount_krw, bid.total_amount, to_krw)
+        elif bid.status == "rejected":
+            month["rejected_count"] += 1
+        month["ranks"].append(rank)
+
+    items = []
+    for key in sorted(months):
+        month = months[key]
+        items.append(ForwarderMonthlyTrendItem(
+            month=key,
+            bid_count=month["bid_count"],
+            awarded_count=month["awarded_count"],
+            rejected_count=month["rejected_count"],
+            revenue_krw=round(month["revenue_krw"], 0),
+            avg_rank=round(sum(month["ranks"]) / len(month["ranks"]), 1)
+        ).model_dump())
+    return items
+
+
+def forwarder_route_stats(db, forwarder_id: int, start_date: datetime, end_date: datetime, limit: int,
+                          now: Optional[datetime] = None) -> List[dict]:
+    """구간별 입찰 / 낙찰 / 수주액 + 최근 6개월 (30일 단위) 낙찰 Sparkline"""
+    now = now or datetime.now()
+    routes = db.query(
+        QuoteRequest.pol,
+        QuoteRequest.pod,
+        func.count(Bid.id).label('total_bids'),
+        func.sum(case((Contract.id.isnot(None), 1), else_=0)).label('awards'),
+        func.sum(case((Contract.id.isnot(None), Contract.total_amount_krw), else_=0)).label('total_revenue')
+    ).join(Bidding, Bidding.quote_request_id == QuoteRequest.id
+    ).join(Bid, Bid.bidding_id == Bidding.id
+    ).outerjoin(Contract, Contract.awarded_bid_id == Bid.id
+    ).filter(
+        Bid.forwarder_id == forwarder_id,
+        Bid.created_at >= start_date,
+        Bid.created_at <= end_date
+    ).group_by(QuoteRequest.pol, QuoteRequest.pod
+    ).order_by(func.count(Bid.id).desc()
+    ).limit(limit).all()
+
+    sparklines = defaultdict(lambda: [0] * 6)
+    if routes:
+        window_start = now - timedelta(days=180)
+        contracts = db.query(QuoteRequest.pol, QuoteRequest.pod, Contract.confirmed_at
+        ).select_from(Contract
+        ).join(Bid, Contract.awarded_bid_id == Bid.id
+        ).join(Bidding, Bid.bidding_id == Bidding.id
+        ).join(QuoteRequest, Bidding.quote_request_id == QuoteRequest.id
+        ).filter(
+            Bid.forwarder_id == forwarder_id,
+            Contract.confirmed_at >= window_start,
+            Contract.confirmed_at < now
+        ).all()
+        for pol, pod, confirmed_at in contracts:
+            sparklines[(pol, pod)][min(5, (confirmed_at - window_start).days // 30)] += 1
+
+    data = []
+    for row in routes:
+        total_bids = row.total_bids or 0
+        awards = row.awards or 0
+        data.append({
+            "route": f"{row.pol} → {row.pod}",
+            "bids": total_bids,
+            "awards": awards,
+            "award_rate": round((awards / total_bids) * 100, 1) if total_bids > 0 else 0,
+            "total_revenue_krw": int(row.total_revenue or 0),
+            "sparkline": list(sparklines[(row.pol, row.pod)])
+        })
+    return data or list(DEMO_ROUTE_STATS)
+
+
+def build_forwarder_bundle(db, forwarder, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                           limit: int = 10, to_krw=None, now: Optional[datetime] = None) -> dict:
+    """운송사 대시보드 위젯 전체 (캐시 미사용)"""
+    now = now or datetime.now()
+    forwarder_id, rating = forwarder.id, forwarder.rating
+    start_date, end_date = analytics_range(from_date, to_date)
+    route_start, route_end = dashboard_range(from_date, to_date)
+
+    def overview(session):
+        ranked = forwarder_ranked_bids(session, forwarder_id, start_date, end_date, to_krw)
+        return {
+            "summary": forwarder_summary(ranked, rating, start_date, end_date, to_krw),
+            "monthly_trend": {
+                "period": _period(start_date, end_date).model_dump(),
+                "data": forwarder_monthly_trend(ranked, to_krw),
+            },
+        }
+
+    results = run_tasks(db, {
+        "overview": overview,
+        "route_stats": lambda session: forwarder_route_stats(session, forwarder_id, route_start, route_end,
+                                                             limit, now),
+    })
+    widgets = results.pop("overview")
+    widgets.update(results)
+    return widgets
+
+
+# ==========================================
+# ENTRY POINTS
+# ==========================================
+
+def resolve_customer_id(db, customer_email: Optional[str], customer_id: Optional[int]) -> Optional[int]:
+    if customer_email and not customer_id:
+        customer = db.query(Customer.id).filter(Customer.email == customer_email).first()
+        return customer.id if customer else None
+    return customer_id
+
+
+def resolve_forwarder(db, forwarder_email: Optional[str], forwarder_id: Optional[int]):
+    query = db.query(Forwarder.id, Forwarder.rating)
+    if forwarder_id:
+        return query.filter(Forwarder.id == forwarder_id).first()
+    if forwarder_email:
+        return query.filter(Forwarder.email == forwarder_email).first()
+    return None
+
+
+def cached_bundle(key: tuple, build: Callable[[], dict]) -> dict:
+    """캐시된 번들 반환 (없거나 만료됐으면 build())"""
+    bundle = bundle_cache.get(key)
+    if bundle is None:
+        bundle = {"widgets": build(), "generated_at": datetime.now().isoformat(timespec="seconds")}
+        bundle_cache.put(key, bundle)
+    return bundle
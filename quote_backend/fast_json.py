@@ -0,0 +1,197 @@
+"""
+Fast JSON - 핫 경로 응답 직렬화
+목록형 응답(비딩 목록, 분석 시계열, 항구 목록, 상품 목록)은 FastAPI 기본 경로에서
+response_model 검증 → jsonable_encoder → json.dumps 를 거치며 항목 수에 비례해 비용이 커짐
+
+- FastJSONResponse: orjson 기반 응답 클래스 (orjson 미설치 시 json 으로 대체)
+- serializer_for(): 스키마 필드 정보로 미리 만든 변환 함수 (ORM row / dict / 모델 → dict)
+  신뢰할 수 있는 DB row 를 Pydantic 검증 없이 바로 JSON 호환 dict 로 변환
+- fast_response(): FAST_JSON_RESPONSES 가 켜져 있을 때만 위 경로 사용 (opt-in)
+
+출력은 Pydantic 직렬화 결과와 동일하도록 맞춤 (float 필드의 Decimal → float,
+datetime → ISO 8601 문자열)
+"""
+
+import os
+import json
+import types
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Union, get_args, get_origin
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+FAST_JSON_ENABLED = os.getenv("FAST_JSON_RESPONSES", "false").lower() in ("1", "true", "yes", "on")
+
+
+def _default(obj):
+    """orjson / json 이 기본으로 처리하지 못하는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(value) -> bytes:
+    """JSON bytes (compact, UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        value, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 으로 렌더링하는 JSONResponse (default_response_class 용)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# ==========================================
+# PRECOMPILED SERIALIZERS
+# ==========================================
+
+def _identity(value):
+    return value
+
+
+def _to_float(value):
+    return float(value)
+
+
+def _to_int(value):
+    return int(value)
+
+
+def _to_bool(value):
+    return bool(value)
+
+
+_SCALARS = {float: _to_float, int: _to_int, bool: _to_bool}
+
+
+def _optional(convert: Callable) -> Callable:
+    def convert_optional(value):
+        return None if value is None else convert(value)
+    return convert_optional
+
+
+def _list_of(convert: Callable) -> Callable:
+    def convert_list(values):
+        return [convert(v) for v in values]
+    return convert_list
+
+
+def _converter(annotation) -> Callable:
+    """타입 어노테이션 → 값 변환 함수"""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union or origin is getattr(types, "UnionType", None):
+        members = [a for a in args if a is not type(None)]
+        if len(members) == 1:
+            inner = _converter(members[0])
+            return _identity if inner is _identity else _optional(inner)
+        return _identity
+
+    if origin in (list, tuple, set, frozenset):
+        inner = _converter(args[0]) if args else _identity
+        return _list_of(inner) if inner is not _identity else list
+
+    if annotation in _SCALARS:
+        return _SCALARS[annotation]
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _compile_model(annotation)
+
+    # str / datetime / Dict[str, Any] 등은 dumps() 에서 그대로 처리
+    return _identity
+
+
+@lru_cache(maxsize=None)
+def _compile_model(model: type) -> Callable:
+    """
+    모델 필드 정보로 변환 함수 생성
+
+    필드마다 getattr / 루프를 도는 대신 필드 목록을 펼친 dict 리터럴 함수를 만들어 사용
+    (ORM row 는 속성 직접 접근, 속성이 없는 객체나 dict 는 기본값 적용 경로)
+    """
+    namespace = {}
+    attr_items, get_items = [], []
+    for index, (name, info) in enumerate(model.model_fields.items()):
+        key = info.serialization_alias or info.alias or name
+        default = None if info.is_required() else info.get_default(call_default_factory=True)
+        convert = _converter(info.annotation)
+        namespace[f"_d{index}"] = default
+        attr_value, get_value = f"o.{name}", f"g({name!r}, _d{index})"
+        if convert is not _identity:
+            namespace[f"_c{index}"] = convert
+            attr_value = f"(None if (v := o.{name}) is None else _c{index}(v))"
+            get_value = f"(None if (v := g({name!r}, _d{index})) is None else _c{index}(v))"
+        attr_items.append(f"{key!r}: {attr_value}")
+        get_items.append(f"{key!r}: {get_value}")
+
+    source = (
+        "def from_attributes(o):\n"
+        f"    return {{{', '.join(attr_items)}}}\n"
+        "def from_getter(g):\n"
+        f"    return {{{', '.join(get_items)}}}\n"
+    )
+    exec(compile(source, f"<fast_json {model.__name__}>", "exec"), namespace)
+    from_attributes, from_getter = namespace["from_attributes"], namespace["from_getter"]
+
+    # 일부 필드 속성이 없는 타입 (예: Product 에는 company_name 이 없음) → 기본값 경로 사용
+    partial_types = set()
+
+    def serialize(obj) -> dict:
+        if isinstance(obj, dict):
+            return from_getter(obj.get)
+        if type(obj) not in partial_types:
+            try:
+                return from_attributes(obj)
+            except AttributeError:
+                partial_types.add(type(obj))
+        return from_getter(lambda name, default: getattr(obj, name, default))
+
+    serialize.__name__ = f"serialize_{model.__name__}"
+    return serialize
+
+
+@lru_cache(maxsize=64)
+def serializer_for(response_model) -> Callable:
+    """
+    response_model 에 맞는 변환 함수 (모델 클래스 또는 List[Model])
+
+    반환된 함수는 ORM 객체 / dict / Pydantic 모델(model_construct 포함)을
+    검증 없이 JSON 호환 dict (또는 list) 로 변환함 - 신뢰할 수 있는 DB 데이터 전용
+    """
+    return _converter(response_model)
+
+
+def dump(value, response_model) -> bytes:
+    """response_model 기준 JSON bytes (검증 생략)"""
+    return dumps(serializer_for(response_model)(value))
+
+
+def fast_response(value, response_model):
+    """
+    FAST_JSON_RESPONSES 활성화 시 미리 직렬화한 Response 반환,
+    비활성화 시 value 를 그대로 반환 (FastAPI 가 response_model 로 검증/직렬화)
+    """
+    if not FAST_JSON_ENABLED:
+        return value
+    return Response(content=dump(value, response_model), media_type="application/json")
@@ -2,203 +2,266 @@
 """
 Import Port Data from Excel Files to Database
 Supports both Air Ports and Sea Ports
+
+Pipeline (행 단위 루프 / 행마다 존재 여부 조회 없음):
+    1. Excel 읽기 → pandas 에서 컬럼 정규화 (code / name / country / country_code)
+    2. Air + Sea 를 메모리에서 병합 (양쪽에 있는 코드는 port_type='both')
+    3. 현재 DB 와 비교해 추가 / 변경 / 비활성화 diff 계산
+    4. 변경분만 INSERT ... ON CONFLICT(code) DO UPDATE 로 chunk 단위 반영 (단일 트랜잭션)
+    5. 파일에서 사라진 항구는 삭제하지 않고 is_active=False 로 비활성화
+
+Usage:
+    python import_ports.py
+    python import_ports.py --air AIR.xls --sea SEA.xls --dry-run
 """
 
 import pandas as pd
 import sys
 import os
+import argparse
 
 # Set console encoding
-sys.stdout.reconfigure(encoding='utf-8')
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+from sqlalchemy import select, update
 
 from database import SessionLocal, engine
 from models import Port, Base
+from response_cache import bump_data_version, PORTS
 
 # Excel file paths
 AIR_PORT_PATH = r"D:\Planning_data\네오헬리우스MTO\기획자료\MDM\PORT\PORT CODE DB_ALIGNED.xls"
 SEA_PORT_PATH = r"D:\Planning_data\네오헬리우스MTO\기획자료\MDM\PORT\PORT CODE_DB2_ALIGNED.xls"
 
+CHUNK_SIZE = 2000
 
-def import_air_ports(db):
-    """Import air port data from Excel"""
-    try:
-        df = pd.read_excel(AIR_PORT_PATH, engine='xlrd')
-        print(f"[AIR] File loaded: {len(df)} rows")
-        
-        added_count = 0
-        for idx, row in df.iterrows():
-            code = row['Location']
-            name = row['Location Name']
-            country_code = row.get('Country', None)
-            country_name = row.get('Country Name', None)
-            
-            if pd.isna(code) or pd.isna(name):
-                continue
-            
-            code = str(code).strip().upper()
-            name = str(name).strip()
-            
-            if pd.isna(country_code):
-                country_code = 'XX'
-            else:
-                country_code = str(country_code).strip().upper()[:2]
-            
-            if pd.isna(country_name):
-                country_name = 'Unknown'
-            else:
-                country_name = str(country_name).strip()
-            
-            port = Port(
-                code=code,
-                name=name,
-                name_ko=None,
-                country=country_name,
-                country_code=country_code,
-                port_type='air',
-                is_active=True
-            )
-            db.add(port)
-            added_count += 1
-            
-            if added_count % 500 == 0:
-                db.commit()
-                print(f"[AIR] Progress: {added_count} ports...")
-        
-        db.commit()
-        print(f"[AIR] Completed: {added_count} air ports added")
-        return added_count
-        
-    except Exception as e:
-        print(f"[AIR ERROR] {e}")
-        return 0
+# Excel 컬럼 → ports 컬럼
+SOURCE_COLUMNS = {
+    'Location': 'code',
+    'Location Name': 'name',
+    'Country': 'country_code',
+    'Country Name': 'country',
+}
 
+# diff 비교 대상 컬럼 (name_ko 는 파일에 없으므로 기존 값 유지)
+COMPARE_COLUMNS = ['name', 'country', 'country_code', 'port_type']
 
-def import_sea_ports(db):
-    """Import sea port data from Excel"""
-    try:
-        df = pd.read_excel(SEA_PORT_PATH, engine='xlrd')
-        print(f"[SEA] File loaded: {len(df)} rows")
-        
-        added_count = 0
-        skipped_count = 0
-        
-        for idx, row in df.iterrows():
-            code = row['Location']
-            name = row['Location Name']
-            country_code = row.get('Country', None)
-            country_name = row.get('Country Name', None)
-            
-            if pd.isna(code) or pd.isna(name):
-                skipped_count += 1
-                continue
-            
-            code = str(code).strip().upper()
-            name = str(name).strip()
-            
-            # Check if same code already exists (might be air port)
-            existing = db.query(Port).filter(Port.code == code).first()
-            if existing:
-                # Update to 'both' if it was 'air'
-                if existing.port_type == 'air':
-                    existing.port_type = 'both'
-                skipped_count += 1
-                continue
-            
-            if pd.isna(country_code):
-                country_code = 'XX'
-            else:
-                country_code = str(country_code).strip().upper()[:2]
-            
-            if pd.isna(country_name):
-                country_name = 'Unknown'
-            else:
-                country_name = str(country_name).strip()
-            
-            port = Port(
-                code=code,
-                name=name,
-                name_ko=None,
-                country=country_name,
-                country_code=country_code,
-                port_type='ocean',
-                is_active=True
-            )
-            db.add(port)
-            added_count += 1
-            
-            if added_count % 5000 == 0:
-                db.commit()
-                print(f"[SEA] Progress: {added_count} ports...")
-        
-        db.commit()
-        print(f"[SEA] Completed: {added_count} sea ports added, {skipped_count} skipped/updated")
-        return added_count
-        
-    except Exception as e:
-        print(f"[SEA ERROR] {e}")
-        import traceback
-        traceback.print_exc()
+
+# ==========================================
+# READ & NORMALIZE
+# ==========================================
+
+def normalize_ports(df):
+    """
+    원본 DataFrame → 정규화된 항구 DataFrame (code 기준 중복 제거)
+
+    Returns:
+        DataFrame[code, name, country, country_code] (code 는 대문자, 없는 국가는 XX / Unknown)
+    """
+    df = df.rename(columns=SOURCE_COLUMNS)
+    for column in SOURCE_COLUMNS.values():
+        if column not in df.columns:
+            df[column] = None
+
+    df = df[df['code'].notna() & df['name'].notna()]
+    frame = pd.DataFrame({
+        'code': df['code'].astype(str).str.strip().str.upper(),
+        'name': df['name'].astype(str).str.strip(),
+        'country': df['country'].where(df['country'].notna(), 'Unknown').astype(str).str.strip(),
+        'country_code': df['country_code'].where(df['country_code'].notna(), 'XX')
+                        .astype(str).str.strip().str.upper().str[:2],
+    })
+    frame = frame[(frame['code'] != '') & (frame['name'] != '')]
+    return frame.drop_duplicates(subset='code', keep='first').reset_index(drop=True)
+
+
+def load_ports(path, label):
+    df = pd.read_excel(path, engine='xlrd')
+    frame = normalize_ports(df)
+    print(f"[{label}] File loaded: {len(df)} rows -> {len(frame)} unique ports")
+    return frame
+
+
+def merge_ports(air, sea):
+    """
+    Air / Sea 항구 병합
+
+    같은 코드가 양쪽에 있으면 port_type='both' (이름 / 국가 정보는 Air 우선)
+    """
+    merged = air.merge(sea, on='code', how='outer', suffixes=('', '_sea'), indicator=True)
+    for column in ('name', 'country', 'country_code'):
+        merged[column] = merged[column].fillna(merged[f'{column}_sea'])
+    merged['port_type'] = merged['_merge'].map({'left_only': 'air', 'right_only': 'ocean', 'both': 'both'}).astype(str)
+    return merged[['code', 'name', 'country', 'country_code', 'port_type']].sort_values('code').reset_index(drop=True)
+
+
+# ==========================================
+# DIFF & UPSERT
+# ==========================================
+
+def read_existing_ports(conn):
+    table = Port.__table__
+    rows = conn.execute(select(
+        table.c.code, table.c.name, table.c.country, table.c.country_code, table.c.port_type, table.c.is_active
+    )).all()
+    return pd.DataFrame(rows, columns=['code', *COMPARE_COLUMNS, 'is_active'])
+
+
+def diff_ports(existing, incoming):
+    """
+    DB 현재 상태와 새 항구 목록 비교
+
+    Returns:
+        dict(added=DataFrame, updated=DataFrame, deactivated=[code], unchanged=int)
+        updated 에는 값이 바뀌었거나 비활성 상태였다가 다시 나타난 항구가 포함됨
+    """
+    joined = incoming.merge(existing, on='code', how='left', suffixes=('', '_db'), indicator=True)
+    is_new = joined['_merge'] == 'left_only'
+
+    changed = pd.Series(False, index=joined.index)
+    for column in COMPARE_COLUMNS:
+        changed |= joined[column] != joined[f'{column}_db']
+    changed |= ~joined['is_active'].eq(True)
+    is_updated = ~is_new & changed
+
+    active = existing[existing['is_active'].eq(True)]
+    deactivated = sorted(set(active['code']) - set(incoming['code']))
+
+    columns = list(incoming.columns)
+    return {
+        'added': joined.loc[is_new, columns].reset_index(drop=True),
+        'updated': joined.loc[is_updated, columns].reset_index(drop=True),
+        'deactivated': deactivated,
+        'unchanged': int((~is_new & ~changed).sum()),
+    }
+
+
+def _insert(dialect_name):
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def upsert_ports(conn, frame, chunk_size=CHUNK_SIZE):
+    """INSERT ... ON CONFLICT(code) DO UPDATE (chunk 단위 executemany)"""
+    if frame.empty:
         return 0
+    table = Port.__table__
+    stmt = _insert(conn.dialect.name)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.code],
+        set_={
+            'name': stmt.excluded.name,
+            'country': stmt.excluded.country,
+            'country_code': stmt.excluded.country_code,
+            'port_type': stmt.excluded.port_type,
+            'is_active': stmt.excluded.is_active,
+        },
+    )
+    records = frame.assign(is_active=True).to_dict('records')
+    for start in range(0, len(records), chunk_size):
+        conn.execute(stmt, records[start:start + chunk_size])
+    return len(records)
+
+
+def deactivate_ports(conn, codes, chunk_size=CHUNK_SIZE):
+    table = Port.__table__
+    for start in range(0, len(codes), chunk_size):
+        conn.execute(
+            update(table).where(table.c.code.in_(codes[start:start + chunk_size])).values(is_active=False)
+        )
+    return len(codes)
+
 
+def sync_ports(conn, incoming, chunk_size=CHUNK_SIZE, dry_run=False):
+    """
+    새 항구 목록을 DB 에 반영 (호출 측 트랜잭션 안에서 실행)
 
-def import_all_ports():
+    Returns:
+        dict: added / updated / deactivated / unchanged 건수와 코드 샘플
+    """
+    diff = diff_ports(read_existing_ports(conn), incoming)
+    if not dry_run:
+        upsert_ports(conn, pd.concat([diff['added'], diff['updated']], ignore_index=True), chunk_size)
+        deactivate_ports(conn, diff['deactivated'], chunk_size)
+    return {
+        'added': len(diff['added']),
+        'updated': len(diff['updated']),
+        'deactivated': len(diff['deactivated']),
+        'unchanged': diff['unchanged'],
+        'samples': {
+            'added': diff['added']['code'].head(5).tolist(),
+            'updated': diff['updated']['code'].head(5).tolist(),
+            'deactivated': diff['deactivated'][:5],
+        },
+    }
+
+
+# ==========================================
+# ENTRY POINT
+# ==========================================
+
+def import_all_ports(air_path=AIR_PORT_PATH, sea_path=SEA_PORT_PATH, chunk_size=CHUNK_SIZE, dry_run=False):
     """Import all ports (air and sea) to database"""
     print("\n" + "="*50)
-    print("PORT DATA IMPORT")
+    print("PORT DATA IMPORT" + (" (DRY RUN)" if dry_run else ""))
     print("="*50 + "\n")
-    
-    db = SessionLocal()
-    
+
     try:
-        # Clear existing data
-        existing_count = db.query(Port).count()
-        print(f"[INFO] Existing ports in DB: {existing_count}")
-        
-        db.query(Port).delete()
-        db.commit()
-        print(f"[INFO] Cleared existing port data\n")
-        
-        # Import air ports first
-        air_count = import_air_ports(db)
-        print()
-        
-        # Import sea ports
-        sea_count = import_sea_ports(db)
-        print()
-        
-        # Summary
-        total_in_db = db.query(Port).count()
-        air_in_db = db.query(Port).filter(Port.port_type == 'air').count()
-        sea_in_db = db.query(Port).filter(Port.port_type == 'ocean').count()
-        both_in_db = db.query(Port).filter(Port.port_type == 'both').count()
-        
+        # 파일 읽기 / 정규화 / 병합은 DB 락 없이 메모리에서 처리
+        air = load_ports(air_path, "AIR")
+        sea = load_ports(sea_path, "SEA")
+        incoming = merge_ports(air, sea)
+        print(f"[INFO] Merged: {len(incoming)} ports\n")
+
+        Base.metadata.create_all(bind=engine, tables=[Port.__table__])
+        # 쓰기는 diff 된 행만, 한 트랜잭션으로
+        with engine.begin() as conn:
+            report = sync_ports(conn, incoming, chunk_size=chunk_size, dry_run=dry_run)
+
+        if not dry_run and (report['added'] or report['updated'] or report['deactivated']):
+            # API 응답 캐시 / 항구 데이터 파생 인덱스 무효화
+            db = SessionLocal()
+            try:
+                bump_data_version(db, PORTS)
+            finally:
+                db.close()
+
         print("="*50)
         print("IMPORT SUMMARY")
         print("="*50)
-        print(f"Total ports in DB: {total_in_db}")
-        print(f"  - Air ports:  {air_in_db}")
-        print(f"  - Sea ports:  {sea_in_db}")
-        print(f"  - Both types: {both_in_db}")
+        print(f"  - Added:       {report['added']}")
+        print(f"  - Updated:     {report['updated']}")
+        print(f"  - Deactivated: {report['deactivated']}")
+        print(f"  - Unchanged:   {report['unchanged']}")
+        print(f"  Types: air={int((incoming['port_type'] == 'air').sum())}, "
+              f"ocean={int((incoming['port_type'] == 'ocean').sum())}, "
+              f"both={int((incoming['port_type'] == 'both').sum())}")
         print("="*50)
-        
-        # Show samples
-        print("\n[SAMPLE] Air ports:")
-        for p in db.query(Port).filter(Port.port_type == 'air').limit(5).all():
-            print(f"  {p.code}: {p.name} ({p.country_code})")
-        
-        print("\n[SAMPLE] Sea ports:")
-        for p in db.query(Port).filter(Port.port_type == 'ocean').limit(5).all():
-            print(f"  {p.code}: {p.name} ({p.country_code})")
-        
+        for kind, codes in report['samples'].items():
+            if codes:
+                print(f"[SAMPLE] {kind}: {', '.join(codes)}")
+        return report
+
     except Exception as e:
         print(f"[ERROR] {e}")
         import traceback
         traceback.print_exc()
-        db.rollback()
-    finally:
-        db.close()
+        return None
 
 
-if __name__ == "__main__":
-    import_all_ports()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import air/sea port master data")
+    parser.add_argument("--air", default=AIR_PORT_PATH, help="Air port Excel file")
+    parser.add_argument("--sea", default=SEA_PORT_PATH, help="Sea port Excel file")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="diff 만 출력하고 DB 는 변경하지 않음")
+    args = parser.parse_args(argv)
+    import_all_ports(args.air, args.sea, chunk_size=args.chunk_size, dry_run=args.dry_run)
 
+
+if __name__ == "__main__":
+    main()
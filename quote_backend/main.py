@@ -3,9 +3,9 @@ FastAPI Backend - Quote Request System
 Main Application Entry Point
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse, JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_, func
 from typing import List, Optional
@@ -136,6 +136,13 @@ from schemas import (
     ForwarderProfileResponse, ForwarderTopRoute, ForwarderShippingModeStats, ForwarderReviewItem
 )
 from pdf_generator import RFQPDFGenerator
+from sql_metrics import SQLMetricsMiddleware, install_sql_hooks, registry as sql_metrics_registry
+import response_cache
+import fast_json
+import dashboard_bundle
+import bidding_stats
+from fast_json import FastJSONResponse
+from response_cache import reference_cache
 import hashlib
 import secrets
 import bcrypt
@@ -179,11 +186,16 @@ from commerce_api import router as commerce_router
 # Create tables for ALL models (quote_backend + commerce)
 Base.metadata.create_all(bind=engine)
 
+# Commerce 전문 검색 인덱스 (SQLite FTS5 + trigram, 미지원 / 설치 실패 시 ilike 검색 - 예외 없음)
+from commerce_search import install_search_indexes
+install_search_indexes(engine)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AAL Quote & Commerce API",
     description="API for international shipping quotes and B2B commerce",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=FastJSONResponse if fast_json.FAST_JSON_ENABLED else JSONResponse
 )
 
 # CORS Configuration
@@ -202,6 +214,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# SQL 계측 (요청별 쿼리 수 / DB 시간 → Server-Timing 헤더, /metrics)
+install_sql_hooks(engine)
+app.add_middleware(SQLMetricsMiddleware)
+
 # Register Commerce Router
 app.include_router(commerce_router)
 
@@ -591,31 +607,44 @@ def get_ports(
     
     # Apply limit (max 200)
     limit = min(limit, 200)
-    return query.order_by(Port.country_code, Port.name).limit(limit).all()
+    ports = query.order_by(Port.country_code, Port.name).limit(limit).all()
+    return fast_json.fast_response(ports, List[PortResponse])
 
 
 @app.get("/api/container-types", response_model=List[ContainerTypeResponse], tags=["Reference Data"])
-def get_container_types(db: Session = Depends(get_db)):
+def get_container_types(request: Request, db: Session = Depends(get_db)):
     """Get list of container types for FCL shipments"""
-    return db.query(ContainerType).filter(
-        ContainerType.is_active == True
-    ).order_by(ContainerType.sort_order).all()
+    return reference_cache.respond(
+        request, (response_cache.CONTAINER_TYPES,),
+        lambda: db.query(ContainerType).filter(
+            ContainerType.is_active == True
+        ).order_by(ContainerType.sort_order).all(),
+        response_model=List[ContainerTypeResponse]
+    )
 
 
 @app.get("/api/truck-types", response_model=List[TruckTypeResponse], tags=["Reference Data"])
-def get_truck_types(db: Session = Depends(get_db)):
+def get_truck_types(request: Request, db: Session = Depends(get_db)):
     """Get list of truck types for FTL shipments"""
-    return db.query(TruckType).filter(
-        TruckType.is_active == True
-    ).order_by(TruckType.sort_order).all()
+    return reference_cache.respond(
+        request, (response_cache.TRUCK_TYPES,),
+        lambda: db.query(TruckType).filter(
+            TruckType.is_active == True
+        ).order_by(TruckType.sort_order).all(),
+        response_model=List[TruckTypeResponse]
+    )
 
 
 @app.get("/api/incoterms", response_model=List[IncotermResponse], tags=["Reference Data"])
-def get_incoterms(db: Session = Depends(get_db)):
+def get_incoterms(request: Request, db: Session = Depends(get_db)):
     """Get list of Incoterms"""
-    return db.query(Incoterm).filter(
-        Incoterm.is_active == True
-    ).order_by(Incoterm.sort_order).all()
+    return reference_cache.respond(
+        request, (response_cache.INCOTERMS,),
+        lambda: db.query(Incoterm).filter(
+            Incoterm.is_active == True
+        ).order_by(Incoterm.sort_order).all(),
+        response_model=List[IncotermResponse]
+    )
 
 
 # ==========================================
@@ -1352,51 +1381,9 @@ def get_bidding_stats(db: Session = Depends(get_db)):
     - closing_soon_count: 24시간 이내 마감 예정 건수
     - awarded_count: 낙찰 완료 건수
     - failed_count: 유찰/마감 건수 (closed + cancelled + expired + 마감일 지난 open)
+    - 1회 조건부 집계 + BIDDING_STATS_TTL 초 마이크로 캐시 (동시 요청은 계산 1회 공유)
     """
-    now = datetime.now()
-    tomorrow = now + timedelta(hours=24)
-    
-    total_count = db.query(Bidding).count()
-    
-    # open_count: status가 'open'이고 마감일이 아직 지나지 않은 것
-    open_count = db.query(Bidding).filter(
-        Bidding.status == "open",
-        or_(
-            Bidding.deadline == None,
-            Bidding.deadline > now
-        )
-    ).count()
-    
-    # closing_soon_count: status가 'open'이고 24시간 이내 마감 예정
-    closing_soon_count = db.query(Bidding).filter(
-        Bidding.status == "open",
-        Bidding.deadline <= tomorrow,
-        Bidding.deadline > now
-    ).count()
-    
-    awarded_count = db.query(Bidding).filter(Bidding.status == "awarded").count()
-    
-    # failed_count: closed, cancelled, expired 상태 + 마감일이 지난 open 상태
-    explicitly_failed = db.query(Bidding).filter(
-        Bidding.status.in_(["closed", "cancelled", "expired"])
-    ).count()
-    
-    # 마감일이 지났지만 아직 status가 'open'인 것들도 마감으로 카운트
-    expired_but_open = db.query(Bidding).filter(
-        Bidding.status == "open",
-        Bidding.deadline != None,
-        Bidding.deadline <= now
-    ).count()
-    
-    failed_count = explicitly_failed + expired_but_open
-    
-    return BiddingStatsResponse(
-        total_count=total_count,
-        open_count=open_count,
-        closing_soon_count=closing_soon_count,
-        awarded_count=awarded_count,
-        failed_count=failed_count
-    )
+    return BiddingStatsResponse(**bidding_stats.bidding_stats(db))
 
 
 @app.get("/api/bidding/list", response_model=BiddingListResponse, tags=["Bidding List"])
@@ -1537,7 +1524,7 @@ def get_bidding_list(
         pol_name = f"{pol_port.name}, {pol_port.country}".upper() if pol_port else None
         pod_name = f"{pod_port.name}, {pod_port.country}".upper() if pod_port else None
         
-        items.append(BiddingListItem(
+        items.append(BiddingListItem.model_construct(
             id=b.id,
             bidding_no=b.bidding_no,
             customer_company=qr.customer.company,
@@ -1556,12 +1543,12 @@ def get_bidding_list(
             my_bid_status=my_bid_status
         ))
     
-    return BiddingListResponse(
+    return fast_json.fast_response(BiddingListResponse.model_construct(
         total=total,
         page=page,
         limit=limit,
         data=items
-    )
+    ), BiddingListResponse)
 
 
 @app.get("/api/bidding/{bidding_no}/detail", response_model=BiddingDetailResponse, tags=["Bidding List"])
@@ -2095,6 +2082,7 @@ def close_bidding(
 
 @app.get("/api/freight-codes", response_model=FreightCodesListResponse, tags=["Freight Codes"])
 def get_freight_codes(
+    request: Request,
     shipping_type: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
@@ -2103,6 +2091,15 @@ def get_freight_codes(
     
     - shipping_type: ocean, air, truck 중 하나 (없으면 전체)
     """
+    return reference_cache.respond(
+        request, (response_cache.FREIGHT_CODES,),
+        lambda: build_freight_codes_response(db, shipping_type),
+        response_model=FreightCodesListResponse
+    )
+
+
+def build_freight_codes_response(db: Session, shipping_type: Optional[str]) -> FreightCodesListResponse:
+    """운임 코드 목록 응답 생성 (캐시 miss 시 호출)"""
     # 카테고리 조회 (shipping_type 필터링)
     categories_query = db.query(FreightCategory).filter(FreightCategory.is_active == True)
     
@@ -2212,25 +2209,22 @@ def get_freight_code_detail(
 
 
 @app.get("/api/freight-units", response_model=List[FreightUnitResponse], tags=["Freight Codes"])
-def get_freight_units(db: Session = Depends(get_db)):
+def get_freight_units(request: Request, db: Session = Depends(get_db)):
     """
     운임 단위 목록 조회
     """
-    units = db.query(FreightUnit).filter(
-        FreightUnit.is_active == True
-    ).order_by(FreightUnit.sort_order).all()
-    
-    return [FreightUnitResponse(
-        id=u.id,
-        code=u.code,
-        name_en=u.name_en,
-        name_ko=u.name_ko,
-        sort_order=u.sort_order
-    ) for u in units]
+    return reference_cache.respond(
+        request, (response_cache.FREIGHT_CODES,),
+        lambda: db.query(FreightUnit).filter(
+            FreightUnit.is_active == True
+        ).order_by(FreightUnit.sort_order).all(),
+        response_model=List[FreightUnitResponse]
+    )
 
 
 @app.get("/api/freight-categories", response_model=List[FreightCategoryResponse], tags=["Freight Codes"])
 def get_freight_categories(
+    request: Request,
     shipping_type: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
@@ -2239,21 +2233,18 @@ def get_freight_categories(
     
     - shipping_type: ocean, air, truck 중 하나 (없으면 전체)
     """
-    query = db.query(FreightCategory).filter(FreightCategory.is_active == True)
-    
-    if shipping_type:
-        query = query.filter(FreightCategory.shipping_types.contains(shipping_type))
-    
-    categories = query.order_by(FreightCategory.sort_order).all()
+    def build():
+        query = db.query(FreightCategory).filter(FreightCategory.is_active == True)
+        
+        if shipping_type:
+            query = query.filter(FreightCategory.shipping_types.contains(shipping_type))
+        
+        return query.order_by(FreightCategory.sort_order).all()
     
-    return [FreightCategoryResponse(
-        id=c.id,
-        code=c.code,
-        name_en=c.name_en,
-        name_ko=c.name_ko,
-        shipping_types=c.shipping_types,
-        sort_order=c.sort_order
-    ) for c in categories]
+    return reference_cache.respond(
+        request, (response_cache.FREIGHT_CODES,), build,
+        response_model=List[FreightCategoryResponse]
+    )
 
 
 # ==========================================
@@ -2560,10 +2551,20 @@ def get_freight_estimate(
 
 
 @app.get("/api/freight/routes", tags=["Quick Quotation"])
-def get_available_routes(db: Session = Depends(get_db)):
+def get_available_routes(request: Request, db: Session = Depends(get_db)):
     """
     Quick Quotation 가능한 구간 목록 조회
     """
+    # 유효기간 판정이 날짜에 따라 달라지므로 날짜도 캐시 키에 포함
+    return reference_cache.respond(
+        request, (response_cache.OCEAN_RATES, response_cache.PORTS),
+        lambda: build_available_routes(db),
+        extra_key=(datetime.now().strftime("%Y-%m-%d"),)
+    )
+
+
+def build_available_routes(db: Session) -> dict:
+    """Quick Quotation 구간 목록 생성 (캐시 miss 시 호출)"""
     today = datetime.now()
     
     sheets = db.query(OceanRateSheet).filter(
@@ -2590,6 +2591,31 @@ def get_available_routes(db: Session = Depends(get_db)):
     }
 
 
+@app.post("/api/freight/ocean-rates/import", tags=["Quick Quotation"])
+async def import_ocean_rates(
+    file: UploadFile = File(...),
+    dry_run: bool = False
+):
+    """
+    선사 운임 파일 (CSV / XLSX) 일괄 등록
+
+    - 항구 / 컨테이너 타입 / 운임 코드를 검증한 뒤 단일 트랜잭션으로 시트 / 항목 등록
+    - 같은 POL/POD/선사의 유효기간이 겹치는 기존 시트는 비활성화
+    - dry_run: 검증만 수행
+    - 검증 실패 시 400 + 행 번호별 오류 목록
+    """
+    from ocean_rate_import import import_rate_file, RateFileError
+    from starlette.concurrency import run_in_threadpool
+
+    content = await file.read()
+    try:
+        result = await run_in_threadpool(import_rate_file, content, file.filename, dry_run=dry_run)
+    except RateFileError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "errors": e.errors})
+
+    return {"success": True, "filename": file.filename, **result}
+
+
 # ==========================================
 # TRUCKING RATE API
 # ==========================================
@@ -2731,6 +2757,12 @@ def health_check(db: Session = Depends(get_db)):
         return {"status": "unhealthy", "database": str(e)}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["System"])
+def get_metrics():
+    """Per-route SQL/latency histograms (Prometheus text format)"""
+    return sql_metrics_registry.render_prometheus()
+
+
 # ==========================================
 # SHIPPER BIDDING MANAGEMENT ENDPOINTS
 # ==========================================
@@ -2786,39 +2818,7 @@ def get_shipper_bidding_stats(
     if not customer_id:
         raise HTTPException(status_code=400, detail="customer_id 또는 customer_email이 필요합니다.")
     
-    # 해당 고객의 Quote Request ID 목록 조회
-    quote_ids = db.query(QuoteRequest.id).filter(
-        QuoteRequest.customer_id == customer_id
-    ).subquery()
-    
-    # 기본 쿼리
-    base_query = db.query(Bidding).filter(Bidding.quote_request_id.in_(quote_ids))
-    
-    total_count = base_query.count()
-    open_count = base_query.filter(Bidding.status == "open").count()
-    
-    # 24시간 이내 마감 예정
-    now = datetime.now()
-    closing_soon_deadline = now + timedelta(hours=24)
-    closing_soon_count = base_query.filter(
-        Bidding.status == "open",
-        Bidding.deadline != None,
-        Bidding.deadline <= closing_soon_deadline,
-        Bidding.deadline > now
-    ).count()
-    
-    awarded_count = base_query.filter(Bidding.status == "awarded").count()
-    failed_count = base_query.filter(
-        Bidding.status.in_(["closed", "cancelled", "expired"])
-    ).count()
-    
-    return ShipperBiddingStatsResponse(
-        total_count=total_count,
-        open_count=open_count,
-        closing_soon_count=closing_soon_count,
-        awarded_count=awarded_count,
-        failed_count=failed_count
-    )
+    return ShipperBiddingStatsResponse(**bidding_stats.shipper_stats(db, customer_id))
 
 
 @app.get("/api/shipper/biddings", response_model=ShipperBiddingListResponse, tags=["Shipper Bidding"])
@@ -3772,7 +3772,7 @@ def get_shipper_monthly_trend(
         data = monthly_data[month]
         avg_price = sum(data["bid_prices"]) / len(data["bid_prices"]) if data["bid_prices"] else 0
         
-        trend_items.append(MonthlyTrendItem(
+        trend_items.append(MonthlyTrendItem.model_construct(
             month=month,
             request_count=data["request_count"],
             bid_count=data["bid_count"],
@@ -3781,13 +3781,13 @@ def get_shipper_monthly_trend(
             avg_bid_price_krw=round(avg_price, 0)
         ))
     
-    return ShipperMonthlyTrendResponse(
+    return fast_json.fast_response(ShipperMonthlyTrendResponse.model_construct(
         period=AnalyticsPeriod(
             from_date=start_date.strftime("%Y-%m-%d"),
             to_date=end_date.strftime("%Y-%m-%d")
         ),
         data=trend_items
-    )
+    ), ShipperMonthlyTrendResponse)
 
 
 @app.get("/api/analytics/shipper/cost-by-type", response_model=ShipperCostByTypeResponse, tags=["Analytics - Shipper"])
@@ -4150,7 +4150,7 @@ def get_forwarder_monthly_trend(
         data = monthly_data[month]
         avg_rank = sum(data["ranks"]) / len(data["ranks"]) if data["ranks"] else 0
         
-        trend_items.append(ForwarderMonthlyTrendItem(
+        trend_items.append(ForwarderMonthlyTrendItem.model_construct(
             month=month,
             bid_count=data["bid_count"],
             awarded_count=data["awarded_count"],
@@ -4159,13 +4159,13 @@ def get_forwarder_monthly_trend(
             avg_rank=round(avg_rank, 1)
         ))
     
-    return ForwarderMonthlyTrendResponse(
+    return fast_json.fast_response(ForwarderMonthlyTrendResponse.model_construct(
         period=AnalyticsPeriod(
             from_date=start_date.strftime("%Y-%m-%d"),
             to_date=end_date.strftime("%Y-%m-%d")
         ),
         data=trend_items
-    )
+    ), ForwarderMonthlyTrendResponse)
 
 
 @app.get("/api/analytics/forwarder/bid-stats", response_model=ForwarderBidStatsResponse, tags=["Analytics - Forwarder"])
@@ -6295,7 +6295,7 @@ def get_shipper_volume_trend(
         func.sum(CargoDetail.qty).label('total_qty'),
         func.sum(CargoDetail.cbm).label('total_cbm'),
         func.sum(CargoDetail.gross_weight).label('total_kgs')
-    ).join(Bid, Contract.bid_id == Bid.id
+    ).join(Bid, Contract.awarded_bid_id == Bid.id
     ).join(Bidding, Bid.bidding_id == Bidding.id
     ).join(QuoteRequest, Bidding.quote_request_id == QuoteRequest.id
     ).join(CargoDetail, CargoDetail.quote_request_id == QuoteRequest.id
@@ -6321,14 +6321,7 @@ def get_shipper_volume_trend(
     
     # If no data, generate mock for demo
     if not data:
-        for i in range(6):
-            month = datetime.now() - timedelta(days=30 * (5 - i))
-            data.append({
-                "month": month.strftime("%Y-%m"),
-                "teu": random.randint(20, 80),
-                "cbm": random.randint(200, 500),
-                "kgs": random.randint(20000, 50000)
-            })
+        data = dashboard_bundle.demo_volume_trend()
     
     return {"success": True, "data": data}
 
@@ -6370,13 +6363,7 @@ def get_shipper_top_export(
     
     # Mock data if empty
     if not data:
-        data = [
-            {"country": "중국", "count": 15, "volume": 120},
-            {"country": "미국", "count": 12, "volume": 95},
-            {"country": "일본", "count": 8, "volume": 65},
-            {"country": "베트남", "count": 6, "volume": 48},
-            {"country": "태국", "count": 4, "volume": 32}
-        ]
+        data = list(dashboard_bundle.DEMO_TOP_EXPORT)
     
     return {"success": True, "data": data}
 
@@ -6417,13 +6404,7 @@ def get_shipper_top_import(
     
     # Mock data if empty
     if not data:
-        data = [
-            {"country": "독일", "count": 10, "volume": 85},
-            {"country": "미국", "count": 8, "volume": 72},
-            {"country": "중국", "count": 7, "volume": 58},
-            {"country": "일본", "count": 5, "volume": 42},
-            {"country": "프랑스", "count": 3, "volume": 25}
-        ]
+        data = list(dashboard_bundle.DEMO_TOP_IMPORT)
     
     return {"success": True, "data": data}
 
@@ -6447,15 +6428,7 @@ def get_shipper_container_efficiency(
     if not customer_id:
         raise HTTPException(status_code=400, detail="customer_email or customer_id required")
     
-    # Container max weights (typical values in kg)
-    container_max_weight = {
-        "20GP": 21800, "20'GP": 21800, "20FT": 21800,
-        "40GP": 26500, "40'GP": 26500, "40FT": 26500,
-        "40HC": 26500, "40'HC": 26500,
-        "20RF": 20000, "20'RF": 20000,
-        "40RF": 26000, "40'RF": 26000,
-        "45HC": 25500, "45'HC": 25500
-    }
+    container_max_weight = dashboard_bundle.CONTAINER_MAX_WEIGHT
     
     from sqlalchemy import func
     
@@ -6490,12 +6463,7 @@ def get_shipper_container_efficiency(
     
     # Mock data if empty
     if not data:
-        data = [
-            {"container_type": "20'GP", "efficiency": 82, "count": 15},
-            {"container_type": "40'GP", "efficiency": 75, "count": 12},
-            {"container_type": "40'HC", "efficiency": 88, "count": 8},
-            {"container_type": "20'RF", "efficiency": 65, "count": 3}
-        ]
+        data = list(dashboard_bundle.DEMO_CONTAINER_EFFICIENCY)
     
     return {"success": True, "data": data}
 
@@ -6536,10 +6504,10 @@ def get_forwarder_route_stats(
         QuoteRequest.pod,
         func.count(Bid.id).label('total_bids'),
         func.sum(case((Contract.id.isnot(None), 1), else_=0)).label('awards'),
-        func.sum(case((Contract.id.isnot(None), Contract.final_price_krw), else_=0)).label('total_revenue')
+        func.sum(case((Contract.id.isnot(None), Contract.total_amount_krw), else_=0)).label('total_revenue')
     ).join(Bidding, Bidding.quote_request_id == QuoteRequest.id
     ).join(Bid, Bid.bidding_id == Bidding.id
-    ).outerjoin(Contract, Contract.bid_id == Bid.id
+    ).outerjoin(Contract, Contract.awarded_bid_id == Bid.id
     ).filter(
         Bid.forwarder_id == forwarder_id,
         Bid.created_at >= start_date,
@@ -6562,7 +6530,7 @@ def get_forwarder_route_stats(
             month_end = datetime.now() - timedelta(days=30 * (5 - i))
             
             month_awards = db.query(func.count(Contract.id)).join(
-                Bid, Contract.bid_id == Bid.id
+                Bid, Contract.awarded_bid_id == Bid.id
             ).join(Bidding, Bid.bidding_id == Bidding.id
             ).join(QuoteRequest, Bidding.quote_request_id == QuoteRequest.id
             ).filter(
@@ -6585,17 +6553,78 @@ def get_forwarder_route_stats(
     
     # Mock data if empty
     if not data:
-        data = [
-            {"route": "부산 → LA", "bids": 15, "awards": 8, "award_rate": 53.3, "total_revenue_krw": 120000000, "sparkline": [3, 5, 2, 4, 6, 3]},
-            {"route": "부산 → 상하이", "bids": 12, "awards": 5, "award_rate": 41.7, "total_revenue_krw": 45000000, "sparkline": [2, 3, 4, 3, 5, 4]},
-            {"route": "인천 → 나리타", "bids": 8, "awards": 4, "award_rate": 50.0, "total_revenue_krw": 32000000, "sparkline": [1, 2, 1, 2, 1, 2]},
-            {"route": "부산 → 싱가포르", "bids": 10, "awards": 2, "award_rate": 20.0, "total_revenue_krw": 28000000, "sparkline": [0, 1, 0, 1, 0, 1]},
-            {"route": "광양 → 로테르담", "bids": 6, "awards": 3, "award_rate": 50.0, "total_revenue_krw": 54000000, "sparkline": [1, 1, 0, 2, 1, 1]}
-        ]
+        data = list(dashboard_bundle.DEMO_ROUTE_STATS)
     
     return {"success": True, "data": data}
 
 
+@app.get("/api/dashboard/shipper/bundle", tags=["Dashboard"])
+def get_shipper_dashboard_bundle(
+    customer_email: Optional[str] = None,
+    customer_id: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    limit: int = 5,
+    db: Session = Depends(get_db)
+):
+    """
+    화주 대시보드 위젯 일괄 조회 (요청 1회)
+
+    - volume_trend / top_export / top_import / container_efficiency: /api/dashboard/shipper/* 와 동일
+    - summary: /api/analytics/shipper/summary 와 동일
+    - bidding_stats: /api/shipper/biddings/stats 와 동일
+    - 같은 파라미터는 DASHBOARD_BUNDLE_TTL 초 동안 캐시
+    """
+    if not customer_email and not customer_id:
+        raise HTTPException(status_code=400, detail="customer_email or customer_id required")
+
+    key = ("shipper", customer_id, (customer_email or "").lower(), from_date, to_date, limit)
+
+    def build():
+        resolved_id = dashboard_bundle.resolve_customer_id(db, customer_email, customer_id)
+        if not resolved_id:
+            raise HTTPException(status_code=404, detail="Customer not found")
+        return dashboard_bundle.build_shipper_bundle(
+            db, resolved_id, from_date, to_date, limit, to_krw=convert_to_krw
+        )
+
+    bundle = dashboard_bundle.cached_bundle(key, build)
+    return {"success": True, "data": bundle["widgets"], "generated_at": bundle["generated_at"]}
+
+
+@app.get("/api/dashboard/forwarder/bundle", tags=["Dashboard"])
+def get_forwarder_dashboard_bundle(
+    forwarder_email: Optional[str] = None,
+    forwarder_id: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    limit: int = 10,
+    db: Session = Depends(get_db)
+):
+    """
+    운송사 대시보드 위젯 일괄 조회 (요청 1회)
+
+    - summary / monthly_trend: /api/analytics/forwarder/summary, monthly-trend 와 동일
+    - route_stats: /api/dashboard/forwarder/route-stats 와 동일
+    - 같은 파라미터는 DASHBOARD_BUNDLE_TTL 초 동안 캐시
+    """
+    if not forwarder_email and not forwarder_id:
+        raise HTTPException(status_code=400, detail="forwarder_email or forwarder_id required")
+
+    key = ("forwarder", forwarder_id, (forwarder_email or "").lower(), from_date, to_date, limit)
+
+    def build():
+        forwarder = dashboard_bundle.resolve_forwarder(db, forwarder_email, forwarder_id)
+        if not forwarder:
+            raise HTTPException(status_code=404, detail="Forwarder not found")
+        return dashboard_bundle.build_forwarder_bundle(
+            db, forwarder, from_date, to_date, limit, to_krw=convert_to_krw
+        )
+
+    bundle = dashboard_bundle.cached_bundle(key, build)
+    return {"success": True, "data": bundle["widgets"], "generated_at": bundle["generated_at"]}
+
+
 # ==========================================
 # RUN SERVER
 # ==========================================
@@ -256,6 +256,21 @@ class FreightCodeUnit(Base):
         return f"<FreightCodeUnit code_id={self.freight_code_id} unit_id={self.freight_unit_id}>"
 
 
+class DataVersion(Base):
+    """
+    Data Version - 참조 데이터 버전
+    seed/import 스크립트가 데이터를 변경할 때 버전을 올려 API 응답 캐시를 무효화
+    """
+    __tablename__ = "data_versions"
+    
+    name = Column(String(50), primary_key=True)  # e.g., ports, container_types, freight_codes
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<DataVersion {self.name}: v{self.version}>"
+
+
 # ==========================================
 # TRANSACTION TABLES
 # ==========================================
@@ -0,0 +1,358 @@
+"""
+Ocean Rate Import - 선사 운임 파일 (CSV / XLSX) 일괄 등록
+매주 들어오는 수천 구간 운임표를 OceanRateSheet / OceanRateItem 으로 변환
+
+파일 형식 (한 행 = 구간 x 컨테이너 x 운임 코드):
+    pol, pod, carrier, valid_from, valid_to, container_type, freight_code,
+    freight_group, unit, currency, rate, remark
+
+    - 필수: pol, pod, valid_from, valid_to, container_type, freight_code
+    - container_type: 코드 (20DC) 또는 이름 (20 Dry Container)
+    - rate 가 비어 있거나 N/A 이면 NULL (Quick Quotation = N)
+    - carrier / unit / currency / freight_group 생략 시
+      HMM / Qty / 운임 코드 기본 통화 / 운임 카테고리명
+
+처리 순서:
+    1. 파일 → DataFrame (컬럼 단위 정규화)
+    2. 항구 / 컨테이너 타입 / 운임 코드는 메모리 lookup 으로 검증 (테이블당 쿼리 1회)
+    3. 오류가 하나라도 있으면 아무것도 쓰지 않고 행 번호별 오류 반환
+    4. 단일 트랜잭션에서 겹치는 기존 시트 비활성화 → 시트 / 항목 chunk 단위 bulk insert
+
+Usage:
+    python ocean_rate_import.py rates.xlsx
+    python ocean_rate_import.py rates.csv --dry-run
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+
+import pandas as pd
+from sqlalchemy import select, func, update, insert
+
+from models import Port, ContainerType, FreightCode, FreightCategory, OceanRateSheet, OceanRateItem
+
+CHUNK_SIZE = 5000
+MAX_ERRORS = 200
+
+DEFAULT_CARRIER = "HMM"
+DEFAULT_UNIT = "Qty"
+
+REQUIRED_COLUMNS = ["pol", "pod", "valid_from", "valid_to", "container_type", "freight_code"]
+OPTIONAL_COLUMNS = ["carrier", "freight_group", "unit", "currency", "rate", "remark"]
+
+# 파일 헤더 별칭 → 표준 컬럼명
+COLUMN_ALIASES = {
+    "origin": "pol", "port_of_loading": "pol",
+    "destination": "pod", "port_of_discharge": "pod",
+    "container": "container_type", "container_code": "container_type",
+    "code": "freight_code", "charge_code": "freight_code",
+    "group": "freight_group",
+    "amount": "rate",
+    "from": "valid_from", "valid_start": "valid_from",
+    "to": "valid_to", "valid_end": "valid_to",
+}
+
+# 시트 단위 키 (같은 키의 행들이 하나의 OceanRateSheet 가 됨)
+SHEET_KEY = ["pol_id", "pod_id", "carrier", "valid_from", "valid_to"]
+
+
+class RateFileError(Exception):
+    """운임 파일 검증 실패 (errors: 행 번호별 오류 목록)"""
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+# ==========================================
+# READ & NORMALIZE
+# ==========================================
+
+def read_rate_file(source, filename=None):
+    """
+    CSV / XLSX → 문자열 DataFrame (헤더 정규화)
+
+    Args:
+        source: 파일 경로 또는 bytes
+        filename: bytes 로 전달할 때 확장자 판별용 파일명
+    """
+    name = (filename or (source if isinstance(source, str) else "")).lower()
+    handle = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+    if name.endswith((".xlsx", ".xlsm", ".xls")):
+        df = pd.read_excel(handle, dtype=str)
+    elif name.endswith((".csv", ".txt")) or not name:
+        df = pd.read_csv(handle, dtype=str, encoding="utf-8-sig", skipinitialspace=True)
+    else:
+        raise RateFileError(f"Unsupported file type: {filename or source}")
+
+    df.columns = [str(c).strip().lower().replace(" ", "_").replace("-", "_") for c in df.columns]
+    df = df.rename(columns={c: COLUMN_ALIASES.get(c, c) for c in df.columns})
+
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise RateFileError(f"Missing required columns: {', '.join(missing)}")
+    for column in OPTIONAL_COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+
+    df = df[REQUIRED_COLUMNS + OPTIONAL_COLUMNS]
+    # 파일 상의 행 번호 (헤더 = 1행)
+    df.index = pd.RangeIndex(2, len(df) + 2, name="row")
+    return df.apply(lambda s: s.str.strip() if s.dtype == object else s)
+
+
+# ==========================================
+# LOOKUPS & VALIDATION
+# ==========================================
+
+class RateLookups:
+    """검증용 참조 데이터 (테이블당 1회 조회)"""
+
+    def __init__(self, ports, container_types, freight_codes):
+        self.ports = ports                      # code → id
+        self.container_types = container_types  # CODE / NAME (대문자) → id
+        self.freight_codes = freight_codes      # code → (id, default_currency, category name)
+
+    @classmethod
+    def load(cls, conn):
+        ports = dict(conn.execute(select(Port.code, Port.id)).all())
+
+        container_types = {}
+        for ct_id, code, name in conn.execute(select(ContainerType.id, ContainerType.code, ContainerType.name)):
+            container_types[code.upper()] = ct_id
+            container_types.setdefault(name.upper(), ct_id)
+
+        freight_codes = {}
+        rows = conn.execute(
+            select(FreightCode.code, FreightCode.id, FreightCode.default_currency, FreightCategory.name_en)
+            .join(FreightCategory, FreightCategory.id == FreightCode.category_id, isouter=True)
+        )
+        for code, fc_id, currency, category in rows:
+            freight_codes[code.upper()] = (fc_id, currency or "USD", category or "Ocean Freight")
+        return cls(ports, container_types, freight_codes)
+
+
+def _collect_errors(errors, mask, df, column, message):
+    for row in df.index[mask][:MAX_ERRORS]:
+        value = df.at[row, column]
+        errors.append({"row": int(row), "column": column, "value": None if pd.isna(value) else value,
+                       "message": message})
+
+
+def _pick(series, index):
+    """lookup 결과 tuple 의 index 번째 값 (lookup 실패 → None)"""
+    return series.map(lambda v: v[index] if isinstance(v, tuple) else None)
+
+
+def prepare_rates(df, lookups):
+    """
+    문자열 DataFrame → ID 로 해석된 운임 DataFrame
+
+    Returns:
+        (frame, errors) - errors 가 비어 있을 때만 frame 사용 가능
+    """
+    errors = []
+    out = pd.DataFrame(index=df.index)
+
+    for column in REQUIRED_COLUMNS:
+        _collect_errors(errors, df[column].isna() | (df[column] == ""), df, column, "required")
+
+    pol = df["pol"].str.upper()
+    pod = df["pod"].str.upper()
+    out["pol_id"] = pol.map(lookups.ports)
+    out["pod_id"] = pod.map(lookups.ports)
+    _collect_errors(errors, pol.notna() & out["pol_id"].isna(), df, "pol", "unknown port")
+    _collect_errors(errors, pod.notna() & out["pod_id"].isna(), df, "pod", "unknown port")
+
+    container = df["container_type"].str.upper()
+    out["container_type_id"] = container.map(lookups.container_types)
+    _collect_errors(errors, container.notna() & out["container_type_id"].isna(), df, "container_type",
+                    "unknown container type")
+
+    freight = df["freight_code"].str.upper().map(lookups.freight_codes)
+    _collect_errors(errors, df["freight_code"].notna() & freight.isna(), df, "freight_code", "unknown freight code")
+    out["freight_code_id"] = _pick(freight, 0)
+
+    out["valid_from"] = pd.to_datetime(df["valid_from"], errors="coerce")
+    out["valid_to"] = pd.to_datetime(df["valid_to"], errors="coerce")
+    _collect_errors(errors, df["valid_from"].notna() & out["valid_from"].isna(), df, "valid_from", "invalid date")
+    _collect_errors(errors, df["valid_to"].notna() & out["valid_to"].isna(), df, "valid_to", "invalid date")
+    _collect_errors(errors, out["valid_to"] < out["valid_from"], df, "valid_to", "valid_to is before valid_from")
+
+    rate_text = df["rate"].fillna("").str.replace(",", "", regex=False)
+    blank = rate_text.str.upper().isin(["", "N/A", "NA", "-"])
+    out["rate"] = pd.to_numeric(rate_text.where(~blank), errors="coerce")
+    _collect_errors(errors, ~blank & out["rate"].isna(), df, "rate", "invalid number")
+
+    out["carrier"] = df["carrier"].fillna(DEFAULT_CARRIER).replace("", DEFAULT_CARRIER).str.upper()
+    out["unit"] = df["unit"].fillna(DEFAULT_UNIT).replace("", DEFAULT_UNIT)
+    out["currency"] = df["currency"].where(df["currency"].fillna("") != "",
+                                           _pick(freight, 1)).str.upper()
+    out["freight_group"] = df["freight_group"].where(df["freight_group"].fillna("") != "",
+                                                     _pick(freight, 2))
+    out["remark"] = df["remark"].where(df["remark"].fillna("") != "", None)
+    # 운임 코드 오류 행은 기본 통화를 알 수 없으므로 통화 오류는 별도로 보고하지 않음
+    invalid_currency = (out["currency"].fillna("").str.len() != 3) & (df["currency"].notna() | out["freight_code_id"].notna())
+    _collect_errors(errors, invalid_currency, df, "currency", "invalid currency")
+
+    duplicated = out.duplicated(subset=SHEET_KEY + ["container_type_id", "freight_code_id"], keep="first")
+    _collect_errors(errors, duplicated & out["freight_code_id"].notna(), df, "freight_code",
+                    "duplicate lane / container / freight code")
+
+    errors.sort(key=lambda e: (e["row"], e["column"]))
+    return out, errors[:MAX_ERRORS]
+
+
+# ==========================================
+# WRITE
+# ==========================================
+
+def _chunks(records, size):
+    for start in range(0, len(records), size):
+        yield records[start:start + size]
+
+
+def _records(frame):
+    """NaN → None 변환된 dict 목록 (executemany 용)"""
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def find_superseded_sheets(conn, sheets):
+    """새 시트와 같은 POL/POD/선사이면서 유효기간이 겹치는 기존 활성 시트 ID"""
+    pol_ids = sorted(int(v) for v in sheets["pol_id"].unique())
+    table = OceanRateSheet.__table__
+    existing = []
+    for chunk in _chunks(pol_ids, 500):
+        existing.extend(conn.execute(
+            select(table.c.id, table.c.pol_id, table.c.pod_id, table.c.carrier, table.c.valid_from, table.c.valid_to)
+            .where(table.c.is_active == True, table.c.pol_id.in_(chunk))  # noqa: E712
+        ).all())
+    if not existing:
+        return []
+
+    old = pd.DataFrame(existing, columns=["id", "pol_id", "pod_id", "carrier", "old_from", "old_to"])
+    old["carrier"] = old["carrier"].fillna(DEFAULT_CARRIER).str.upper()
+    joined = sheets.merge(old, on=["pol_id", "pod_id", "carrier"])
+    overlap = (joined["old_from"] <= joined["valid_to"]) & (joined["old_to"] >= joined["valid_from"])
+    return sorted(int(v) for v in joined.loc[overlap, "id"].unique())
+
+
+def write_rates(conn, frame, chunk_size=CHUNK_SIZE, source_name=None):
+    """
+    검증된 운임 DataFrame 을 DB 에 기록 (호출 측 트랜잭션 안에서 실행)
+
+    Returns:
+        dict: sheets_created / items_created / sheets_superseded
+    """
+    frame = frame.astype({"pol_id": "int64", "pod_id": "int64",
+                          "container_type_id": "int64", "freight_code_id": "int64"})
+    sheets = frame.groupby(SHEET_KEY, sort=True, as_index=False).agg(remark=("remark", "first"))
+
+    superseded = find_superseded_sheets(conn, sheets)
+    sheet_table = OceanRateSheet.__table__
+    for chunk in _chunks(superseded, 500):
+        conn.execute(update(sheet_table).where(sheet_table.c.id.in_(chunk)).values(is_active=False))
+
+    # 시트 PK 를 미리 할당 → 항목의 sheet_id 를 merge 한 번으로 연결
+    next_id = (conn.execute(select(func.max(sheet_table.c.id))).scalar() or 0) + 1
+    sheets["id"] = range(next_id, next_id + len(sheets))
+    sheets["is_active"] = True
+    if source_name:
+        sheets["remark"] = sheets["remark"].fillna(f"Imported from {source_name}")
+    sheet_rows = _records(sheets)
+    for row in sheet_rows:
+        row["valid_from"] = pd.Timestamp(row["valid_from"]).to_pydatetime()
+        row["valid_to"] = pd.Timestamp(row["valid_to"]).to_pydatetime()
+    for chunk in _chunks(sheet_rows, chunk_size):
+        conn.execute(insert(sheet_table), chunk)
+
+    items = frame.merge(sheets[SHEET_KEY + ["id"]].rename(columns={"id": "sheet_id"}), on=SHEET_KEY)
+    items = items[["sheet_id", "container_type_id", "freight_code_id", "freight_group", "unit", "currency", "rate"]]
+    items = items.assign(is_active=True)
+    item_rows = _records(items)
+    for chunk in _chunks(item_rows, chunk_size):
+        conn.execute(insert(OceanRateItem.__table__), chunk)
+
+    return {
+        "sheets_created": len(sheet_rows),
+        "items_created": len(item_rows),
+        "sheets_superseded": len(superseded),
+    }
+
+
+def import_rate_file(source, filename=None, bind=None, chunk_size=CHUNK_SIZE, dry_run=False):
+    """
+    운임 파일 import (검증 → 단일 트랜잭션 기록)
+
+    Args:
+        source: 파일 경로 또는 bytes
+        filename: 원본 파일명 (bytes 인 경우 형식 판별 / remark 용)
+        bind: SQLAlchemy Engine (기본값: database.engine)
+        dry_run: 검증만 수행
+
+    Raises:
+        RateFileError: 필수 컬럼 누락 / 행 검증 실패 (errors 에 상세)
+    """
+    if bind is None:
+        from database import engine as bind
+
+    started = time.perf_counter()
+    df = read_rate_file(source, filename)
+    source_name = os.path.basename(filename or (source if isinstance(source, str) else "")) or None
+
+    with bind.begin() as conn:
+        frame, errors = prepare_rates(df, RateLookups.load(conn))
+        if errors:
+            raise RateFileError(f"{len(errors)} invalid rows in rate file", errors)
+        if dry_run or frame.empty:
+            result = {"sheets_created": 0, "items_created": 0, "sheets_superseded": 0}
+        else:
+            result = write_rates(conn, frame, chunk_size=chunk_size, source_name=source_name)
+
+    result.update({
+        "rows": len(df),
+        "lanes": int(frame.groupby(SHEET_KEY).ngroups) if not frame.empty else 0,
+        "dry_run": dry_run,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    })
+
+    if not dry_run and result["items_created"]:
+        from sqlalchemy.orm import Session
+        from response_cache import bump_data_version, OCEAN_RATES
+
+        db = Session(bind=bind)
+        try:
+            bump_data_version(db, OCEAN_RATES)
+        finally:
+            db.close()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import ocean rate sheets from CSV/XLSX")
+    parser.add_argument("path", help="운임 파일 경로 (.csv / .xlsx)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="검증만 수행")
+    args = parser.parse_args(argv)
+
+    try:
+        result = import_rate_file(args.path, chunk_size=args.chunk_size, dry_run=args.dry_run)
+    except RateFileError as e:
+        print(f"[ERROR] {e}")
+        for error in e.errors[:50]:
+            print(f"  row {error['row']}: {error['column']}={error['value']!r} - {error['message']}")
+        sys.exit(1)
+
+    print(f"[OK] {result['rows']} rows / {result['lanes']} lanes "
+          f"({'dry run' if result['dry_run'] else 'imported'}) in {result['elapsed_ms']}ms")
+    print(f"  - Sheets created:    {result['sheets_created']}")
+    print(f"  - Items created:     {result['items_created']}")
+    print(f"  - Sheets superseded: {result['sheets_superseded']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Response Cache - 참조 데이터 API 응답 캐시 (ETag / Conditional GET)
+컨테이너 타입, 운임 코드 등 거의 변하지 않는 목록을 직렬화된 bytes로 보관
+(route, params, data version) 단위로 캐시하며, seed/import 스크립트가
+data_versions 테이블의 버전을 올리면 자동으로 무효화됨
+
+- If-None-Match 일치 시 304 응답 (본문 없음)
+- ETag에 데이터 버전 포함 → 버전이 바뀌면 클라이언트 캐시도 무효화
+- 버전 조회는 VERSION_TTL 초마다 한 번만 DB 접근
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+# 데이터 버전 재확인 주기 (초) - 다른 프로세스에서 seed 실행 시 반영 지연 상한
+VERSION_TTL = float(os.getenv("REFERENCE_CACHE_VERSION_TTL", "5"))
+
+# 브라우저 캐시: max-age 동안은 재요청 없이 사용, 이후 stale 응답을 쓰면서 백그라운드 재검증
+CACHE_CONTROL = os.getenv(
+    "REFERENCE_CACHE_CONTROL", "public, max-age=3600, stale-while-revalidate=86400"
+)
+
+MAX_ENTRIES = 256
+
+# 참조 데이터 버전 이름
+PORTS = "ports"
+CONTAINER_TYPES = "container_types"
+TRUCK_TYPES = "truck_types"
+INCOTERMS = "incoterms"
+FREIGHT_CODES = "freight_codes"  # 운임 카테고리 / 코드 / 단위
+OCEAN_RATES = "ocean_rates"
+CATEGORIES = "categories"  # commerce 카테고리 트리
+PRODUCTS = "products"  # commerce 상품 (공급사 매칭 색인)
+
+
+@lru_cache(maxsize=64)
+def _type_adapter(response_model):
+    return TypeAdapter(response_model)
+
+
+def serialize(value, response_model=None) -> bytes:
+    """response_model 기준으로 직렬화 (FastAPI 기본 응답과 동일한 JSON)"""
+    if response_model is not None:
+        adapter = _type_adapter(response_model)
+        return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return json.dumps(
+        jsonable_encoder(value), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates
+    )
+
+
+class CacheEntry:
+    __slots__ = ("versions", "body", "etag")
+
+    def __init__(self, versions: Tuple[int, ...], body: bytes, etag: str):
+        self.versions = versions
+        self.body = body
+        self.etag = etag
+
+
+class ResponseCache:
+    """직렬화된 응답 bytes 캐시"""
+
+    def __init__(self, version_ttl: float = VERSION_TTL, cache_control: str = CACHE_CONTROL,
+                 max_entries: int = MAX_ENTRIES):
+        self.version_ttl = version_ttl
+        self.cache_control = cache_control
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._versions_loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    # ---------- data versions ----------
+
+    def _load_versions(self) -> Dict[str, int]:
+        from sqlalchemy import select
+        from database import engine
+        from models import DataVersion
+
+        table = DataVersion.__table__
+        with engine.connect() as conn:
+            return {name: version for name, version in conn.execute(select(table.c.name, table.c.version))}
+
+    def current_versions(self, names: Iterable[str]) -> Tuple[int, ...]:
+        now = time.monotonic()
+        if self._versions_loaded_at is None or now - self._versions_loaded_at >= self.version_ttl:
+            versions = self._load_versions()
+            with self._lock:
+                self._versions = versions
+                self._versions_loaded_at = now
+        return tuple(self._versions.get(name, 0) for name in names)
+
+    def expire_versions(self):
+        """다음 요청에서 데이터 버전을 즉시 다시 읽도록 함"""
+        self._versions_loaded_at = None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.not_modified = 0
+        self.expire_versions()
+
+    # ---------- responses ----------
+
+    def respond(
+        self,
+        request: Request,
+        versions: Tuple[str, ...],
+        build: Callable[[], object],
+        response_model=None,
+        extra_key: tuple = (),
+    ) -> Response:
+        """
+        캐시된 응답 반환 (없거나 버전이 바뀌었으면 build()로 새로 생성)
+
+        Args:
+            request: 요청 (경로 / 쿼리 파라미터 / If-None-Match)
+            versions: 응답이 의존하는 데이터 버전 이름들
+            build: 응답 데이터 생성 함수 (캐시 miss 시에만 호출 → DB 접근)
+            response_model: 직렬화 기준 Pydantic 타입
+            extra_key: 날짜 등 데이터 버전 외의 캐시 키
+        """
+        key = (request.url.path, tuple(sorted(request.query_params.multi_items())), extra_key)
+        current = self.current_versions(versions)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.versions == current:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                entry = None
+
+        if entry is None:
+            body = serialize(build(), response_model)
+            version_token = ".".join(str(v) for v in current)
+            digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+            entry = CacheEntry(current, body, f'"v{version_token}-{digest}"')
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        headers = {"ETag": entry.etag, "Cache-Control": self.cache_control}
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+            }
+
+
+reference_cache = ResponseCache()
+
+
+def bump_data_version(db, *names: str):
+    """
+    참조 데이터 버전 증가 (seed/import 스크립트에서 데이터 변경 후 호출)
+
+    Args:
+        db: SQLAlchemy Session
+        names: 버전 이름 (PORTS, CONTAINER_TYPES, ...)
+
+    Returns:
+        Dict[str, int]: 증가한 버전 (이름 → 새 버전)
+    """
+    from models import DataVersion
+
+    versions = {}
+    for name in names:
+        row = db.query(DataVersion).filter(DataVersion.name == name).first()
+        if row:
+            row.version = (row.version or 0) + 1
+        else:
+            row = DataVersion(name=name, version=1)
+            db.add(row)
+        versions[name] = row.version
+    db.commit()
+    reference_cache.expire_versions()
+    return versions
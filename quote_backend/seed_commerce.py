@@ -12,6 +12,7 @@ import uuid
 import bcrypt
 
 from database import SessionLocal, engine
+from response_cache import bump_data_version, CATEGORIES, PRODUCTS
 from commerce_models import (
     Company, CompanyCertification, CommerceUser, Category, Product,
     ProductRFQ, ProductRFQItem, ProductQuotation, ProductQuotationItem
@@ -63,6 +64,7 @@ def seed_categories(db):
             print(f"  + Category: {cat_data['name_ko']}")
     
     db.commit()
+    bump_data_version(db, CATEGORIES)
 
 
 def seed_companies(db):
@@ -429,6 +431,7 @@ def seed_products(db):
             print(f"  + Product: {prod_data['name_ko']}")
     
     db.commit()
+    bump_data_version(db, PRODUCTS)
 
 
 def seed_rfqs(db):
@@ -5,6 +5,7 @@ Run this after database initialization to populate master tables
 
 from database import SessionLocal, engine, init_db
 from models import Port, ContainerType, TruckType, Incoterm, Base
+from response_cache import bump_data_version, PORTS, CONTAINER_TYPES, TRUCK_TYPES, INCOTERMS
 
 
 def seed_ports(db):
@@ -322,6 +323,9 @@ def run_all_seeds():
         seed_truck_types(db)
         seed_incoterms(db)
         
+        # API 응답 캐시 무효화
+        bump_data_version(db, PORTS, CONTAINER_TYPES, TRUCK_TYPES, INCOTERMS)
+        
         print("\n[SUCCESS] All seed data inserted successfully!")
         
     except Exception as e:
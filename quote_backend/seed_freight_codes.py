@@ -8,6 +8,7 @@ Usage:
 
 from database import SessionLocal, engine
 from models import Base, FreightCategory, FreightCode, FreightUnit, FreightCodeUnit
+from response_cache import bump_data_version, FREIGHT_CODES
 
 # Create tables if not exist
 Base.metadata.create_all(bind=engine)
@@ -196,6 +197,9 @@ def seed_freight_data():
             db.commit()
             print(f"[OK] Seeded {mapping_count} freight code-unit mappings")
         
+        # API 응답 캐시 무효화
+        bump_data_version(db, FREIGHT_CODES)
+        
         print("\n[DONE] Freight master data seed completed!")
         
     except Exception as e:
@@ -12,6 +12,7 @@ from models import (
     Base, Port, ContainerType, FreightCode, FreightCategory,
     OceanRateSheet, OceanRateItem
 )
+from response_cache import bump_data_version, CONTAINER_TYPES, FREIGHT_CODES, OCEAN_RATES
 
 # Create tables if not exist
 Base.metadata.create_all(bind=engine)
@@ -324,6 +325,9 @@ def main():
         # Step 3: Seed rate data
         seed_busan_rotterdam_rates(db)
         
+        # API 응답 캐시 무효화
+        bump_data_version(db, CONTAINER_TYPES, FREIGHT_CODES, OCEAN_RATES)
+        
         print("\n[DONE] Ocean rate seed completed!")
         
     except Exception as e:
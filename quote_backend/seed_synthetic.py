@@ -0,0 +1,378 @@
+"""
+Synthetic Data Generator - 대규모 부하 테스트용 데이터 생성
+seed_demo_data.py / seed_commerce.py 는 수십 건 수준이라 N+1 / full scan 문제가 드러나지 않음
+동일한 seed + anchor 로 실행하면 항상 같은 데이터가 생성됨 (결정적)
+
+Usage:
+    python seed_synthetic.py --scale large                     # 10k 화주, 200k 견적, 1M 입찰, 500k 알림
+    python seed_synthetic.py --scale small --db-url sqlite:///bench.db
+    python seed_synthetic.py --customers 5000 --bids 300000 --seed 7
+
+Note:
+    Core executemany 로 chunk 단위 bulk insert (ORM 객체 생성 없음)
+    PK를 직접 할당하므로 SQLite 기준 (biddings ↔ bids 순환 FK)
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+SCALE_PRESETS = {
+    "small": {"customers": 200, "forwarders": 50, "quote_requests": 2_000, "bids": 10_000, "notifications": 5_000},
+    "medium": {"customers": 2_000, "forwarders": 200, "quote_requests": 20_000, "bids": 100_000, "notifications": 50_000},
+    "large": {"customers": 10_000, "forwarders": 500, "quote_requests": 200_000, "bids": 1_000_000, "notifications": 500_000},
+}
+
+CHUNK_SIZE = 5_000
+
+SHIPPING_PROFILES = [
+    # (shipping_type, load_type, weight)
+    ("ocean", "FCL", 50),
+    ("ocean", "LCL", 15),
+    ("air", "Air", 25),
+    ("truck", "FTL", 7),
+    ("truck", "LTL", 3),
+]
+
+CONTAINER_CODES = ["20DC", "40DC", "4HDC", "20RF", "40RF"]
+TRUCK_CODES = ["1T_CARGO", "5T_WING", "11T_WING", "25T_WING"]
+CARRIERS = ["HMM", "MAERSK", "MSC", "CMA CGM", "ONE", "EVERGREEN", "KOREAN AIR", "ASIANA CARGO"]
+NOTIFICATION_TYPES = ["new_bidding", "bid_received", "bid_awarded", "bid_rejected", "bidding_expired"]
+
+TRADE_PREFIX = {"export": "EX", "import": "IM", "domestic": "DO"}
+SHIP_PREFIX = {"ocean": "SEA", "air": "AIR", "truck": "TRK"}
+
+
+def _weighted_choice(rng, profiles):
+    total = sum(p[-1] for p in profiles)
+    r = rng.uniform(0, total)
+    for profile in profiles:
+        r -= profile[-1]
+        if r <= 0:
+            return profile
+    return profiles[-1]
+
+
+def _next_id(conn, table):
+    from sqlalchemy import func, select
+    return (conn.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def _bidding_sequences(conn, table):
+    """prefix별 마지막 bidding_no 시퀀스 (기존 데이터와 충돌 방지)"""
+    from sqlalchemy import select
+    sequences = {}
+    for (bidding_no,) in conn.execute(select(table.c.bidding_no)):
+        prefix, seq = bidding_no[:5], bidding_no[5:]
+        if seq.isdigit():
+            sequences[prefix] = max(sequences.get(prefix, -1), int(seq))
+    return sequences
+
+
+class BulkWriter:
+    """테이블별 버퍼 → chunk 단위 executemany"""
+
+    def __init__(self, conn, chunk_size=CHUNK_SIZE):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, table, row):
+        buf = self.buffers.setdefault(table, [])
+        buf.append(row)
+        if len(buf) >= self.chunk_size:
+            self.flush(table)
+
+    def flush(self, table=None):
+        tables = [table] if table is not None else list(self.buffers)
+        for t in tables:
+            buf = self.buffers.get(t)
+            if buf:
+                self.conn.execute(t.insert(), buf)
+                self.counts[t.name] = self.counts.get(t.name, 0) + len(buf)
+                self.buffers[t] = []
+
+
+def generate(conn, config, seed=42, anchor=None, chunk_size=CHUNK_SIZE):
+    """
+    합성 데이터 생성
+
+    Args:
+        conn: SQLAlchemy Connection (트랜잭션 내)
+        config: customers / forwarders / quote_requests / bids / notifications 건수
+        seed: 난수 시드
+        anchor: 기준 시각 (마감/생성일 분포의 기준점, 기본값 오늘 00:00)
+
+    Returns:
+        테이블별 생성 건수 dict
+    """
+    from models import (
+        Port, Customer, Forwarder, QuoteRequest, CargoDetail, Bidding, Bid, Notification
+    )
+    from sqlalchemy import select
+
+    rng = random.Random(seed)
+    anchor = anchor or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    t_customer = Customer.__table__
+    t_forwarder = Forwarder.__table__
+    t_qr = QuoteRequest.__table__
+    t_cargo = CargoDetail.__table__
+    t_bidding = Bidding.__table__
+    t_bid = Bid.__table__
+    t_notification = Notification.__table__
+
+    writer = BulkWriter(conn, chunk_size)
+
+    port_codes = sorted(code for (code,) in conn.execute(
+        select(Port.__table__.c.code).where(Port.__table__.c.is_active == True)
+    ))
+    if len(port_codes) < 2:
+        raise RuntimeError("Port master data is empty - run seed_data.py first")
+    kr_ports = [c for c in port_codes if c.startswith("KR")] or port_codes[:1]
+
+    # ---------- Customers ----------
+    customer_start = _next_id(conn, t_customer)
+    customer_ids = list(range(customer_start, customer_start + config["customers"]))
+    for cid in customer_ids:
+        writer.add(t_customer, {
+            "id": cid,
+            "company": f"Synthetic Shipper {cid:06d}",
+            "name": f"Shipper {cid}",
+            "email": f"cust{cid:07d}@syn.test",
+            "phone": f"010-{cid % 10000:04d}-{(cid * 7) % 10000:04d}",
+            "created_at": anchor - timedelta(days=rng.randint(30, 720)),
+        })
+
+    # ---------- Forwarders ----------
+    forwarder_start = _next_id(conn, t_forwarder)
+    forwarder_ids = list(range(forwarder_start, forwarder_start + config["forwarders"]))
+    for fid in forwarder_ids:
+        writer.add(t_forwarder, {
+            "id": fid,
+            "company": f"Synthetic Forwarder {fid:05d}",
+            "name": f"Forwarder {fid}",
+            "email": f"fwd{fid:06d}@syn.test",
+            "phone": "02-0000-0000",
+            "password_hash": "$2b$12$synthetic_hash_not_for_login",
+            "is_verified": True,
+            "rating": round(rng.uniform(2.5, 5.0) * 2) / 2,
+            "rating_count": rng.randint(0, 200),
+            "created_at": anchor - timedelta(days=rng.randint(30, 720)),
+        })
+    writer.flush()
+
+    # ---------- Quote Requests / Cargo / Biddings / Bids ----------
+    n_requests = config["quote_requests"]
+    qr_start = _next_id(conn, t_qr)
+    cargo_id = _next_id(conn, t_cargo)
+    bidding_start = _next_id(conn, t_bidding)
+    bid_id = _next_id(conn, t_bid)
+    sequences = _bidding_sequences(conn, t_bidding)
+
+    # 입찰 수를 비딩에 균등 분배 (나머지는 앞쪽 비딩에 1개씩)
+    base_bids, extra_bids = divmod(config["bids"], max(n_requests, 1))
+    bidding_ids = []
+
+    for i in range(n_requests):
+        qr_id = qr_start + i
+        bidding_id = bidding_start + i
+        bidding_ids.append(bidding_id)
+
+        shipping_type, load_type, _ = _weighted_choice(rng, SHIPPING_PROFILES)
+        trade_mode = "export" if rng.random() < 0.6 else "import"
+        kr_port = rng.choice(kr_ports)
+        foreign_port = rng.choice(port_codes)
+        pol, pod = (kr_port, foreign_port) if trade_mode == "export" else (foreign_port, kr_port)
+
+        created_at = anchor - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        etd = created_at + timedelta(days=rng.randint(7, 45))
+        lead_days = 4 if shipping_type == "ocean" else 1
+        deadline = (etd - timedelta(days=lead_days)).replace(hour=18, minute=0, second=0, microsecond=0)
+
+        writer.add(t_qr, {
+            "id": qr_id,
+            "request_number": f"QR-SYN-{qr_id:09d}",
+            "trade_mode": trade_mode,
+            "shipping_type": shipping_type,
+            "load_type": load_type,
+            "incoterms": rng.choice(["FOB", "CIF", "EXW", "DAP"]),
+            "pol": pol,
+            "pod": pod,
+            "etd": etd,
+            "invoice_value": round(rng.uniform(5_000, 500_000), 2),
+            "status": "pending",
+            "customer_id": rng.choice(customer_ids),
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+
+        cargo = {
+            "id": cargo_id,
+            "quote_request_id": qr_id,
+            "row_index": 0,
+            "qty": rng.randint(1, 5),
+            "container_type": None,
+            "truck_type": None,
+            "gross_weight": None,
+            "cbm": None,
+            "chargeable_weight": None,
+            "created_at": created_at,
+        }
+        if load_type == "FCL":
+            cargo["container_type"] = rng.choice(CONTAINER_CODES)
+        elif load_type == "FTL":
+            cargo["truck_type"] = rng.choice(TRUCK_CODES)
+        else:
+            cargo["gross_weight"] = round(rng.uniform(100, 5_000), 2)
+            cargo["cbm"] = round(rng.uniform(0.5, 30), 2)
+            cargo["chargeable_weight"] = rng.randint(100, 5_000)
+        writer.add(t_cargo, cargo)
+        cargo_id += 1
+
+        # 비딩 상태: 마감 전이면 open, 마감 후면 낙찰/유찰/만료
+        if deadline > anchor:
+            status = "open"
+        else:
+            status = rng.choices(["awarded", "expired", "closed", "cancelled", "open"], [55, 25, 8, 4, 8])[0]
+
+        prefix = TRADE_PREFIX[trade_mode] + SHIP_PREFIX[shipping_type]
+        seq = sequences.get(prefix, -1) + 1
+        sequences[prefix] = seq
+
+        n_bids = min(base_bids + (1 if i < extra_bids else 0), len(forwarder_ids))
+        bidders = rng.sample(forwarder_ids, n_bids) if n_bids else []
+        awarded_index = rng.randrange(n_bids) if (status == "awarded" and n_bids) else None
+        awarded_bid_id = None
+
+        for j, forwarder_id in enumerate(bidders):
+            amount = round(rng.uniform(300, 8_000), 2)
+            submitted_at = created_at + timedelta(minutes=rng.randint(10, 60 * 24 * 5))
+            if awarded_index is None:
+                bid_status = "submitted" if status == "open" else rng.choice(["submitted", "rejected"])
+            elif j == awarded_index:
+                bid_status = "awarded"
+                awarded_bid_id = bid_id
+            else:
+                bid_status = "rejected"
+            writer.add(t_bid, {
+                "id": bid_id,
+                "bidding_id": bidding_id,
+                "forwarder_id": forwarder_id,
+                "total_amount": amount,
+                "total_amount_krw": round(amount * 1350),
+                "freight_charge": round(amount * 0.7, 2),
+                "local_charge": round(amount * 0.2, 2),
+                "other_charge": round(amount * 0.1, 2),
+                "transit_time": f"{rng.randint(2, 40)} days",
+                "carrier": rng.choice(CARRIERS),
+                "status": bid_status,
+                "submitted_at": submitted_at,
+                "created_at": submitted_at,
+                "updated_at": submitted_at,
+            })
+            bid_id += 1
+
+        if status == "awarded" and awarded_bid_id is None:
+            status = "closed"  # 입찰이 없는 비딩은 낙찰될 수 없음
+
+        writer.add(t_bidding, {
+            "id": bidding_id,
+            "bidding_no": f"{prefix}{seq:05d}",
+            "quote_request_id": qr_id,
+            "deadline": deadline,
+            "status": status,
+            "awarded_bid_id": awarded_bid_id,
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+
+    writer.flush()
+
+    # ---------- Notifications ----------
+    notification_start = _next_id(conn, t_notification)
+    for k in range(config["notifications"]):
+        to_forwarder = rng.random() < 0.5
+        created_at = anchor - timedelta(minutes=rng.randint(0, 180 * 24 * 60))
+        is_read = rng.random() < 0.6
+        writer.add(t_notification, {
+            "id": notification_start + k,
+            "recipient_type": "forwarder" if to_forwarder else "customer",
+            "recipient_id": rng.choice(forwarder_ids if to_forwarder else customer_ids),
+            "notification_type": rng.choice(NOTIFICATION_TYPES),
+            "title": "Synthetic notification",
+            "message": None,
+            "related_type": "bidding",
+            "related_id": rng.choice(bidding_ids) if bidding_ids else None,
+            "is_read": is_read,
+            "read_at": created_at + timedelta(hours=1) if is_read else None,
+            "created_at": created_at,
+        })
+    writer.flush()
+
+    return dict(writer.counts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a large deterministic dataset for quote_backend")
+    parser.add_argument("--scale", choices=sorted(SCALE_PRESETS), default="small")
+    parser.add_argument("--customers", type=int)
+    parser.add_argument("--forwarders", type=int)
+    parser.add_argument("--quote-requests", dest="quote_requests", type=int)
+    parser.add_argument("--bids", type=int)
+    parser.add_argument("--notifications", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", help="기준 날짜 YYYY-MM-DD (기본값: 오늘)")
+    parser.add_argument("--db-url", help="대상 DB (기본값: DATABASE_URL / quote.db)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.db_url:
+        os.environ["DATABASE_URL"] = args.db_url
+
+    # DATABASE_URL 반영 후 import
+    from database import SessionLocal, engine
+    from models import Base
+    from seed_data import seed_ports, seed_container_types, seed_truck_types, seed_incoterms
+    from response_cache import bump_data_version, PORTS, CONTAINER_TYPES, TRUCK_TYPES, INCOTERMS
+    import commerce_models  # noqa: F401 - 전체 테이블 생성
+
+    config = dict(SCALE_PRESETS[args.scale])
+    for key in config:
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+    anchor = datetime.strptime(args.anchor, "%Y-%m-%d") if args.anchor else None
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed_ports(db)
+        seed_container_types(db)
+        seed_truck_types(db)
+        seed_incoterms(db)
+        bump_data_version(db, PORTS, CONTAINER_TYPES, TRUCK_TYPES, INCOTERMS)
+    finally:
+        db.close()
+
+    print(f"[*] Generating synthetic data: {config} (seed={args.seed})")
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        counts = generate(conn, config, seed=args.seed, anchor=anchor, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    for table, count in counts.items():
+        print(f"  {table}: {count:,}")
+    print(f"[DONE] Synthetic data generated in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+SQL Metrics - 요청 단위 SQL 계측 및 N+1 탐지
+SQLAlchemy 이벤트 훅으로 요청마다 실행된 쿼리 수와 DB 시간을 집계하고
+Server-Timing 헤더와 /metrics (Prometheus text format)로 노출
+
+모드 (환경 변수 SQL_METRICS_MODE):
+- off:   계측 비활성화 (이벤트 훅 미등록)
+- basic: 쿼리 수 / DB 시간만 집계 (운영 환경 기본값, 오버헤드 무시 가능)
+- dev:   basic + 정규화된 SQL 별 실행 횟수 집계, N+1 의심 시 경고 로그
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+SQL_METRICS_MODE = os.getenv("SQL_METRICS_MODE", "basic").lower()
+
+# 한 요청 내 동일 SQL이 이 횟수를 초과하면 N+1 경고 (dev 모드)
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+
+# 히스토그램 버킷
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+DB_TIME_MS_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+REQUEST_TIME_MS_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+# ==========================================
+# PER-REQUEST STATE
+# ==========================================
+
+class RequestSQLStats:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    __slots__ = ("query_count", "db_time", "statements")
+
+    def __init__(self, track_statements: bool = False):
+        self.query_count = 0
+        self.db_time = 0.0  # seconds
+        self.statements: Optional[Counter] = Counter() if track_statements else None
+
+    def record(self, statement: str, elapsed: float):
+        self.query_count += 1
+        self.db_time += elapsed
+        if self.statements is not None:
+            self.statements[normalize_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 초과 실행된 정규화 SQL 목록 (N+1 의심)"""
+        if not self.statements:
+            return []
+        return [(sql, n) for sql, n in self.statements.most_common() if n > threshold]
+
+
+# FastAPI 동기 엔드포인트는 threadpool에서 실행되지만 contextvars가 복사되므로
+# 미들웨어에서 설정한 객체를 그대로 공유함
+_current_stats: ContextVar[Optional[RequestSQLStats]] = ContextVar("sql_metrics_stats", default=None)
+
+
+def get_current_stats() -> Optional[RequestSQLStats]:
+    """현재 요청의 SQL 통계 (요청 컨텍스트 밖에서는 None)"""
+    return _current_stats.get()
+
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*(?:\?|%\(\w+\)s|:\w+|__\[POSTCOMPILE_\w+\])\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """리터럴/IN 리스트 길이 차이를 제거하여 같은 형태의 SQL을 하나로 묶음"""
+    sql = _LITERAL_RE.sub("?", statement)
+    sql = _IN_LIST_RE.sub("IN (?)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+# ==========================================
+# SQLALCHEMY EVENT HOOKS
+# ==========================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("sql_metrics_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("sql_metrics_start")
+    if not starts:
+        return
+    stats.record(statement, time.perf_counter() - starts.pop())
+
+
+def install_sql_hooks(engine):
+    """엔진에 쿼리 계측 훅 등록 (off 모드에서는 아무것도 하지 않음)"""
+    if SQL_METRICS_MODE == "off":
+        return
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ==========================================
+# PER-ROUTE HISTOGRAMS
+# ==========================================
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 형식)"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result = []
+        running = 0
+        for upper, n in zip(self.buckets, self.counts):
+            running += n
+            result.append((str(upper), running))
+        result.append(("+Inf", running + self.counts[-1]))
+        return result
+
+
+class RouteMetrics:
+    """라우트별 요청 수 / 쿼리 수 / DB 시간 / 응답 시간 히스토그램"""
+
+    def __init__(self):
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_time_ms = Histogram(DB_TIME_MS_BUCKETS)
+        self.request_time_ms = Histogram(REQUEST_TIME_MS_BUCKETS)
+
+
+class MetricsRegistry:
+    """라우트 (method, path template) 별 메트릭 저장소"""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, stats: RequestSQLStats, request_time: float):
+        key = (method, route)
+        with self._lock:
+            metrics = self._routes.get(key)
+            if metrics is None:
+                metrics = self._routes[key] = RouteMetrics()
+            metrics.queries.observe(stats.query_count)
+            metrics.db_time_ms.observe(stats.db_time * 1000)
+            metrics.request_time_ms.observe(request_time * 1000)
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+    def snapshot(self) -> Dict[Tuple[str, str], RouteMetrics]:
+        with self._lock:
+            return dict(self._routes)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        families = (
+            ("quote_http_request_db_queries", "SQL statements executed per request", "queries"),
+            ("quote_http_request_db_time_ms", "Total DB time per request in milliseconds", "db_time_ms"),
+            ("quote_http_request_duration_ms", "Request duration in milliseconds", "request_time_ms"),
+        )
+        routes = sorted(self.snapshot().items())
+        lines = []
+        with self._lock:
+            for name, help_text, attr in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (method, route), metrics in routes:
+                    hist = getattr(metrics, attr)
+                    labels = f'method="{method}",route="{route}"'
+                    for le, n in hist.cumulative():
+                        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {n}')
+                    lines.append(f"{name}_sum{{{labels}}} {round(hist.total, 3)}")
+                    lines.append(f"{name}_count{{{labels}}} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# ==========================================
+# ASGI MIDDLEWARE
+# ==========================================
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return path or "<unmatched>"
+
+
+def format_server_timing(stats: RequestSQLStats, request_time: float) -> str:
+    """Server-Timing 헤더 값: db 시간(쿼리 수 포함) + 전체 처리 시간"""
+    return (
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.query_count} queries", '
+        f"app;dur={request_time * 1000:.2f}"
+    )
+
+
+class SQLMetricsMiddleware:
+    """
+    요청 단위 SQL 계측 미들웨어 (pure ASGI)
+    - Server-Timing 헤더 추가
+    - 라우트별 히스토그램 기록
+    - dev 모드: 동일 SQL 반복 실행(N+1) 경고
+    """
+
+    def __init__(self, app, mode: Optional[str] = None, threshold: Optional[int] = None):
+        self.app = app
+        self.mode = (mode or SQL_METRICS_MODE).lower()
+        self.threshold = N_PLUS_ONE_THRESHOLD if threshold is None else threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.mode == "off":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSQLStats(track_statements=(self.mode == "dev"))
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - started
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", format_server_timing(stats, elapsed).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            elapsed = time.perf_counter() - started
+            route = _route_template(scope)
+            registry.observe(scope["method"], route, stats, elapsed)
+            if self.mode == "dev":
+                for sql, count in stats.repeated_statements(self.threshold):
+                    logger.warning(
+                        f"[SQL Metrics] Possible N+1 on {scope['method']} {route}: "
+                        f"statement executed {count} times: {sql[:200]}"
+                    )
@@ -0,0 +1,140 @@
+"""
+Integration Tests for Bidding Stats API
+Tests that the single-pass aggregate matches the per-status COUNT queries at a pinned time
+"""
+import pytest
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine, or_
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+NOW = datetime(2025, 3, 10, 12, 0, 0)
+
+
+def _legacy_stats(db, now):
+    """기존 /api/bidding/stats 의 상태별 COUNT 쿼리"""
+    from models import Bidding
+
+    tomorrow = now + timedelta(hours=24)
+    failed = db.query(Bidding).filter(Bidding.status.in_(["closed", "cancelled", "expired"])).count()
+    expired_but_open = db.query(Bidding).filter(
+        Bidding.status == "open", Bidding.deadline != None, Bidding.deadline <= now
+    ).count()
+    return {
+        "total_count": db.query(Bidding).count(),
+        "open_count": db.query(Bidding).filter(
+            Bidding.status == "open", or_(Bidding.deadline == None, Bidding.deadline > now)
+        ).count(),
+        "closing_soon_count": db.query(Bidding).filter(
+            Bidding.status == "open", Bidding.deadline <= tomorrow, Bidding.deadline > now
+        ).count(),
+        "awarded_count": db.query(Bidding).filter(Bidding.status == "awarded").count(),
+        "failed_count": failed + expired_but_open,
+    }
+
+
+def _legacy_shipper_stats(db, customer_id, now):
+    """기존 /api/shipper/biddings/stats 의 상태별 COUNT 쿼리"""
+    from models import Bidding, QuoteRequest
+
+    quote_ids = db.query(QuoteRequest.id).filter(QuoteRequest.customer_id == customer_id).subquery()
+    base = db.query(Bidding).filter(Bidding.quote_request_id.in_(quote_ids))
+    return {
+        "total_count": base.count(),
+        "open_count": base.filter(Bidding.status == "open").count(),
+        "closing_soon_count": base.filter(
+            Bidding.status == "open", Bidding.deadline != None,
+            Bidding.deadline <= now + timedelta(hours=24), Bidding.deadline > now
+        ).count(),
+        "awarded_count": base.filter(Bidding.status == "awarded").count(),
+        "failed_count": base.filter(Bidding.status.in_(["closed", "cancelled", "expired"])).count(),
+    }
+
+
+@pytest.fixture
+def stats_db(monkeypatch):
+    """마감일 경계값을 포함한 비딩 + 고정 시각"""
+    from main import app
+    from database import Base, get_db
+    from models import Customer, QuoteRequest, Bidding
+    from sql_metrics import install_sql_hooks
+    import bidding_stats
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    install_sql_hooks(engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add_all([
+        Customer(id=1, company="A", name="Kim", email="a@example.com", phone="010"),
+        Customer(id=2, company="B", name="Lee", email="b@example.com", phone="010"),
+    ])
+    deadlines = [
+        ("open", None), ("open", NOW), ("open", NOW + timedelta(seconds=1)), ("open", NOW + timedelta(hours=24)),
+        ("open", NOW + timedelta(hours=24, seconds=1)), ("open", NOW - timedelta(days=3)),
+        ("awarded", NOW - timedelta(days=1)), ("closed", None), ("cancelled", NOW), ("expired", NOW),
+    ]
+    for i, (status, deadline) in enumerate(deadlines, start=1):
+        customer_id = 1 if i % 3 else 2
+        db.add(QuoteRequest(id=i, request_number=f"QR-{i}", trade_mode="export", shipping_type="ocean",
+                            load_type="FCL", pol="KRPUS", pod="USLAX", etd=NOW, customer_id=customer_id))
+        db.add(Bidding(id=i, bidding_no=f"EX{i}", quote_request_id=i, status=status, deadline=deadline))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(bidding_stats, "current_time", lambda: NOW)
+    bidding_stats.stats_cache.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    bidding_stats.stats_cache.clear()
+
+
+@pytest.mark.integration
+class TestBiddingStats:
+    """Tests for /api/bidding/stats and /api/shipper/biddings/stats"""
+
+    def test_matches_legacy_counts(self, stats_db):
+        from bidding_stats import compute_bidding_stats, compute_shipper_stats
+
+        db = stats_db()
+        for now in (NOW, NOW - timedelta(days=2), NOW + timedelta(hours=24)):
+            assert compute_bidding_stats(db, now) == _legacy_stats(db, now)
+            for customer_id in (1, 2, 3):
+                assert compute_shipper_stats(db, customer_id, now) == _legacy_shipper_stats(db, customer_id, now)
+        db.close()
+
+    def test_endpoint_single_query_and_cached(self, sync_client, stats_db):
+        first = sync_client.get("/api/bidding/stats")
+        second = sync_client.get("/api/bidding/stats")
+
+        assert first.json() == {"total_count": 10, "open_count": 4, "closing_soon_count": 2,
+                                "awarded_count": 1, "failed_count": 5}
+        assert re.search(r'desc="1 queries"', first.headers["server-timing"])
+        assert re.search(r'desc="0 queries"', second.headers["server-timing"])
+
+    def test_shipper_endpoint(self, sync_client, stats_db):
+        db = stats_db()
+        expected = _legacy_shipper_stats(db, 1, NOW)
+        db.close()
+
+        response = sync_client.get("/api/shipper/biddings/stats", params={"customer_email": "a@example.com"})
+
+        assert response.json() == expected
+        # 고객 조회 + 집계 1회
+        assert re.search(r'desc="2 queries"', response.headers["server-timing"])
@@ -0,0 +1,180 @@
+"""
+Integration Tests for Commerce Category Tree
+Tests for the versioned category tree cache, subcategory filters and list query counts
+"""
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def commerce_db():
+    """카테고리 3단계 + 상품 / 견적이 있는 in-memory DB 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from commerce_models import Company, Category, CommerceMessage, CommerceUser, Product, ProductRFQ, ProductQuotation
+    from category_tree import category_tree_cache
+    from sql_metrics import install_sql_hooks
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    install_sql_hooks(engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add_all([
+        Company(id="c-1", company_name="한빛전자", company_type="seller", country_code="KR"),
+        Company(id="c-2", company_name="대한상사", company_type="buyer", country_code="KR"),
+    ])
+    db.add_all([
+        Category(id="cat-elec", code="ELEC", name_ko="전자", level=1),
+        Category(id="cat-phone", code="PHONE", name_ko="휴대폰", parent_id="cat-elec", level=2),
+        Category(id="cat-case", code="CASE", name_ko="케이스", parent_id="cat-phone", level=3),
+        Category(id="cat-food", code="FOOD", name_ko="식품", level=1),
+    ])
+    db.add_all([
+        Product(id=f"p-{i}", company_id="c-1", category_id=category, sku=f"SKU-{i}", name_ko=f"상품{i}")
+        for i, category in enumerate(["cat-elec", "cat-phone", "cat-case", "cat-food"] * 3)
+    ])
+    db.add(ProductRFQ(id="r-1", company_id="c-2", category_id="cat-case", rfq_number="RFQ-1",
+                      title="케이스 구매", status="open"))
+    db.add_all([
+        ProductQuotation(id=f"q-{i}", rfq_id="r-1", company_id="c-1", quotation_number=f"Q-{i}")
+        for i in range(5)
+    ])
+    # 메시지 스레드: r-1 은 2건, r-2 는 20건 (발신 회사 / 사용자 번갈아)
+    db.add(ProductRFQ(id="r-2", company_id="c-2", category_id="cat-food", rfq_number="RFQ-2",
+                      title="식품 구매", status="open"))
+    db.add_all([
+        CommerceUser(id="u-1", company_id="c-1", email="seller@example.com", name="김셀러"),
+        CommerceUser(id="u-2", company_id="c-2", email="buyer@example.com", name="이바이어"),
+    ])
+    db.add_all([
+        CommerceMessage(id=f"m-{rfq_id}-{i}", rfq_id=rfq_id, content=f"메시지 {i}",
+                        sender_company_id=("c-1", "c-2")[i % 2], sender_user_id=("u-1", "u-2")[i % 2],
+                        recipient_company_id=("c-2", "c-1")[i % 2])
+        for rfq_id, count in (("r-1", 2), ("r-2", 20)) for i in range(count)
+    ])
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    category_tree_cache.invalidate()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    category_tree_cache.invalidate()
+
+
+def _query_count(response):
+    match = re.search(r'desc="(\d+) queries"', response.headers.get("server-timing", ""))
+    assert match, "SQL metrics disabled"
+    return int(match.group(1))
+
+
+@pytest.mark.integration
+class TestCategoryTree:
+    """Tests for /api/commerce/categories/tree"""
+
+    def test_tree_is_built_once(self, sync_client, commerce_db):
+        from category_tree import category_tree_cache
+
+        builds = category_tree_cache.builds
+        first = sync_client.get("/api/commerce/categories/tree").json()
+        second = sync_client.get("/api/commerce/categories/tree").json()
+
+        assert first == second
+        assert [c["code"] for c in first] == ["ELEC", "FOOD"]
+        assert first[0]["children"][0]["children"][0]["code"] == "CASE"
+        assert category_tree_cache.builds == builds + 1
+
+    def test_create_and_update_invalidate(self, sync_client, commerce_db):
+        sync_client.get("/api/commerce/categories/tree")
+
+        created = sync_client.post("/api/commerce/categories", json={
+            "code": "SNACK", "name_ko": "과자", "parent_id": "cat-food", "level": 2,
+        })
+        assert created.status_code == 201, created.text
+        tree = sync_client.get("/api/commerce/categories/tree").json()
+        assert tree[1]["children"][0]["code"] == "SNACK"
+
+        moved = sync_client.put("/api/commerce/categories/cat-case", json={"parent_id": "cat-food", "name_ko": "포장"})
+        assert moved.status_code == 200, moved.text
+        tree = sync_client.get("/api/commerce/categories/tree").json()
+        assert tree[0]["children"][0]["children"] == []
+        assert {c["name_ko"] for c in tree[1]["children"]} == {"과자", "포장"}
+
+    def test_cannot_move_under_descendant(self, sync_client, commerce_db):
+        response = sync_client.put("/api/commerce/categories/cat-elec", json={"parent_id": "cat-case"})
+
+        assert response.status_code == 400
+
+    def test_update_unknown_category(self, sync_client, commerce_db):
+        response = sync_client.put("/api/commerce/categories/none", json={"name_ko": "x"})
+
+        assert response.status_code == 404
+
+
+@pytest.mark.integration
+class TestCategoryFilter:
+    """Tests for include_subcategories on the list endpoints"""
+
+    def test_products_direct_and_subcategories(self, sync_client, commerce_db):
+        direct = sync_client.get("/api/commerce/products", params={"category_id": "cat-elec"}).json()
+        nested = sync_client.get("/api/commerce/products", params={
+            "category_id": "cat-elec", "include_subcategories": True, "page_size": 100,
+        }).json()
+
+        assert direct["total"] == 3
+        assert nested["total"] == 9
+        assert {p["category_name"] for p in nested["products"]} == {"전자", "휴대폰", "케이스"}
+
+    def test_rfqs_with_parent_category(self, sync_client, commerce_db):
+        response = sync_client.get("/api/commerce/rfqs", params={
+            "category_id": "cat-phone", "include_subcategories": True,
+        })
+
+        assert [r["id"] for r in response.json()["rfqs"]] == ["r-1"]
+
+
+@pytest.mark.integration
+class TestListQueryCount:
+    """관계 필드는 행 수와 무관하게 eager loading 쿼리로 조회"""
+
+    def test_products_query_count_is_constant(self, sync_client, commerce_db):
+        small = sync_client.get("/api/commerce/products", params={"page_size": 2})
+        large = sync_client.get("/api/commerce/products", params={"page_size": 12})
+
+        assert len(large.json()["products"]) == 12
+        assert _query_count(small) == _query_count(large)
+
+    def test_quotations_query_count_is_constant(self, sync_client, commerce_db):
+        small = sync_client.get("/api/commerce/quotations", params={"page_size": 1})
+        large = sync_client.get("/api/commerce/quotations", params={"page_size": 5})
+
+        assert large.json()["quotations"][0]["rfq_number"] == "RFQ-1"
+        assert _query_count(small) == _query_count(large)
+
+    def test_message_thread_query_count_is_constant(self, sync_client, commerce_db):
+        small = sync_client.get("/api/commerce/messages/thread", params={"rfq_id": "r-1", "company_id": "c-2"})
+        large = sync_client.get("/api/commerce/messages/thread", params={"rfq_id": "r-2", "company_id": "c-2"})
+
+        messages = large.json()["messages"]
+        assert len(messages) == 20
+        assert messages[0]["sender_company_name"] == "한빛전자" and messages[0]["sender_user_name"] == "김셀러"
+        assert messages[0]["is_read"] and not messages[1]["is_read"]
+        assert _query_count(small) == _query_count(large)
@@ -0,0 +1,164 @@
+"""
+Integration Tests for Commerce Product Facets
+Tests for single-pass facet counts and the facet cache
+"""
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def commerce_db():
+    """패싯 값이 섞인 상품이 있는 in-memory DB 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from commerce_models import Company, Category, Product
+    from category_tree import category_tree_cache
+    from commerce_facets import facet_cache
+    from sql_metrics import install_sql_hooks
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    install_sql_hooks(engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add(Company(id="c-1", company_name="한빛전자", company_type="seller", country_code="KR"))
+    db.add_all([
+        Category(id="cat-elec", code="ELEC", name_ko="전자", level=1),
+        Category(id="cat-phone", code="PHONE", name_ko="휴대폰", parent_id="cat-elec", level=2),
+        Category(id="cat-food", code="FOOD", name_ko="식품", level=1),
+    ])
+    rows = [
+        # category, origin, price_type, stock_status
+        ("cat-elec", "KR", "public", "in_stock"),
+        ("cat-phone", "KR", "public", "limited"),
+        ("cat-phone", "CN", "range", "in_stock"),
+        ("cat-phone", "CN", "private", "in_stock"),
+        ("cat-food", "KR", "public", "made_to_order"),
+        ("cat-food", "VN", "public", "in_stock"),
+    ]
+    db.add_all([
+        Product(id=f"p-{i}", company_id="c-1", category_id=category, sku=f"SKU-{i}", name_ko=f"상품{i}",
+                origin_country=origin, price_type=price_type, stock_status=stock)
+        for i, (category, origin, price_type, stock) in enumerate(rows)
+    ])
+    db.add(Product(id="p-off", company_id="c-1", category_id="cat-food", sku="SKU-OFF", name_ko="단종",
+                   origin_country="KR", is_active=False))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    category_tree_cache.invalidate()
+    facet_cache.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    category_tree_cache.invalidate()
+    facet_cache.clear()
+
+
+def _counts(facet):
+    return {item["value"]: item["count"] for item in facet}
+
+
+def _query_count(response):
+    match = re.search(r'desc="(\d+) queries"', response.headers.get("server-timing", ""))
+    assert match, "SQL metrics disabled"
+    return int(match.group(1))
+
+
+@pytest.mark.integration
+class TestProductFacets:
+    """Tests for /api/commerce/products/facets"""
+
+    def test_counts_without_filters(self, sync_client, commerce_db):
+        data = sync_client.get("/api/commerce/products/facets").json()
+
+        assert data["total"] == 6
+        assert _counts(data["facets"]["origin_country"]) == {"KR": 3, "CN": 2, "VN": 1}
+        assert _counts(data["facets"]["stock_status"]) == {"in_stock": 4, "limited": 1, "made_to_order": 1}
+        assert data["facets"]["category"][0] == {"value": "cat-phone", "label": "휴대폰", "count": 3}
+
+    def test_selected_facet_keeps_alternatives(self, sync_client, commerce_db):
+        data = sync_client.get("/api/commerce/products/facets", params={
+            "origin_country": "KR", "price_type": "public",
+        }).json()
+
+        assert data["total"] == 3
+        # 원산지 카운트는 원산지 선택을 제외한 조건 (price_type=public) 기준
+        assert _counts(data["facets"]["origin_country"]) == {"KR": 3, "VN": 1}
+        assert _counts(data["facets"]["price_type"]) == {"public": 3}
+        assert _counts(data["facets"]["stock_status"]) == {"in_stock": 1, "limited": 1, "made_to_order": 1}
+
+    def test_subcategory_filter(self, sync_client, commerce_db):
+        data = sync_client.get("/api/commerce/products/facets", params={
+            "category_id": "cat-elec", "include_subcategories": True,
+        }).json()
+
+        assert data["total"] == 4
+        assert _counts(data["facets"]["origin_country"]) == {"KR": 2, "CN": 2}
+
+    def test_list_includes_facets_matching_total(self, sync_client, commerce_db):
+        data = sync_client.get("/api/commerce/products", params={
+            "origin_country": "CN", "stock_status": "in_stock", "include_facets": True,
+        }).json()
+
+        assert data["total"] == 2
+        assert _counts(data["facets"]["origin_country"]) == {"CN": 2, "KR": 1, "VN": 1}
+        assert _counts(data["facets"]["price_type"]) == {"range": 1, "private": 1}
+
+    def test_list_without_facets(self, sync_client, commerce_db):
+        data = sync_client.get("/api/commerce/products").json()
+
+        assert data.get("facets") is None
+
+
+@pytest.mark.integration
+class TestFacetCache:
+    """패싯 선택만 바뀌는 요청은 캐시된 집계 재사용"""
+
+    def test_facet_navigation_reuses_grouped_counts(self, sync_client, commerce_db):
+        sync_client.get("/api/commerce/categories/tree")  # 카테고리 트리 쿼리 제외
+        first = sync_client.get("/api/commerce/products/facets", params={"search": "상품"})
+        second = sync_client.get("/api/commerce/products/facets", params={"search": " 상품 ", "origin_country": "CN"})
+        uncached = sync_client.get("/api/commerce/products/facets", params={"search": "상품", "is_featured": False})
+
+        assert second.json()["total"] == 2
+        assert _query_count(second) < _query_count(first)
+        assert _query_count(uncached) == _query_count(first)
+
+    def test_product_writes_clear_cache(self, sync_client, commerce_db):
+        sync_client.get("/api/commerce/products/facets")
+        sync_client.delete("/api/commerce/products/p-5")
+
+        data = sync_client.get("/api/commerce/products/facets").json()
+
+        assert data["total"] == 5
+        assert "VN" not in _counts(data["facets"]["origin_country"])
+
+    def test_entries_expire_after_ttl(self):
+        from commerce_facets import FacetCache
+
+        now = [1000.0]
+        cache = FacetCache(ttl=30, clock=lambda: now[0])
+        cache.put(("c-1", None, ""), [("cat", "KR", "public", "in_stock", 1)])
+
+        now[0] += 29
+        assert cache.get(("c-1", None, "")) is not None
+        now[0] += 1
+        assert cache.get(("c-1", None, "")) is None
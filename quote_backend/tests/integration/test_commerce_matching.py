@@ -0,0 +1,208 @@
+"""
+Integration Tests for RFQ Supplier Matching
+Tests for supplier scoring, invitations on publish and incremental index maintenance
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def commerce_db(monkeypatch):
+    """바이어 1 + 셀러 4 + 카테고리 2단계 in-memory DB 로 get_db 교체 (데이터 버전도 같은 DB 에서 읽음)"""
+    from main import app
+    from database import Base, get_db
+    from models import DataVersion
+    from commerce_models import Company, Category, Product, ProductRFQ, ProductRFQItem
+    from category_tree import category_tree_cache
+    from commerce_matching import matching_index
+    from response_cache import reference_cache
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add_all([
+        Company(id="buyer", company_name="대한상사", company_type="buyer", country_code="KR"),
+        Company(id="s-kr", company_name="한빛전자", company_type="seller", country_code="KR"),
+        Company(id="s-cn", company_name="Shenzhen Parts", company_type="both", country_code="CN"),
+        Company(id="s-food", company_name="바다식품", company_type="seller", country_code="KR"),
+        Company(id="s-off", company_name="휴업상사", company_type="seller", country_code="KR", is_active=False),
+    ])
+    db.add_all([
+        Category(id="cat-elec", code="ELEC", name_ko="전자", level=1),
+        Category(id="cat-phone", code="PHONE", name_ko="휴대폰", parent_id="cat-elec", level=2),
+        Category(id="cat-food", code="FOOD", name_ko="식품", level=1),
+    ])
+    db.add_all([
+        Product(id="p-kr", company_id="s-kr", category_id="cat-elec", sku="KR-1", name_ko="멀티탭",
+                origin_country="KR", certifications=["KC", "CE"], price_type="public"),
+        Product(id="p-cn", company_id="s-cn", category_id="cat-phone", sku="CN-1", name_ko="케이스",
+                origin_country="CN", certifications=["ce"], price_type="private"),
+        Product(id="p-food", company_id="s-food", category_id="cat-food", sku="F-1", name_ko="김",
+                origin_country="KR", price_type="public"),
+        Product(id="p-off", company_id="s-off", category_id="cat-elec", sku="O-1", name_ko="충전기",
+                origin_country="KR", price_type="public"),
+    ])
+    db.add(ProductRFQ(id="rfq-1", company_id="buyer", category_id="cat-elec", rfq_number="RFQ-1",
+                      title="전자부품 구매", visibility="public", status="draft",
+                      target_countries=["KR"], required_certs=["CE", "KC"]))
+    db.add(ProductRFQItem(id="item-1", rfq_id="rfq-1", name="멀티탭", quantity=100))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def load_versions():
+        session = TestSession()
+        try:
+            return dict(session.query(DataVersion.name, DataVersion.version).all())
+        finally:
+            session.close()
+
+    monkeypatch.setattr(reference_cache, "_load_versions", load_versions)
+    reference_cache.expire_versions()
+    category_tree_cache.invalidate()
+    matching_index.reset()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    reference_cache.expire_versions()
+    category_tree_cache.invalidate()
+    matching_index.reset()
+
+
+def _invited(session_factory, rfq_id="rfq-1"):
+    from commerce_models import ProductRFQInvitation
+
+    db = session_factory()
+    try:
+        return {row.company_id for row in db.query(ProductRFQInvitation).filter_by(rfq_id=rfq_id)}
+    finally:
+        db.close()
+
+
+@pytest.mark.integration
+class TestSupplierMatching:
+    """Tests for /api/commerce/rfqs/{rfq_id}/matches"""
+
+    def test_scores_and_order(self, sync_client, commerce_db):
+        data = sync_client.get("/api/commerce/rfqs/rfq-1/matches").json()
+
+        ranked = [(m["company_id"], m["score"]) for m in data["matches"]]
+        # 카테고리 40 + 원산지 20 + 인증 30 + 가격 공개 10
+        assert ranked[0] == ("s-kr", 100.0)
+        # 하위 카테고리 30 + 인증 1/2 × 30
+        assert ("s-cn", 45.0) in ranked
+        assert "s-food" not in dict(ranked)
+        assert data["matches"][0]["company_name"] == "한빛전자"
+
+    def test_unknown_rfq(self, sync_client, commerce_db):
+        assert sync_client.get("/api/commerce/rfqs/none/matches").status_code == 404
+
+
+@pytest.mark.integration
+class TestPublishInvitations:
+    """Tests for invitations created by publish_rfq"""
+
+    def test_publish_invites_eligible_suppliers(self, sync_client, commerce_db):
+        response = sync_client.post("/api/commerce/rfqs/rfq-1/publish")
+
+        assert response.status_code == 200, response.text
+        # 비활성 회사는 매칭되더라도 초대하지 않음
+        assert _invited(commerce_db) == {"s-kr", "s-cn"}
+
+    def test_publish_without_auto_invite(self, sync_client, commerce_db):
+        sync_client.post("/api/commerce/rfqs/rfq-1/publish", params={"auto_invite": False})
+
+        assert _invited(commerce_db) == set()
+
+    def test_private_rfq_is_not_auto_matched(self, sync_client, commerce_db):
+        from commerce_models import ProductRFQ
+
+        db = commerce_db()
+        db.get(ProductRFQ, "rfq-1").visibility = "private"
+        db.commit()
+        db.close()
+
+        sync_client.post("/api/commerce/rfqs/rfq-1/publish")
+
+        assert _invited(commerce_db) == set()
+
+    def test_limit_counts_only_new_eligible_invitations(self, commerce_db):
+        from commerce_models import ProductRFQ, ProductRFQInvitation
+        from commerce_matching import invite_matched_suppliers
+
+        db = commerce_db()
+        # 재게시: 최고 점수 s-kr 은 이미 초대됨, 다음 순위 s-off 는 비활성
+        db.add(ProductRFQInvitation(id="inv-1", rfq_id="rfq-1", company_id="s-kr", status="pending"))
+        db.commit()
+        invited = invite_matched_suppliers(db, db.get(ProductRFQ, "rfq-1"), limit=1)
+        db.commit()
+        db.close()
+
+        assert [m.company_id for m in invited] == ["s-cn"]
+        assert _invited(commerce_db) == {"s-kr", "s-cn"}
+
+
+@pytest.mark.integration
+class TestIncrementalIndex:
+    """상품 API 변경이 재로딩 없이 매칭에 반영되는지 확인"""
+
+    def _matched(self, sync_client):
+        return {m["company_id"] for m in sync_client.get("/api/commerce/rfqs/rfq-1/matches").json()["matches"]}
+
+    def test_create_update_delete(self, sync_client, commerce_db, monkeypatch):
+        from commerce_matching import matching_index
+
+        assert self._matched(sync_client) == {"s-kr", "s-cn", "s-off"}
+        loaded = matching_index.products.copy()
+        reloads = []
+        reload = matching_index.reload
+        monkeypatch.setattr(matching_index, "reload", lambda db: reloads.append(1) or reload(db))
+
+        created = sync_client.post("/api/commerce/products", json={
+            "company_id": "s-food", "category_id": "cat-phone", "name_ko": "보조배터리", "price_type": "public",
+        })
+        assert created.status_code == 201, created.text
+        assert "s-food" in self._matched(sync_client)
+
+        sync_client.put("/api/commerce/products/p-cn", json={"category_id": "cat-food"})
+        assert "s-cn" not in self._matched(sync_client)
+
+        sync_client.delete("/api/commerce/products/p-off")
+        assert "s-off" not in self._matched(sync_client)
+
+        # 전체 재로딩 없이 반영되었는지 확인 (이 프로세스가 올린 버전은 색인 버전도 함께 올림)
+        assert matching_index.loaded and len(matching_index.products) == len(loaded)
+        assert reloads == []
+
+    def test_reloads_after_change_in_other_process(self, sync_client, commerce_db):
+        from sqlalchemy import text
+        from response_cache import reference_cache
+
+        assert "s-cn" in self._matched(sync_client)
+
+        # 다른 워커: 상품 수정 + products 버전 증가 (이 프로세스의 색인은 모름)
+        db = commerce_db()
+        db.execute(text("UPDATE products SET category_id = 'cat-food' WHERE id = 'p-cn'"))
+        db.execute(text("INSERT INTO data_versions (name, version) VALUES ('products', 7)"))
+        db.commit()
+        db.close()
+        assert "s-cn" in self._matched(sync_client)  # 버전 재확인 주기 전
+
+        reference_cache.expire_versions()  # VERSION_TTL 경과
+        assert "s-cn" not in self._matched(sync_client)
@@ -0,0 +1,174 @@
+"""
+Integration Tests for Commerce Full-Text Search
+Tests for FTS5-backed product / RFQ search on the list endpoints
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def commerce_db():
+    """FTS 인덱스가 설치된 in-memory DB 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from commerce_models import Company, Category, Product, ProductRFQ
+    from commerce_search import install_search_indexes
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    seller = Company(id="c-1", company_name="한빛전자", company_type="seller", country_code="KR")
+    db.add(seller)
+    db.add(Category(id="cat-1", code="ELEC", name_ko="전자"))
+    db.add_all([
+        Product(id="p-1", company_id="c-1", category_id="cat-1", sku="SKU-CASE-01",
+                name_ko="스마트폰케이스", name_en="Smartphone Case", description="실리콘 소재", origin_country="KR"),
+        Product(id="p-2", company_id="c-1", category_id="cat-1", sku="SKU-CBL-02",
+                name_ko="충전 케이블", name_en="Charging Cable", description="스마트폰케이스와 함께 사용",
+                origin_country="CN"),
+        Product(id="p-3", company_id="c-1", sku="SKU-LED-03",
+                name_ko="LED 조명", name_en="LED Lamp", description="Warm white", origin_country="KR"),
+    ])
+    db.add_all([
+        ProductRFQ(id="r-1", company_id="c-1", rfq_number="RFQ-2026-0001", title="알루미늄 프로파일 구매",
+                   description="6063 합금", status="open"),
+        ProductRFQ(id="r-2", company_id="c-1", rfq_number="RFQ-2026-0002", title="Cotton T-shirt sourcing",
+                   description="organic cotton", status="draft"),
+    ])
+    db.commit()
+    db.close()
+
+    # 기존 데이터가 있는 상태에서 설치 → 초기 색인
+    assert install_search_indexes(engine)
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+
+
+def _ids(response, key):
+    assert response.status_code == 200, response.text
+    return [item["id"] for item in response.json()[key]]
+
+
+@pytest.mark.integration
+class TestProductSearch:
+    """Tests for /api/commerce/products?search="""
+
+    def test_korean_substring_match(self, sync_client, commerce_db):
+        ids = _ids(sync_client.get("/api/commerce/products", params={"search": "폰케이스"}), "products")
+
+        assert set(ids) == {"p-1", "p-2"}
+
+    def test_name_match_ranks_above_description(self, sync_client, commerce_db):
+        ids = _ids(sync_client.get("/api/commerce/products", params={"search": "스마트폰케이스"}), "products")
+
+        assert ids == ["p-1", "p-2"]
+
+    def test_english_is_case_insensitive(self, sync_client, commerce_db):
+        ids = _ids(sync_client.get("/api/commerce/products", params={"search": "charging"}), "products")
+
+        assert ids == ["p-2"]
+
+    def test_combined_with_structured_filters(self, sync_client, commerce_db):
+        response = sync_client.get("/api/commerce/products", params={"search": "폰케이스", "origin_country": "CN"})
+
+        assert _ids(response, "products") == ["p-2"]
+        assert response.json()["total"] == 1
+
+    def test_short_terms_fall_back_to_like(self, sync_client, commerce_db):
+        ids = _ids(sync_client.get("/api/commerce/products", params={"search": "LED 조명"}), "products")
+
+        assert ids == ["p-3"]
+
+    def test_index_follows_updates_and_deletes(self, sync_client, commerce_db):
+        from commerce_models import Product
+
+        db = commerce_db()
+        product = db.get(Product, "p-3")
+        product.name_en = "Bluetooth Speaker"
+        db.delete(db.get(Product, "p-2"))
+        db.commit()
+        db.close()
+
+        assert _ids(sync_client.get("/api/commerce/products", params={"search": "speaker"}), "products") == ["p-3"]
+        assert _ids(sync_client.get("/api/commerce/products", params={"search": "charging"}), "products") == []
+
+    def test_index_survives_rowid_renumbering(self, sync_client, commerce_db):
+        from commerce_models import Product
+
+        db = commerce_db()
+        db.delete(db.get(Product, "p-1"))
+        db.commit()
+        # 문자열 PK 테이블의 암묵적 rowid 는 VACUUM 때 다시 매겨질 수 있음 (재현: rowid 직접 변경)
+        db.execute(text("UPDATE products SET rowid = rowid + 100"))
+        db.commit()
+        db.close()
+
+        assert _ids(sync_client.get("/api/commerce/products", params={"search": "charging"}), "products") == ["p-2"]
+        assert _ids(sync_client.get("/api/commerce/products", params={"search": "LED 조명"}), "products") == ["p-3"]
+
+    def test_quotes_in_search_are_escaped(self, sync_client, commerce_db):
+        response = sync_client.get("/api/commerce/products", params={"search": '"케이스 OR *'})
+
+        assert response.status_code == 200
+
+
+@pytest.mark.integration
+class TestRFQSearch:
+    """Tests for /api/commerce/rfqs?search="""
+
+    def test_title_and_number_search(self, sync_client, commerce_db):
+        assert _ids(sync_client.get("/api/commerce/rfqs", params={"search": "알루미늄"}), "rfqs") == ["r-1"]
+        assert _ids(sync_client.get("/api/commerce/rfqs", params={"search": "2026-0002"}), "rfqs") == ["r-2"]
+
+    def test_search_with_status_filter(self, sync_client, commerce_db):
+        response = sync_client.get("/api/commerce/rfqs", params={"search": "cotton", "status": "open"})
+
+        assert _ids(response, "rfqs") == []
+
+
+@pytest.mark.integration
+class TestSearchFallback:
+    """Tests that SQLite builds without the trigram tokenizer fall back to ilike search"""
+
+    def test_missing_tokenizer_uses_ilike(self, sync_client, commerce_db, monkeypatch):
+        import commerce_search
+        from sqlalchemy import create_engine
+        from database import Base
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        monkeypatch.setattr(commerce_search, "TOKENIZER", "no_such_tokenizer")
+
+        assert commerce_search.install_search_indexes(engine) is False
+        assert engine not in commerce_search._installed_engines
+        with engine.connect() as conn:
+            assert not commerce_search.fts5_available(conn)
+
+    def test_search_without_index(self, sync_client, commerce_db):
+        import commerce_search
+
+        db = commerce_db()
+        commerce_search._installed_engines.discard(db.get_bind())
+        db.close()
+
+        ids = _ids(sync_client.get("/api/commerce/products", params={"search": "폰케이스"}), "products")
+        assert set(ids) == {"p-1", "p-2"}
@@ -0,0 +1,204 @@
+"""
+Integration Tests for Dashboard Bundle API
+Tests that bundled widgets match the individual dashboard / analytics endpoints
+"""
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+NOW = datetime.now().replace(microsecond=0)
+FROM_DATE = (NOW - timedelta(days=300)).strftime("%Y-%m-%d")
+TO_DATE = (NOW + timedelta(days=1)).strftime("%Y-%m-%d")
+RANGE = {"from_date": FROM_DATE, "to_date": TO_DATE}
+
+
+def _seed(db):
+    """화주 1 / 운송사 2 + 견적 요청 5건 (비딩 3건, 낙찰 / 계약 2건)"""
+    from models import (
+        Customer, Forwarder, QuoteRequest, CargoDetail, Bidding, Bid, Contract, ContainerType
+    )
+
+    db.add_all([
+        Customer(id=1, company="Test Shipper", name="Kim", email="shipper@example.com", phone="010"),
+        Forwarder(id=1, company="Fast Forwarding", name="Lee", email="fwd@example.com", phone="010", rating=4.5),
+        Forwarder(id=2, company="Slow Forwarding", name="Park", email="slow@example.com", phone="010"),
+        ContainerType(id=1, code="40HC", name="40 High Cube", abbreviation="40'HC"),
+    ])
+    routes = [("KRPUS", "USLAX", "FOB"), ("KRPUS", "USLAX", "CIF"), ("KRPUS", "CNSHA", None),
+              ("KRINC", "CNSHA", "FOB"), ("KRINC", "USLAX", None)]
+    for i, (pol, pod, incoterms) in enumerate(routes, start=1):
+        db.add(QuoteRequest(id=i, request_number=f"QR-{i}", trade_mode="export", shipping_type="ocean",
+                            load_type="FCL", incoterms=incoterms, pol=pol, pod=pod, etd=NOW, customer_id=1,
+                            created_at=NOW - timedelta(days=100 - i)))
+        db.add(CargoDetail(quote_request_id=i, container_type="40HC" if i < 4 else "20GP", qty=i,
+                           gross_weight=10000 + i * 1000, cbm=20 + i))
+    db.add_all([
+        Bidding(id=1, bidding_no="EX1", quote_request_id=1, status="awarded", awarded_bid_id=1),
+        Bidding(id=2, bidding_no="EX2", quote_request_id=2, status="awarded", awarded_bid_id=4),
+        Bidding(id=3, bidding_no="EX3", quote_request_id=3, status="open", deadline=NOW + timedelta(hours=5)),
+    ])
+    db.add_all([
+        Bid(id=1, bidding_id=1, forwarder_id=1, total_amount=1000, total_amount_krw=1350000, status="awarded",
+            created_at=NOW - timedelta(days=95)),
+        Bid(id=2, bidding_id=1, forwarder_id=2, total_amount=1200, status="rejected",
+            created_at=NOW - timedelta(days=94)),
+        Bid(id=3, bidding_id=2, forwarder_id=1, total_amount=900, status="rejected",
+            created_at=NOW - timedelta(days=60)),
+        Bid(id=4, bidding_id=2, forwarder_id=2, total_amount=800, status="awarded",
+            created_at=NOW - timedelta(days=59)),
+        Bid(id=5, bidding_id=3, forwarder_id=1, total_amount=700, status="submitted",
+            created_at=NOW - timedelta(days=10)),
+    ])
+    db.add_all([
+        Contract(id=1, contract_no="CT-1", bidding_id=1, awarded_bid_id=1, customer_id=1, forwarder_id=1,
+                 total_amount_krw=1350000, status="confirmed", confirmed_at=NOW - timedelta(days=40)),
+        Contract(id=2, contract_no="CT-2", bidding_id=2, awarded_bid_id=4, customer_id=1, forwarder_id=2,
+                 total_amount_krw=1080000, status="confirmed", confirmed_at=NOW - timedelta(days=20)),
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def dashboard_db(tmp_path):
+    """파일 SQLite (위젯 동시 실행 경로) 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from dashboard_bundle import bundle_cache
+    from bidding_stats import stats_cache
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+    db = TestSession()
+    _seed(db)
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    bundle_cache.clear()
+    stats_cache.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    bundle_cache.clear()
+    stats_cache.clear()
+    engine.dispose()
+
+
+def _get(sync_client, path, **params):
+    response = sync_client.get(path, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.integration
+class TestShipperBundle:
+    """Tests for /api/dashboard/shipper/bundle"""
+
+    def test_matches_individual_endpoints(self, sync_client, dashboard_db):
+        bundle = _get(sync_client, "/api/dashboard/shipper/bundle", customer_email="shipper@example.com", **RANGE)
+        widgets = bundle["data"]
+
+        for widget in ("volume-trend", "top-export", "top-import", "container-efficiency"):
+            expected = _get(sync_client, f"/api/dashboard/shipper/{widget}",
+                            customer_email="shipper@example.com", **RANGE)["data"]
+            assert widgets[widget.replace("-", "_")] == expected, widget
+        assert widgets["summary"] == _get(sync_client, "/api/analytics/shipper/summary", customer_id=1, **RANGE)
+        assert widgets["bidding_stats"] == _get(sync_client, "/api/shipper/biddings/stats", customer_id=1)
+
+    def test_widget_values(self, sync_client, dashboard_db):
+        widgets = _get(sync_client, "/api/dashboard/shipper/bundle", customer_id=1, **RANGE)["data"]
+
+        assert widgets["top_export"] == [{"country": "KRPUS", "count": 2, "volume": 20},
+                                         {"country": "KRINC", "count": 1, "volume": 10}]
+        assert [c["country"] for c in widgets["top_import"]] == ["USLAX", "CNSHA"]
+        assert [(m["teu"], m["cbm"]) for m in widgets["volume_trend"]] in ([(3, 43.0)], [(1, 21.0), (2, 22.0)])
+        assert widgets["container_efficiency"] == [{"container_type": "20GP", "efficiency": 66, "count": 2},
+                                                   {"container_type": "40'HC", "efficiency": 45, "count": 3}]
+        assert widgets["bidding_stats"] == {"total_count": 3, "open_count": 1, "closing_soon_count": 1,
+                                            "awarded_count": 2, "failed_count": 0}
+        summary = widgets["summary"]
+        assert (summary["total_requests"], summary["total_biddings"], summary["award_rate"]) == (5, 3, 66.7)
+        assert summary["total_cost_krw"] == 1350000 + 800 * 1350
+
+    def test_cached_per_user(self, sync_client, dashboard_db):
+        from dashboard_bundle import bundle_cache
+
+        first = _get(sync_client, "/api/dashboard/shipper/bundle", customer_id=1, **RANGE)
+        second = _get(sync_client, "/api/dashboard/shipper/bundle", customer_id=1, **RANGE)
+
+        assert first == second
+        assert bundle_cache.stats()["hits"] >= 1
+
+    def test_unknown_customer(self, sync_client, dashboard_db):
+        assert sync_client.get("/api/dashboard/shipper/bundle",
+                               params={"customer_email": "none@example.com"}).status_code == 404
+        assert sync_client.get("/api/dashboard/shipper/bundle").status_code == 400
+
+
+@pytest.mark.integration
+class TestForwarderBundle:
+    """Tests for /api/dashboard/forwarder/bundle"""
+
+    def test_matches_individual_endpoints(self, sync_client, dashboard_db):
+        widgets = _get(sync_client, "/api/dashboard/forwarder/bundle", forwarder_email="fwd@example.com",
+                       **RANGE)["data"]
+
+        assert widgets["summary"] == _get(sync_client, "/api/analytics/forwarder/summary", forwarder_id=1, **RANGE)
+        assert widgets["monthly_trend"] == _get(sync_client, "/api/analytics/forwarder/monthly-trend",
+                                                forwarder_id=1, **RANGE)
+        assert widgets["route_stats"] == _get(sync_client, "/api/dashboard/forwarder/route-stats",
+                                              forwarder_id=1, **RANGE)["data"]
+
+    def test_widget_values(self, sync_client, dashboard_db):
+        widgets = _get(sync_client, "/api/dashboard/forwarder/bundle", forwarder_id=1, **RANGE)["data"]
+
+        summary = widgets["summary"]
+        assert (summary["total_bids"], summary["awarded_count"], summary["rejected_count"]) == (3, 1, 1)
+        assert (summary["avg_rank"], summary["avg_rating"]) == (1.3, 4.5)
+        lax = widgets["route_stats"][0]
+        assert (lax["route"], lax["bids"], lax["awards"]) == ("KRPUS → USLAX", 2, 1)
+        assert lax["sparkline"] == [0, 0, 0, 0, 1, 0]
+
+
+@pytest.mark.unit
+class TestRunTasks:
+    """Tests for dashboard_bundle.run_tasks"""
+
+    def test_in_memory_sqlite_runs_sequentially(self):
+        from database import Base
+        import dashboard_bundle
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        results = dashboard_bundle.run_tasks(db, {"a": lambda s: s is db, "b": lambda s: s is db})
+
+        assert results == {"a": True, "b": True}
+        assert not dashboard_bundle.can_run_concurrently(engine)
+        db.close()
+
+    def test_file_sqlite_uses_separate_sessions(self, tmp_path):
+        import dashboard_bundle
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}")
+        db = sessionmaker(bind=engine)()
+
+        results = dashboard_bundle.run_tasks(db, {"a": lambda s: s is db, "b": lambda s: s is db})
+
+        assert results == {"a": False, "b": False}
+        db.close()
+        engine.dispose()
@@ -0,0 +1,180 @@
+"""
+Integration Tests for Commerce Dashboard Counters
+Tests for counter maintenance across RFQ / quotation / transaction transitions
+"""
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def commerce_db():
+    """바이어 / 셀러 2곳 + 기존 거래 이력이 있는 in-memory DB 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from commerce_models import Company, ProductRFQ, ProductQuotation, ProductTransaction
+    from commerce_matching import matching_index
+    from sql_metrics import install_sql_hooks
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    install_sql_hooks(engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add_all([
+        Company(id="buyer", company_name="대한상사", company_type="buyer", country_code="KR"),
+        Company(id="seller", company_name="한빛전자", company_type="seller", country_code="KR"),
+        Company(id="other", company_name="Shenzhen Parts", company_type="both", country_code="CN"),
+    ])
+    # 카운터 테이블 도입 전부터 있던 이력
+    db.add_all([
+        ProductRFQ(id="old-1", company_id="buyer", rfq_number="RFQ-OLD-1", title="지난 구매", status="completed"),
+        ProductRFQ(id="old-2", company_id="buyer", rfq_number="RFQ-OLD-2", title="진행 중 구매", status="open"),
+    ])
+    db.add_all([
+        ProductQuotation(id="oq-1", rfq_id="old-1", company_id="seller", quotation_number="Q-OLD-1",
+                         status="accepted"),
+        ProductQuotation(id="oq-2", rfq_id="old-2", company_id="other", quotation_number="Q-OLD-2",
+                         status="draft"),
+    ])
+    db.add(ProductTransaction(id="ot-1", transaction_number="TX-OLD-1", rfq_id="old-1", quotation_id="oq-1",
+                              buyer_company_id="buyer", seller_company_id="seller", status="completed",
+                              total_amount=1000))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    matching_index.reset()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    matching_index.reset()
+
+
+def _stats(sync_client, company_id):
+    response = sync_client.get(f"/api/commerce/dashboard/{company_id}/stats")
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _aggregate(session_factory, company_id):
+    from commerce_counters import aggregate_counters
+
+    db = session_factory()
+    try:
+        return aggregate_counters(db, company_id)
+    finally:
+        db.close()
+
+
+def _assert_consistent(sync_client, session_factory):
+    """카운터 값 == 원본 테이블 집계"""
+    for company_id in ("buyer", "seller", "other"):
+        stats = _stats(sync_client, company_id)
+        expected = _aggregate(session_factory, company_id)
+        assert {k: stats[k] for k in expected} == expected, company_id
+
+
+@pytest.mark.integration
+class TestDashboardCounters:
+    """Tests for /api/commerce/dashboard/{company_id}/stats"""
+
+    def test_existing_history_is_seeded(self, sync_client, commerce_db):
+        buyer = _stats(sync_client, "buyer")
+        seller = _stats(sync_client, "seller")
+
+        assert (buyer["total_rfqs"], buyer["open_rfqs"], buyer["total_quotations_received"]) == (2, 1, 2)
+        assert buyer["completed_transactions"] == 1
+        assert (seller["total_quotations_sent"], seller["completed_transactions"]) == (1, 1)
+        assert _stats(sync_client, "other")["pending_quotations"] == 1
+
+    def test_full_trade_flow(self, sync_client, commerce_db):
+        # 카운터 행을 먼저 만들어 증분 경로를 검증
+        _assert_consistent(sync_client, commerce_db)
+
+        rfq = sync_client.post("/api/commerce/rfqs", json={
+            "company_id": "buyer", "title": "LED 구매", "items": [{"name": "LED", "quantity": 10}],
+        }).json()
+        sync_client.post(f"/api/commerce/rfqs/{rfq['id']}/publish", params={"auto_invite": False})
+        _assert_consistent(sync_client, commerce_db)
+
+        quotations = [
+            sync_client.post("/api/commerce/quotations", json={
+                "rfq_id": rfq["id"], "company_id": company_id,
+                "items": [{"name": "LED", "quantity": 10, "unit_price": price}],
+            }).json()
+            for company_id, price in (("seller", 5), ("other", 6))
+        ]
+        assert _stats(sync_client, "seller")["pending_quotations"] == 1
+        for quotation in quotations:
+            sync_client.post(f"/api/commerce/quotations/{quotation['id']}/submit")
+        _assert_consistent(sync_client, commerce_db)
+
+        transaction = sync_client.post(f"/api/commerce/quotations/{quotations[0]['id']}/accept").json()
+        stats = _stats(sync_client, "buyer")
+        assert (stats["open_rfqs"], stats["active_transactions"]) == (1, 1)
+        _assert_consistent(sync_client, commerce_db)
+
+        sync_client.put(f"/api/commerce/transactions/{transaction['id']}/status", json={"status": "completed"})
+        assert _stats(sync_client, "seller")["completed_transactions"] == 2
+        _assert_consistent(sync_client, commerce_db)
+
+    def test_close_and_cancel(self, sync_client, commerce_db):
+        _stats(sync_client, "buyer")
+
+        sync_client.post("/api/commerce/rfqs/old-2/close")
+        assert _stats(sync_client, "buyer")["open_rfqs"] == 0
+        sync_client.post("/api/commerce/rfqs/old-2/cancel")
+        _assert_consistent(sync_client, commerce_db)
+
+    def test_dashboard_reads_one_row(self, sync_client, commerce_db):
+        _stats(sync_client, "buyer")  # 카운터 행 생성
+
+        response = sync_client.get("/api/commerce/dashboard/buyer/stats")
+
+        # 회사 조회 + 카운터 행 조회
+        assert re.search(r'desc="2 queries"', response.headers["server-timing"])
+
+    def test_rebuild_fixes_drift(self, sync_client, commerce_db):
+        from commerce_models import CompanyDashboardCounter
+        from commerce_counters import rebuild_counters
+
+        _stats(sync_client, "buyer")
+        db = commerce_db()
+        db.get(CompanyDashboardCounter, "buyer").total_rfqs = 99
+        db.commit()
+        assert _stats(sync_client, "buyer")["total_rfqs"] == 99
+
+        assert rebuild_counters(db) == 3
+        db.commit()
+        db.close()
+
+        assert _stats(sync_client, "buyer")["total_rfqs"] == 2
+
+    def test_aggregate_fallback(self, sync_client, commerce_db, monkeypatch):
+        import commerce_counters
+        from commerce_models import CompanyDashboardCounter
+
+        monkeypatch.setattr(commerce_counters, "COUNTERS_ENABLED", False)
+
+        stats = _stats(sync_client, "seller")
+
+        assert (stats["total_quotations_sent"], stats["completed_transactions"]) == (1, 1)
+        db = commerce_db()
+        assert db.query(CompanyDashboardCounter).count() == 0
+        db.close()
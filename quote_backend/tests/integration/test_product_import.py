@@ -0,0 +1,173 @@
+"""
+Integration Tests for Commerce Product Catalog Import
+Tests for validation, SKU upserts, chunking and index refresh
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+HEADER = "sku,name_ko,name_en,category,price_type,price,moq,stock_status,origin_country,certifications\n"
+
+
+@pytest.fixture
+def commerce_db():
+    """셀러 / 바이어 + 카테고리 + 기존 상품 1건이 있는 in-memory DB 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from commerce_models import Company, Category, Product
+    from commerce_search import install_search_indexes
+    from commerce_matching import matching_index
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    install_search_indexes(engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add_all([
+        Company(id="seller", company_name="한빛전자", company_type="seller", country_code="KR"),
+        Company(id="buyer", company_name="대한상사", company_type="buyer", country_code="KR"),
+    ])
+    db.add(Category(id="cat-elec", code="ELEC", name_ko="전자", level=1))
+    db.add(Product(id="p-old", company_id="seller", sku="SKU-1", name_ko="구형 멀티탭", price_type="private",
+                   is_active=False))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    matching_index.reset()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    matching_index.reset()
+
+
+def _products(session_factory):
+    from commerce_models import Product
+
+    db = session_factory()
+    try:
+        return {p.sku: p for p in db.query(Product).all()}
+    finally:
+        db.close()
+
+
+@pytest.mark.integration
+class TestProductImport:
+    """Tests for import_products"""
+
+    def test_creates_updates_and_reports_errors(self, commerce_db):
+        from commerce_product_import import import_products
+
+        csv = HEADER + (
+            "SKU-1,멀티탭,Power Strip,ELEC,public,\"1,200\",10,limited,kr,\"KC, CE\"\n"
+            "SKU-2,충전기,Charger,cat-elec,,15.5,,,CN,\n"
+            "SKU-3,케이블,,NOPE,cheap,abc,,,KR,\n"
+            ",이름만,,,,,,,,\n"
+            "SKU-2,충전기 중복,,,,,,,,\n"
+        )
+        db = commerce_db()
+        result = import_products(db, "seller", csv.encode(), "catalog.csv", chunk_size=2)
+        db.close()
+
+        assert (result["rows"], result["created"], result["updated"], result["skipped"]) == (5, 1, 1, 3)
+        errors = {(e["row"], e["column"]) for e in result["errors"]}
+        assert errors == {(4, "category"), (4, "price_type"), (4, "price"), (5, "sku"), (6, "sku")}
+        assert "row 3" in next(e["message"] for e in result["errors"] if e["row"] == 6)
+
+        products = _products(commerce_db)
+        updated = products["SKU-1"]
+        assert updated.id == "p-old" and updated.is_active
+        assert (updated.name_ko, float(updated.price), updated.origin_country) == ("멀티탭", 1200.0, "KR")
+        assert updated.certifications == ["KC", "CE"]
+        assert (products["SKU-2"].price_type, products["SKU-2"].stock_status) == ("private", "in_stock")
+        assert products["SKU-2"].category_id == "cat-elec"
+
+    def test_partial_reimport_keeps_other_columns(self, commerce_db):
+        from commerce_product_import import import_products
+
+        db = commerce_db()
+        import_products(db, "seller", (
+            "sku,name_ko,category,description,price_type,price,price_currency,price_unit,moq,stock_status,hs_code\n"
+            "SKU-1,멀티탭,ELEC,4구 멀티탭,public,1200,KRW,EA,10,limited,8536.69\n"
+        ).encode(), "catalog.csv")
+        result = import_products(db, "seller", (
+            "sku,name,price,stock_status\n"
+            "SKU-1,멀티탭 2024,1300,\n"
+        ).encode(), "catalog.csv")
+        db.close()
+
+        assert (result["created"], result["updated"], result["error_count"]) == (0, 1, 0)
+        product = _products(commerce_db)["SKU-1"]
+        assert (product.name_ko, float(product.price)) == ("멀티탭 2024", 1300.0)
+        assert (product.description, product.category_id, product.hs_code) == ("4구 멀티탭", "cat-elec", "8536.69")
+        assert (product.price_unit, float(product.moq)) == ("EA", 10.0)
+        assert (product.price_type, product.price_currency, product.stock_status) == ("public", "KRW", "limited")
+
+    def test_dry_run_and_xlsx(self, commerce_db, tmp_path):
+        from commerce_product_import import import_products
+
+        path = tmp_path / "catalog.xlsx"
+        pd.DataFrame([{"Product Code": "SKU-9", "Product Name": "LED", "Price": 3}]).to_excel(path, index=False)
+
+        db = commerce_db()
+        result = import_products(db, "seller", str(path), dry_run=True)
+        db.close()
+
+        assert (result["rows"], result["error_count"]) == (1, 0)
+        assert "SKU-9" not in _products(commerce_db)
+
+    def test_rejects_buyer_company_and_missing_columns(self, commerce_db):
+        from commerce_product_import import import_products, ProductFileError
+
+        db = commerce_db()
+        with pytest.raises(ProductFileError, match="Buyer"):
+            import_products(db, "buyer", HEADER.encode(), "catalog.csv")
+        with pytest.raises(ProductFileError, match="name_ko"):
+            import_products(db, "seller", b"sku,price\nA,1\n", "catalog.csv")
+        db.close()
+
+    def test_endpoint_refreshes_indexes(self, sync_client, commerce_db):
+        from commerce_models import ProductRFQ
+        from commerce_matching import matching_index
+
+        db = commerce_db()
+        db.add(ProductRFQ(id="rfq-1", company_id="buyer", category_id="cat-elec", rfq_number="RFQ-1",
+                          title="전자부품", status="draft"))
+        db.commit()
+        matching_index.reload(db)
+        db.close()
+
+        response = sync_client.post(
+            "/api/commerce/products/import", params={"company_id": "seller"},
+            files={"file": ("catalog.csv", (HEADER + "SKU-7,블루투스스피커,Speaker,ELEC,public,30,,,KR,\n").encode())},
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.json()["created"] == 1
+        search = sync_client.get("/api/commerce/products", params={"search": "스피커"}).json()
+        assert [p["sku"] for p in search["products"]] == ["SKU-7"]
+        matches = sync_client.get("/api/commerce/rfqs/rfq-1/matches").json()["matches"]
+        assert [m["company_id"] for m in matches] == ["seller"]
+
+    def test_endpoint_unknown_company(self, sync_client, commerce_db):
+        response = sync_client.post(
+            "/api/commerce/products/import", params={"company_id": "none"},
+            files={"file": ("catalog.csv", HEADER.encode())},
+        )
+
+        assert response.status_code == 400
@@ -0,0 +1,163 @@
+"""
+Integration Tests for Quotation Comparison Matrix
+Tests for item alignment, per-item ranking and revision-keyed caching
+"""
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+def _quotation(qid, company_id, status, total, items, lead_time=None):
+    from commerce_models import ProductQuotation, ProductQuotationItem
+
+    quotation = ProductQuotation(id=qid, rfq_id="rfq-1", company_id=company_id, quotation_number=f"Q-{qid}",
+                                 status=status, total_amount=total, currency="USD", lead_time=lead_time)
+    quotation.items = [
+        ProductQuotationItem(id=f"{qid}-{i}", rfq_item_id=rfq_item_id, item_number=i, name=name,
+                             quantity=1, unit_price=price, lead_time=item_lead)
+        for i, (rfq_item_id, name, price, item_lead) in enumerate(items, start=1)
+    ]
+    return quotation
+
+
+@pytest.fixture
+def commerce_db():
+    """RFQ 품목 3개 + 비교 대상 견적 3건 (+ 초안 1건) in-memory DB 로 get_db 교체"""
+    from main import app
+    from database import Base, get_db
+    from commerce_models import Company, ProductRFQ, ProductRFQItem
+    from commerce_comparison import comparison_cache
+    from sql_metrics import install_sql_hooks
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    install_sql_hooks(engine)
+    TestSession = sessionmaker(bind=engine, autoflush=False)
+
+    db = TestSession()
+    db.add_all([
+        Company(id="buyer", company_name="대한상사", company_type="buyer", country_code="KR"),
+        Company(id="s1", company_name="한빛전자", company_type="seller", country_code="KR", trust_score=4.5),
+        Company(id="s2", company_name="Shenzhen Parts", company_type="seller", country_code="CN"),
+        Company(id="s3", company_name="Saigon Trading", company_type="seller", country_code="VN"),
+        Company(id="s4", company_name="Draft Co", company_type="seller", country_code="KR"),
+    ])
+    rfq = ProductRFQ(id="rfq-1", company_id="buyer", rfq_number="RFQ-1", title="전자부품", status="open")
+    rfq.items = [
+        ProductRFQItem(id="ri-1", item_number=1, name="LED", quantity=100, target_price=2),
+        ProductRFQItem(id="ri-2", item_number=2, name="케이블", quantity=50),
+        ProductRFQItem(id="ri-3", item_number=3, name="어댑터", quantity=10),
+    ]
+    db.add(rfq)
+    db.add_all([
+        # s1: 품목 1 은 s2 와 같은 단가, 품목 3 견적 없음
+        _quotation("q1", "s1", "submitted", 300, [("ri-1", "LED", 2.0, 7), ("ri-2", "케이블", 2.0, None)],
+                   lead_time=10),
+        # s2: rfq_item_id 없이 item_number 로 매칭 + RFQ 에 없는 품목 1건
+        _quotation("q2", "s2", "negotiating", 280, [(None, "LED", 2.0, 5), (None, "케이블", 1.5, 5),
+                                                     (None, "어댑터", 4.0, 5), (None, "덤", 0.1, 5)]),
+        _quotation("q3", "s3", "viewed", 500, [("ri-1", "LED", 2.5, 3), ("ri-3", "어댑터", 3.0, 3)]),
+        _quotation("q4", "s4", "draft", 10, [("ri-1", "LED", 0.1, 1)]),
+    ])
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = TestSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    comparison_cache.invalidate()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db, None)
+    comparison_cache.invalidate()
+
+
+def _matrix(sync_client):
+    response = sync_client.get("/api/commerce/rfqs/rfq-1/comparison/matrix")
+    assert response.status_code == 200, response.text
+    return response
+
+
+@pytest.mark.integration
+class TestQuotationMatrix:
+    """Tests for /api/commerce/rfqs/{rfq_id}/comparison/matrix"""
+
+    def test_matrix_alignment_and_ranking(self, sync_client, commerce_db):
+        data = _matrix(sync_client).json()
+
+        assert [s["quotation_id"] for s in data["suppliers"]] == ["q2", "q1", "q3"]
+        assert (data["total_items"], data["total_quotations"]) == (3, 3)
+        q2, q1, q3 = data["suppliers"]
+        assert (q2["covered_items"], q2["unmatched_items"], q2["best_price_items"]) == (3, 1, 2)
+        assert q1["aligned_total"] == 100 * 2.0 + 50 * 2.0
+        assert q1["trust_score"] == 4.5
+
+        led, cable, adapter = data["items"]
+        assert [c["price_rank"] for c in led["cells"]] == [1, 1, 3]
+        assert [c["is_best_price"] for c in led["cells"]] == [True, True, False]
+        assert led["cells"][2]["price_diff_pct"] == 25.0
+        assert led["cells"][2]["is_fastest"] and led["best_unit_price"] == 2.0
+        # 품목 리드타임이 없으면 견적 리드타임 사용
+        assert cable["cells"][1]["lead_time"] == 10
+        assert adapter["cells"][1] is None
+        assert (adapter["offer_count"], adapter["best_unit_price"]) == (2, 3.0)
+
+    def test_cached_per_revision(self, sync_client, commerce_db):
+        from commerce_models import ProductQuotationRevision
+        from commerce_comparison import comparison_cache
+
+        builds = comparison_cache.stats()["builds"]
+        _matrix(sync_client)
+        cached = _matrix(sync_client)
+
+        # RFQ 조회 + 스탬프 조회
+        assert re.search(r'desc="2 queries"', cached.headers["server-timing"])
+        assert comparison_cache.stats()["builds"] == builds + 1
+
+        db = commerce_db()
+        db.add(ProductQuotationRevision(quotation_id="q3", revision_number=1, change_type="price"))
+        db.commit()
+        db.close()
+        _matrix(sync_client)
+
+        assert comparison_cache.stats()["builds"] == builds + 2
+
+    def test_reject_invalidates(self, sync_client, commerce_db):
+        _matrix(sync_client)
+
+        sync_client.post("/api/commerce/quotations/q2/reject")
+        data = _matrix(sync_client).json()
+
+        assert [s["quotation_id"] for s in data["suppliers"]] == ["q1", "q3"]
+        assert data["items"][2]["offer_count"] == 1
+
+    def test_empty_and_missing_rfq(self, sync_client, commerce_db):
+        from commerce_models import ProductRFQ
+
+        db = commerce_db()
+        db.add(ProductRFQ(id="rfq-2", company_id="buyer", rfq_number="RFQ-2", title="빈 RFQ", status="open"))
+        db.commit()
+        db.close()
+
+        data = sync_client.get("/api/commerce/rfqs/rfq-2/comparison/matrix").json()
+        assert (data["suppliers"], data["items"]) == ([], [])
+        assert sync_client.get("/api/commerce/rfqs/none/comparison/matrix").status_code == 404
+
+    def test_summary_item_counts(self, sync_client, commerce_db):
+        response = sync_client.get("/api/commerce/rfqs/rfq-1/comparison")
+
+        assert response.status_code == 200
+        counts = {q["quotation_id"]: q["item_count"] for q in response.json()["quotations"]}
+        assert counts == {"q1": 2, "q2": 4, "q3": 2}
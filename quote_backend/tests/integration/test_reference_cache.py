@@ -0,0 +1,91 @@
+"""
+Integration Tests for Reference Data Response Cache
+Tests for ETag / If-None-Match handling and data version invalidation
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.fixture
+def cache():
+    from response_cache import reference_cache
+
+    reference_cache.clear()
+    original_ttl = reference_cache.version_ttl
+    reference_cache.version_ttl = 3600
+    yield reference_cache
+    reference_cache.version_ttl = original_ttl
+    reference_cache.clear()
+
+
+@pytest.mark.integration
+class TestReferenceDataCache:
+    """Tests for cached reference data endpoints"""
+
+    @pytest.mark.parametrize("path", [
+        "/api/container-types",
+        "/api/truck-types",
+        "/api/incoterms",
+        "/api/freight-codes",
+        "/api/freight-units",
+        "/api/freight-categories",
+        "/api/freight/routes",
+    ])
+    def test_returns_etag_and_cache_control(self, sync_client, cache, path):
+        response = sync_client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"v')
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_if_none_match_returns_304(self, sync_client, cache):
+        first = sync_client.get("/api/container-types")
+        etag = first.headers["etag"]
+
+        second = sync_client.get("/api/container-types", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_cached_response_does_not_query_database(self, sync_client, cache):
+        sync_client.get("/api/incoterms")
+
+        response = sync_client.get("/api/incoterms")
+
+        assert 'desc="0 queries"' in response.headers["server-timing"]
+        assert cache.stats()["hits"] >= 1
+
+    def test_query_params_are_part_of_cache_key(self, sync_client, cache):
+        sync_client.get("/api/freight-categories")
+        sync_client.get("/api/freight-categories?shipping_type=air")
+
+        assert cache.stats()["misses"] == 2
+
+    def test_version_bump_invalidates_etag(self, sync_client, cache):
+        from database import SessionLocal
+        from response_cache import bump_data_version, TRUCK_TYPES
+
+        etag_before = sync_client.get("/api/truck-types").headers["etag"]
+
+        db = SessionLocal()
+        try:
+            bump_data_version(db, TRUCK_TYPES)
+        finally:
+            db.close()
+
+        response = sync_client.get("/api/truck-types", headers={"If-None-Match": etag_before})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag_before
+
+    def test_cached_body_matches_response_model(self, sync_client, cache):
+        data = sync_client.get("/api/container-types").json()
+
+        assert isinstance(data, list)
+        if data:
+            assert {"id", "code", "name"} <= set(data[0])
@@ -0,0 +1,33 @@
+"""
+Unit Tests for Endpoint Benchmark Helpers
+Tests for nearest-rank percentiles written to the benchmark report
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend/benchmarks directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "benchmarks"))
+
+from bench_endpoints import percentile
+
+
+class TestPercentile:
+    """Tests for percentile (nearest-rank: ceil(pct / 100 × n) 번째 값)"""
+
+    @pytest.mark.parametrize("n,expected", [
+        (20, (10, 19, 20)),
+        (30, (15, 29, 30)),
+        (100, (50, 95, 99)),
+    ])
+    def test_nearest_rank(self, n, expected):
+        values = list(range(1, n + 1))
+
+        assert (percentile(values, 50), percentile(values, 95), percentile(values, 99)) == expected
+
+    def test_edge_cases(self):
+        assert percentile([], 50) is None
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([1, 2, 3], 0) == 1
+        assert percentile([1, 2, 3], 100) == 3
+        assert percentile(list(range(1, 101)), 7) == 7
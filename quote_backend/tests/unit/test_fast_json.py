@@ -0,0 +1,112 @@
+"""
+Unit Tests for Fast JSON Serialization
+Tests that precompiled serializers match Pydantic output
+"""
+import pytest
+import sys
+import json
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pydantic import TypeAdapter
+
+import fast_json
+from schemas import PortResponse, BiddingListItem, BiddingListResponse, ShipperMonthlyTrendResponse
+from commerce_schemas import ProductListItem
+
+
+def _pydantic_json(response_model, value):
+    adapter = TypeAdapter(response_model)
+    return json.loads(adapter.dump_json(adapter.validate_python(value, from_attributes=True)))
+
+
+def _bidding_row(**overrides):
+    row = dict(
+        id=1, bidding_no="EXSEA00000001", customer_company="테스트 화주",
+        pol="KRPUS", pod="USLAX", pol_name="BUSAN, SOUTH KOREA", pod_name=None,
+        shipping_type="ocean", load_type="FCL", cargo_summary="20'GP × 3",
+        etd=datetime(2026, 1, 15, 9, 30), deadline=datetime(2026, 1, 10, 18, 0, 0, 123456),
+        status="open", bid_count=3, avg_bid_price=1234.5, my_bid_status=None,
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestSerializers:
+    """Tests for serializer_for / dump"""
+
+    def test_port_list_matches_pydantic(self):
+        ports = [SimpleNamespace(id=i, code=f"KR{i}", name="Busan", name_ko="부산", country="South Korea",
+                                 country_code="KR", port_type="ocean", is_active=True) for i in range(3)]
+
+        assert json.loads(fast_json.dump(ports, List[PortResponse])) == _pydantic_json(List[PortResponse], ports)
+
+    def test_bidding_list_matches_pydantic(self):
+        rows = [_bidding_row(), _bidding_row(id=2, deadline=None, avg_bid_price=None)]
+        items = [BiddingListItem.model_construct(**vars(r)) for r in rows]
+        payload = BiddingListResponse.model_construct(total=2, page=1, limit=20, data=items)
+
+        assert json.loads(fast_json.dump(payload, BiddingListResponse)) == _pydantic_json(BiddingListResponse, payload)
+
+    def test_decimal_float_fields_are_numbers(self):
+        product = SimpleNamespace(
+            id="p1", company_id="c1", category_id=None, sku="SKU-1", name_ko="상품", name_en=None,
+            price_type="public", price=Decimal("12.50"), price_min=None, price_max=None,
+            price_currency="USD", moq=Decimal("100"), origin_country="KR",
+            images=[{"url": "/a.jpg", "is_primary": True}], view_count=0, is_featured=False,
+        )
+
+        data = json.loads(fast_json.dump(product, ProductListItem))
+
+        assert data == _pydantic_json(ProductListItem, product)
+        assert data["price"] == 12.5 and data["moq"] == 100.0
+        # 속성이 없는 필드는 기본값
+        assert data["company_name"] is None
+
+    def test_dict_input_uses_defaults(self):
+        data = fast_json.serializer_for(ShipperMonthlyTrendResponse)({
+            "period": {"from_date": "2026-01-01", "to_date": "2026-01-31"},
+            "data": [{"month": "2026-01", "request_count": 2, "bid_count": 5, "awarded_count": 1,
+                      "total_cost_krw": 1000, "avg_bid_price_krw": Decimal("500")}],
+        })
+
+        assert data["data"][0]["total_cost_krw"] == 1000.0
+        assert isinstance(data["data"][0]["avg_bid_price_krw"], float)
+
+    def test_json_fallback_without_orjson(self, monkeypatch):
+        payload = {"when": datetime(2026, 1, 15, 9, 30), "amount": Decimal("1.5"), "name": "부산"}
+        expected = fast_json.dumps(payload)
+
+        monkeypatch.setattr(fast_json, "orjson", None)
+
+        assert json.loads(fast_json.dumps(payload)) == json.loads(expected)
+        assert "부산".encode("utf-8") in fast_json.dumps(payload)
+
+
+class TestFastResponse:
+    """Tests for the opt-in response path"""
+
+    def test_disabled_returns_value_unchanged(self, monkeypatch):
+        monkeypatch.setattr(fast_json, "FAST_JSON_ENABLED", False)
+        value = {"total": 0}
+
+        assert fast_json.fast_response(value, BiddingListResponse) is value
+
+    def test_enabled_returns_serialized_response(self, monkeypatch):
+        monkeypatch.setattr(fast_json, "FAST_JSON_ENABLED", True)
+
+        response = fast_json.fast_response({"total": 0, "page": 1, "limit": 20, "data": []}, BiddingListResponse)
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"total": 0, "page": 1, "limit": 20, "data": []}
+
+    def test_response_class_renders_non_ascii(self):
+        response = fast_json.FastJSONResponse({"name": "부산", "n": 1})
+
+        assert json.loads(response.body) == {"name": "부산", "n": 1}
@@ -0,0 +1,115 @@
+"""
+Unit Tests for Port Import Pipeline
+Tests for normalization, air/sea merge and diff-based upsert
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
+from sqlalchemy import create_engine, select
+
+from models import Port
+from import_ports import normalize_ports, merge_ports, sync_ports
+
+
+def _source(rows):
+    return pd.DataFrame(rows, columns=['Location', 'Location Name', 'Country', 'Country Name'])
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Port.__table__.create(bind=engine)
+    return engine
+
+
+def _ports(engine):
+    with engine.connect() as conn:
+        rows = conn.execute(select(Port.code, Port.name, Port.port_type, Port.is_active, Port.name_ko)).all()
+    return {r.code: r for r in rows}
+
+
+class TestNormalizeAndMerge:
+    """Tests for normalize_ports / merge_ports"""
+
+    def test_normalize_cleans_and_dedupes(self):
+        frame = normalize_ports(_source([
+            [' krpus ', ' Busan ', 'kr', 'South Korea'],
+            ['KRPUS', 'Busan duplicate', 'KR', 'South Korea'],
+            [None, 'No code', 'KR', 'South Korea'],
+            ['XXABC', 'Nowhere', None, None],
+        ]))
+
+        assert frame['code'].tolist() == ['KRPUS', 'XXABC']
+        assert frame.iloc[0]['name'] == 'Busan'
+        assert frame.iloc[0]['country_code'] == 'KR'
+        assert frame.iloc[1]['country_code'] == 'XX'
+        assert frame.iloc[1]['country'] == 'Unknown'
+
+    def test_merge_marks_both(self):
+        air = normalize_ports(_source([['ICN', 'Incheon Airport', 'KR', 'South Korea'],
+                                       ['KRPUS', 'Gimhae', 'KR', 'South Korea']]))
+        sea = normalize_ports(_source([['KRPUS', 'Busan', 'KR', 'South Korea'],
+                                       ['USLAX', 'Los Angeles', 'US', 'United States']]))
+
+        merged = merge_ports(air, sea).set_index('code')
+
+        assert merged.loc['ICN', 'port_type'] == 'air'
+        assert merged.loc['USLAX', 'port_type'] == 'ocean'
+        assert merged.loc['KRPUS', 'port_type'] == 'both'
+        # 이름은 Air 우선 (기존 import 순서와 동일)
+        assert merged.loc['KRPUS', 'name'] == 'Gimhae'
+
+
+class TestSyncPorts:
+    """Tests for sync_ports diff and upsert"""
+
+    def _incoming(self, rows):
+        return merge_ports(normalize_ports(_source([])), normalize_ports(_source(rows)))
+
+    def test_initial_import_adds_all(self, engine):
+        with engine.begin() as conn:
+            report = sync_ports(conn, self._incoming([['KRPUS', 'Busan', 'KR', 'South Korea'],
+                                                     ['USLAX', 'Los Angeles', 'US', 'United States']]))
+
+        assert (report['added'], report['updated'], report['deactivated']) == (2, 0, 0)
+        assert set(_ports(engine)) == {'KRPUS', 'USLAX'}
+
+    def test_reimport_reports_diff(self, engine):
+        with engine.begin() as conn:
+            sync_ports(conn, self._incoming([['KRPUS', 'Busan', 'KR', 'South Korea'],
+                                             ['USLAX', 'Los Angeles', 'US', 'United States'],
+                                             ['CNSHA', 'Shanghai', 'CN', 'China']]))
+            conn.execute(Port.__table__.update().where(Port.code == 'KRPUS').values(name_ko='부산'))
+
+        with engine.begin() as conn:
+            report = sync_ports(conn, self._incoming([['KRPUS', 'Busan New Port', 'KR', 'South Korea'],
+                                                     ['USLAX', 'Los Angeles', 'US', 'United States'],
+                                                     ['JPTYO', 'Tokyo', 'JP', 'Japan']]), chunk_size=1)
+
+        assert (report['added'], report['updated'], report['deactivated'], report['unchanged']) == (1, 1, 1, 1)
+        ports = _ports(engine)
+        assert ports['KRPUS'].name == 'Busan New Port'
+        assert ports['KRPUS'].name_ko == '부산'  # 파일에 없는 컬럼은 유지
+        assert ports['CNSHA'].is_active is False
+        assert ports['JPTYO'].is_active is True
+
+    def test_reappearing_port_is_reactivated(self, engine):
+        with engine.begin() as conn:
+            sync_ports(conn, self._incoming([['KRPUS', 'Busan', 'KR', 'South Korea']]))
+            sync_ports(conn, self._incoming([]))
+            report = sync_ports(conn, self._incoming([['KRPUS', 'Busan', 'KR', 'South Korea']]))
+
+        assert report['updated'] == 1
+        assert _ports(engine)['KRPUS'].is_active is True
+
+    def test_dry_run_does_not_write(self, engine):
+        with engine.begin() as conn:
+            report = sync_ports(conn, self._incoming([['KRPUS', 'Busan', 'KR', 'South Korea']]), dry_run=True)
+
+        assert report['added'] == 1
+        assert _ports(engine) == {}
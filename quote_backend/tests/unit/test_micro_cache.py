@@ -0,0 +1,102 @@
+"""
+Unit Tests for Bidding Stats Micro Cache
+Tests for TTL expiry and request coalescing
+"""
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bidding_stats import MicroCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestMicroCache:
+    """Tests for MicroCache"""
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = MicroCache(ttl=2, clock=clock)
+        calls = []
+
+        def compute():
+            calls.append(clock.now)
+            return len(calls)
+
+        assert cache.get_or_compute("k", compute) == 1
+        clock.now = 1.9
+        assert cache.get_or_compute("k", compute) == 1
+        clock.now = 2.0
+        assert cache.get_or_compute("k", compute) == 2
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2, "coalesced": 0}
+
+    def test_concurrent_callers_share_one_computation(self):
+        cache = MicroCache(ttl=5)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"total_count": 7}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        leader.start()
+        started.wait(5)
+        waiters = [threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+                   for _ in range(8)]
+        for thread in waiters:
+            thread.start()
+        while cache.stats()["coalesced"] < len(waiters):
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in [leader] + waiters:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert results == [{"total_count": 7}] * 9
+        assert cache.stats()["coalesced"] == 8
+
+    def test_errors_reach_waiters_and_are_not_cached(self):
+        cache = MicroCache(ttl=5)
+        started, release = threading.Event(), threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("db down")
+
+        errors = []
+
+        def call():
+            try:
+                cache.get_or_compute("k", failing)
+            except RuntimeError as exc:
+                errors.append(str(exc))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        waiter = threading.Thread(target=call)
+        waiter.start()
+        while cache.stats()["coalesced"] < 1:
+            threading.Event().wait(0.01)
+        release.set()
+        leader.join(5)
+        waiter.join(5)
+
+        assert errors == ["db down", "db down"]
+        assert cache.get_or_compute("k", lambda: "ok") == "ok"
@@ -0,0 +1,123 @@
+"""
+Unit Tests for Ocean Rate File Import
+Tests for validation, bulk insert and sheet superseding
+"""
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from models import Port, ContainerType, FreightCategory, FreightCode, OceanRateSheet, OceanRateItem
+import commerce_models  # noqa: F401
+from ocean_rate_import import import_rate_file, RateFileError
+
+HEADER = "pol,pod,carrier,valid_from,valid_to,container_type,freight_code,unit,currency,rate\n"
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Port.__table__.insert(), [
+            {"code": code, "name": code, "country": "X", "country_code": code[:2], "port_type": "ocean"}
+            for code in ("KRPUS", "NLRTM", "USLAX")
+        ])
+        conn.execute(ContainerType.__table__.insert(), [
+            {"code": "20DC", "name": "20 Dry Container"},
+            {"code": "4HDC", "name": "40 HC Dry Container"},
+        ])
+        conn.execute(FreightCategory.__table__.insert(), [{"id": 1, "code": "OCEAN", "name_en": "Ocean Freight"}])
+        conn.execute(FreightCode.__table__.insert(), [
+            {"code": "FRT", "category_id": 1, "name_en": "OCEAN FREIGHT", "default_currency": "USD"},
+            {"code": "THC", "category_id": 1, "name_en": "TERMINAL HANDLING", "default_currency": "KRW"},
+        ])
+    return engine
+
+
+def _counts(engine):
+    with engine.connect() as conn:
+        active = conn.execute(select(func.count()).select_from(OceanRateSheet.__table__)
+                              .where(OceanRateSheet.is_active == True)).scalar()  # noqa: E712
+        items = conn.execute(select(func.count()).select_from(OceanRateItem.__table__)).scalar()
+    return active, items
+
+
+class TestOceanRateImport:
+    """Tests for import_rate_file"""
+
+    def test_imports_sheets_and_items(self, engine):
+        csv = HEADER + (
+            "KRPUS,NLRTM,HMM,2026-01-01,2026-01-31,20DC,FRT,Qty,USD,858\n"
+            "KRPUS,NLRTM,HMM,2026-01-01,2026-01-31,40 HC Dry Container,FRT,Qty,USD,\"1,316\"\n"
+            "KRPUS,NLRTM,HMM,2026-01-01,2026-01-31,20DC,THC,Qty,,150000\n"
+            "KRPUS,USLAX,,2026-01-01,2026-01-31,20DC,FRT,Qty,USD,N/A\n"
+        )
+
+        result = import_rate_file(csv.encode(), "rates.csv", bind=engine)
+
+        assert (result["sheets_created"], result["items_created"], result["lanes"]) == (2, 4, 2)
+        with engine.connect() as conn:
+            items = conn.execute(
+                select(FreightCode.code, OceanRateItem.currency, OceanRateItem.rate, OceanRateItem.freight_group)
+                .join(FreightCode, FreightCode.id == OceanRateItem.freight_code_id)
+                .order_by(OceanRateItem.id)
+            ).all()
+        assert float(items[1].rate) == 1316
+        assert items[2].currency == "KRW"  # 운임 코드 기본 통화
+        assert items[2].freight_group == "Ocean Freight"
+        assert items[3].rate is None  # N/A → Quick Quotation = N
+
+    def test_invalid_rows_are_rejected_without_writes(self, engine):
+        csv = HEADER + (
+            "KRPUS,NLRTM,HMM,2026-01-01,2026-01-31,20DC,FRT,Qty,USD,858\n"
+            "KRXXX,NLRTM,HMM,2026-01-01,2026-01-31,20DC,FRT,Qty,USD,858\n"
+            "KRPUS,NLRTM,HMM,2026-01-01,2026-01-31,99ZZ,BAF,Qty,USD,abc\n"
+        )
+
+        with pytest.raises(RateFileError) as exc:
+            import_rate_file(csv.encode(), "rates.csv", bind=engine)
+
+        errors = {(e["row"], e["column"]) for e in exc.value.errors}
+        assert errors == {(3, "pol"), (4, "container_type"), (4, "freight_code"), (4, "rate")}
+        assert _counts(engine) == (0, 0)
+
+    def test_missing_required_column(self, engine):
+        with pytest.raises(RateFileError, match="container_type"):
+            import_rate_file(b"pol,pod,valid_from,valid_to,freight_code\n", "rates.csv", bind=engine)
+
+    def test_overlapping_sheets_are_superseded(self, engine):
+        january = HEADER + "KRPUS,NLRTM,HMM,2026-01-01,2026-01-31,20DC,FRT,Qty,USD,858\n"
+        mid_month = HEADER + "KRPUS,NLRTM,HMM,2026-01-15,2026-02-15,20DC,FRT,Qty,USD,900\n"
+        other_carrier = HEADER + "KRPUS,NLRTM,MSC,2026-01-15,2026-02-15,20DC,FRT,Qty,USD,950\n"
+
+        import_rate_file(january.encode(), "jan.csv", bind=engine)
+        result = import_rate_file(mid_month.encode(), "mid.csv", bind=engine)
+        import_rate_file(other_carrier.encode(), "msc.csv", bind=engine)
+
+        assert result["sheets_superseded"] == 1
+        with engine.connect() as conn:
+            sheets = conn.execute(select(OceanRateSheet.carrier, OceanRateSheet.valid_from, OceanRateSheet.is_active)
+                                  .order_by(OceanRateSheet.id)).all()
+        assert [(s.carrier, s.is_active) for s in sheets] == [("HMM", False), ("HMM", True), ("MSC", True)]
+        assert sheets[1].valid_from == datetime(2026, 1, 15)
+
+    def test_dry_run_and_xlsx(self, engine, tmp_path):
+        path = tmp_path / "rates.xlsx"
+        pd.DataFrame([{
+            "POL": "KRPUS", "POD": "NLRTM", "Valid From": "2026-01-01", "Valid To": "2026-01-31",
+            "Container Type": "20DC", "Freight Code": "FRT", "Rate": 858,
+        }]).to_excel(path, index=False)
+
+        result = import_rate_file(str(path), bind=engine, dry_run=True)
+
+        assert result["rows"] == 1 and result["lanes"] == 1
+        assert _counts(engine) == (0, 0)
@@ -0,0 +1,79 @@
+"""
+Unit Tests for Synthetic Data Generator
+Tests for deterministic bulk generation
+"""
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import create_engine, select, func
+
+from database import Base
+from models import Port, Customer, QuoteRequest, Bidding, Bid, Notification
+import commerce_models  # noqa: F401
+from seed_synthetic import generate
+
+CONFIG = {"customers": 20, "forwarders": 8, "quote_requests": 50, "bids": 170, "notifications": 30}
+ANCHOR = datetime(2026, 1, 15)
+
+
+def _build(seed):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Port.__table__.insert(), [
+            {"code": "KRPUS", "name": "Busan", "country": "South Korea", "country_code": "KR", "port_type": "ocean", "is_active": True},
+            {"code": "USLAX", "name": "Los Angeles", "country": "United States", "country_code": "US", "port_type": "ocean", "is_active": True},
+            {"code": "CNSHA", "name": "Shanghai", "country": "China", "country_code": "CN", "port_type": "ocean", "is_active": True},
+        ])
+        counts = generate(conn, CONFIG, seed=seed, anchor=ANCHOR, chunk_size=16)
+    return engine, counts
+
+
+def _dump(engine):
+    with engine.connect() as conn:
+        return {
+            "quote_requests": conn.execute(select(QuoteRequest.__table__).order_by(QuoteRequest.id)).all(),
+            "biddings": conn.execute(select(Bidding.__table__).order_by(Bidding.id)).all(),
+            "bids": conn.execute(select(Bid.__table__).order_by(Bid.id)).all(),
+        }
+
+
+class TestSyntheticGenerator:
+    """Tests for seed_synthetic.generate"""
+
+    def test_generates_requested_counts(self):
+        engine, counts = _build(seed=1)
+
+        assert counts["customers"] == 20
+        assert counts["quote_requests"] == 50
+        assert counts["biddings"] == 50
+        assert counts["bids"] == 170
+        assert counts["notifications"] == 30
+        with engine.connect() as conn:
+            assert conn.execute(select(func.count()).select_from(Customer.__table__)).scalar() == 20
+            assert conn.execute(select(func.count()).select_from(Notification.__table__)).scalar() == 30
+
+    def test_same_seed_is_deterministic(self):
+        first, _ = _build(seed=7)
+        second, _ = _build(seed=7)
+
+        assert _dump(first) == _dump(second)
+
+    def test_awarded_biddings_point_to_awarded_bid(self):
+        engine, _ = _build(seed=3)
+
+        with engine.connect() as conn:
+            rows = conn.execute(
+                select(Bidding.status, Bid.status, Bid.bidding_id, Bidding.id)
+                .join(Bid, Bid.id == Bidding.awarded_bid_id)
+            ).all()
+        assert rows
+        for bidding_status, bid_status, bid_bidding_id, bidding_id in rows:
+            assert bidding_status == "awarded"
+            assert bid_status == "awarded"
+            assert bid_bidding_id == bidding_id
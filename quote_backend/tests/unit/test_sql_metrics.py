@@ -0,0 +1,145 @@
+"""
+Unit Tests for SQL Metrics Middleware
+Tests for per-request query counting, Server-Timing and N+1 detection
+"""
+import logging
+import pytest
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+import sql_metrics
+from sql_metrics import (
+    SQLMetricsMiddleware, MetricsRegistry, RequestSQLStats, Histogram,
+    install_sql_hooks, normalize_statement
+)
+
+
+@pytest.fixture
+def instrumented_app():
+    """Small app with an instrumented in-memory engine."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    install_sql_hooks(engine)
+
+    app = FastAPI()
+
+    @app.get("/items/{n}")
+    def run_queries(n: int):
+        with engine.connect() as conn:
+            for i in range(n):
+                conn.execute(text(f"SELECT {i}"))
+        return {"n": n}
+
+    sql_metrics.registry.reset()
+    return app
+
+
+class TestNormalizeStatement:
+    """Tests for SQL normalization"""
+
+    def test_literals_are_collapsed(self):
+        assert normalize_statement("SELECT * FROM t WHERE id = 5") == normalize_statement(
+            "SELECT * FROM t WHERE id = 42"
+        )
+        assert "'abc'" not in normalize_statement("SELECT * FROM t WHERE name = 'abc'")
+
+    def test_in_lists_are_collapsed(self):
+        assert normalize_statement("SELECT * FROM t WHERE id IN (?, ?, ?)") == normalize_statement(
+            "SELECT * FROM t WHERE id IN (?)"
+        )
+
+
+class TestHistogram:
+    """Tests for cumulative histogram buckets"""
+
+    def test_cumulative_counts(self):
+        hist = Histogram((1, 5, 10))
+        for value in (0, 3, 7, 100):
+            hist.observe(value)
+        assert hist.cumulative() == [("1", 1), ("5", 2), ("10", 3), ("+Inf", 4)]
+        assert hist.count == 4
+        assert hist.total == 110
+
+
+class TestSQLMetricsMiddleware:
+    """Tests for the ASGI middleware"""
+
+    def test_server_timing_header_reports_query_count(self, instrumented_app):
+        instrumented_app.add_middleware(SQLMetricsMiddleware, mode="basic")
+        client = TestClient(instrumented_app)
+
+        response = client.get("/items/3")
+
+        assert response.status_code == 200
+        timing = response.headers["server-timing"]
+        assert 'desc="3 queries"' in timing
+        assert timing.startswith("db;dur=")
+
+    def test_route_histogram_uses_path_template(self, instrumented_app):
+        instrumented_app.add_middleware(SQLMetricsMiddleware, mode="basic")
+        client = TestClient(instrumented_app)
+
+        client.get("/items/2")
+        client.get("/items/4")
+
+        metrics = sql_metrics.registry.snapshot()[("GET", "/items/{n}")]
+        assert metrics.queries.count == 2
+        assert metrics.queries.total == 6
+        rendered = sql_metrics.registry.render_prometheus()
+        assert 'quote_http_request_db_queries_count{method="GET",route="/items/{n}"} 2' in rendered
+
+    def test_dev_mode_warns_on_repeated_statements(self, instrumented_app, caplog):
+        instrumented_app.add_middleware(SQLMetricsMiddleware, mode="dev", threshold=3)
+        client = TestClient(instrumented_app)
+
+        with caplog.at_level(logging.WARNING, logger="sql_metrics"):
+            client.get("/items/5")
+
+        assert any("Possible N+1" in r.message for r in caplog.records)
+
+    def test_basic_mode_does_not_track_statements(self, instrumented_app, caplog):
+        instrumented_app.add_middleware(SQLMetricsMiddleware, mode="basic", threshold=1)
+        client = TestClient(instrumented_app)
+
+        with caplog.at_level(logging.WARNING, logger="sql_metrics"):
+            client.get("/items/5")
+
+        assert not any("Possible N+1" in r.message for r in caplog.records)
+
+    def test_off_mode_adds_no_header(self, instrumented_app):
+        instrumented_app.add_middleware(SQLMetricsMiddleware, mode="off")
+        client = TestClient(instrumented_app)
+
+        response = client.get("/items/1")
+
+        assert "server-timing" not in response.headers
+
+
+class TestRequestSQLStats:
+    """Tests for per-request statistics"""
+
+    def test_repeated_statements_threshold(self):
+        stats = RequestSQLStats(track_statements=True)
+        for i in range(4):
+            stats.record(f"SELECT * FROM ports WHERE id = {i}", 0.001)
+        stats.record("SELECT 1 FROM other", 0.001)
+
+        repeated = stats.repeated_statements(3)
+        assert len(repeated) == 1
+        assert repeated[0][1] == 4
+        assert stats.query_count == 5
+
+    def test_registry_reset(self):
+        registry = MetricsRegistry()
+        registry.observe("GET", "/x", RequestSQLStats(), 0.01)
+        registry.reset()
+        assert registry.snapshot() == {}
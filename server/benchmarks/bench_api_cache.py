@@ -0,0 +1,168 @@
+"""
+API Cache Benchmark - APICache (LRU + 예산) vs 기존 dict 캐시
+무작위 키 워크로드 (기간 / 통계표 조합, 일부 키에 편중) 로 cache-aside get/set 처리량과 RSS 비교
+
+- 구현별로 별도 프로세스에서 실행 (RSS 가 서로 섞이지 않도록)
+- miss 시 ECOS 응답과 비슷한 JSON 을 새로 파싱해 set (실제 서버의 response.json() 과 동일한 메모리 패턴)
+- legacy: 이 변경 이전의 APICache (만료 항목은 다시 조회될 때만 삭제, 크기 제한 없음)
+
+Usage:
+    python benchmarks/bench_api_cache.py --ops 200000 --keys 50000 --output bench_api_cache.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import platform
+import resource
+import subprocess
+import threading
+from datetime import datetime
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+os.environ.setdefault("ECOS_API_KEY", "bench")
+os.environ.setdefault("ECOS_STORE_ENABLED", "false")
+
+
+class LegacyCacheEntry:
+    def __init__(self, data, ttl=300):
+        self.data = data
+        self.created_at = time.time()
+        self.ttl = ttl
+
+    def is_expired(self):
+        return time.time() - self.created_at > self.ttl
+
+
+class LegacyAPICache:
+    """변경 이전 APICache (비교용)"""
+    def __init__(self):
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.cache:
+                entry = self.cache[key]
+                if not entry.is_expired():
+                    return entry.data
+                del self.cache[key]
+            return None
+
+    def set(self, key, data, ttl=300):
+        with self.lock:
+            self.cache[key] = LegacyCacheEntry(data, ttl)
+
+
+def make_payloads(rng, count):
+    """ECOS StatisticSearch 형식의 직렬화된 응답 (10~300 rows)"""
+    payloads = []
+    for _ in range(count):
+        rows = [{"STAT_CODE": "731Y001", "STAT_NAME": "3.1.1.1. 주요국 통화의 대원화환율",
+                 "ITEM_CODE1": "0000001", "ITEM_NAME1": "원/미국달러(매매기준율)", "UNIT_NAME": "원",
+                 "TIME": f"2024{m:02d}{d:02d}", "DATA_VALUE": f"{1300 + rng.random() * 100:.2f}"}
+                for m in range(1, 13) for d in range(1, 29)][:rng.randint(10, 300)]
+        payloads.append(json.dumps({"StatisticSearch": {"list_total_count": len(rows), "row": rows}}))
+    return payloads
+
+
+def current_rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * (os.sysconf("SC_PAGE_SIZE") // 1024)
+
+
+def run_workload(impl, ops, keys, seed, max_entries, max_bytes):
+    rng = random.Random(seed)
+    payloads = make_payloads(rng, 64)
+    # 키 편중: 인기 키 (최근 기간 / 주요 통화) 가 많이 조회됨
+    key_ids = [int(keys * rng.random() ** 3) for _ in range(ops)]
+    namespaces = ["StatisticSearch", "StatisticSearch", "StatisticSearch", "StatisticItemList"]
+
+    if impl == "legacy":
+        cache = LegacyAPICache()
+    else:
+        import bok_backend
+        cache = bok_backend.APICache(max_entries=max_entries, max_bytes=max_bytes)
+
+    rss_before = current_rss_kb()
+    get_time = set_time = 0.0
+    hits = sets = 0
+    for i, key_id in enumerate(key_ids):
+        key = f"{namespaces[key_id % 4]}:731Y001:{key_id % 97:07d}:D:{key_id}"
+        started = time.perf_counter()
+        value = cache.get(key)
+        get_time += time.perf_counter() - started
+        if value is not None:
+            hits += 1
+            continue
+        data = json.loads(payloads[key_id % len(payloads)])
+        started = time.perf_counter()
+        cache.set(key, data, 300)
+        set_time += time.perf_counter() - started
+        sets += 1
+
+    return {
+        "impl": impl,
+        "get_ops_per_sec": round(ops / get_time),
+        "set_ops_per_sec": round(sets / set_time) if set_time else 0,
+        "hit_rate": round(hits / ops, 4),
+        "entries": len(cache.cache),
+        "rss_growth_mb": round((current_rss_kb() - rss_before) / 1024, 1),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark APICache against the previous unbounded dict cache")
+    parser.add_argument("--ops", type=int, default=200000)
+    parser.add_argument("--keys", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-entries", type=int, default=2000)
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--impl", choices=["legacy", "lru"], help=argparse.SUPPRESS)
+    parser.add_argument("--output", default="bench_api_cache.json")
+    args = parser.parse_args(argv)
+
+    if args.impl:
+        # 하위 프로세스: 한 구현만 실행하고 결과를 stdout 으로 전달
+        print(json.dumps(run_workload(args.impl, args.ops, args.keys, args.seed, args.max_entries, args.max_bytes)))
+        return
+
+    print(f"[*] Workload: {args.ops:,} lookups over {args.keys:,} keys "
+          f"(budget {args.max_entries:,} entries / {args.max_bytes // (1024 * 1024)}MB)")
+    results = []
+    for impl in ("legacy", "lru"):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--impl", impl, "--ops", str(args.ops),
+             "--keys", str(args.keys), "--seed", str(args.seed), "--max-entries", str(args.max_entries),
+             "--max-bytes", str(args.max_bytes)],
+            capture_output=True, text=True, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print(f"  {impl:<6} get {result['get_ops_per_sec']:>10,}/s  set {result['set_ops_per_sec']:>8,}/s  "
+              f"hit {result['hit_rate']:.1%}  entries {result['entries']:>6,}  "
+              f"RSS +{result['rss_growth_mb']}MB (max {result['max_rss_mb']}MB)")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "ops": args.ops,
+            "keys": args.keys,
+            "max_entries": args.max_entries,
+            "max_bytes": args.max_bytes,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Catalog Search Benchmark - n-gram 색인 검색 vs 전체 목록 선형 필터
+타이핑 중 검색(한 글자씩 늘어나는 질의)을 가정해 질의당 지연 시간(평균 / p99) 비교
+
+- linear: 기존 search_statistical_codes 의 로컬 필터 (`keyword in STAT_NAME`) 를 전체 목록에 적용
+- index: bok_catalog.StatCatalog.search_tables (메모리 색인, 순위 정렬 포함)
+  cold = 질의 결과 캐시를 비운 상태 (직전 글자 결과로 후보 축소만 사용), warm = 같은 질의 반복
+- 카탈로그는 ECOS 통계표명과 비슷한 합성 목록 (한글/영문 이름)
+
+Usage:
+    python benchmarks/bench_catalog_search.py --tables 5000 --output bench_catalog_search.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+import bok_catalog  # noqa: E402
+
+SUBJECTS = [("소비자물가지수", "Consumer Price Indices"), ("생산자물가지수", "Producer Price Indices"),
+            ("수출물가지수", "Export Price Indices"), ("수입물가지수", "Import Price Indices"),
+            ("대원화환율", "Exchange Rates against Won"), ("대미달러 환율", "Exchange Rates against US Dollar"),
+            ("국내총생산", "Gross Domestic Product"), ("경상수지", "Current Account"),
+            ("기준금리", "Base Rate"), ("통화량", "Money Supply"), ("실업률", "Unemployment Rate"),
+            ("산업생산지수", "Industrial Production Index"), ("주가지수", "Stock Price Indices")]
+QUALIFIERS = [("주요국", "Major Countries"), ("지역별", "by Region"), ("업종별", "by Industry"),
+              ("품목별", "by Commodity"), ("용도별", "by Use"), ("계절조정", "Seasonally Adjusted"),
+              ("원계열", "Original Series"), ("특수분류", "Special Groups"), ("기본분류", "Basic Groups")]
+
+
+def make_tables(rng, count):
+    rows_kr, rows_en = [], []
+    for i in range(count):
+        subject, qualifier = rng.choice(SUBJECTS), rng.choice(QUALIFIERS)
+        code = f"{100 + i // 26:03d}Y{i % 1000:03d}"
+        number = f"{rng.randint(1, 9)}.{rng.randint(1, 9)}.{rng.randint(1, 9)}."
+        rows_kr.append({"STAT_CODE": code, "STAT_NAME": f"{number} {qualifier[0]} {subject[0]}", "CYCLE": "M"})
+        rows_en.append({"STAT_CODE": code, "STAT_NAME": f"{number} {subject[1]} ({qualifier[1]})", "CYCLE": "M"})
+    return rows_kr, rows_en
+
+
+def typeahead_queries():
+    """한 글자씩 입력되는 질의 목록"""
+    words = ["소비자물가지수", "환율", "국내총생산", "consumer price", "exchange", "계절조정 실업률"]
+    return [w[:n] for w in words for n in range(1, len(w) + 1)]
+
+
+def linear_search(rows, keyword):
+    return [r for r in rows if keyword in str(r.get('STAT_NAME', ''))]
+
+
+def measure(fn, queries, repeat, before_pass=None):
+    samples = []
+    for _ in range(repeat):
+        if before_pass:
+            before_pass()
+        for q in queries:
+            started = time.perf_counter()
+            fn(q)
+            samples.append(time.perf_counter() - started)
+    samples.sort()
+    return {
+        "avg_us": round(sum(samples) / len(samples) * 1e6, 1),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark catalog n-gram search against a linear name filter")
+    parser.add_argument("--tables", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_catalog_search.json")
+    args = parser.parse_args(argv)
+
+    queries = typeahead_queries()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.tables:
+            rows_kr, rows_en = make_tables(random.Random(args.seed), count)
+            catalog = bok_catalog.StatCatalog(os.path.join(tmp, f"catalog_{count}.db"))
+            started = time.perf_counter()
+            catalog.replace_tables(rows_kr, rows_en)
+            build_ms = (time.perf_counter() - started) * 1000
+
+            linear = measure(lambda q: linear_search(rows_kr, q), queries, args.repeat)
+            search = lambda q: catalog.search_tables(query=q, end_index=20)  # noqa: E731
+            snapshot = catalog._table_snapshot()
+
+            def reset_query_cache():
+                snapshot.code_index.clear_query_cache()
+                snapshot.name_index.clear_query_cache()
+
+            # cold: 매 회차 질의 캐시를 비움 (직전 글자 결과 재사용만 허용) / warm: 같은 질의 반복
+            cold = measure(search, queries, args.repeat, before_pass=reset_query_cache)
+            warm = measure(search, queries, args.repeat)
+            result = {"tables": count, "build_ms": round(build_ms, 1), "linear": linear,
+                      "index_cold": cold, "index_warm": warm}
+            results.append(result)
+            print(f"[*] {count:,} tables (build {result['build_ms']}ms, {len(queries)} typeahead queries)")
+            for name, r in (("linear", linear), ("cold", cold), ("warm", warm)):
+                print(f"  {name:<6}  avg {r['avg_us']:>8.1f}us  p99 {r['p99_us']:>8.1f}us")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "queries": queries,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
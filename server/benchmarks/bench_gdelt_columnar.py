@@ -0,0 +1,341 @@
+"""
+GDELT Column Cache Benchmark - 요청마다 export 파싱 vs 컬럼 캐시 (메모리 맵) 로드
+하루치 15분 export (기본 96개) 에 대해 파일마다 알림/국가별/카테고리별 통계 요청을 처리하는 시간과 peak RSS 비교
+
+- legacy: 이 변경 이전의 parse_gdelt_events / get_stats_by_* (요청마다 zip 해제 + csv.reader + 이벤트 dict)
+- columnar: 현재 gdelt_backend (다운로드 시 변환해 둔 <export>.cols/ 를 메모리 맵으로 읽음)
+- convert: 다운로드 시 1회 드는 변환 비용 (convert_gdelt_file)
+- 구현별로 별도 프로세스에서 실행 (peak RSS 가 서로 섞이지 않도록), 두 구현의 응답이 같은지 digest 로 확인
+
+Usage:
+    python benchmarks/bench_gdelt_columnar.py --files 96 --rows 2000 --output bench_gdelt_columnar.json
+"""
+
+import sys
+import os
+import csv
+import io
+import json
+import time
+import random
+import hashlib
+import zipfile
+import argparse
+import platform
+import resource
+import subprocess
+import tempfile
+from datetime import datetime
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+from pathlib import Path  # noqa: E402
+
+import gdelt_backend  # noqa: E402
+from gdelt_backend import (  # noqa: E402
+    COL_ACTION_GEO_COUNTRYCODE, COL_ACTION_GEO_FULLNAME, COL_ACTION_GEO_LAT, COL_ACTION_GEO_LONG,
+    COL_ACTOR1COUNTRYCODE, COL_ACTOR1NAME, COL_ACTOR2COUNTRYCODE, COL_ACTOR2NAME, COL_AVG_TONE,
+    COL_EVENT_CODE, COL_GOLDSTEIN_SCALE, COL_NUM_ARTICLES, COL_NUM_MENTIONS, COL_NUM_SOURCES,
+    COL_QUAD_CLASS, COL_SOURCEURL, COL_SQLDATE, get_event_category, safe_float, safe_int, safe_str,
+)
+
+DAY = "20250101"
+
+
+# ============================================================
+# Legacy implementation (변경 이전 코드, 비교용)
+# ============================================================
+
+def legacy_parse_gdelt_events(file_path, goldstein_threshold=-5.0, max_events=1000):
+    with zipfile.ZipFile(file_path, 'r') as zf:
+        csv_name = [name for name in zf.namelist() if name.endswith('.CSV')][0]
+        with zf.open(csv_name) as f:
+            content = io.TextIOWrapper(f, encoding='utf-8', errors='ignore')
+            return legacy_parse_csv_content(content, goldstein_threshold, max_events)
+
+
+def legacy_parse_csv_content(content, goldstein_threshold, max_events):
+    events = []
+    for row in csv.reader(content, delimiter='\t'):
+        if len(row) < 61:
+            continue
+        goldstein_scale = safe_float(row[COL_GOLDSTEIN_SCALE])
+        if goldstein_scale is None or goldstein_scale > goldstein_threshold:
+            continue
+        lat = safe_float(row[COL_ACTION_GEO_LAT])
+        lng = safe_float(row[COL_ACTION_GEO_LONG])
+        if lat is None or lng is None:
+            continue
+        event_code = safe_str(row[COL_EVENT_CODE])
+        quad_class = safe_int(row[COL_QUAD_CLASS])
+        actor1 = safe_str(row[COL_ACTOR1NAME])
+        actor2 = safe_str(row[COL_ACTOR2NAME])
+        name_parts = [p for p in (actor1, actor2) if p]
+        source_url = safe_str(row[COL_SOURCEURL])
+        events.append({
+            'name': ' - '.join(name_parts) if name_parts else 'Event',
+            'event_date': safe_str(row[COL_SQLDATE]),
+            'event_code': event_code,
+            'category': get_event_category(event_code, quad_class),
+            'quad_class': quad_class,
+            'actor1': actor1,
+            'actor1_country': safe_str(row[COL_ACTOR1COUNTRYCODE]),
+            'actor2': actor2,
+            'actor2_country': safe_str(row[COL_ACTOR2COUNTRYCODE]),
+            'lat': lat,
+            'lng': lng,
+            'latitude': lat,
+            'longitude': lng,
+            'location': safe_str(row[COL_ACTION_GEO_FULLNAME]),
+            'country_code': safe_str(row[COL_ACTION_GEO_COUNTRYCODE]),
+            'scale': goldstein_scale,
+            'goldstein_scale': goldstein_scale,
+            'avg_tone': safe_float(row[COL_AVG_TONE]),
+            'num_articles': safe_int(row[COL_NUM_ARTICLES], 0),
+            'num_mentions': safe_int(row[COL_NUM_MENTIONS], 0),
+            'num_sources': safe_int(row[COL_NUM_SOURCES], 0),
+            'url': source_url,
+            'source_url': source_url,
+        })
+        if len(events) >= max_events:
+            break
+    return events
+
+
+def legacy_get_stats_by_country(file_path, goldstein_threshold=-5.0, max_alerts=10000):
+    events = legacy_parse_gdelt_events(file_path, goldstein_threshold, max_alerts)
+    country_stats = {}
+    for event in events:
+        country = event.get('country_code', 'UNKNOWN') or 'UNKNOWN'
+        if country not in country_stats:
+            country_stats[country] = {'count': 0, 'avg_goldstein': 0.0, 'avg_tone': 0.0,
+                                      'total_articles': 0, 'categories': {}}
+        stats = country_stats[country]
+        stats['count'] += 1
+        stats['avg_goldstein'] += event.get('goldstein_scale', 0)
+        stats['avg_tone'] += event.get('avg_tone', 0) or 0
+        stats['total_articles'] += event.get('num_articles', 0)
+        category = event.get('category', 'Unknown')
+        stats['categories'][category] = stats['categories'].get(category, 0) + 1
+    for stats in country_stats.values():
+        stats['avg_goldstein'] = round(stats['avg_goldstein'] / stats['count'], 2)
+        stats['avg_tone'] = round(stats['avg_tone'] / stats['count'], 2)
+    sorted_stats = dict(sorted(country_stats.items(), key=lambda x: x[1]['count'], reverse=True))
+    return {'stats': sorted_stats, 'total_countries': len(sorted_stats), 'total_events': len(events)}
+
+
+def legacy_get_stats_by_category(file_path, goldstein_threshold=-5.0, max_alerts=10000):
+    events = legacy_parse_gdelt_events(file_path, goldstein_threshold, max_alerts)
+    category_stats = {}
+    for event in events:
+        category = event.get('category', 'Unknown')
+        if category not in category_stats:
+            category_stats[category] = {'count': 0, 'avg_goldstein': 0.0, 'avg_tone': 0.0,
+                                        'total_articles': 0, 'countries': set()}
+        stats = category_stats[category]
+        stats['count'] += 1
+        stats['avg_goldstein'] += event.get('goldstein_scale', 0)
+        stats['avg_tone'] += event.get('avg_tone', 0) or 0
+        stats['total_articles'] += event.get('num_articles', 0)
+        if event.get('country_code', ''):
+            stats['countries'].add(event['country_code'])
+    for stats in category_stats.values():
+        stats['avg_goldstein'] = round(stats['avg_goldstein'] / stats['count'], 2)
+        stats['avg_tone'] = round(stats['avg_tone'] / stats['count'], 2)
+        stats['countries'] = list(stats['countries'])
+        stats['num_countries'] = len(stats['countries'])
+    sorted_stats = dict(sorted(category_stats.items(), key=lambda x: x[1]['count'], reverse=True))
+    return {'stats': sorted_stats, 'total_categories': len(sorted_stats), 'total_events': len(events)}
+
+
+# ============================================================
+# Workload
+# ============================================================
+
+ACTORS = [("UNITED STATES", "USA"), ("CHINA", "CHN"), ("RUSSIA", "RUS"), ("UKRAINE", "UKR"),
+          ("SOUTH KOREA", "KOR"), ("JAPAN", "JPN"), ("IRAN", "IRN"), ("POLICE", ""), ("", "")]
+PLACES = [("Seoul, Seoul-t'ukpyolsi, South Korea", "KS", 37.5664, 126.9997),
+          ("Kyiv, Kyyiv, Misto, Ukraine", "UP", 50.4333, 30.5167),
+          ("Red Sea, Yemen", "YM", 15.0, 42.0), ("Shanghai, Shanghai, China", "CH", 31.2222, 121.4581),
+          ("Panama Canal, Panama", "PM", 9.08, -79.68), ("Strait of Hormuz, Iran", "IR", 26.5667, 56.25),
+          ("Rotterdam, Zuid-Holland, Netherlands", "NL", 51.9225, 4.4792), ("", "", None, None)]
+EVENT_CODES = [("190", 4), ("193", 4), ("180", 4), ("145", 3), ("112", 3), ("036", 1), ("042", 1), ("061", 2)]
+
+
+def make_export_rows(rng, count, file_index):
+    """GDELT 2.0 export 와 같은 61개 컬럼 행 (GoldsteinScale 분포는 실제 파일처럼 양수 쪽이 많음)"""
+    lines = []
+    for i in range(count):
+        fields = [""] * 61
+        actor1, actor2 = rng.choice(ACTORS), rng.choice(ACTORS)
+        place = rng.choice(PLACES)
+        code, quad = rng.choice(EVENT_CODES)
+        mentions = rng.randint(1, 60)
+        sources = rng.randint(1, mentions)
+        fields[0] = str(1200000000 + file_index * count + i)
+        fields[1], fields[2], fields[3] = DAY, DAY[:6], DAY[:4]
+        fields[5], fields[6], fields[7] = actor1[1], actor1[0], actor1[1]
+        fields[15], fields[16], fields[17] = actor2[1], actor2[0], actor2[1]
+        fields[25], fields[26], fields[27], fields[28], fields[29] = "1", code, code, code[:2], str(quad)
+        fields[30] = str(rng.choice([-10.0, -9.0, -7.2, -5.0, -4.0, -2.0, 0.0, 1.0, 1.9, 3.4, 4.0, 7.0]))
+        fields[31], fields[32], fields[33] = str(mentions), str(sources), str(rng.randint(sources, mentions))
+        fields[34] = f"{rng.uniform(-12, 4):.14f}"
+        fields[51], fields[52], fields[53] = "4", place[0], place[1]
+        if place[2] is not None:
+            fields[56], fields[57] = str(place[2]), str(place[3])
+        fields[59] = f"{DAY}{file_index // 4:02d}{file_index % 4 * 15:02d}00"
+        fields[60] = f"https://news.example.com/{DAY}/{file_index}/article-{i}.html"
+        lines.append("\t".join(fields))
+    return "\n".join(lines) + "\n"
+
+
+def make_day(workdir, files, rows, seed):
+    """
+    하루치 zip export 생성. 파일마다 별도 base 디렉토리 (default/events/YYYYMMDD/) 를 만들어
+    각 파일이 '최신 파일' 인 시점의 요청을 공개 함수 그대로 재현
+
+    Returns:
+        list[Path]: base 디렉토리 목록
+    """
+    rng = random.Random(seed)
+    bases = []
+    for index in range(files):
+        name = f"{DAY}{index // 4:02d}{index % 4 * 15:02d}00.export.CSV"
+        base = Path(workdir) / f"base{index:03d}"
+        date_dir = base / "default" / "events" / DAY
+        date_dir.mkdir(parents=True)
+        with zipfile.ZipFile(date_dir / f"{name}.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(name, make_export_rows(rng, rows, index))
+        bases.append(base)
+    return bases
+
+
+def _update_digest(hasher, results):
+    """응답 digest 누적 (시각 필드 제외, 카테고리별 국가 목록은 순서 무관) - 응답은 보관하지 않음"""
+    for result in results:
+        result.pop('last_updated', None)
+        for stats in result.get('stats', {}).values():
+            if 'countries' in stats:
+                stats['countries'] = sorted(stats['countries'])
+    hasher.update(json.dumps(results, sort_keys=True).encode())
+
+
+def run_requests(impl, base):
+    """파일 1개가 최신일 때 들어오는 요청 3건 (알림 목록, 국가별 통계, 카테고리별 통계)"""
+    if impl == "legacy":
+        path = gdelt_backend.find_latest_gdelt_file(base)
+        return [
+            {'alerts': legacy_parse_gdelt_events(path, -5.0, 1000)},
+            legacy_get_stats_by_country(path),
+            legacy_get_stats_by_category(path),
+        ]
+    path = gdelt_backend.find_latest_gdelt_file(base)
+    return [
+        {'alerts': gdelt_backend.parse_gdelt_events(path, -5.0, 1000)},
+        gdelt_backend.get_stats_by_country(base_path=base),
+        gdelt_backend.get_stats_by_category(base_path=base),
+    ]
+
+
+def run_impl(impl, workdir, repeat):
+    """하위 프로세스: 한 구현만 실행하고 결과를 stdout 으로 전달"""
+    bases = sorted(Path(workdir).glob("base*"))
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if impl == "convert":
+        started = time.perf_counter()
+        for base in bases:
+            gdelt_backend.convert_gdelt_file(gdelt_backend.find_latest_gdelt_file(base))
+        elapsed = time.perf_counter() - started
+        cache_bytes = sum(f.stat().st_size for f in Path(workdir).rglob("*.cols/*"))
+        export_bytes = sum(f.stat().st_size for f in Path(workdir).rglob("*.zip"))
+        return {
+            "impl": impl,
+            "total_ms": round(elapsed * 1000, 1),
+            "per_file_ms": round(elapsed * 1000 / len(bases), 2),
+            "cache_mb": round(cache_bytes / 1024 / 1024, 2),
+            "export_mb": round(export_bytes / 1024 / 1024, 2),
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        }
+
+    best, per_file, digest = float("inf"), [], None
+    for _ in range(repeat):
+        timings, hasher = [], hashlib.sha1()
+        for base in bases:
+            file_started = time.perf_counter()
+            results = run_requests(impl, base)
+            timings.append(time.perf_counter() - file_started)
+            _update_digest(hasher, results)
+        elapsed = sum(timings)
+        if elapsed < best:
+            best, per_file = elapsed, sorted(timings)
+        digest = hasher.hexdigest()[:16]
+    return {
+        "impl": impl,
+        "total_ms": round(best * 1000, 1),
+        "per_file_p50_ms": round(per_file[len(per_file) // 2] * 1000, 2),
+        "per_file_p95_ms": round(per_file[int(len(per_file) * 0.95)] * 1000, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "rss_growth_mb": round((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_start) / 1024, 1),
+        "digest": digest,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark GDELT column cache against parse-per-request")
+    parser.add_argument("--files", type=int, default=96, help="exports per day (15-minute files)")
+    parser.add_argument("--rows", type=int, default=2000, help="rows per export")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--impl", choices=["legacy", "convert", "columnar"], help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    parser.add_argument("--output", default="bench_gdelt_columnar.json")
+    args = parser.parse_args(argv)
+
+    if args.impl:
+        print(json.dumps(run_impl(args.impl, args.workdir, args.repeat)))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="bench-gdelt-") as workdir:
+        make_day(workdir, args.files, args.rows, args.seed)
+        print(f"[*] Workload: {args.files} exports x {args.rows:,} rows, "
+              f"3 requests per export (alerts, stats by country, stats by category)")
+        results = {}
+        for impl in ("legacy", "convert", "columnar"):
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--impl", impl, "--workdir", workdir,
+                 "--repeat", str(args.repeat)],
+                capture_output=True, text=True, check=True,
+            )
+            results[impl] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    legacy, convert, columnar = results["legacy"], results["convert"], results["columnar"]
+    print(f"  legacy    day {legacy['total_ms']:>9.1f}ms  p50 {legacy['per_file_p50_ms']:>7.2f}ms/file  "
+          f"peak RSS {legacy['peak_rss_mb']}MB (+{legacy['rss_growth_mb']}MB)")
+    print(f"  columnar  day {columnar['total_ms']:>9.1f}ms  p50 {columnar['per_file_p50_ms']:>7.2f}ms/file  "
+          f"peak RSS {columnar['peak_rss_mb']}MB (+{columnar['rss_growth_mb']}MB)  "
+          f"x{round(legacy['total_ms'] / columnar['total_ms'], 2)}")
+    print(f"  convert   {convert['per_file_ms']:.2f}ms/file once at download, "
+          f"cache {convert['cache_mb']}MB vs export {convert['export_mb']}MB (zip)")
+    identical = legacy["digest"] == columnar["digest"]
+    print(f"  responses identical: {identical}")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "files": args.files,
+            "rows": args.rows,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+        },
+        "results": {**results, "speedup": round(legacy["total_ms"] / columnar["total_ms"], 2),
+                    "identical": identical},
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+GDELT Parser Benchmark - 행 단위 csv.reader 파싱 vs 스키마 컬럼만 고르는 projected 파싱
+15분 export 1개 분량 텍스트에 대해 처리량 (rows/sec) 과 tracemalloc 할당 peak 비교
+
+- row_dicts: 이 변경 이전의 _parse_csv_content (행마다 csv.reader + 이벤트 dict, 임계값 없이 전체)
+- csv_columns: 직전 컬럼 캐시 변환 (행마다 csv.reader + safe_* 변환 후 컬럼 목록에 추가)
+- projected: 현재 _build_event_columns (split + EVENT_SCHEMA 컬럼만 골라 컬럼 단위 타입 변환)
+- alerts: 필터/정렬이 있는 알림 요청 1건 - 이벤트 dict 목록에서 filter_events + sort_events (legacy)
+  vs 컬럼 마스크 후 응답 행만 dict 변환 (columnar)
+- 결과 동일성을 먼저 확인한 뒤 측정
+
+Usage:
+    python benchmarks/bench_gdelt_parser.py --rows 2000 20000 --output bench_gdelt_parser.json
+"""
+
+import sys
+import os
+import csv
+import io
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, SERVER_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import gdelt_backend  # noqa: E402
+import gdelt_columnar  # noqa: E402
+from bench_gdelt_columnar import make_export_rows, legacy_parse_csv_content  # noqa: E402
+from gdelt_backend import (  # noqa: E402
+    COL_ACTION_GEO_COUNTRYCODE, COL_ACTION_GEO_FULLNAME, COL_ACTION_GEO_LAT, COL_ACTION_GEO_LONG,
+    COL_ACTOR1COUNTRYCODE, COL_ACTOR1NAME, COL_ACTOR2COUNTRYCODE, COL_ACTOR2NAME, COL_AVG_TONE,
+    COL_EVENT_CODE, COL_GOLDSTEIN_SCALE, COL_NUM_ARTICLES, COL_NUM_MENTIONS, COL_NUM_SOURCES,
+    COL_QUAD_CLASS, COL_SOURCEURL, COL_SQLDATE, get_event_category, safe_float, safe_int, safe_str,
+)
+
+ALERT_FILTERS = {"event_roots": ["14", "18", "19"], "min_articles": 5}
+
+
+# ============================================================
+# Legacy implementation (변경 이전 코드, 비교용)
+# ============================================================
+
+def legacy_build_event_columns(content):
+    """행마다 csv.reader + safe_* 변환 후 컬럼 목록에 추가"""
+    goldstein, lats, lngs, avg_tones = [], [], [], []
+    quad_classes, num_articles, num_mentions, num_sources = [], [], [], []
+    strings = {name: [] for name in gdelt_columnar.STRING_COLUMNS}
+    for row in csv.reader(content, delimiter='\t'):
+        if len(row) < 61:
+            continue
+        goldstein_scale = safe_float(row[COL_GOLDSTEIN_SCALE])
+        if goldstein_scale is None:
+            continue
+        lat, lng = safe_float(row[COL_ACTION_GEO_LAT]), safe_float(row[COL_ACTION_GEO_LONG])
+        if lat is None or lng is None:
+            continue
+        event_code = safe_str(row[COL_EVENT_CODE])
+        quad_class = safe_int(row[COL_QUAD_CLASS])
+        goldstein.append(goldstein_scale)
+        lats.append(lat)
+        lngs.append(lng)
+        quad_classes.append(quad_class)
+        num_articles.append(safe_int(row[COL_NUM_ARTICLES], 0))
+        num_mentions.append(safe_int(row[COL_NUM_MENTIONS], 0))
+        num_sources.append(safe_int(row[COL_NUM_SOURCES], 0))
+        avg_tones.append(safe_float(row[COL_AVG_TONE]))
+        for name, value in (
+            ('event_date', safe_str(row[COL_SQLDATE])),
+            ('event_code', event_code),
+            ('category', get_event_category(event_code, quad_class)),
+            ('actor1', safe_str(row[COL_ACTOR1NAME])),
+            ('actor1_country', safe_str(row[COL_ACTOR1COUNTRYCODE])),
+            ('actor2', safe_str(row[COL_ACTOR2NAME])),
+            ('actor2_country', safe_str(row[COL_ACTOR2COUNTRYCODE])),
+            ('country_code', safe_str(row[COL_ACTION_GEO_COUNTRYCODE])),
+            ('location', safe_str(row[COL_ACTION_GEO_FULLNAME])),
+            ('source_url', safe_str(row[COL_SOURCEURL])),
+        ):
+            strings[name].append(value)
+    numbers = {
+        'goldstein': goldstein, 'lat': lats, 'lng': lngs,
+        'num_articles': num_articles, 'num_mentions': num_mentions, 'num_sources': num_sources,
+        'avg_tone': [0 if v is None else v for v in avg_tones],
+        'avg_tone_valid': [v is not None for v in avg_tones],
+        'quad_class': [0 if v is None else v for v in quad_classes],
+        'quad_class_valid': [v is not None for v in quad_classes],
+    }
+    return gdelt_columnar.EventColumns.from_columns(numbers, strings)
+
+
+def legacy_alerts(text, max_alerts, sort_by):
+    events = legacy_parse_csv_content(io.StringIO(text), -5.0, max_alerts * 2)
+    events = gdelt_backend.filter_events(events, **ALERT_FILTERS)
+    return gdelt_backend.sort_events(events, sort_by=sort_by)[:max_alerts]
+
+
+def columnar_alerts(columns, max_alerts, sort_by):
+    rows = gdelt_backend._filter_rows(columns, columns.select(-5.0, max_alerts * 2), **ALERT_FILTERS)
+    return gdelt_backend._materialize_alerts([(columns, rows)], sort_by, max_alerts)
+
+
+# ============================================================
+# Workload
+# ============================================================
+
+def measure(fn, repeat):
+    """(best 실행 시간, tracemalloc peak bytes) - 시간은 tracemalloc 없이 따로 측정"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_case(rows, repeat, seed, max_alerts, sort_by):
+    text = make_export_rows(random.Random(seed + rows), rows, 0)
+
+    # 결과 동일성 확인
+    projected, source_rows = gdelt_backend._build_event_columns(io.StringIO(text))
+    legacy_columns = legacy_build_event_columns(io.StringIO(text))
+    assert source_rows == rows
+    assert projected.to_events(projected.select(10.0, rows)) == legacy_parse_csv_content(io.StringIO(text), 10.0, rows)
+    assert legacy_columns.to_events(legacy_columns.select(10.0, rows)) == projected.to_events(projected.select(10.0, rows))
+    assert columnar_alerts(projected, max_alerts, sort_by) == legacy_alerts(text, max_alerts, sort_by)
+
+    result = {"rows": rows}
+    parsers = {
+        "row_dicts": lambda: legacy_parse_csv_content(io.StringIO(text), 10.0, rows),
+        "csv_columns": lambda: legacy_build_event_columns(io.StringIO(text)),
+        "projected": lambda: gdelt_backend._build_event_columns(io.StringIO(text)),
+    }
+    for name, fn in parsers.items():
+        elapsed, peak = measure(fn, repeat)
+        result[f"{name}_rows_per_sec"] = round(rows / elapsed)
+        result[f"{name}_peak_kb"] = round(peak / 1024)
+
+    # 알림 요청: legacy 는 요청마다 파싱, columnar 는 저장된 컬럼 캐시 (메모리 맵) 에서 시작
+    with tempfile.TemporaryDirectory(prefix="bench-gdelt-") as workdir:
+        cache_dir = gdelt_columnar.save(projected, Path(workdir) / "export.CSV.cols")
+        elapsed, peak = measure(lambda: legacy_alerts(text, max_alerts, sort_by), repeat)
+        result["alerts_legacy_ms"], result["alerts_legacy_peak_kb"] = round(elapsed * 1000, 2), round(peak / 1024)
+        elapsed, peak = measure(lambda: columnar_alerts(gdelt_columnar.load(cache_dir), max_alerts, sort_by), repeat)
+        result["alerts_columnar_ms"], result["alerts_columnar_peak_kb"] = round(elapsed * 1000, 2), round(peak / 1024)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark projected GDELT parsing against the row-by-row parser")
+    parser.add_argument("--rows", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-alerts", type=int, default=100)
+    parser.add_argument("--sort-by", default="importance")
+    parser.add_argument("--output", default="bench_gdelt_parser.json")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in args.rows:
+        result = run_case(rows, args.repeat, args.seed, args.max_alerts, args.sort_by)
+        results.append(result)
+        print(f"[*] {rows:,} rows")
+        for name in ("row_dicts", "csv_columns", "projected"):
+            print(f"  parse {name:<12} {result[f'{name}_rows_per_sec']:>10,} rows/s  "
+                  f"peak {result[f'{name}_peak_kb']:>8,}KB")
+        print(f"  alerts legacy   {result['alerts_legacy_ms']:>9.2f}ms  peak {result['alerts_legacy_peak_kb']:>8,}KB")
+        print(f"  alerts columnar {result['alerts_columnar_ms']:>9.2f}ms  peak {result['alerts_columnar_peak_kb']:>8,}KB")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "max_alerts": args.max_alerts,
+            "sort_by": args.sort_by,
+            "filters": ALERT_FILTERS,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
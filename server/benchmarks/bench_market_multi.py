@@ -0,0 +1,116 @@
+"""
+Market Multi Benchmark - get_market_index_multi 항목 수별 조회 시간 (순차 vs 동시)
+로컬 가짜 ECOS 서버 (응답 지연 --latency-ms) 를 띄우고 실제 HTTP 경로로 측정
+
+- serial: 워커 1개 (기존 순차 조회와 동일한 경로)
+- parallel: 워커 --workers 개 + 토큰 버킷 (버스트 RATE_LIMIT_BURST)
+- 측정마다 _api_cache / 저장소 / limiter 를 새로 시작, 두 결과가 동일한지 검증
+
+Usage:
+    python benchmarks/bench_market_multi.py --items 1 2 4 8 16 --latency-ms 150 --output bench_market_multi.json
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+os.environ.setdefault("ECOS_API_KEY", "bench")
+os.environ.setdefault("ECOS_STORE_ENABLED", "false")
+
+import bok_backend
+
+
+class FakeECOSHandler(BaseHTTPRequestHandler):
+    """/StatisticSearch/KEY/json/kr/1/N/STAT/CYCLE/START/END/ITEM → 일별 row"""
+    latency = 0.15
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        parts = self.path.rstrip('/').split('/')
+        item_code, start = parts[-1], parts[-3]
+        end_index = int(parts[-6])
+        rows = [{"STAT_CODE": parts[-5], "ITEM_CODE1": item_code, "TIME": f"{start[:6]}{d:02d}",
+                 "DATA_VALUE": f"{1300 + d + int(item_code) % 100}.25"} for d in range(1, min(end_index, 28) + 1)]
+        body = json.dumps({"StatisticSearch": {"list_total_count": len(rows), "row": rows}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fake_ecos(latency):
+    FakeECOSHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeECOSHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed_fetch(items, workers):
+    bok_backend.clear_api_cache()
+    bok_backend._rate_limiter = bok_backend.TokenBucketLimiter()
+    started = time.perf_counter()
+    result = bok_backend.get_market_index_multi("exchange", "20240101", "20240131", item_codes=items,
+                                                max_workers=workers)
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark get_market_index_multi against a local fake ECOS")
+    parser.add_argument("--items", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--workers", type=int, default=bok_backend.MULTI_FETCH_WORKERS)
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--output", default="bench_market_multi.json")
+    args = parser.parse_args(argv)
+
+    server = start_fake_ecos(args.latency_ms / 1000)
+    bok_backend.API_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    bok_backend._observation_store = None
+    all_items = list(bok_backend.BOK_MAPPING["exchange"]["items"].keys())
+    print(f"[*] Fake ECOS at {bok_backend.API_BASE_URL} (latency {args.latency_ms:.0f}ms), workers={args.workers}")
+
+    rows = []
+    for count in args.items:
+        items = all_items[:count]
+        serial_ms, serial = timed_fetch(items, 1)
+        parallel_ms, parallel = timed_fetch(items, args.workers)
+        if parallel != serial:
+            raise SystemExit(f"[ERROR] parallel result differs from serial for {count} items")
+        rows.append({
+            "items": count,
+            "serial_ms": round(serial_ms, 1),
+            "parallel_ms": round(parallel_ms, 1),
+            "speedup": round(serial_ms / parallel_ms, 2),
+        })
+        print(f"  items={count:>3}  serial {serial_ms:>8.1f}ms  parallel {parallel_ms:>8.1f}ms  "
+              f"x{serial_ms / parallel_ms:.2f}")
+    server.shutdown()
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "latency_ms": args.latency_ms,
+            "workers": args.workers,
+            "burst": bok_backend.RATE_LIMIT_BURST,
+            "python": platform.python_version(),
+        },
+        "results": rows,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Market Stats Benchmark - MarketSeries (NumPy) vs 기존 row 루프
+다년 일별 환율 시계열 (통화 N개) 에 대해 calculate_statistics 처리 시간 비교
+
+- legacy: 이 변경 이전의 calculate_statistics / calculate_statistics_previous_period (row 단위 파싱 + Python 루프)
+- series: bok_series.MarketSeries 기반 summary (+ 보조지표 포함 시간 별도 측정)
+- 두 구현의 summary 결과가 같은지 먼저 확인한 뒤 측정
+
+Usage:
+    python benchmarks/bench_market_stats.py --years 5 10 --currencies 8 --output bench_market_stats.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import platform
+from datetime import datetime, date, timedelta
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+os.environ.setdefault("ECOS_API_KEY", "bench")
+os.environ.setdefault("ECOS_STORE_ENABLED", "false")
+
+import bok_backend  # noqa: E402
+from bok_series import time_sort_key  # noqa: E402
+
+
+# ============================================================
+# Legacy implementation (변경 이전 코드, 비교용)
+# ============================================================
+
+def legacy_calculate_statistics(data, currency_code=None, previous_period=False):
+    if "error" in data:
+        return data
+    rows = data.get('StatisticSearch', {}).get('row', [])
+    if not rows:
+        return {"error": "No data available"}
+
+    parsed = []
+    for row in rows:
+        if isinstance(row, dict):
+            date_str = row.get('TIME', '')
+            value_str = row.get('DATA_VALUE', '')
+        elif isinstance(row, list) and len(row) >= 2:
+            date_str = str(row[0])
+            value_str = str(row[1])
+        else:
+            continue
+        if date_str and value_str:
+            try:
+                value = float(value_str)
+                if value > 0:
+                    parsed.append((date_str, value))
+            except (ValueError, TypeError):
+                continue
+    if not parsed:
+        return {"error": "No valid data values found"}
+
+    if previous_period:
+        parsed.sort(key=lambda x: time_sort_key(x[0]))
+    values = [v for _, v in parsed]
+    current_value = values[-1]
+    if previous_period:
+        previous_value = values[-2] if len(values) >= 2 else current_value
+    else:
+        previous_value = values[0] if len(values) > 1 else current_value
+    change = current_value - previous_value
+    change_percent = (change / previous_value * 100) if previous_value != 0 else 0
+    return {
+        "currency": currency_code or "UNKNOWN",
+        "high": round(max(values), 2),
+        "low": round(min(values), 2),
+        "average": round(sum(values) / len(values), 2),
+        "current": round(current_value, 2),
+        "previous": round(previous_value, 2),
+        "change": round(change, 2),
+        "changePercent": round(change_percent, 2),
+    }
+
+
+# ============================================================
+# Workload
+# ============================================================
+
+def make_daily_rows(rng, years):
+    """영업일 기준 일별 환율 row (ECOS StatisticSearch 형식, 간헐적 빈 값 포함)"""
+    rows = []
+    day = date(2024, 12, 31) - timedelta(days=365 * years)
+    value = 900 + rng.random() * 600
+    while day <= date(2024, 12, 31):
+        if day.weekday() < 5:
+            value *= 1 + rng.gauss(0, 0.004)
+            data_value = "" if rng.random() < 0.002 else f"{value:.2f}"
+            rows.append({"STAT_CODE": "731Y001", "ITEM_CODE1": "0000001", "UNIT_NAME": "원",
+                         "TIME": day.strftime("%Y%m%d"), "DATA_VALUE": data_value})
+        day += timedelta(days=1)
+    return rows
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_case(years, currencies, repeat, seed):
+    rng = random.Random(seed + years)
+    datasets = [{"StatisticSearch": {"row": make_daily_rows(rng, years)}} for _ in range(currencies)]
+    total_rows = sum(len(d["StatisticSearch"]["row"]) for d in datasets)
+
+    # 결과 동일성 확인
+    for data in datasets:
+        assert bok_backend.calculate_statistics(data, "USD") == legacy_calculate_statistics(data, "USD")
+        assert bok_backend.calculate_statistics_previous_period(data, "USD") == \
+            legacy_calculate_statistics(data, "USD", previous_period=True)
+
+    legacy = best_of(lambda: [legacy_calculate_statistics(d, "USD") for d in datasets], repeat)
+    legacy_prev = best_of(lambda: [legacy_calculate_statistics(d, "USD", previous_period=True) for d in datasets], repeat)
+    series = best_of(lambda: [bok_backend.calculate_statistics(d, "USD") for d in datasets], repeat)
+    series_prev = best_of(lambda: [bok_backend.calculate_statistics_previous_period(d, "USD") for d in datasets], repeat)
+    series_ind = best_of(lambda: [bok_backend.calculate_statistics(d, "USD", indicators=True, cycle="D")
+                                  for d in datasets], repeat)
+
+    return {
+        "years": years,
+        "currencies": currencies,
+        "rows": total_rows,
+        "legacy_ms": round(legacy * 1000, 2),
+        "series_ms": round(series * 1000, 2),
+        "speedup": round(legacy / series, 2),
+        "legacy_previous_period_ms": round(legacy_prev * 1000, 2),
+        "series_previous_period_ms": round(series_prev * 1000, 2),
+        "previous_period_speedup": round(legacy_prev / series_prev, 2),
+        "series_with_indicators_ms": round(series_ind * 1000, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark MarketSeries statistics against the previous row loop")
+    parser.add_argument("--years", type=int, nargs="+", default=[5, 10])
+    parser.add_argument("--currencies", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_market_stats.json")
+    args = parser.parse_args(argv)
+
+    results = []
+    for years in args.years:
+        result = run_case(years, args.currencies, args.repeat, args.seed)
+        results.append(result)
+        print(f"[*] {years}y x {args.currencies} currencies ({result['rows']:,} rows)")
+        print(f"  summary          legacy {result['legacy_ms']:>9.2f}ms  series {result['series_ms']:>9.2f}ms  "
+              f"x{result['speedup']}")
+        print(f"  previous-period  legacy {result['legacy_previous_period_ms']:>9.2f}ms  "
+              f"series {result['series_previous_period_ms']:>9.2f}ms  x{result['previous_period_speedup']}")
+        print(f"  with indicators  series {result['series_with_indicators_ms']:>9.2f}ms")
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "currencies": args.currencies,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+    print(f"[DONE] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,18 +8,23 @@ Endpoints:
 - /api/bok/item-list - 항목 목록 조회
 - /api/bok/cache/stats - 캐시 통계
 - /api/bok/cache/clear - 캐시 초기화
+- /api/bok/catalog/refresh - 통계표/항목 카탈로그 갱신
 - /api/market/indices - 시장 지수 조회
 - /api/market/indices/multi - 다중 시장 지수 조회
 - /api/market/indices/stats - 시장 지수 통계
+- /api/market/indices/stats/multi - 다중 시장 지수 통계
+- /api/market/snapshot - 전체 카테고리 시장 지수 스냅샷 (ETag)
 - /api/market/categories - 카테고리 정보
 """
 
 import os
 import logging
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 import requests
 
 import bok_backend
+import bok_prefetch
+import bok_snapshot
 from config import ECOS_API_KEY, ECOS_API_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -60,11 +65,13 @@ def search_statistical_codes():
     파라미터:
     - statCode: 통계표 코드 (부분 검색 가능, 선택)
     - statName: 통계표명 (부분 검색 가능, 선택)
+    - q: 코드 또는 통계표명(한글/영문) 검색어 (선택, 타이핑 중 검색용)
     - startIndex: 요청 시작 건수 (기본값: 1)
     - endIndex: 요청 종료 건수 (기본값: 100, 최대 1000)
     """
     stat_code = request.args.get('statCode')
     stat_name = request.args.get('statName')
+    query = request.args.get('q')
     start_index = request.args.get('startIndex', 1, type=int)
     end_index = request.args.get('endIndex', 100, type=int)
     
@@ -72,7 +79,8 @@ def search_statistical_codes():
         stat_code=stat_code,
         stat_name=stat_name,
         start_index=start_index,
-        end_index=end_index
+        end_index=end_index,
+        query=query
     )
     
     if "error" in result:
@@ -88,10 +96,12 @@ def get_statistic_item_list():
     
     파라미터:
     - statCode: 통계표 코드 (필수)
+    - itemName: 항목 코드/항목명(한글/영문) 검색어 (선택)
     - startIndex: 요청 시작 건수 (기본값: 1)
     - endIndex: 요청 종료 건수 (기본값: 100, 최대 1000)
     """
     stat_code = request.args.get('statCode')
+    item_name = request.args.get('itemName')
     start_index = request.args.get('startIndex', 1, type=int)
     end_index = request.args.get('endIndex', 100, type=int)
     
@@ -101,7 +111,8 @@ def get_statistic_item_list():
     result = bok_backend.get_statistic_item_list(
         stat_code=stat_code,
         start_index=start_index,
-        end_index=end_index
+        end_index=end_index,
+        item_name=item_name
     )
     
     if "error" in result:
@@ -115,6 +126,8 @@ def get_bok_cache_stats():
     """BOK API 캐시 통계를 반환합니다."""
     try:
         stats = bok_backend.get_cache_stats()
+        stats["prefetch"] = bok_prefetch.get_stats()
+        stats["snapshot"] = bok_snapshot.get_stats()
         return jsonify(stats)
     except Exception as e:
         logger.error(f"Error getting cache stats: {e}", exc_info=True)
@@ -132,6 +145,25 @@ def clear_bok_cache():
         return jsonify({'error': str(e)}), 500
 
 
+@bok_bp.route('/api/bok/catalog/refresh', methods=['POST'])
+def refresh_bok_catalog():
+    """
+    통계표/항목 카탈로그를 ECOS 에서 다시 받아 갱신합니다.
+    
+    파라미터 (JSON body, 선택):
+    - statCodes: 항목 목록을 갱신할 통계표 코드 목록 (기본값: 저장된 통계표 전체)
+    """
+    try:
+        body = request.get_json(silent=True) or {}
+        result = bok_backend.refresh_catalog(stat_codes=body.get('statCodes'))
+        if result.get('error'):
+            return jsonify(result), 400
+        return jsonify(result), (500 if result['tables'] is None else 200)
+    except Exception as e:
+        logger.error(f"Error refreshing BOK catalog: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
 # ============================================================
 # Market Indices API
 # ============================================================
@@ -191,12 +223,16 @@ def get_market_categories():
 def get_market_indices_stats():
     """
     시장 지수 데이터의 통계 정보를 반환합니다 (환율, 물가, GDP 등).
+    
+    파라미터:
+    - indicators: true 이면 보조지표(이동평균, 변동성, 백분위, 낙폭) 포함 (선택)
     """
     category = request.args.get('type', 'exchange')
     item_code = request.args.get('itemCode')
     start_date = request.args.get('startDate')
     end_date = request.args.get('endDate')
     cycle = request.args.get('cycle')
+    with_indicators = request.args.get('indicators', 'false').lower() in ('1', 'true', 'yes')
     
     if not all([category, start_date, end_date]):
         return jsonify({"error": "Missing parameters: type, startDate, endDate are required"}), 400
@@ -213,10 +249,13 @@ def get_market_indices_stats():
     
     # 통계 정보 계산
     # GDP는 QoQ(직전 분기 대비)로 계산 (나머지는 기존 range-start 대비 유지)
+    series_cycle = cycle or bok_backend.BOK_MAPPING.get(category, {}).get('default_cycle')
     if category == 'gdp':
-        stats = bok_backend.calculate_statistics_previous_period(result, currency_code=item_code)
+        stats = bok_backend.calculate_statistics_previous_period(
+            result, currency_code=item_code, indicators=with_indicators, cycle=series_cycle)
     else:
-        stats = bok_backend.calculate_statistics(result, currency_code=item_code)
+        stats = bok_backend.calculate_statistics(
+            result, currency_code=item_code, indicators=with_indicators, cycle=series_cycle)
     
     if "error" in stats:
         return jsonify(stats), 500
@@ -224,6 +263,58 @@ def get_market_indices_stats():
     return jsonify(stats)
 
 
+@bok_bp.route('/api/market/indices/stats/multi', methods=['GET'])
+def get_market_indices_stats_multi():
+    """
+    한 카테고리 여러 항목의 통계를 한 번에 반환합니다.
+    (항목 조회는 get_market_index_multi 로 동시에, 통계는 항목별 배열 연산 1회)
+    
+    파라미터:
+    - type, startDate, endDate (필수) / itemCode (여러 개, 생략 시 전체) / cycle / indicators
+    """
+    category = request.args.get('type', 'exchange')
+    item_codes = request.args.getlist('itemCode') or None
+    start_date = request.args.get('startDate')
+    end_date = request.args.get('endDate')
+    cycle = request.args.get('cycle')
+    with_indicators = request.args.get('indicators', 'false').lower() in ('1', 'true', 'yes')
+    
+    if not all([category, start_date, end_date]):
+        return jsonify({"error": "Missing parameters: type, startDate, endDate are required"}), 400
+    
+    results = bok_backend.get_market_index_multi(category, start_date, end_date, item_codes=item_codes, cycle=cycle)
+    if "error" in results:
+        return jsonify(results), 400
+    
+    series_cycle = cycle or bok_backend.BOK_MAPPING.get(category, {}).get('default_cycle')
+    stats = bok_backend.calculate_statistics_multi(
+        results, cycle=series_cycle, indicators=with_indicators, previous_period=(category == 'gdp'))
+    return jsonify(stats)
+
+
+@bok_bp.route('/api/market/snapshot', methods=['GET'])
+def get_market_snapshot():
+    """
+    전체 카테고리/항목의 최신값, 변동, 스파크라인, 요약 통계를 한 번에 반환합니다.
+    
+    - ETag 지원: If-None-Match 가 현재 스냅샷과 같으면 304
+    - 파라미터: refresh=true 이면 캐시 TTL 과 관계없이 다시 확인 (바뀐 시리즈만 재계산)
+    """
+    try:
+        force = request.args.get('refresh', 'false').lower() in ('1', 'true', 'yes')
+        snapshot = bok_snapshot.get_snapshot(force=force)
+        if snapshot['etag'] in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(snapshot['json'], mimetype='application/json')
+        response.set_etag(snapshot['etag'])
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    except Exception as e:
+        logger.error(f"Error building market snapshot: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
 # ============================================================
 # Legacy Exchange Rates API (keeping for backwards compatibility)
 # ============================================================
@@ -244,9 +335,12 @@ def get_exchange_rates():
     # Format: /StatisticSearch/KEY/json/kr/1/10/731Y001/D/START/END/ITEM
     url = f"{ECOS_API_BASE_URL}/StatisticSearch/{ECOS_API_KEY}/json/kr/1/10/731Y001/D/{start_date}/{end_date}/{item_code}"
 
+    # 동시에 들어온 같은 조회는 ECOS 호출 1회를 공유 (결과/예외 모두)
+    cache_key = bok_backend._generate_cache_key("ExchangeRates", item_code, start_date, end_date)
+
     try:
-        response = requests.get(url)
-        return jsonify(response.json())
+        data = bok_backend.coalesce(cache_key, lambda: requests.get(url).json())
+        return jsonify(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -1,12 +1,20 @@
 import requests
 import os
+import heapq
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import logging
 import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
+import bok_catalog
+import bok_series
+import bok_store
+
 load_dotenv()
 
 # 로깅 설정
@@ -27,12 +35,29 @@ API_TIMEOUT = 30  # 30초 타임아웃
 # BOK API 제한: 3분(180초)에 300회 → 안전하게 3분에 250회로 제한
 # 즉, 약 0.72초에 1회 → 안전하게 0.8초 간격으로 설정
 RATE_LIMIT_INTERVAL = 0.8  # 최소 요청 간격 (초)
+RATE_LIMIT_WINDOW = 180  # 쿼터 윈도우 (초)
+RATE_LIMIT_MAX_REQUESTS = 250  # 윈도우당 최대 요청 수
+# 토큰 버킷 버스트 크기 - 임의의 3분 구간 최대 요청 수 = 버스트 + 250 (ECOS 한도 300 이내)
+RATE_LIMIT_BURST = int(os.getenv("ECOS_RATE_LIMIT_BURST", "20"))
+# get_market_index_multi 동시 조회 워커 수
+MULTI_FETCH_WORKERS = int(os.getenv("ECOS_MULTI_FETCH_WORKERS", "6"))
 CACHE_TTL_SECONDS = 300  # 캐시 유효 시간 (5분)
 CACHE_TTL_ITEM_LIST = 3600  # 항목 목록 캐시 유효 시간 (1시간)
+CACHE_MAX_ENTRIES = int(os.getenv("ECOS_CACHE_MAX_ENTRIES", "2000"))  # 캐시 최대 항목 수
+CACHE_MAX_BYTES = int(os.getenv("ECOS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 캐시 최대 크기 (JSON 기준, 64MB)
+
+# 관측값 디스크 저장소 (재시작 후에도 과거 관측값 재사용, 누락 구간만 ECOS 조회)
+ECOS_STORE_ENABLED = os.getenv("ECOS_STORE_ENABLED", "true").lower() != "false"
+ECOS_STORE_PATH = os.getenv("ECOS_STORE_PATH", str(bok_store.DEFAULT_STORE_PATH))
+
+# 통계표/항목 카탈로그 (코드 검색, 항목 목록을 로컬 색인으로 처리)
+ECOS_CATALOG_ENABLED = os.getenv("ECOS_CATALOG_ENABLED", "true").lower() != "false"
+ECOS_CATALOG_PATH = os.getenv("ECOS_CATALOG_PATH", str(bok_catalog.DEFAULT_CATALOG_PATH))
+CATALOG_PAGE_SIZE = 1000  # ECOS 1회 요청 최대 건수
 
 # Rate Limiter - 요청 간격 제어
 class RateLimiter:
-    """API 호출 간격을 제어하는 Rate Limiter"""
+    """API 호출 간격을 제어하는 Rate Limiter (고정 윈도우 + 최소 간격, 전역 인스턴스는 TokenBucketLimiter 사용)"""
     def __init__(self, min_interval=RATE_LIMIT_INTERVAL):
         self.min_interval = min_interval
         self.last_request_time = 0
@@ -73,75 +98,239 @@ class RateLimiter:
             self.request_count += 1
             logger.debug(f"API request #{self.request_count} in current window")
 
+
+class TokenBucketLimiter:
+    """
+    토큰 버킷 Rate Limiter - 버스트 허용 + 장기 평균 속도(쿼터) 준수
+    
+    - 토큰은 rate(개/초) 속도로 capacity 까지 채워지고, 요청마다 1개 소비
+    - 토큰이 부족하면 예약(토큰 음수) 후 lock 밖에서 자신의 차례까지만 대기 → 여러 스레드가 동시에 대기 가능
+    - RateLimiter 와 동일하게 wait_if_needed() 로 호출
+    """
+    def __init__(self, rate=RATE_LIMIT_MAX_REQUESTS / RATE_LIMIT_WINDOW, capacity=RATE_LIMIT_BURST,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(capacity)
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.throttled_count = 0
+    
+    def wait_if_needed(self):
+        """토큰 1개를 확보할 때까지 대기"""
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            self.request_count += 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+            if wait_time > 0:
+                self.throttled_count += 1
+        if wait_time > 0:
+            logger.debug(f"Rate limit: waiting {wait_time:.2f}s for a token")
+            self.sleep(wait_time)
+    
+    def get_stats(self):
+        with self.lock:
+            return {
+                "tokens": round(min(self.capacity, self.tokens + (self.clock() - self.updated_at) * self.rate), 2),
+                "capacity": self.capacity,
+                "rate_per_sec": round(self.rate, 3),
+                "requests": self.request_count,
+                "throttled": self.throttled_count,
+            }
+
 # 전역 Rate Limiter 인스턴스
-_rate_limiter = RateLimiter()
+_rate_limiter = TokenBucketLimiter()
 
 # 캐시 저장소
 class CacheEntry:
     """캐시 항목"""
-    def __init__(self, data, ttl=CACHE_TTL_SECONDS):
+    __slots__ = ("data", "created_at", "ttl", "size")
+    
+    def __init__(self, data, ttl=CACHE_TTL_SECONDS, created_at=None, size=0):
         self.data = data
-        self.created_at = time.time()
+        self.created_at = time.time() if created_at is None else created_at
         self.ttl = ttl
+        self.size = size
+    
+    @property
+    def expires_at(self):
+        return self.created_at + self.ttl
     
-    def is_expired(self):
-        return time.time() - self.created_at > self.ttl
+    def is_expired(self, now=None):
+        return (time.time() if now is None else now) - self.created_at > self.ttl
+
+
+def _estimate_size(data, sample=8):
+    """
+    캐시 항목 크기 추정 (JSON 직렬화 길이 근사치, 바이트 예산 계산용)
+    - 리스트는 앞쪽 sample 개 항목의 평균 크기 × 길이로 추정 (ECOS row 목록 전체를 직렬화하지 않음)
+    """
+    if isinstance(data, dict):
+        return 2 + sum(len(str(k)) + 4 + _estimate_size(v, sample) for k, v in data.items())
+    if isinstance(data, (list, tuple)):
+        if not data:
+            return 2
+        head = data[:sample]
+        per_item = sum(_estimate_size(v, sample) + 1 for v in head) / len(head)
+        return int(2 + per_item * len(data))
+    if isinstance(data, str):
+        return len(data) + 2
+    return len(str(data))
+
 
 class APICache:
-    """API 응답 캐시"""
-    def __init__(self):
-        self.cache = {}
+    """
+    API 응답 캐시 - LRU + 항목 수 / 바이트 예산 + TTL
+    
+    - 조회 시 최근 사용으로 이동, 예산(max_entries, max_bytes) 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - 만료 시각 힙을 set/cleanup 시점에 앞에서부터 정리 (만료 항목이 다시 조회되지 않아도 제거됨)
+    - 키의 첫 구간(StatisticSearch, StatisticItemList ...)을 네임스페이스로 hit/miss/eviction 집계
+    """
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES, clock=time.time):
+        self.cache = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.total_bytes = 0
+        self._expiry_heap = []  # (expires_at, seq, key, entry)
+        self._seq = 0
+        self._namespaces = {}
         self.lock = threading.Lock()
     
+    def _ns(self, key):
+        namespace = str(key).split(":", 1)[0]
+        stats = self._namespaces.get(namespace)
+        if stats is None:
+            stats = self._namespaces[namespace] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        return stats
+    
+    def _remove(self, key):
+        entry = self.cache.pop(key)
+        self.total_bytes -= entry.size
+        return entry
+    
+    def _sweep_expired(self, now):
+        """만료 힙 앞쪽의 만료 항목 제거 (이미 교체/삭제된 항목은 건너뜀)"""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            _, _, key, entry = heapq.heappop(heap)
+            if self.cache.get(key) is entry:
+                self._remove(key)
+                self._ns(key)["expirations"] += 1
+                removed += 1
+        # 같은 키를 반복 갱신해 힙에 남은 죽은 항목이 많아지면 재구성
+        if len(heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [item for item in heap if self.cache.get(item[2]) is item[3]]
+            heapq.heapify(self._expiry_heap)
+        return removed
+    
     def get(self, key):
         """캐시에서 데이터 조회"""
         with self.lock:
-            if key in self.cache:
-                entry = self.cache[key]
-                if not entry.is_expired():
+            ns = self._ns(key)
+            entry = self.cache.get(key)
+            if entry is not None:
+                if not entry.is_expired(self.clock()):
+                    self.cache.move_to_end(key)
+                    ns["hits"] += 1
                     logger.debug(f"Cache HIT: {key[:50]}...")
                     return entry.data
-                else:
-                    # 만료된 항목 삭제
-                    del self.cache[key]
-                    logger.debug(f"Cache EXPIRED: {key[:50]}...")
+                # 만료된 항목 삭제
+                self._remove(key)
+                ns["expirations"] += 1
+                logger.debug(f"Cache EXPIRED: {key[:50]}...")
+            ns["misses"] += 1
             return None
     
     def set(self, key, data, ttl=CACHE_TTL_SECONDS):
         """캐시에 데이터 저장"""
+        size = _estimate_size(data)
         with self.lock:
-            self.cache[key] = CacheEntry(data, ttl)
-            logger.debug(f"Cache SET: {key[:50]}... (TTL: {ttl}s)")
+            now = self.clock()
+            self._sweep_expired(now)
+            if key in self.cache:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.warning(f"Cache SKIP: {key[:50]}... ({size} bytes > budget {self.max_bytes})")
+                return
+            entry = CacheEntry(data, ttl, created_at=now, size=size)
+            self.cache[key] = entry
+            self.total_bytes += size
+            self._seq += 1
+            heapq.heappush(self._expiry_heap, (entry.expires_at, self._seq, key, entry))
+            # 예산 초과 시 LRU 제거
+            while len(self.cache) > self.max_entries or self.total_bytes > self.max_bytes:
+                evicted_key = next(iter(self.cache))
+                self._remove(evicted_key)
+                self._ns(evicted_key)["evictions"] += 1
+            logger.debug(f"Cache SET: {key[:50]}... (TTL: {ttl}s, {size} bytes)")
     
     def clear(self):
         """캐시 전체 삭제"""
         with self.lock:
             count = len(self.cache)
             self.cache.clear()
+            self._expiry_heap = []
+            self.total_bytes = 0
             logger.info(f"Cache cleared: {count} entries removed")
     
     def cleanup_expired(self):
         """만료된 캐시 항목 정리"""
         with self.lock:
-            expired_keys = [k for k, v in self.cache.items() if v.is_expired()]
-            for key in expired_keys:
-                del self.cache[key]
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+            removed = self._sweep_expired(self.clock())
+            if removed:
+                logger.debug(f"Cleaned up {removed} expired cache entries")
+    
+    clear_expired = cleanup_expired
     
     def get_stats(self):
         """캐시 통계 반환"""
         with self.lock:
+            now = self.clock()
             total = len(self.cache)
-            expired = sum(1 for v in self.cache.values() if v.is_expired())
-            return {"total": total, "active": total - expired, "expired": expired}
+            expired = sum(1 for v in self.cache.values() if v.is_expired(now))
+            namespaces = {name: dict(stats) for name, stats in self._namespaces.items()}
+            totals = {field: sum(s[field] for s in namespaces.values())
+                      for field in ("hits", "misses", "evictions", "expirations")}
+            lookups = totals["hits"] + totals["misses"]
+            return {
+                "total": total,
+                "active": total - expired,
+                "expired": expired,
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                **totals,
+                "hit_rate": round(totals["hits"] / lookups, 4) if lookups else 0.0,
+                "namespaces": namespaces,
+            }
 
 # 전역 캐시 인스턴스
 _api_cache = APICache()
 
+# 전역 관측값 저장소 인스턴스 (비활성화 시 None)
+_observation_store = bok_store.ObservationStore(ECOS_STORE_PATH) if ECOS_STORE_ENABLED else None
+
+# 전역 통계표 카탈로그 인스턴스 (비활성화 시 None)
+_stat_catalog = bok_catalog.StatCatalog(ECOS_CATALOG_PATH) if ECOS_CATALOG_ENABLED else None
+
 def get_cache_stats():
     """캐시 통계 조회 (외부 노출용)"""
-    return _api_cache.get_stats()
+    stats = _api_cache.get_stats()
+    if _observation_store is not None:
+        stats["store"] = _observation_store.stats()
+    if _stat_catalog is not None:
+        stats["catalog"] = _stat_catalog.stats()
+    stats["singleflight"] = _singleflight.get_stats()
+    stats["served"] = _served_stats.get_stats()
+    return stats
 
 def clear_api_cache():
     """캐시 초기화 (외부 노출용)"""
@@ -153,6 +342,158 @@ def _generate_cache_key(*args, **kwargs):
     key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
     return ":".join(key_parts)
 
+
+# ============================================================
+# PREFETCH SCOPE & WARM/COLD 집계
+# ============================================================
+# 예열(prefetch) 조회는 캐시를 읽지 않고 ECOS 결과로 다시 채우며 (긴 TTL),
+# 사용자 요청은 ECOS 를 기다리지 않고 응답했는지(warm) / ECOS 호출 또는 진행 중 호출을 기다렸는지(cold) 집계
+
+_fetch_context = threading.local()
+
+def _note_ecos_wait():
+    """현재 스레드가 ECOS 응답을 기다린 횟수 +1 (직접 호출 또는 singleflight 대기)"""
+    _fetch_context.ecos_waits = getattr(_fetch_context, 'ecos_waits', 0) + 1
+
+def _ecos_waits():
+    return getattr(_fetch_context, 'ecos_waits', 0)
+
+def _prefetch_ttl():
+    """prefetch_scope 안이면 예열 캐시 TTL, 아니면 None"""
+    return getattr(_fetch_context, 'prefetch_ttl', None)
+
+def _flight_key(key):
+    """예열 조회는 사용자 요청과 singleflight 를 공유하지 않음 (캐시를 건너뛰고 새로 받아야 하므로)"""
+    return f"Prefetch:{key}" if _prefetch_ttl() is not None else key
+
+@contextmanager
+def prefetch_scope(ttl=CACHE_TTL_SECONDS):
+    """
+    블록 안(현재 스레드)의 시장 지수 조회를 예열 조회로 실행합니다.
+
+    - StatisticSearch 캐시를 읽지 않고 새로 조회해 ttl(초) 동안 캐시에 저장
+      (관측값 저장소는 그대로 사용 → 확정된 과거 구간은 다시 받지 않음)
+    - 사용자 요청 warm/cold 집계에서 제외
+    """
+    previous = _prefetch_ttl()
+    _fetch_context.prefetch_ttl = ttl
+    try:
+        yield
+    finally:
+        _fetch_context.prefetch_ttl = previous
+
+
+class ServedStats:
+    """사용자 시장 지수 요청의 warm / cold 응답 수 (카테고리별)"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_category = {}
+
+    def record(self, category, warm):
+        with self.lock:
+            counts = self.by_category.setdefault(category, {"warm": 0, "cold": 0})
+            counts["warm" if warm else "cold"] += 1
+
+    def get_stats(self):
+        with self.lock:
+            by_category = {category: dict(counts) for category, counts in self.by_category.items()}
+        warm = sum(counts["warm"] for counts in by_category.values())
+        cold = sum(counts["cold"] for counts in by_category.values())
+        return {
+            "warm": warm,
+            "cold": cold,
+            "warm_ratio": round(warm / (warm + cold), 4) if warm + cold else 0.0,
+            "by_category": by_category,
+        }
+
+# 전역 warm/cold 집계 인스턴스
+_served_stats = ServedStats()
+
+def _serve(category, fn):
+    """사용자 요청 fn() 실행 후 이 스레드가 ECOS 를 기다리지 않았으면 warm, 기다렸으면 cold 로 기록"""
+    if _prefetch_ttl() is not None:
+        return fn()
+    before = _ecos_waits()
+    result = fn()
+    _served_stats.record(category, warm=_ecos_waits() == before)
+    return result
+
+
+# ============================================================
+# SINGLEFLIGHT (동시 동일 요청 병합)
+# ============================================================
+# 캐시가 채워지기 전 같은 키로 동시에 들어온 요청은 먼저 온 1건만 ECOS 를 호출하고
+# 나머지는 그 결과(또는 예외)를 그대로 공유
+
+class _Call:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """키별 진행 중 호출 1건만 실행, 동시 호출자는 결과를 기다려 공유"""
+    def __init__(self):
+        self._calls = {}
+        self.lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.coalesced_by_namespace = {}
+    
+    def do(self, key, fn):
+        """key 로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn() 을 실행"""
+        with self.lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+                namespace = key.split(":", 1)[0]
+                self.coalesced_by_namespace[namespace] = self.coalesced_by_namespace.get(namespace, 0) + 1
+        
+        if not leader:
+            _note_ecos_wait()
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            with self.lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.value
+    
+    def get_stats(self):
+        with self.lock:
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "coalesced_by_namespace": dict(self.coalesced_by_namespace),
+            }
+
+# 전역 SingleFlight 인스턴스
+_singleflight = SingleFlight()
+
+def coalesce(key, fn):
+    """동일 key 의 동시 호출을 1회로 병합 (외부 노출용, 예: /api/exchange-rates)"""
+    return _singleflight.do(key, fn)
+
 # BOK ECOS API StatisticSearch 엔드포인트 형식:
 # /StatisticSearch/{KEY}/{언어}/{요청시작건수}/{요청종료건수}/{통계표코드}/{주기}/{시작일자}/{종료일자}/{항목코드}
 # 참고: https://ecos.bok.or.kr/api/#/DevGuide/DevSpeciflcation
@@ -512,6 +853,14 @@ BOK_MAPPING = {
     }
 }
 
+# 국가별 (International) 카테고리 - items 는 StatisticItemList 로 동적 조회 (국가 목록)
+INTERNATIONAL_CATEGORIES = (
+    "interest-international", "cpi-international", "export-international",
+    "import-international", "gdp-growth-international", "gdp-international",
+    "gni-international", "gdp-per-capita-international", "unemployment-international",
+    "stock-index-international"
+)
+
 
 def validate_date_format(date_str):
     """
@@ -619,6 +968,7 @@ def get_bok_statistics(stat_code, item_code, cycle, start_date, end_date, start_
             return {"error": f"Date range cannot exceed 5 years (current: {days_diff} days)"}
         
         # end_index가 None이면 기간에 따라 자동 계산
+        auto_end_index = end_index is None
         if end_index is None:
             days = (end_dt - start_dt).days + 1
             
@@ -647,26 +997,84 @@ def get_bok_statistics(stat_code, item_code, cycle, start_date, end_date, start_
     except ValueError as e:
         return {"error": f"Date parsing error: {str(e)}"}
     
-    # BOK ECOS API 엔드포인트 형식
-    # /StatisticSearch/{KEY}/{언어}/{요청시작건수}/{요청종료건수}/{통계표코드}/{주기}/{시작일자}/{종료일자}/{항목코드}
-    url = f"{API_BASE_URL}/StatisticSearch/{ECOS_API_KEY}/json/kr/{start_index}/{end_index}/{stat_code}/{cycle}/{formatted_start_date}/{formatted_end_date}/{item_code}"
-    
-    logger.info(f"BOK API Request: stat_code={stat_code}, item_code={item_code}, cycle={cycle}, period={formatted_start_date}~{formatted_end_date} (original: {start_date}~{end_date})")
-    logger.debug(f"Request URL: {url}")
-    
     # 캐시 키 생성 (API 키 제외)
     cache_key = _generate_cache_key("StatisticSearch", stat_code, item_code, cycle, formatted_start_date, formatted_end_date, start_index, end_index)
     
+    # 예열 조회(prefetch_scope)는 캐시를 읽지 않고 새로 받아 예열 TTL 로 다시 저장
+    refresh_ttl = _prefetch_ttl() if use_cache else None
+    read_cache = use_cache and refresh_ttl is None
+    
     # 캐시에서 먼저 조회
-    if use_cache:
+    if read_cache:
         cached_data = _api_cache.get(cache_key)
         if cached_data is not None:
             logger.info(f"Cache HIT for stat_code={stat_code}, item_code={item_code}")
             return cached_data
     
+    def _load():
+        # 앞선 동일 요청이 방금 캐시를 채웠으면 그대로 사용
+        if read_cache:
+            cached_data = _api_cache.get(cache_key)
+            if cached_data is not None:
+                return cached_data
+        # 기간 전체 조회 (start_index=1, end_index 자동 계산)는 디스크 저장소 + 누락 구간만 ECOS 조회
+        # 명시적인 페이지 조회(start_index/end_index 지정)는 기존처럼 ECOS 직접 조회
+        if use_cache and _observation_store is not None and start_index == 1 and auto_end_index:
+            data = _fetch_with_store(stat_code, item_code, cycle, start_dt, end_dt, end_index)
+        else:
+            data = _fetch_statistic_search(stat_code, item_code, cycle, formatted_start_date, formatted_end_date, start_index, end_index)
+        return _finish_statistic_search(data, cache_key if use_cache else None, stat_code, item_code, cycle,
+                                        ttl=refresh_ttl or CACHE_TTL_SECONDS)
+    
+    # 동시에 들어온 같은 요청은 ECOS 호출 1회를 공유
+    if use_cache:
+        return _singleflight.do(_flight_key(cache_key), _load)
+    return _load()
+
+
+def _finish_statistic_search(data, cache_key, stat_code, item_code, cycle, ttl=CACHE_TTL_SECONDS):
+    """StatisticSearch 응답 정리 (0건 응답 정규화) 후 cache_key 가 있으면 ttl 동안 캐시에 저장"""
+    if 'error' in data:
+        return data
+    
+    # 데이터 개수 확인
+    total_count = data['StatisticSearch'].get('list_total_count', 0)
+    if total_count == 0:
+        logger.info(f"No data found for stat_code={stat_code}, item_code={item_code}, cycle={cycle}")
+        return {
+            "StatisticSearch": {
+                "list_total_count": 0,
+                "row": []
+            }
+        }
+    
+    logger.info(f"Successfully retrieved {total_count} records")
+    
+    # 성공적인 응답을 캐시에 저장
+    if cache_key is not None:
+        _api_cache.set(cache_key, data, ttl)
+    
+    return data
+
+
+def _fetch_statistic_search(stat_code, item_code, cycle, formatted_start_date, formatted_end_date, start_index, end_index):
+    """
+    ECOS StatisticSearch 1회 호출 (캐시/저장소 없이 네트워크 조회만 수행)
+    
+    Returns:
+        dict: API 응답 데이터 ('StatisticSearch' 포함) 또는 에러 정보
+    """
+    # BOK ECOS API 엔드포인트 형식
+    # /StatisticSearch/{KEY}/{언어}/{요청시작건수}/{요청종료건수}/{통계표코드}/{주기}/{시작일자}/{종료일자}/{항목코드}
+    url = f"{API_BASE_URL}/StatisticSearch/{ECOS_API_KEY}/json/kr/{start_index}/{end_index}/{stat_code}/{cycle}/{formatted_start_date}/{formatted_end_date}/{item_code}"
+    
+    logger.info(f"BOK API Request: stat_code={stat_code}, item_code={item_code}, cycle={cycle}, period={formatted_start_date}~{formatted_end_date}")
+    logger.debug(f"Request URL: {url}")
+    
     try:
         # Rate Limiting 적용
         _rate_limiter.wait_if_needed()
+        _note_ecos_wait()
         
         response = requests.get(url, timeout=API_TIMEOUT)
         response.raise_for_status()
@@ -688,25 +1096,6 @@ def get_bok_statistics(stat_code, item_code, cycle, start_date, end_date, start_
             logger.warning("No 'StatisticSearch' key in response")
             return {"error": "Invalid API response format: missing 'StatisticSearch'", "response": data}
         
-        stat_search = data['StatisticSearch']
-        
-        # 데이터 개수 확인
-        total_count = stat_search.get('list_total_count', 0)
-        if total_count == 0:
-            logger.info(f"No data found for stat_code={stat_code}, item_code={item_code}, cycle={cycle}")
-            return {
-                "StatisticSearch": {
-                    "list_total_count": 0,
-                    "row": []
-                }
-            }
-        
-        logger.info(f"Successfully retrieved {total_count} records")
-        
-        # 성공적인 응답을 캐시에 저장
-        if use_cache:
-            _api_cache.set(cache_key, data, CACHE_TTL_SECONDS)
-        
         return data
         
     except requests.exceptions.Timeout:
@@ -735,6 +1124,48 @@ def get_bok_statistics(stat_code, item_code, cycle, start_date, end_date, start_
         return {"error": error_msg}
 
 
+def _fetch_with_store(stat_code, item_code, cycle, start_dt, end_dt, end_index):
+    """
+    디스크 저장소에 없는 구간만 ECOS 에서 받아 저장한 뒤, 요청 구간 전체를 저장소에서 읽어 응답을 구성합니다.
+    
+    - 누락 구간(gap)별로 1회씩 조회, INFO-200 (데이터 없음) 은 빈 구간으로 기록
+    - 그 외 에러가 나면 기존과 동일하게 에러를 그대로 반환
+    - 응답 형식은 ECOS StatisticSearch 와 동일 (row 는 기간순, 최대 end_index 건)
+    """
+    series = (stat_code, item_code, cycle)
+    lo = bok_store.period_of_date(start_dt.date(), cycle)
+    hi = bok_store.period_of_date(end_dt.date(), cycle)
+    
+    no_data_error = None
+    for gap_lo, gap_hi in _observation_store.missing_ranges(series, lo, hi):
+        gap_start = bok_store.format_period(gap_lo, cycle)
+        gap_end = bok_store.format_period(gap_hi, cycle)
+        logger.info(f"ECOS store miss: stat_code={stat_code}, item_code={item_code}, cycle={cycle}, gap={gap_start}~{gap_end}")
+        
+        data = _fetch_statistic_search(stat_code, item_code, cycle, gap_start, gap_end, 1, min(gap_hi - gap_lo + 1, 1000))
+        if 'error' in data:
+            if data.get('result_code') != 'INFO-200':
+                return data
+            no_data_error = data
+            _observation_store.save(series, gap_lo, gap_hi, [])
+            continue
+        
+        stat_search = data['StatisticSearch']
+        rows = stat_search.get('row') or []
+        truncated = stat_search.get('list_total_count', 0) > len(rows)
+        _observation_store.save(series, gap_lo, gap_hi, rows, truncated=truncated)
+    
+    rows = _observation_store.load(series, lo, hi)
+    if not rows and no_data_error is not None:
+        return no_data_error
+    return {
+        "StatisticSearch": {
+            "list_total_count": len(rows),
+            "row": rows[:end_index]
+        }
+    }
+
+
 def get_market_index(category, start_date, end_date, item_code=None, cycle=None, stat_code=None):
     """
     카테고리별 시장 지수 데이터를 조회합니다.
@@ -750,6 +1181,14 @@ def get_market_index(category, start_date, end_date, item_code=None, cycle=None,
     Returns:
         dict: API 응답 데이터 또는 에러 정보
     """
+    # 동시에 들어온 같은 조회는 항목 목록 조회 / fallback 재시도까지 포함해 1회만 실행
+    key = _generate_cache_key("MarketIndex", category, start_date, end_date, item_code, cycle, stat_code)
+    return _serve(category, lambda: _singleflight.do(
+        _flight_key(key), lambda: _get_market_index(category, start_date, end_date, item_code, cycle, stat_code)))
+
+
+def _get_market_index(category, start_date, end_date, item_code=None, cycle=None, stat_code=None):
+    """get_market_index 본체 (singleflight 없이 실행)"""
     logger.info(f"get_market_index called: category={category}, item_code={item_code}, cycle={cycle}, stat_code={stat_code}, start_date={start_date}, end_date={end_date}")
     
     mapping = BOK_MAPPING.get(category)
@@ -759,12 +1198,6 @@ def get_market_index(category, start_date, end_date, item_code=None, cycle=None,
         return {"error": error_msg}
     
     # International categories: 동적 국가 리스트 조회
-    INTERNATIONAL_CATEGORIES = [
-        "interest-international", "cpi-international", "export-international", 
-        "import-international", "gdp-growth-international", "gdp-international",
-        "gni-international", "gdp-per-capita-international", "unemployment-international",
-        "stock-index-international"
-    ]
     if category in INTERNATIONAL_CATEGORIES:
         stat_code = mapping.get('stat_code', '902Y006')
         requested_cycle = cycle if cycle else mapping.get('default_cycle', 'M')
@@ -1196,45 +1629,18 @@ def get_market_index(category, start_date, end_date, item_code=None, cycle=None,
         return result
 
 
-def _parse_time_to_sort_key(time_str):
-    """
-    ECOS TIME 필드를 정렬 가능한 숫자 키로 변환합니다.
-    - YYYYMMDD -> YYYYMMDD
-    - YYYYMM   -> YYYYMM00
-    - YYYYQn   -> YYYY*10 + n
-    - YYYY     -> YYYY0000
-    """
-    if not time_str:
-        return 0
-    s = str(time_str).strip()
-    try:
-        # YYYYMMDD
-        if len(s) == 8 and s.isdigit():
-            return int(s)
-        # YYYYMM
-        if len(s) == 6 and s.isdigit():
-            return int(s) * 100
-        # YYYYQn
-        if len(s) == 6 and ('Q' in s):
-            # e.g., 2025Q4
-            y = int(s[:4])
-            q = int(s[-1])
-            return y * 10 + q
-        # YYYY
-        if len(s) == 4 and s.isdigit():
-            return int(s) * 10000
-    except Exception:
-        return 0
-    return 0
-
-
-def calculate_statistics_previous_period(data, currency_code=None):
+# ECOS TIME 정렬 키 (YYYYMMDD / YYYYMM / YYYYQn / YYYY) - bok_series 로 이동
+_parse_time_to_sort_key = bok_series.time_sort_key
+
+
+def calculate_statistics_previous_period(data, currency_code=None, indicators=False, cycle=None):
     """
     직전 기간(이전 포인트) 대비 통계를 계산합니다.
     - current: 최신 값(마지막 포인트)
     - previous: 직전 값(마지막-1 포인트)
     - change: current - previous
     - changePercent: change / previous * 100
+    - indicators=True 이면 보조지표(이동평균, 변동성, 백분위, 낙폭)를 "indicators" 에 추가
     """
     if "error" in data:
         return {"error": data["error"]}
@@ -1245,57 +1651,24 @@ def calculate_statistics_previous_period(data, currency_code=None):
     if not rows:
         return {"error": "No data available"}
 
-    parsed = []
-    for row in rows:
-        try:
-            if isinstance(row, dict):
-                t = row.get('TIME', '')
-                v = row.get('DATA_VALUE', '')
-            elif isinstance(row, list) and len(row) >= 2:
-                t = str(row[0])
-                v = str(row[1])
-            else:
-                continue
-
-            if not t or v is None or v == '':
-                continue
-            value = float(v)
-            if value <= 0:
-                continue
-            parsed.append((t, value))
-        except Exception:
-            continue
-
-    if not parsed:
+    series = bok_series.MarketSeries.from_rows(rows, cycle=cycle, sort=True)
+    if not len(series):
         return {"error": "No valid data values found"}
 
-    parsed.sort(key=lambda x: _parse_time_to_sort_key(x[0]))
-    values = [v for _, v in parsed]
-
-    high = max(values)
-    low = min(values)
-    average = sum(values) / len(values)
-    current = values[-1]
-    previous = values[-2] if len(values) >= 2 else current
-
-    change = current - previous
-    change_percent = (change / previous * 100) if previous != 0 else 0
-
-    return {
-        "currency": currency_code or "UNKNOWN",
-        "high": round(high, 2),
-        "low": round(low, 2),
-        "average": round(average, 2),
-        "current": round(current, 2),
-        "previous": round(previous, 2),
-        "change": round(change, 2),
-        "changePercent": round(change_percent, 2)
-    }
+    result = series.summary(currency_code, baseline='previous')
+    if indicators:
+        result["indicators"] = series.indicators()
+    return result
 
 
-def get_market_index_multi(category, start_date, end_date, item_codes=None, cycle=None):
+def get_market_index_multi(category, start_date, end_date, item_codes=None, cycle=None, max_workers=None):
     """
     한 카테고리의 여러 항목을 한 번에 조회합니다.
+    
+    - 항목별 조회는 최대 max_workers(기본 MULTI_FETCH_WORKERS)개 스레드로 동시에 실행
+      (ECOS 호출 속도는 전역 토큰 버킷 _rate_limiter 가 제한)
+    - 결과 순서/형식은 순차 조회와 동일하며, 실패한 항목은 해당 항목의 data 에 에러를 담아 반환
+    - BOK_MAPPING 은 읽기만 함 (동시 요청 안전)
     """
     mapping = BOK_MAPPING.get(category)
     if not mapping:
@@ -1304,99 +1677,89 @@ def get_market_index_multi(category, start_date, end_date, item_codes=None, cycl
     if not cycle:
         cycle = mapping.get('default_cycle', 'D')
     
+    stat_code = mapping.get('stat_code')
+    stat_items = dict(mapping.get('items') or {})
+    
     # International categories: 동적 국가 리스트 조회
-    INTERNATIONAL_CATEGORIES = [
-        "interest-international", "cpi-international", "export-international", 
-        "import-international", "gdp-growth-international", "gdp-international",
-        "gni-international", "gdp-per-capita-international", "unemployment-international",
-        "stock-index-international"
-    ]
     if category in INTERNATIONAL_CATEGORIES:
-        stat_code = mapping.get('stat_code', '902Y006')
-        requested_cycle = cycle if cycle else mapping.get('default_cycle', 'M')
-        stat_items = mapping.get('items', {})
+        stat_code = stat_code or '902Y006'
         
-        # items가 비어있으면 StatisticItemList로 조회
+        # items가 비어있으면 StatisticItemList로 조회 (항목 목록은 _api_cache 에 1시간 캐시)
         if not stat_items:
-            logger.info(f"Fetching country list for stat_code={stat_code}, cycle={requested_cycle}")
-            item_list_result = get_statistic_item_list(stat_code, start_index=1, end_index=300)
-            
-            if 'error' in item_list_result:
-                logger.warning(f"Failed to fetch item list: {item_list_result['error']}")
-                stat_items = {}
-            else:
-                rows = item_list_result.get('row', [])
-                stat_items = {}
-                
-                for row in rows:
-                    item_code_val = row.get('ITEM_CODE', '')
-                    item_name = row.get('ITEM_NAME', '')
-                    row_cycle = row.get('CYCLE', '')
-                    
-                    if item_code_val and row_cycle == requested_cycle:
-                        key = item_code_val
-                        stat_items[key] = {
-                            "code": item_code_val,
-                            "name": item_name,
-                            "cycle": row_cycle
-                        }
-                
-                mapping['items'] = stat_items
-                logger.info(f"Cached {len(stat_items)} items for stat_code={stat_code}, cycle={requested_cycle}")
-        
-        # If item_codes not specified, fetch all items
-        if not item_codes:
-            item_codes = list(stat_items.keys())
-        
-        results = {}
-        for item_key in item_codes:
-            item_info = stat_items.get(item_key)
-            if item_info:
-                result = get_bok_statistics(
-                    stat_code=stat_code,
-                    item_code=item_info['code'],
-                    cycle=requested_cycle,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                results[item_key] = {
-                    "name": item_info['name'],
-                    "data": result
-                }
-        
-        return results
+            logger.info(f"Fetching country list for stat_code={stat_code}, cycle={cycle}")
+            stat_items = _load_cycle_items(stat_code, cycle)
     
-    # 기존 로직 (exchange, gdp 등)
     # If item_codes not specified, fetch all items
     if not item_codes:
-        item_codes = list(mapping['items'].keys())
+        item_codes = list(stat_items.keys())
     
-    results = {}
-    for item_key in item_codes:
-        item_info = mapping['items'].get(item_key)
-        if item_info:
-            result = get_bok_statistics(
-                stat_code=mapping['stat_code'],
+    jobs = [(item_key, stat_items[item_key]) for item_key in item_codes if stat_items.get(item_key)]
+    
+    def _fetch(job):
+        item_key, item_info = job
+        try:
+            return _serve(category, lambda: get_bok_statistics(
+                stat_code=stat_code,
                 item_code=item_info['code'],
                 cycle=cycle,
                 start_date=start_date,
                 end_date=end_date
-            )
-            results[item_key] = {
-                "name": item_info['name'],
-                "data": result
-            }
+            ))
+        except Exception as e:
+            logger.error(f"Multi fetch failed for {category}/{item_key}: {e}", exc_info=True)
+            return {"error": f"Unexpected error: {str(e)}"}
+    
+    workers = min(max_workers or MULTI_FETCH_WORKERS, len(jobs))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ecos-multi") as pool:
+            fetched = list(pool.map(_fetch, jobs))
+    else:
+        fetched = [_fetch(job) for job in jobs]
+    
+    results = {}
+    for (item_key, item_info), result in zip(jobs, fetched):
+        results[item_key] = {
+            "name": item_info['name'],
+            "data": result
+        }
+    
+    failed = [key for key, value in results.items() if 'error' in value['data']]
+    if failed:
+        logger.warning(f"get_market_index_multi: {len(failed)}/{len(results)} items failed for {category}: {', '.join(failed)}")
     
     return results
 
 
-def calculate_statistics(data, currency_code=None):
+def _load_cycle_items(stat_code, cycle):
+    """StatisticItemList 에서 주기가 일치하는 항목만 {item_code: {code, name, cycle}} 로 변환 (BOK_MAPPING 미변경)"""
+    item_list_result = get_statistic_item_list(stat_code, start_index=1, end_index=300)
+    if 'error' in item_list_result:
+        logger.warning(f"Failed to fetch item list: {item_list_result['error']}")
+        return {}
+    
+    stat_items = {}
+    for row in item_list_result.get('row', []):
+        item_code_val = row.get('ITEM_CODE', '')
+        row_cycle = row.get('CYCLE', '')
+        if item_code_val and row_cycle == cycle:
+            stat_items[item_code_val] = {
+                "code": item_code_val,
+                "name": row.get('ITEM_NAME', ''),
+                "cycle": row_cycle
+            }
+    logger.info(f"Loaded {len(stat_items)} items for stat_code={stat_code}, cycle={cycle}")
+    return stat_items
+
+
+def calculate_statistics(data, currency_code=None, indicators=False, cycle=None):
     """
     환율 데이터에서 통계 정보를 계산합니다.
     
     Args:
         data: ECOS API 응답 데이터 (StatisticSearch 형식)
         currency_code: 통화 코드 (예: "USD") - 선택적
+        indicators: True 이면 보조지표(이동평균, 변동성, 백분위, 낙폭)를 "indicators" 에 추가
+        cycle: 주기 (보조지표 기본 윈도우 선택용, 기본값 D)
     
     Returns:
         dict: 통계 정보
@@ -1423,64 +1786,35 @@ def calculate_statistics(data, currency_code=None):
     if not rows or len(rows) == 0:
         return {"error": "No data available"}
     
-    # 데이터 추출 및 정렬 (날짜순)
-    values = []
-    dates = []
+    # 유효값 추출 (응답 순서 유지) 및 통계 계산
+    series = bok_series.MarketSeries.from_rows(rows, cycle=cycle)
+    if len(series) == 0:
+        return {"error": "No valid data values found"}
     
-    for row in rows:
-        try:
-            # ECOS API 응답 구조: row는 딕셔너리 형식
-            # 프론트엔드에서 row.TIME, row.DATA_VALUE를 사용하므로 동일한 구조 가정
-            if isinstance(row, dict):
-                date_str = row.get('TIME', '')
-                value_str = row.get('DATA_VALUE', '')
-            elif isinstance(row, list) and len(row) >= 2:
-                # 리스트 형식인 경우 (대체 형식)
-                date_str = str(row[0]) if len(row) > 0 else ''
-                value_str = str(row[1]) if len(row) > 1 else ''
-            else:
-                continue
-            
-            if not date_str or not value_str:
-                continue
-            
-            # 값이 숫자인지 확인
-            try:
-                value = float(value_str)
-                if value > 0:  # 유효한 값만 추가
-                    values.append(value)
-                    dates.append(date_str)
-            except (ValueError, TypeError):
-                continue
-        except Exception as e:
-            logger.warning(f"Error parsing row: {e}")
-            continue
+    result = series.summary(currency_code)
+    if indicators:
+        result["indicators"] = series.indicators()
+    return result
+
+
+def calculate_statistics_multi(results, cycle=None, indicators=False, previous_period=False):
+    """
+    get_market_index_multi 결과의 항목별 통계를 한 번에 계산합니다.
     
-    if len(values) == 0:
-        return {"error": "No valid data values found"}
+    Returns:
+        dict: {item_key: {"name": 항목명, "stats": calculate_statistics 결과 (실패 시 error)}}
+    """
+    if "error" in results:
+        return {"error": results["error"]}
     
-    # 통계 계산
-    high = max(values)
-    low = min(values)
-    average = sum(values) / len(values)
-    current = values[-1]  # 최신값 (마지막)
-    previous = values[0] if len(values) > 1 else current  # 첫 번째 값
-    
-    change = current - previous
-    change_percent = ((current - previous) / previous * 100) if previous != 0 else 0
-    
-    result = {
-        "currency": currency_code or "UNKNOWN",
-        "high": round(high, 2),
-        "low": round(low, 2),
-        "average": round(average, 2),
-        "current": round(current, 2),
-        "previous": round(previous, 2),
-        "change": round(change, 2),
-        "changePercent": round(change_percent, 2)
+    calculate = calculate_statistics_previous_period if previous_period else calculate_statistics
+    return {
+        item_key: {
+            "name": item["name"],
+            "stats": calculate(item["data"], currency_code=item_key, indicators=indicators, cycle=cycle)
+        }
+        for item_key, item in results.items()
     }
-    
-    return result
 
 
 def get_category_info(category=None):
@@ -1493,12 +1827,6 @@ def get_category_info(category=None):
             return {"error": f"Unknown category: {category}"}
         
         # International categories: items가 비어있으면 동적으로 로드
-        INTERNATIONAL_CATEGORIES = [
-            "interest-international", "cpi-international", "export-international", 
-            "import-international", "gdp-growth-international", "gdp-international",
-            "gni-international", "gdp-per-capita-international", "unemployment-international",
-            "stock-index-international"
-        ]
         stat_items = mapping.get('items', {})
         if category in INTERNATIONAL_CATEGORIES and not stat_items:
             stat_code = mapping.get('stat_code')
@@ -1563,7 +1891,142 @@ def get_category_info(category=None):
         }
 
 
-def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_index=100, use_cache=True):
+# ============================================================
+# STAT CATALOG (통계표/항목 목록 로컬 카탈로그)
+# ============================================================
+# 통계표 목록과 항목 목록은 거의 바뀌지 않으므로 전체를 한 번 받아 bok_catalog 에 저장하고
+# /api/bok/search-codes, /api/bok/item-list 는 로컬 색인으로 응답
+# - 통계표 목록: 처음 검색 시 비어 있으면 1회 적재, 이후 스케줄러(refresh_catalog)로 갱신
+# - 항목 목록: 통계표별로 처음 조회할 때 전체를 받아 저장, 스케줄러가 저장된 통계표만 갱신
+
+class CatalogFetchError(Exception):
+    """카탈로그 목록 조회 실패 (ECOS 오류 코드 / 응답 형식 오류)"""
+
+
+def _fetch_catalog_list(service, lang, *path):
+    """
+    ECOS 목록형 서비스(StatisticTableList / StatisticItemList)의 전체 row 를 페이지 단위로 조회
+
+    Raises:
+        CatalogFetchError, requests.exceptions.RequestException, ValueError
+    """
+    rows = []
+    start = 1
+    suffix = "".join(f"{p}/" for p in path)
+    while True:
+        end = start + CATALOG_PAGE_SIZE - 1
+        url = f"{API_BASE_URL}/{service}/{ECOS_API_KEY}/json/{lang}/{start}/{end}/{suffix}"
+        _rate_limiter.wait_if_needed()
+        _note_ecos_wait()
+        # http에서 302로 https로 가면 404가 나는 케이스가 있어 리다이렉트를 따라가지 않음
+        response = requests.get(url, timeout=API_TIMEOUT, allow_redirects=False)
+        if response.status_code in (301, 302, 307, 308):
+            raise CatalogFetchError(f"Redirect blocked for {service}: {response.status_code}")
+        response.raise_for_status()
+        data = response.json()
+
+        if 'RESULT' in data:
+            result_code = data['RESULT'].get('CODE', '')
+            if result_code == 'INFO-200' and not rows:
+                return []
+            if result_code != 'INFO-000':
+                raise CatalogFetchError(f"BOK API Error [{result_code}]: {data['RESULT'].get('MESSAGE', '')}")
+        if service not in data:
+            raise CatalogFetchError(f"Invalid API response format: missing '{service}'")
+
+        block = data[service]
+        page = block.get('row', []) or []
+        rows.extend(page)
+        total = int(block.get('list_total_count', len(rows)) or 0)
+        if not page or len(rows) >= total:
+            return rows
+        start = end + 1
+
+
+def _fetch_english(service, *path):
+    """영문 목록 (실패해도 한글 목록만으로 카탈로그 구성)"""
+    try:
+        return _fetch_catalog_list(service, "en", *path)
+    except Exception as e:
+        logger.warning(f"English {service} fetch failed ({'/'.join(path) or 'all'}): {e}")
+        return None
+
+
+def _refresh_catalog_tables():
+    rows = _fetch_catalog_list("StatisticTableList", "kr")
+    return _stat_catalog.replace_tables(rows, _fetch_english("StatisticTableList"))
+
+
+def _refresh_catalog_items(stat_code):
+    rows = _fetch_catalog_list("StatisticItemList", "kr", stat_code)
+    return _stat_catalog.replace_items(stat_code, rows, _fetch_english("StatisticItemList", stat_code))
+
+
+def refresh_catalog(stat_codes=None, include_tables=True):
+    """
+    카탈로그 갱신 (스케줄러 / CLI 용)
+
+    Args:
+        stat_codes: 항목 목록을 갱신할 통계표 코드 (기본값: 이미 저장된 통계표 전체)
+        include_tables: 통계표 목록도 갱신할지 여부
+
+    Returns:
+        dict: {"tables", "item_lists", "errors", "elapsed_seconds", "refreshed_at"}
+    """
+    if _stat_catalog is None:
+        return {"error": "ECOS catalog is disabled"}
+
+    started = time.time()
+    result = {"tables": None, "item_lists": 0, "errors": []}
+    if include_tables:
+        try:
+            result["tables"] = coalesce("Catalog:tables", _refresh_catalog_tables)
+        except Exception as e:
+            logger.error(f"Catalog table refresh failed: {e}")
+            result["errors"].append(f"tables: {e}")
+
+    for stat_code in (stat_codes if stat_codes is not None else _stat_catalog.item_stat_codes()):
+        try:
+            coalesce(f"Catalog:items:{stat_code}", lambda: _refresh_catalog_items(stat_code))
+            result["item_lists"] += 1
+        except Exception as e:
+            logger.error(f"Catalog item refresh failed for {stat_code}: {e}")
+            result["errors"].append(f"{stat_code}: {e}")
+
+    result["elapsed_seconds"] = round(time.time() - started, 2)
+    result["refreshed_at"] = _stat_catalog.refreshed_at()
+    logger.info(f"Catalog refreshed: tables={result['tables']}, item_lists={result['item_lists']}, "
+                f"errors={len(result['errors'])}, {result['elapsed_seconds']}s")
+    return result
+
+
+def _catalog_search(stat_code, stat_name, query, start_index, end_index):
+    """카탈로그에서 통계표 검색 (카탈로그가 비어 있으면 1회 적재, 실패 시 None → 기존 ECOS 조회)"""
+    if not _stat_catalog.has_tables():
+        try:
+            coalesce("Catalog:tables", _refresh_catalog_tables)
+        except Exception as e:
+            logger.warning(f"Catalog table load failed, falling back to ECOS search: {e}")
+            return None
+    return _stat_catalog.search_tables(stat_code=stat_code, stat_name=stat_name, query=query,
+                                       start_index=start_index, end_index=end_index)
+
+
+def _catalog_item_list(stat_code, item_name, start_index, end_index):
+    """카탈로그에서 항목 목록 조회 (없으면 전체 항목을 받아 저장, 실패 시 None → 기존 ECOS 조회)"""
+    result = _stat_catalog.item_list(stat_code, item_name=item_name, start_index=start_index, end_index=end_index)
+    if result is not None:
+        return result
+    try:
+        coalesce(f"Catalog:items:{stat_code}", lambda: _refresh_catalog_items(stat_code))
+    except Exception as e:
+        logger.warning(f"Catalog item load failed for {stat_code}, falling back to ECOS: {e}")
+        return None
+    return _stat_catalog.item_list(stat_code, item_name=item_name, start_index=start_index, end_index=end_index)
+
+
+def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_index=100, use_cache=True,
+                             query=None):
     """
     통계표 코드를 검색합니다.
     
@@ -1577,9 +2040,11 @@ def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_
         start_index: 요청 시작 건수 (기본값: 1)
         end_index: 요청 종료 건수 (기본값: 100, 최대 1000)
         use_cache: 캐시 사용 여부 (기본값: True)
+        query: 코드 또는 이름(한글/영문) 검색어 (카탈로그 사용 시, 타이핑 중 검색용)
     
     Returns:
         dict: 검색 결과 (StatisticalCodeSearch 형식) 또는 에러 정보
+        - 카탈로그 사용 시 전체 통계표에서 검색하고 순위순으로 정렬, "catalog" 에 갱신 시각 포함
         
     참고: https://ecos.bok.or.kr/api/#/DevGuide/StatisticalCodeSearch
     """
@@ -1588,6 +2053,12 @@ def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_
         end_index = 1000
         logger.warning(f"end_index limited to 1000 (BOK API maximum)")
     
+    # 로컬 카탈로그 우선 (네트워크 없이 검색)
+    if use_cache and _stat_catalog is not None:
+        result = _catalog_search(stat_code, stat_name, query, start_index, end_index)
+        if result is not None:
+            return result
+    
     # 캐시 키 생성 (검색 조건 포함)
     cache_key = _generate_cache_key("StatisticTableList", stat_code or "", stat_name or "", start_index, end_index)
     
@@ -1608,6 +2079,7 @@ def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_
     try:
         # Rate Limiting 적용
         _rate_limiter.wait_if_needed()
+        _note_ecos_wait()
         
         # http에서 302로 https로 가면 404가 나는 케이스가 있어 리다이렉트를 따라가지 않음
         response = requests.get(url, timeout=API_TIMEOUT, allow_redirects=False)
@@ -1682,7 +2154,7 @@ def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_
         return {"error": error_msg}
 
 
-def get_statistic_item_list(stat_code, start_index=1, end_index=100, use_cache=True):
+def get_statistic_item_list(stat_code, start_index=1, end_index=100, use_cache=True, item_name=None):
     """
     특정 통계표의 항목 목록을 조회합니다.
     
@@ -1694,6 +2166,7 @@ def get_statistic_item_list(stat_code, start_index=1, end_index=100, use_cache=T
         start_index: 요청 시작 건수 (기본값: 1)
         end_index: 요청 종료 건수 (기본값: 100, 최대 1000)
         use_cache: 캐시 사용 여부 (기본값: True)
+        item_name: 항목 코드/이름(한글/영문) 검색어 (카탈로그 사용 시)
     
     Returns:
         dict: 항목 목록 (StatisticItemList 형식) 또는 에러 정보
@@ -1705,6 +2178,12 @@ def get_statistic_item_list(stat_code, start_index=1, end_index=100, use_cache=T
         end_index = 1000
         logger.warning(f"end_index limited to 1000 (BOK API maximum)")
     
+    # 로컬 카탈로그 우선 (통계표별 항목 전체를 한 번만 받아 저장)
+    if use_cache and _stat_catalog is not None:
+        result = _catalog_item_list(stat_code, item_name, start_index, end_index)
+        if result is not None:
+            return result
+    
     # 캐시 키 생성
     cache_key = _generate_cache_key("StatisticItemList", stat_code, start_index, end_index)
     
@@ -1725,6 +2204,7 @@ def get_statistic_item_list(stat_code, start_index=1, end_index=100, use_cache=T
     try:
         # Rate Limiting 적용
         _rate_limiter.wait_if_needed()
+        _note_ecos_wait()
         
         response = requests.get(url, timeout=API_TIMEOUT)
         response.raise_for_status()
@@ -0,0 +1,654 @@
+"""
+ECOS 통계표 / 항목 카탈로그 (SQLite + 메모리 색인)
+- StatisticTableList / StatisticItemList 결과를 디스크에 보관 → 코드 검색·항목 조회를 네트워크 없이 처리
+- 한글/영문 이름과 코드에 1·2-gram posting 색인 → 부분 문자열 검색 후보를 posting 교집합으로 좁힌 뒤 확인
+- 순위: 완전일치 > 접두일치 > 단어 접두일치 > 부분일치, 같은 순위는 일치 위치 → 이름 길이 → 카탈로그 순서
+  (같은 카탈로그에서는 항상 같은 순서)
+- 통계표 목록 / 통계표별 항목 목록의 갱신 시각(refreshed_at)을 함께 기록하고 응답에 포함
+- 갱신: 스케줄러 (bok_backend.refresh_catalog) 또는 JSON 파일 import (python bok_catalog.py import <file>)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = Path(__file__).parent / 'ecos_catalog.db'
+EXPORT_VERSION = 1
+
+# 순위 구분 (작을수록 우선)
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stat_tables (
+    position INTEGER PRIMARY KEY,
+    stat_code TEXT NOT NULL,
+    row_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stat_items (
+    stat_code TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    row_json TEXT NOT NULL,
+    PRIMARY KEY (stat_code, position)
+);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_TABLES_REFRESHED_KEY = 'tables_refreshed_at'
+_ITEMS_REFRESHED_PREFIX = 'items_refreshed_at:'
+
+
+# ============================================================
+# N-GRAM INDEX
+# ============================================================
+
+def normalize(text):
+    """검색용 정규화: 공백 제거 + casefold ("소비자 물가" == "소비자물가", "GDP" == "gdp")"""
+    return ''.join(str(text or '').split()).casefold()
+
+
+def _field(text):
+    """(정규화된 문자열, 단어 시작 위치 집합)"""
+    words = [w.casefold() for w in str(text or '').split()]
+    starts = []
+    offset = 0
+    for word in words:
+        starts.append(offset)
+        offset += len(word)
+    return ''.join(words), frozenset(starts)
+
+
+class NgramIndex:
+    """
+    문서별 검색 필드의 1-gram / 2-gram posting 색인
+
+    - 질의 길이 1: 1-gram posting, 2 이상: 질의의 모든 2-gram posting 교집합 → 후보, 실제 포함 여부 확인
+    - 타이핑 중 검색: 직전 질의(q[:-1] 등)의 결과가 캐시에 있으면 그 결과만 후보로 사용
+    - 후보가 SCAN_THRESHOLD 보다 많으면 (한두 글자 질의 등) 전체 필드를 이어 붙인 코드포인트 배열에서
+      NumPy 로 일치 위치를 한 번에 찾아 순위 계산 (후보별 Python 루프 대신),
+      직전 질의의 일치 위치가 있으면 그 위치들만 다시 비교
+    - 순위 키는 정수 하나로 합쳐 정렬 (kind, 위치, 길이, doc_id 순) - 두 경로 모두 같은 키
+    - 질의별 순위 결과는 최근 QUERY_CACHE_SIZE 개까지 보관 (색인 구축 후에는 읽기 전용이므로 무효화 불필요)
+    """
+
+    QUERY_CACHE_SIZE = 256
+    SCAN_THRESHOLD = 256
+
+    def __init__(self):
+        self.fields = []
+        self.postings = defaultdict(set)
+        self._results = OrderedDict()
+        self._positions = OrderedDict()
+        self._lock = threading.Lock()
+        self._corpus = None
+
+    def add(self, *texts):
+        doc_id = len(self.fields)
+        fields = tuple(_field(t) for t in texts if t)
+        self.fields.append(fields)
+        for text, _ in fields:
+            for i in range(len(text)):
+                self.postings[text[i]].add(doc_id)
+                if i + 1 < len(text):
+                    self.postings[text[i:i + 2]].add(doc_id)
+        self._corpus = None
+        self._results.clear()
+        self._positions.clear()
+        return doc_id
+
+    def __len__(self):
+        return len(self.fields)
+
+    def _candidates(self, q):
+        """후보 doc_id 들 (직전 질의 결과 → 1/2-gram posting 순으로 좁힘)"""
+        with self._lock:
+            for n in range(len(q) - 1, 0, -1):
+                parent = self._results.get(q[:n])
+                if parent is not None:
+                    return parent
+        if len(q) <= 2:
+            return self.postings.get(q) or ()
+        postings = sorted((self.postings.get(q[i:i + 2]) or set() for i in range(len(q) - 1)), key=len)
+        if len(postings[0]) > self.SCAN_THRESHOLD:
+            return postings[0]
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    @staticmethod
+    def _key(kind, pos, length):
+        # 정수 키: kind > 위치 > 길이 (위치/길이는 4095 에서 절단), doc_id 는 호출 측에서 합침
+        return (kind * 4096 + min(pos, 4095)) * 4096 + min(length, 4095)
+
+    def _rank_candidates(self, q, candidates):
+        """후보별 순위 키 계산 (후보가 적을 때)"""
+        fields = self.fields
+        n_docs = len(fields)
+        q_len = len(q)
+        keys = []
+        for doc_id in candidates:
+            best = None
+            for text, starts in fields[doc_id]:
+                pos = text.find(q)
+                if pos < 0:
+                    continue
+                if pos == 0:
+                    kind = RANK_EXACT if len(text) == q_len else RANK_PREFIX
+                elif pos in starts:
+                    kind = RANK_WORD_PREFIX
+                else:
+                    # 첫 위치가 단어 중간이면, 뒤쪽에 단어 시작 위치의 일치가 있는지 확인
+                    kind = RANK_SUBSTRING
+                    for s in sorted(starts):
+                        if s > pos and text.startswith(q, s):
+                            kind, pos = RANK_WORD_PREFIX, s
+                            break
+                key = self._key(kind, pos, len(text))
+                if best is None or key < best:
+                    best = key
+            if best is not None:
+                keys.append(best * n_docs + doc_id)
+        keys.sort()
+        return [k % n_docs for k in keys]
+
+    def _build_corpus(self):
+        """
+        전체 필드를 구분자(\x1f, 정규화 문자열에는 없음)로 이어 붙인 코드포인트 배열
+        (문서 순서대로 배치 → 일치 위치를 정렬하면 doc_id 도 정렬된 상태)
+        """
+        texts, field_start, field_len, field_doc, word_starts = [], [], [], [], []
+        offset = 0
+        for doc_id, fields in enumerate(self.fields):
+            for text, starts in fields:
+                texts.append(text)
+                field_start.append(offset)
+                field_len.append(len(text))
+                field_doc.append(doc_id)
+                word_starts.extend(offset + s for s in starts)
+                offset += len(text) + 1
+        codepoints = np.frombuffer('\x1f'.join(texts).encode('utf-32-le'), dtype=np.uint32)
+        is_word_start = np.zeros(len(codepoints), dtype=bool)
+        is_word_start[np.array(word_starts, dtype=np.int64)] = True
+        # 위치 → 필드 번호
+        field_of = np.repeat(np.arange(len(texts), dtype=np.int32), np.array(field_len, dtype=np.int64) + 1)
+        return (codepoints, field_of[:len(codepoints)], np.array(field_start, dtype=np.int64),
+                np.array(field_len, dtype=np.int64), np.array(field_doc, dtype=np.int64), is_word_start)
+
+    def _rank_scan(self, q):
+        """전체 필드 배열에서 모든 일치 위치를 찾아 문서별 최소 키로 순위 계산 (후보가 많을 때)"""
+        corpus = self._corpus
+        if corpus is None:
+            corpus = self._corpus = self._build_corpus()
+        codepoints, field_of, field_start, field_len, field_doc, is_word_start = corpus
+        query = np.frombuffer(q.encode('utf-32-le'), dtype=np.uint32)
+        m = len(query)
+        if len(codepoints) < m:
+            return []
+        # 직전 질의(접두)의 일치 위치가 있으면 그 위치에서 남은 글자만 비교
+        with self._lock:
+            done, occ = next(((n, self._positions[q[:n]]) for n in range(m - 1, 0, -1)
+                              if q[:n] in self._positions), (0, None))
+        if occ is None:
+            occ = np.flatnonzero(codepoints[:len(codepoints) - m + 1] == query[0])
+            done = 1
+        for i in range(done, m):
+            occ = occ[occ + i < len(codepoints)]
+            occ = occ[codepoints[occ + i] == query[i]]
+        with self._lock:
+            self._positions[q] = occ
+            if len(self._positions) > self.QUERY_CACHE_SIZE:
+                self._positions.popitem(last=False)
+        if not len(occ):
+            return []
+
+        field = field_of[occ]
+        pos = occ - field_start[field]
+        length = field_len[field]
+        kind = np.where(pos == 0,
+                        np.where(length == m, RANK_EXACT, RANK_PREFIX),
+                        np.where(is_word_start[occ], RANK_WORD_PREFIX, RANK_SUBSTRING))
+        key = (kind * 4096 + np.minimum(pos, 4095)) * 4096 + np.minimum(length, 4095)
+
+        # 문서별 최소 키 (occ 가 위치순이므로 doc 도 정렬되어 있음)
+        doc = field_doc[field]
+        group = np.flatnonzero(np.concatenate(([True], doc[1:] != doc[:-1])))
+        n_docs = len(self.fields)
+        final = np.sort(np.minimum.reduceat(key, group) * n_docs + doc[group])
+        return (final % n_docs).tolist()
+
+    def _ranked(self, q):
+        with self._lock:
+            cached = self._results.get(q)
+            if cached is not None:
+                self._results.move_to_end(q)
+                return cached
+
+        candidates = self._candidates(q)
+        if len(candidates) > self.SCAN_THRESHOLD:
+            ranked = self._rank_scan(q)
+        else:
+            ranked = self._rank_candidates(q, candidates)
+
+        with self._lock:
+            self._results[q] = ranked
+            if len(self._results) > self.QUERY_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return ranked
+
+    def clear_query_cache(self):
+        with self._lock:
+            self._results.clear()
+            self._positions.clear()
+
+    def search(self, query, within=None):
+        """
+        질의와 일치하는 doc_id 목록 (순위순)
+
+        - query 가 비어 있으면 전체 (카탈로그 순서)
+        - within: 이 doc_id 집합 안에서만 검색
+        - 반환 목록은 캐시와 공유되므로 수정하지 않음
+        """
+        q = normalize(query)
+        if not q:
+            return list(range(len(self.fields))) if within is None else sorted(within)
+        ranked = self._ranked(q)
+        if within is not None:
+            return [doc_id for doc_id in ranked if doc_id in within]
+        return ranked
+
+
+def merge_english(rows, rows_en, key_fields, name_field):
+    """한글 row 에 영문 이름(<name_field>_EN)을 합침 (key_fields 가 같은 row 끼리)"""
+    names = {}
+    for row in rows_en or []:
+        names.setdefault(tuple(row.get(k) for k in key_fields), row.get(name_field))
+    merged = []
+    for row in rows:
+        row = dict(row)
+        name_en = names.get(tuple(row.get(k) for k in key_fields))
+        if name_en:
+            row[f"{name_field}_EN"] = name_en
+        merged.append(row)
+    return merged
+
+
+def _page(rows, start_index, end_index):
+    start = max(int(start_index or 1), 1) - 1
+    return rows[start:max(int(end_index or 0), start)]
+
+
+# ============================================================
+# SNAPSHOTS (읽기 전용, 갱신 시 통째로 교체)
+# ============================================================
+
+class _TableSnapshot:
+    __slots__ = ("rows", "code_index", "name_index", "refreshed_at")
+
+    def __init__(self, rows, refreshed_at):
+        self.rows = rows
+        self.refreshed_at = refreshed_at
+        self.code_index = NgramIndex()
+        self.name_index = NgramIndex()
+        for row in rows:
+            self.code_index.add(row.get('STAT_CODE'))
+            self.name_index.add(row.get('STAT_NAME'), row.get('STAT_NAME_EN'))
+
+
+class _ItemSnapshot:
+    __slots__ = ("rows", "index", "refreshed_at")
+
+    def __init__(self, rows, refreshed_at):
+        self.rows = rows
+        self.refreshed_at = refreshed_at
+        self.index = NgramIndex()
+        for row in rows:
+            self.index.add(row.get('ITEM_CODE'), row.get('ITEM_NAME'), row.get('ITEM_NAME_EN'))
+
+
+# ============================================================
+# STAT CATALOG
+# ============================================================
+
+class StatCatalog:
+    """
+    ECOS 통계표 / 항목 카탈로그
+
+    Usage:
+        catalog = StatCatalog('ecos_catalog.db')
+        catalog.replace_tables(rows_kr, rows_en)
+        result = catalog.search_tables(stat_name='소비자물가')
+        catalog.replace_items('901Y009', rows_kr, rows_en)
+        items = catalog.item_list('901Y009', item_name='식료품')
+
+    디스크 내용은 처음 조회할 때 메모리 색인으로 올리고, 이후 검색은 메모리에서만 처리
+    """
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._tables = None
+        self._items = {}
+        self.searches = 0
+        self.item_lookups = 0
+        self.item_misses = 0
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def _exists(self):
+        return self._initialized or os.path.exists(self.path)
+
+    def _meta(self, conn, key):
+        row = conn.execute("SELECT value FROM catalog_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    # ==========================================
+    # LOAD
+    # ==========================================
+
+    def _table_snapshot(self):
+        snapshot = self._tables
+        if snapshot is not None:
+            return snapshot
+        rows, refreshed_at = [], None
+        if self._exists():
+            conn = self._connect()
+            try:
+                rows = [json.loads(r[0]) for r in
+                        conn.execute("SELECT row_json FROM stat_tables ORDER BY position").fetchall()]
+                refreshed_at = self._meta(conn, _TABLES_REFRESHED_KEY)
+            finally:
+                conn.close()
+        snapshot = _TableSnapshot(rows, refreshed_at)
+        with self._lock:
+            if self._tables is None:
+                self._tables = snapshot
+            return self._tables
+
+    def _item_snapshot(self, stat_code):
+        snapshot = self._items.get(stat_code)
+        if snapshot is not None or not self._exists():
+            return snapshot
+        conn = self._connect()
+        try:
+            refreshed_at = self._meta(conn, _ITEMS_REFRESHED_PREFIX + stat_code)
+            if refreshed_at is None:
+                return None
+            rows = [json.loads(r[0]) for r in conn.execute(
+                "SELECT row_json FROM stat_items WHERE stat_code = ? ORDER BY position", (stat_code,)
+            ).fetchall()]
+        finally:
+            conn.close()
+        snapshot = _ItemSnapshot(rows, refreshed_at)
+        with self._lock:
+            return self._items.setdefault(stat_code, snapshot)
+
+    def reload(self):
+        """메모리 색인을 버리고 다음 조회 시 디스크에서 다시 읽음 (다른 프로세스가 import 한 경우)"""
+        with self._lock:
+            self._tables = None
+            self._items = {}
+
+    # ==========================================
+    # WRITE
+    # ==========================================
+
+    def replace_tables(self, rows, rows_en=None, refreshed_at=None):
+        """통계표 목록 전체 교체 (rows_en: 영문 목록, STAT_NAME_EN 으로 합침)"""
+        if rows_en is not None:
+            rows = merge_english(rows, rows_en, ('STAT_CODE',), 'STAT_NAME')
+        refreshed_at = refreshed_at or datetime.now().isoformat(timespec='seconds')
+        conn = self._connect()
+        try:
+            with self._lock, conn:
+                conn.execute("DELETE FROM stat_tables")
+                conn.executemany(
+                    "INSERT INTO stat_tables (position, stat_code, row_json) VALUES (?, ?, ?)",
+                    [(i, str(row.get('STAT_CODE', '')), json.dumps(row, ensure_ascii=False))
+                     for i, row in enumerate(rows)]
+                )
+                conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+                             (_TABLES_REFRESHED_KEY, refreshed_at))
+        finally:
+            conn.close()
+        snapshot = _TableSnapshot(list(rows), refreshed_at)
+        with self._lock:
+            self._tables = snapshot
+        logger.info(f"Catalog tables replaced: {len(rows)} tables")
+        return len(rows)
+
+    def replace_items(self, stat_code, rows, rows_en=None, refreshed_at=None):
+        """통계표 1개의 항목 목록 전체 교체 (rows_en: 영문 목록, ITEM_NAME_EN 으로 합침)"""
+        if rows_en is not None:
+            rows = merge_english(rows, rows_en, ('GRP_CODE', 'ITEM_CODE', 'CYCLE'), 'ITEM_NAME')
+        refreshed_at = refreshed_at or datetime.now().isoformat(timespec='seconds')
+        conn = self._connect()
+        try:
+            with self._lock, conn:
+                conn.execute("DELETE FROM stat_items WHERE stat_code = ?", (stat_code,))
+                conn.executemany(
+                    "INSERT INTO stat_items (stat_code, position, row_json) VALUES (?, ?, ?)",
+                    [(stat_code, i, json.dumps(row, ensure_ascii=False)) for i, row in enumerate(rows)]
+                )
+                conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+                             (_ITEMS_REFRESHED_PREFIX + stat_code, refreshed_at))
+        finally:
+            conn.close()
+        snapshot = _ItemSnapshot(list(rows), refreshed_at)
+        with self._lock:
+            self._items[stat_code] = snapshot
+        return len(rows)
+
+    def clear(self):
+        """카탈로그 전체 삭제"""
+        if self._exists():
+            conn = self._connect()
+            try:
+                with self._lock, conn:
+                    conn.execute("DELETE FROM stat_tables")
+                    conn.execute("DELETE FROM stat_items")
+                    conn.execute("DELETE FROM catalog_meta")
+            finally:
+                conn.close()
+        self.reload()
+
+    # ==========================================
+    # READ
+    # ==========================================
+
+    def has_tables(self):
+        return bool(self._table_snapshot().rows)
+
+    def refreshed_at(self):
+        """통계표 목록 갱신 시각 (ISO 문자열, 없으면 None)"""
+        return self._table_snapshot().refreshed_at
+
+    def item_stat_codes(self):
+        """항목 목록이 저장된 통계표 코드"""
+        if not self._exists():
+            return sorted(self._items)
+        conn = self._connect()
+        try:
+            keys = conn.execute("SELECT key FROM catalog_meta WHERE key LIKE ?",
+                                (_ITEMS_REFRESHED_PREFIX + '%',)).fetchall()
+        finally:
+            conn.close()
+        return sorted(k[0][len(_ITEMS_REFRESHED_PREFIX):] for k in keys)
+
+    def search_tables(self, stat_code=None, stat_name=None, query=None, start_index=1, end_index=100):
+        """
+        통계표 검색 (StatisticTableList 형식 + catalog 메타)
+
+        - stat_code: 코드 부분 일치 / stat_name: 이름(한글·영문) 부분 일치 / query: 코드 또는 이름
+        - 여러 조건을 주면 모두 만족하는 통계표, 순위는 query → stat_name → stat_code 순으로 우선
+        - 카탈로그가 비어 있으면 None
+        """
+        snapshot = self._table_snapshot()
+        if not snapshot.rows:
+            return None
+        with self._lock:
+            self.searches += 1
+
+        within = None
+        if stat_code and normalize(stat_code):
+            within = set(snapshot.code_index.search(stat_code))
+        if stat_name and normalize(stat_name):
+            matched = snapshot.name_index.search(stat_name, within)
+            within = set(matched)
+        else:
+            matched = None
+
+        if query and normalize(query):
+            by_code = snapshot.code_index.search(query, within)
+            by_name = snapshot.name_index.search(query, within)
+            seen = set(by_code)
+            ids = by_code + [i for i in by_name if i not in seen]
+        elif matched is not None:
+            ids = matched
+        elif within is not None:
+            ids = snapshot.code_index.search(stat_code)
+        else:
+            ids = range(len(snapshot.rows))
+
+        return {
+            "list_total_count": len(ids),
+            "row": [snapshot.rows[i] for i in _page(ids, start_index, end_index)],
+            "catalog": {"source": "local", "refreshed_at": snapshot.refreshed_at},
+        }
+
+    def item_list(self, stat_code, item_name=None, start_index=1, end_index=100):
+        """
+        통계표 항목 목록 (StatisticItemList 형식 + catalog 메타)
+
+        - item_name: 항목 코드/이름(한글·영문) 부분 일치 (순위순), 없으면 전체 (ECOS 순서)
+        - 해당 통계표 항목이 저장되어 있지 않으면 None
+        """
+        snapshot = self._item_snapshot(stat_code)
+        with self._lock:
+            self.item_lookups += 1
+            if snapshot is None:
+                self.item_misses += 1
+        if snapshot is None:
+            return None
+        ids = snapshot.index.search(item_name) if item_name else range(len(snapshot.rows))
+        return {
+            "list_total_count": len(ids),
+            "row": [snapshot.rows[i] for i in _page(ids, start_index, end_index)],
+            "catalog": {"source": "local", "refreshed_at": snapshot.refreshed_at},
+        }
+
+    # ==========================================
+    # IMPORT / EXPORT
+    # ==========================================
+
+    def export_json(self, path):
+        """카탈로그 전체를 JSON 파일로 저장 (import_json 으로 다른 서버에 적재 가능)"""
+        tables = self._table_snapshot()
+        items = {}
+        for stat_code in self.item_stat_codes():
+            snapshot = self._item_snapshot(stat_code)
+            if snapshot is not None:
+                items[stat_code] = {"refreshed_at": snapshot.refreshed_at, "row": snapshot.rows}
+        payload = {
+            "version": EXPORT_VERSION,
+            "refreshed_at": tables.refreshed_at,
+            "tables": tables.rows,
+            "items": items,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        return {"tables": len(tables.rows), "item_lists": len(items)}
+
+    def import_json(self, path):
+        """export_json 형식 파일을 적재 (통계표 목록 교체, 파일에 있는 통계표의 항목 목록 교체)"""
+        with open(path, encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get("version") != EXPORT_VERSION:
+            raise ValueError(f"Unsupported catalog export version: {payload.get('version')}")
+        tables = payload.get("tables") or []
+        if tables:
+            self.replace_tables(tables, refreshed_at=payload.get("refreshed_at"))
+        items = payload.get("items") or {}
+        for stat_code, block in items.items():
+            self.replace_items(stat_code, block.get("row") or [], refreshed_at=block.get("refreshed_at"))
+        logger.info(f"Catalog imported from {path}: {len(tables)} tables, {len(items)} item lists")
+        return {"tables": len(tables), "item_lists": len(items)}
+
+    def stats(self):
+        """카탈로그 통계"""
+        tables = self._table_snapshot()
+        item_lists = len(self.item_stat_codes())
+        with self._lock:
+            return {
+                "path": self.path,
+                "tables": len(tables.rows),
+                "item_lists": item_lists,
+                "refreshed_at": tables.refreshed_at,
+                "searches": self.searches,
+                "item_lookups": self.item_lookups,
+                "item_misses": self.item_misses,
+            }
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv=None):
+    """
+    Usage:
+        python bok_catalog.py import catalog.json
+        python bok_catalog.py export catalog.json
+        python bok_catalog.py refresh
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ECOS statistical-code catalog")
+    parser.add_argument("command", choices=["import", "export", "refresh"])
+    parser.add_argument("file", nargs="?")
+    parser.add_argument("--path", default=os.getenv("ECOS_CATALOG_PATH", str(DEFAULT_CATALOG_PATH)))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "refresh":
+        import bok_backend
+        bok_backend._stat_catalog = StatCatalog(args.path)
+        result = bok_backend.refresh_catalog()
+    else:
+        if not args.file:
+            parser.error(f"{args.command} requires a file path")
+        catalog = StatCatalog(args.path)
+        result = catalog.import_json(args.file) if args.command == "import" else catalog.export_json(args.file)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0 if not result.get("error") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+BOK 시장 지수 프리페치 (캐시 예열)
+- 자주 조회되는 시리즈(hot set)를 ECOS 공표 직후, 그리고 서버 시작 시 미리 조회해
+  StatisticSearch 캐시와 관측값 저장소를 채움 → 첫 사용자 요청도 ECOS 왕복 없이 응답
+- 조회 기간은 프론트엔드와 같은 규칙 (UTC 기준 오늘까지 최근 N일 / 현재월 포함 N개월) 으로 계산해
+  사용자 요청과 같은 캐시 키가 되도록 함
+- 예열 조회는 bok_backend.prefetch_scope 안에서 실행: 캐시를 건너뛰고 새로 받아 긴 TTL 로 저장,
+  사용자 요청 warm/cold 집계에서 제외
+- 실행별 소요 시간과 성공/실패 수는 get_stats() 로 노출 (/api/bok/cache/stats 의 "prefetch")
+"""
+
+import logging
+import threading
+import time
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+
+import bok_backend
+
+logger = logging.getLogger(__name__)
+
+# 하나의 예열 조회 (get_market_index 인자와 동일)
+PrefetchTarget = namedtuple("PrefetchTarget", ["category", "item_code", "cycle", "start_date", "end_date"])
+
+
+def _months_back(today, months):
+    """현재월 포함 최근 months 개월의 시작일 (months=12 → 11개월 전 1일)"""
+    index = today.year * 12 + (today.month - 1) - (months - 1)
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def prefetch_targets(hot_set, today=None, cycles=None):
+    """
+    hot set 설정을 예열 조회 목록으로 펼칩니다.
+
+    Args:
+        hot_set: config.MARKET_PREFETCH_HOT_SET 형식의 목록
+        today: 기준일 (기본값: UTC 기준 오늘 - 프론트엔드 toISOString() 날짜와 동일)
+        cycles: 지정하면 해당 주기(카테고리 기본 주기 포함)의 항목만 포함
+
+    Returns:
+        list[PrefetchTarget]: 설정 순서 유지, 중복 제거
+    """
+    today = today or datetime.now(timezone.utc).date()
+    end_date = today.strftime('%Y%m%d')
+
+    targets = []
+    seen = set()
+    for entry in hot_set:
+        category = entry['category']
+        cycle = entry.get('cycle')
+        if cycles:
+            effective_cycle = cycle or bok_backend.BOK_MAPPING.get(category, {}).get('default_cycle', 'D')
+            if effective_cycle not in cycles:
+                continue
+
+        starts = [today - timedelta(days=days) for days in entry.get('days', [])]
+        starts += [_months_back(today, months) for months in entry.get('months', [])]
+        for item_code in entry.get('items') or [None]:
+            for start in starts:
+                target = PrefetchTarget(category, item_code, cycle, start.strftime('%Y%m%d'), end_date)
+                if target not in seen:
+                    seen.add(target)
+                    targets.append(target)
+    return targets
+
+
+class PrefetchStats:
+    """예열 실행 통계 (실행 수, 소요 시간, 마지막 실행 결과)"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.runs = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.warmed = 0
+        self.failed = 0
+        self.last_run = None
+
+    def record(self, result):
+        with self.lock:
+            self.runs += 1
+            self.total_seconds += result['elapsed_seconds']
+            self.max_seconds = max(self.max_seconds, result['elapsed_seconds'])
+            self.warmed += result['warmed']
+            self.failed += len(result['errors'])
+            self.last_run = result
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                "runs": self.runs,
+                "warmed": self.warmed,
+                "failed": self.failed,
+                "total_seconds": round(self.total_seconds, 3),
+                "avg_seconds": round(self.total_seconds / self.runs, 3) if self.runs else 0.0,
+                "max_seconds": round(self.max_seconds, 3),
+                "last_run": dict(self.last_run) if self.last_run else None,
+            }
+
+
+# 전역 예열 통계 / 실행 잠금 (시작 예열과 정기 예열이 겹치면 나중 것은 건너뜀)
+_stats = PrefetchStats()
+_run_lock = threading.Lock()
+
+
+def run_prefetch(hot_set, cycles=None, ttl_seconds=bok_backend.CACHE_TTL_SECONDS, reason="scheduled", today=None):
+    """
+    hot set 의 시리즈를 순서대로 예열 조회합니다.
+
+    - ECOS 호출 속도는 bok_backend 의 전역 토큰 버킷이 제한 (사용자 요청과 공유)
+    - 항목별 실패는 errors 에 모으고 다음 항목을 계속 조회
+
+    Returns:
+        dict: reason, started_at, targets, warmed, errors, elapsed_seconds
+              (이미 실행 중이면 {"skipped": ...})
+    """
+    if not _run_lock.acquire(blocking=False):
+        logger.info(f"Market prefetch ({reason}) skipped: previous run still in progress")
+        return {"skipped": "previous run still in progress", "reason": reason}
+
+    try:
+        targets = prefetch_targets(hot_set, today=today, cycles=cycles)
+        started_at = datetime.now().isoformat(timespec="seconds")
+        started = time.time()
+        warmed = 0
+        errors = []
+
+        with bok_backend.prefetch_scope(ttl_seconds):
+            for target in targets:
+                try:
+                    result = bok_backend.get_market_index(
+                        target.category, target.start_date, target.end_date,
+                        item_code=target.item_code, cycle=target.cycle
+                    )
+                except Exception as e:
+                    logger.error(f"Market prefetch failed for {target}: {e}", exc_info=True)
+                    result = {"error": f"Unexpected error: {str(e)}"}
+
+                if 'error' in result:
+                    errors.append(f"{target.category}/{target.item_code or 'default'} "
+                                  f"{target.start_date}~{target.end_date}: {result['error']}")
+                else:
+                    warmed += 1
+
+        result = {
+            "reason": reason,
+            "started_at": started_at,
+            "targets": len(targets),
+            "warmed": warmed,
+            "errors": errors,
+            "elapsed_seconds": round(time.time() - started, 3),
+        }
+        _stats.record(result)
+        logger.info(f"Market prefetch ({reason}) finished: {warmed}/{len(targets)} series warmed "
+                    f"in {result['elapsed_seconds']}s")
+        return result
+    finally:
+        _run_lock.release()
+
+
+def get_stats():
+    """예열 통계 조회 (외부 노출용)"""
+    return _stats.get_stats()
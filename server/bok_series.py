@@ -0,0 +1,237 @@
+"""
+시장 지수 시계열 (NumPy) - ECOS StatisticSearch row 를 한 번만 파싱해 배열로 보관
+- TIME / DATA_VALUE 를 times(str) / values(float64) 배열로 변환 (D/M/Q/A 주기 공통)
+- 통계(최고/최저/평균/변동)와 보조지표(이동평균, 변동성, 백분위, 낙폭)를 배열 연산으로 계산
+- 유효값 기준은 기존 calculate_statistics 와 동일: TIME/DATA_VALUE 가 비어있지 않고, float 변환 가능하며, 0 초과
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 주기별 보조지표 기본 윈도우 (이동평균 / 변동성)
+MA_WINDOWS = {
+    'D': (5, 20, 60),
+    'M': (3, 6, 12),
+    'Q': (2, 4, 8),
+    'A': (3, 5),
+}
+VOLATILITY_WINDOWS = {
+    'D': 20,
+    'M': 12,
+    'Q': 4,
+    'A': 5,
+}
+
+
+def time_sort_key(time_str):
+    """
+    ECOS TIME 필드를 정렬 가능한 숫자 키로 변환합니다.
+    - YYYYMMDD -> YYYYMMDD
+    - YYYYMM   -> YYYYMM00
+    - YYYYQn   -> YYYY*10 + n
+    - YYYY     -> YYYY0000
+    """
+    if not time_str:
+        return 0
+    s = str(time_str).strip()
+    try:
+        # YYYYMMDD
+        if len(s) == 8 and s.isdigit():
+            return int(s)
+        # YYYYMM
+        if len(s) == 6 and s.isdigit():
+            return int(s) * 100
+        # YYYYQn
+        if len(s) == 6 and ('Q' in s):
+            # e.g., 2025Q4
+            y = int(s[:4])
+            q = int(s[-1])
+            return y * 10 + q
+        # YYYY
+        if len(s) == 4 and s.isdigit():
+            return int(s) * 10000
+    except Exception:
+        return 0
+    return 0
+
+
+def _extract(rows):
+    """row (dict 또는 [TIME, VALUE] 리스트) → (times, raw values) 목록, 비어있는 값은 제외"""
+    times = []
+    raw = []
+    for row in rows:
+        if isinstance(row, dict):
+            t = row.get('TIME', '')
+            v = row.get('DATA_VALUE', '')
+        elif isinstance(row, list) and len(row) >= 2:
+            t = str(row[0])
+            v = str(row[1])
+        else:
+            continue
+        if t and v:
+            times.append(t)
+            raw.append(v)
+    return times, raw
+
+
+def _to_float(raw):
+    """문자열 목록 → float64 배열 (변환 불가 값은 NaN)"""
+    try:
+        return np.array(raw, dtype=np.float64)
+    except (ValueError, TypeError):
+        out = np.empty(len(raw), dtype=np.float64)
+        for i, v in enumerate(raw):
+            try:
+                out[i] = float(v)
+            except (ValueError, TypeError):
+                out[i] = np.nan
+        return out
+
+
+def _sort_keys(times):
+    """
+    TIME 목록의 정렬 키 (time_sort_key 와 같은 값)
+    - 모든 TIME 이 같은 형식(YYYYMMDD / YYYYMM / YYYYQn / YYYY)이면 ASCII 바이트를 숫자로 바로 변환
+    - 형식이 섞여 있거나 공백 등이 있으면 time_sort_key 로 하나씩 변환
+    """
+    n = len(times)
+    joined = ''.join(times)
+    length = len(joined) // n if n else 0
+    if length in (8, 6, 4) and len(joined) == length * n and set(map(len, times)) == {length}:
+        try:
+            digits = np.frombuffer(joined.encode('ascii'), dtype=np.uint8).reshape(n, length).astype(np.int64) - 48
+        except UnicodeEncodeError:
+            digits = None
+        if digits is not None:
+            if ((digits >= 0) & (digits <= 9)).all():
+                return digits @ (10 ** np.arange(length - 1, -1, -1, dtype=np.int64)) * {8: 1, 6: 100, 4: 10000}[length]
+            # YYYYQn
+            if length == 6 and (digits[:, 4] == ord('Q') - 48).all():
+                year, quarter = digits[:, :4], digits[:, 5]
+                if ((year >= 0) & (year <= 9)).all() and ((quarter >= 0) & (quarter <= 9)).all():
+                    return year @ np.array([1000, 100, 10, 1], dtype=np.int64) * 10 + quarter
+    return np.fromiter((time_sort_key(t) for t in times), dtype=np.int64, count=n)
+
+
+def _round(value):
+    return round(float(value), 2)
+
+
+class MarketSeries:
+    """
+    ECOS 시계열 (유효값만, 배열 기반)
+
+    Usage:
+        series = MarketSeries.from_rows(data['StatisticSearch']['row'], cycle='D')
+        stats = series.summary(currency_code='USD')
+        indicators = series.indicators()
+    """
+
+    __slots__ = ("times", "values", "cycle")
+
+    def __init__(self, times, values, cycle=None):
+        self.times = times
+        self.values = values
+        self.cycle = 'A' if cycle == 'Y' else cycle
+
+    @classmethod
+    def from_rows(cls, rows, cycle=None, sort=False):
+        """
+        row 목록에서 유효값만 추출
+
+        - sort=False: ECOS 응답 순서 유지 (calculate_statistics 와 동일)
+        - sort=True: TIME 기준 안정 정렬 (calculate_statistics_previous_period 와 동일)
+        """
+        times, raw = _extract(rows or [])
+        values = _to_float(raw)
+        mask = values > 0
+        times = np.array(times, dtype=object)[mask]
+        values = values[mask]
+        if sort and len(values) > 1:
+            order = np.argsort(_sort_keys(times.tolist()), kind='stable')
+            times, values = times[order], values[order]
+        return cls(times, values, cycle)
+
+    def __len__(self):
+        return len(self.values)
+
+    # ==========================================
+    # SUMMARY
+    # ==========================================
+
+    def summary(self, currency_code=None, baseline='first'):
+        """
+        최고/최저/평균/현재/이전/변동 (기존 calculate_statistics 응답 형식)
+
+        - baseline='first': 이전값 = 기간 첫 값 (기간 시작 대비)
+        - baseline='previous': 이전값 = 직전 값 (직전 기간 대비)
+        """
+        values = self.values
+        current = values[-1]
+        if len(values) < 2:
+            previous = current
+        else:
+            previous = values[0] if baseline == 'first' else values[-2]
+        change = current - previous
+        change_percent = (change / previous * 100) if previous != 0 else 0
+        return {
+            "currency": currency_code or "UNKNOWN",
+            "high": _round(values.max()),
+            "low": _round(values.min()),
+            # 순차 합산 (기존 sum(values) / len(values) 와 동일한 값)
+            "average": _round(sum(values.tolist()) / len(values)),
+            "current": _round(current),
+            "previous": _round(previous),
+            "change": _round(change),
+            "changePercent": _round(change_percent),
+        }
+
+    # ==========================================
+    # ROLLING INDICATORS
+    # ==========================================
+
+    def moving_average(self, window):
+        """단순 이동평균 (앞쪽 window-1 개는 NaN)"""
+        out = np.full(len(self.values), np.nan)
+        if 0 < window <= len(self.values):
+            csum = np.cumsum(np.insert(self.values, 0, 0.0))
+            out[window - 1:] = (csum[window:] - csum[:-window]) / window
+        return out
+
+    def returns(self):
+        """기간 수익률 (%), 길이 n-1"""
+        return np.diff(self.values) / self.values[:-1] * 100
+
+    def rolling_volatility(self, window):
+        """수익률(%)의 이동 표준편차 (표본, 앞쪽 window 개는 NaN)"""
+        out = np.full(len(self.values), np.nan)
+        returns = self.returns()
+        if 1 < window <= len(returns):
+            out[window:] = sliding_window_view(returns, window).std(axis=1, ddof=1)
+        return out
+
+    def drawdown(self):
+        """고점 대비 낙폭 (%)"""
+        return (self.values / np.maximum.accumulate(self.values) - 1) * 100
+
+    def percent_rank(self):
+        """현재값 이하인 값의 비율 (%)"""
+        return float((self.values <= self.values[-1]).mean() * 100)
+
+    def indicators(self, ma_windows=None, volatility_window=None):
+        """최신 시점 기준 보조지표 (데이터가 윈도우보다 짧으면 None)"""
+        cycle = self.cycle or 'D'
+        ma_windows = ma_windows or MA_WINDOWS.get(cycle, MA_WINDOWS['D'])
+        volatility_window = volatility_window or VOLATILITY_WINDOWS.get(cycle, VOLATILITY_WINDOWS['D'])
+
+        def latest(arr):
+            return None if not len(arr) or np.isnan(arr[-1]) else _round(arr[-1])
+
+        drawdown = self.drawdown()
+        return {
+            "movingAverage": {str(w): latest(self.moving_average(w)) for w in ma_windows},
+            "volatility": {str(volatility_window): latest(self.rolling_volatility(volatility_window))},
+            "percentRank": _round(self.percent_rank()),
+            "drawdown": _round(drawdown[-1]),
+            "maxDrawdown": _round(drawdown.min()),
+        }
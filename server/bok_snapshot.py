@@ -0,0 +1,320 @@
+"""
+시장 지수 스냅샷 (여러 카테고리 한 번에)
+- BOK_MAPPING 의 카테고리/항목 전체에 대해 최신값, 변동, 스파크라인, 요약 통계를 한 응답으로 구성
+- 하나의 조회 계획(fetch plan): 주기별로 같은 조회 기간을 쓰고, 항목 조회는 get_market_index 로 동시에 실행
+  (캐시/관측값 저장소/singleflight/토큰 버킷 공유 → 재구성 시 ECOS 는 새 구간만 조회)
+- 스냅샷은 직렬화된 JSON + ETag 단위로 캐시, TTL 이 지나면 시리즈별 관측값 digest 를 비교해
+  바뀐 시리즈만 다시 계산 (아무것도 바뀌지 않았으면 ETag 유지 → 304)
+- stale-while-revalidate: TTL 이 지난 뒤의 요청은 이전 스냅샷을 바로 받고 재구성은 백그라운드 1회
+  (전체 계획 재조회가 토큰 버킷에 막혀 요청을 1분 넘게 붙잡지 않도록). 스냅샷이 없을 때만 요청이 기다림
+- 정기 예열 작업이 refresh_snapshot(prefetch_ttl) 로 조회 계획 전체를 긴 TTL 로 캐시에 채움
+  → TTL 재확인 시 ECOS 호출 없이 캐시에서 재구성
+- 국가별 카테고리(국가 목록을 동적으로 조회)와 항목 코드가 정해지지 않은 항목("[item_code]")은 제외
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import bok_backend
+import bok_series
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TTL_SECONDS = bok_backend.CACHE_TTL_SECONDS  # 스냅샷 재확인 주기 (5분)
+
+# 주기별 조회 기간 - D 는 일 수, 나머지는 현재월 포함 개월 수
+SNAPSHOT_WINDOWS = {
+    'D': 90,
+    'M': 24,
+    'Q': 36,
+    'A': 120,
+}
+
+# 주기별 스파크라인 포인트 수 (최근 N개)
+SPARKLINE_POINTS = {
+    'D': 60,
+    'M': 24,
+    'Q': 12,
+    'A': 10,
+}
+
+# 조회 계획의 시리즈 1건 (get_market_index 인자 + 표시명)
+SnapshotSeries = namedtuple("SnapshotSeries", ["category", "item_key", "name", "cycle", "start_date", "end_date"])
+
+
+def _window_start(today, cycle):
+    """주기별 조회 시작일 (D: 최근 N일, M/Q/A: 현재월 포함 N개월의 첫날)"""
+    window = SNAPSHOT_WINDOWS.get(cycle, SNAPSHOT_WINDOWS['M'])
+    if cycle == 'D':
+        return today - timedelta(days=window)
+    index = today.year * 12 + (today.month - 1) - (window - 1)
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _category_items(category, mapping):
+    """스냅샷에 포함할 {item_key: 표시명} (inflation 은 프론트엔드 itemCode 매핑 기준)"""
+    if category == "inflation":
+        return {key: key for key in mapping.get('item_code_mapping', {})}
+    items = {}
+    for key, info in (mapping.get('items') or {}).items():
+        code = str(info.get('code', ''))
+        if not code or code.startswith('['):
+            continue
+        items[key] = info.get('name') or key
+    return items
+
+
+def build_plan(mapping=None, today=None):
+    """
+    스냅샷 조회 계획을 만듭니다.
+
+    Args:
+        mapping: 카테고리 매핑 (기본값: bok_backend.BOK_MAPPING)
+        today: 기준일 (기본값: 오늘)
+
+    Returns:
+        list[SnapshotSeries]: 카테고리/항목 순서는 매핑 순서 유지
+    """
+    mapping = bok_backend.BOK_MAPPING if mapping is None else mapping
+    today = today or date.today()
+    end_date = today.strftime('%Y%m%d')
+
+    plan = []
+    for category, info in mapping.items():
+        if category in bok_backend.INTERNATIONAL_CATEGORIES:
+            continue
+        cycle = info.get('default_cycle', 'D')
+        start_date = _window_start(today, cycle).strftime('%Y%m%d')
+        for item_key, name in _category_items(category, info).items():
+            plan.append(SnapshotSeries(category, item_key, name, cycle, start_date, end_date))
+    return plan
+
+
+def _digest(data):
+    """시리즈 응답의 관측값 digest (TIME/DATA_VALUE 기준, 에러는 메시지 기준)"""
+    if 'error' in data:
+        text = f"error:{data['error']}"
+    else:
+        rows = data.get('StatisticSearch', {}).get('row') or []
+        text = "\n".join(f"{row.get('TIME', '')}={row.get('DATA_VALUE', '')}" for row in rows if isinstance(row, dict))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _series_payload(spec, data):
+    """시리즈 1건의 스냅샷 항목 (최신값/직전 대비 변동/요약 통계/스파크라인)"""
+    if 'error' in data:
+        return {"name": spec.name, "error": data['error']}
+    rows = data.get('StatisticSearch', {}).get('row') or []
+    series = bok_series.MarketSeries.from_rows(rows, cycle=spec.cycle, sort=True)
+    if not len(series):
+        return {"name": spec.name, "error": "No valid data values found"}
+
+    summary = series.summary(baseline='previous')
+    del summary["currency"]
+    points = SPARKLINE_POINTS.get(series.cycle, SPARKLINE_POINTS['D'])
+    return {
+        "name": spec.name,
+        "time": str(series.times[-1]),
+        **summary,
+        "sparkline": [round(value, 4) for value in series.values[-points:].tolist()],
+    }
+
+
+class MarketSnapshot:
+    """
+    전체 시장 지수 스냅샷 캐시
+
+    Usage:
+        snapshot = MarketSnapshot()
+        current = snapshot.get()          # {"etag", "json", "built_at", "checked_at"}
+        current = snapshot.get(force=True)
+    """
+    def __init__(self, ttl=SNAPSHOT_TTL_SECONDS, max_workers=None, clock=time.time):
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.clock = clock
+        self.lock = threading.Lock()
+        self._series = {}      # (category, item_key) -> (digest, payload)
+        self._current = None
+        self.revalidation = None  # 진행 중인 백그라운드 재구성 스레드
+        self.hits = 0
+        self.stale_hits = 0
+        self.builds = 0
+        self.changed_builds = 0
+        self.recomputed_series = 0
+        self.reused_series = 0
+
+    def get(self, force=False):
+        """
+        스냅샷 조회 (stale-while-revalidate)
+
+        - TTL 안: 캐시된 스냅샷
+        - TTL 지남: 캐시된 스냅샷을 바로 반환하고 백그라운드에서 증분 재구성 (동시에 1회)
+        - 스냅샷이 없거나 force: 재구성 후 반환 (동시 요청은 1회로 병합)
+        """
+        with self.lock:
+            current = self._current
+            if not force and current is not None:
+                if self.clock() - current["checked_at"] < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    self._start_revalidation()
+                return current
+        return bok_backend.coalesce(f"MarketSnapshot:{id(self)}", self.rebuild)
+
+    def _start_revalidation(self):
+        """백그라운드 재구성 시작 (self.lock 보유 상태에서 호출, 이미 진행 중이면 무시)"""
+        if self.revalidation is not None:
+            return
+        self.revalidation = threading.Thread(target=self._revalidate, name="market-snapshot-revalidate", daemon=True)
+        self.revalidation.start()
+
+    def _revalidate(self):
+        try:
+            bok_backend.coalesce(f"MarketSnapshot:{id(self)}", self.rebuild)
+        except Exception as e:
+            logger.error(f"Background market snapshot rebuild failed: {e}", exc_info=True)
+        finally:
+            with self.lock:
+                self.revalidation = None
+
+    def _fetch(self, spec, prefetch_ttl=None):
+        try:
+            if prefetch_ttl is None:
+                return bok_backend.get_market_index(spec.category, spec.start_date, spec.end_date,
+                                                    item_code=spec.item_key)
+            # prefetch_scope 는 스레드 단위 → 조회 스레드 안에서 설정
+            with bok_backend.prefetch_scope(prefetch_ttl):
+                return bok_backend.get_market_index(spec.category, spec.start_date, spec.end_date,
+                                                    item_code=spec.item_key)
+        except Exception as e:
+            logger.error(f"Snapshot fetch failed for {spec.category}/{spec.item_key}: {e}", exc_info=True)
+            return {"error": f"Unexpected error: {str(e)}"}
+
+    def rebuild(self, today=None, prefetch_ttl=None):
+        """
+        조회 계획 전체를 다시 읽고 관측값이 바뀐 시리즈만 다시 계산
+
+        Args:
+            prefetch_ttl: 지정하면 예열 조회로 실행 (캐시를 건너뛰고 새로 받아 이 TTL(초) 동안 캐시에 저장)
+        """
+        started = time.time()
+        plan = build_plan(today=today)
+        workers = min(self.max_workers or bok_backend.MULTI_FETCH_WORKERS, len(plan))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="market-snapshot") as pool:
+                fetched = list(pool.map(lambda spec: self._fetch(spec, prefetch_ttl), plan))
+        else:
+            fetched = [self._fetch(spec, prefetch_ttl) for spec in plan]
+
+        with self.lock:
+            previous = self._series
+        series_state = {}
+        recomputed = 0
+        for spec, data in zip(plan, fetched):
+            key = (spec.category, spec.item_key)
+            digest = _digest(data)
+            cached = previous.get(key)
+            if cached is not None and cached[0] == digest:
+                payload = cached[1]
+            else:
+                payload = _series_payload(spec, data)
+                recomputed += 1
+            series_state[key] = (digest, payload)
+
+        etag = hashlib.sha1("\n".join(f"{spec.category}/{spec.item_key}={series_state[(spec.category, spec.item_key)][0]}"
+                                      for spec in plan).encode('utf-8')).hexdigest()[:20]
+        now = self.clock()
+        with self.lock:
+            current = self._current
+            if current is not None and current["etag"] == etag:
+                current = dict(current, checked_at=now)
+            else:
+                current = {
+                    "etag": etag,
+                    "json": json.dumps(self._assemble(plan, series_state), ensure_ascii=False),
+                    "built_at": now,
+                    "checked_at": now,
+                }
+                self.changed_builds += 1
+            self._current = current
+            self._series = series_state
+            self.builds += 1
+            self.recomputed_series += recomputed
+            self.reused_series += len(plan) - recomputed
+
+        logger.info(f"Market snapshot rebuilt in {time.time() - started:.2f}s: "
+                    f"{recomputed}/{len(plan)} series recomputed, etag={etag}")
+        return current
+
+    def _assemble(self, plan, series_state):
+        categories = {}
+        errors = 0
+        for spec in plan:
+            payload = series_state[(spec.category, spec.item_key)][1]
+            errors += 'error' in payload
+            category = categories.get(spec.category)
+            if category is None:
+                category = categories[spec.category] = {
+                    "name": bok_backend.BOK_MAPPING.get(spec.category, {}).get('name', spec.category),
+                    "cycle": spec.cycle,
+                    "startDate": spec.start_date,
+                    "endDate": spec.end_date,
+                    "items": {},
+                }
+            category["items"][spec.item_key] = payload
+        return {
+            "generatedAt": datetime.now().isoformat(timespec="seconds"),
+            "series": len(plan),
+            "errors": errors,
+            "categories": categories,
+        }
+
+    def get_stats(self):
+        with self.lock:
+            current = self._current
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "revalidating": self.revalidation is not None,
+                "builds": self.builds,
+                "changed_builds": self.changed_builds,
+                "recomputed_series": self.recomputed_series,
+                "reused_series": self.reused_series,
+                "series": len(self._series),
+                "etag": current["etag"] if current else None,
+                "built_at": datetime.fromtimestamp(current["built_at"]).isoformat(timespec="seconds") if current else None,
+            }
+
+
+# 전역 스냅샷 인스턴스
+_snapshot = MarketSnapshot()
+
+
+def get_snapshot(force=False):
+    """현재 스냅샷 조회 (외부 노출용) - {"etag", "json", "built_at", "checked_at"}"""
+    return _snapshot.get(force=force)
+
+
+def refresh_snapshot(prefetch_ttl=None):
+    """
+    스냅샷 재구성 (정기 예열 작업용)
+
+    Args:
+        prefetch_ttl: 조회 계획 전체를 예열 조회로 실행해 이 TTL(초) 동안 캐시에 저장
+                      → 사용자 요청 뒤의 백그라운드 재구성이 ECOS 를 다시 호출하지 않음
+    """
+    return bok_backend.coalesce(f"MarketSnapshot:{id(_snapshot)}",
+                                lambda: _snapshot.rebuild(prefetch_ttl=prefetch_ttl))
+
+
+def get_stats():
+    """스냅샷 캐시 통계 조회 (외부 노출용)"""
+    return _snapshot.get_stats()
@@ -0,0 +1,318 @@
+"""
+ECOS 관측값 로컬 저장소 (SQLite)
+- StatisticSearch 응답 row 를 (stat_code, item_code, cycle, TIME) 단위로 디스크에 보관
+- 시리즈별로 "이미 확정된 구간(coverage)" 을 기록하고, 요청 구간 중 빠진 부분(꼬리/중간 gap)만 ECOS 에서 받아옴
+- 공표 후 충분히 지난 과거 관측값은 불변으로 취급, 최근 구간(MUTABLE_DAYS 이내)과
+  마지막 관측값 이후 구간은 확정하지 않음 → 다음 요청에서 다시 조회되어 수정/신규 공표를 반영
+- 서버 재시작이나 하루씩 밀린 조회 구간에도 전체 재다운로드가 발생하지 않음
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = Path(__file__).parent / 'ecos_observations.db'
+
+# 주기별 "수정 가능" 기간 (일) - 종료일이 오늘 - N일 이후인 기간은 확정하지 않음
+MUTABLE_DAYS = {
+    'D': 7,
+    'M': 62,
+    'Q': 184,
+    'A': 400,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    stat_code TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    cycle TEXT NOT NULL,
+    time TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    row_json TEXT NOT NULL,
+    PRIMARY KEY (stat_code, item_code, cycle, time)
+);
+CREATE INDEX IF NOT EXISTS idx_observations_period
+    ON observations (stat_code, item_code, cycle, period);
+CREATE TABLE IF NOT EXISTS coverage (
+    stat_code TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    cycle TEXT NOT NULL,
+    start_period INTEGER NOT NULL,
+    end_period INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_coverage_series
+    ON coverage (stat_code, item_code, cycle);
+"""
+
+
+# ============================================================
+# PERIOD HELPERS
+# ============================================================
+# 주기별 기간을 연속된 정수(period)로 변환해 구간 계산을 단순화
+# - D: date ordinal / M: year*12 + (month-1) / Q: year*4 + (quarter-1) / A, Y: year
+
+def _normalize_cycle(cycle):
+    return 'A' if cycle == 'Y' else cycle
+
+
+def period_of_date(d, cycle):
+    """날짜가 속한 기간의 period 값"""
+    cycle = _normalize_cycle(cycle)
+    if cycle == 'D':
+        return d.toordinal()
+    if cycle == 'M':
+        return d.year * 12 + d.month - 1
+    if cycle == 'Q':
+        return d.year * 4 + (d.month - 1) // 3
+    return d.year
+
+
+def period_of_time(time_str, cycle):
+    """ECOS TIME 문자열 (YYYYMMDD / YYYYMM / YYYYQn / YYYY) 의 period 값, 해석 불가 시 None"""
+    s = str(time_str or '').strip()
+    cycle = _normalize_cycle(cycle)
+    try:
+        if cycle == 'D' and len(s) == 8:
+            return datetime.strptime(s, '%Y%m%d').toordinal()
+        if cycle == 'M' and len(s) == 6:
+            return int(s[:4]) * 12 + int(s[4:6]) - 1
+        if cycle == 'Q' and len(s) == 6 and s[4] == 'Q':
+            return int(s[:4]) * 4 + int(s[5]) - 1
+        if cycle == 'A' and len(s) == 4:
+            return int(s)
+    except ValueError:
+        return None
+    return None
+
+
+def format_period(period, cycle):
+    """period 값을 ECOS 요청용 기간 문자열로 변환"""
+    cycle = _normalize_cycle(cycle)
+    if cycle == 'D':
+        return date.fromordinal(period).strftime('%Y%m%d')
+    if cycle == 'M':
+        return f"{period // 12:04d}{period % 12 + 1:02d}"
+    if cycle == 'Q':
+        return f"{period // 4:04d}Q{period % 4 + 1}"
+    return f"{period:04d}"
+
+
+def settled_period(cycle, today=None):
+    """불변으로 취급할 수 있는 마지막 period (이후 기간은 수정 가능)"""
+    today = today or date.today()
+    grace = MUTABLE_DAYS.get(_normalize_cycle(cycle), 7)
+    return period_of_date(today - timedelta(days=grace), cycle) - 1
+
+
+def subtract_ranges(lo, hi, covered):
+    """[lo, hi] 에서 covered 구간들을 뺀 나머지 구간 목록 (모두 양끝 포함)"""
+    missing = []
+    cursor = lo
+    for start, end in sorted(covered):
+        if end < cursor:
+            continue
+        if start > hi:
+            break
+        if start > cursor:
+            missing.append((cursor, start - 1))
+        cursor = max(cursor, end + 1)
+        if cursor > hi:
+            break
+    if cursor <= hi:
+        missing.append((cursor, hi))
+    return missing
+
+
+def _merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# ============================================================
+# OBSERVATION STORE
+# ============================================================
+
+class ObservationStore:
+    """
+    ECOS 관측값 디스크 저장소
+
+    Usage:
+        store = ObservationStore('ecos_observations.db')
+        gaps = store.missing_ranges(series, lo, hi)
+        store.save(series, gap_lo, gap_hi, rows)
+        rows = store.load(series, lo, hi)
+
+    series 는 (stat_code, item_code, cycle) 튜플
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, today=None):
+        self.path = str(path)
+        self.today = today or date.today
+        self._lock = threading.Lock()
+        self._initialized = False
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.rows_fetched = 0
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    # 항목별 동시 조회 시 읽기/쓰기가 서로 막지 않도록 WAL 사용
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def _exists(self):
+        return self._initialized or os.path.exists(self.path)
+
+    def coverage(self, series):
+        """시리즈의 확정 구간 목록 (병합된 상태)"""
+        if not self._exists():
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT start_period, end_period FROM coverage WHERE stat_code = ? AND item_code = ? AND cycle = ?",
+                series
+            ).fetchall()
+        finally:
+            conn.close()
+        return _merge_ranges(rows)
+
+    def missing_ranges(self, series, lo, hi):
+        """요청 구간 중 디스크에 확정되지 않은 구간 목록"""
+        missing = subtract_ranges(lo, hi, self.coverage(series))
+        with self._lock:
+            if not missing:
+                self.hits += 1
+            elif missing == [(lo, hi)]:
+                self.misses += 1
+            else:
+                self.partial_hits += 1
+        return missing
+
+    def save(self, series, lo, hi, rows, truncated=False):
+        """
+        ECOS 에서 받은 [lo, hi] 구간의 row 를 저장하고 확정 가능한 범위를 coverage 에 기록
+
+        - 구간 내 기존 row 는 새 응답으로 교체 (수정 공표 반영)
+        - truncated (건수 제한으로 잘린 응답) 이면 마지막으로 받은 기간까지만 유효
+        - 확정 범위 = min(hi, 시리즈의 마지막 관측 기간, settled_period)
+          → 아직 공표되지 않았을 수 있는 꼬리 구간은 다음 요청에서 다시 조회
+        """
+        stat_code, item_code, cycle = series
+        parsed = []
+        for row in rows:
+            period = period_of_time(row.get('TIME'), cycle)
+            if period is not None and lo <= period <= hi:
+                parsed.append((period, row))
+        if truncated:
+            hi = max((p for p, _ in parsed), default=lo - 1)
+
+        conn = self._connect()
+        try:
+            with self._lock, conn:
+                conn.execute(
+                    "DELETE FROM observations WHERE stat_code = ? AND item_code = ? AND cycle = ? "
+                    "AND period BETWEEN ? AND ?",
+                    (stat_code, item_code, cycle, lo, hi)
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO observations (stat_code, item_code, cycle, time, period, row_json) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(stat_code, item_code, cycle, str(row.get('TIME')), period,
+                      json.dumps(row, ensure_ascii=False)) for period, row in parsed if period <= hi]
+                )
+                last_observed = conn.execute(
+                    "SELECT MAX(period) FROM observations WHERE stat_code = ? AND item_code = ? AND cycle = ?",
+                    series
+                ).fetchone()[0]
+                covered_hi = min(hi, settled_period(cycle, self.today()))
+                if last_observed is not None:
+                    covered_hi = min(covered_hi, last_observed)
+                if last_observed is not None and covered_hi >= lo:
+                    self._add_coverage(conn, series, lo, covered_hi)
+                self.rows_fetched += len(parsed)
+        finally:
+            conn.close()
+
+    def _add_coverage(self, conn, series, lo, hi):
+        """coverage 에 [lo, hi] 를 추가하고 시리즈의 구간을 병합된 상태로 다시 기록"""
+        existing = conn.execute(
+            "SELECT start_period, end_period FROM coverage WHERE stat_code = ? AND item_code = ? AND cycle = ?",
+            series
+        ).fetchall()
+        fetched_at = datetime.now().isoformat()
+        conn.execute("DELETE FROM coverage WHERE stat_code = ? AND item_code = ? AND cycle = ?", series)
+        conn.executemany(
+            "INSERT INTO coverage (stat_code, item_code, cycle, start_period, end_period, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(*series, start, end, fetched_at) for start, end in _merge_ranges(existing + [(lo, hi)])]
+        )
+
+    def load(self, series, lo, hi):
+        """[lo, hi] 구간의 row 목록 (기간순)"""
+        if not self._exists():
+            return []
+        stat_code, item_code, cycle = series
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT row_json FROM observations WHERE stat_code = ? AND item_code = ? AND cycle = ? "
+                "AND period BETWEEN ? AND ? ORDER BY period",
+                (stat_code, item_code, cycle, lo, hi)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(r[0]) for r in rows]
+
+    def clear(self):
+        """저장된 관측값 및 coverage 전체 삭제"""
+        if not self._exists():
+            return
+        conn = self._connect()
+        try:
+            with self._lock, conn:
+                conn.execute("DELETE FROM observations")
+                conn.execute("DELETE FROM coverage")
+        finally:
+            conn.close()
+
+    def stats(self):
+        """저장소 통계"""
+        observations = series = 0
+        if self._exists():
+            conn = self._connect()
+            try:
+                observations, series = conn.execute(
+                    "SELECT COUNT(*), COUNT(DISTINCT stat_code || ':' || item_code || ':' || cycle) FROM observations"
+                ).fetchone()
+            finally:
+                conn.close()
+        with self._lock:
+            return {
+                "path": self.path,
+                "series": series,
+                "observations": observations,
+                "hits": self.hits,
+                "partial_hits": self.partial_hits,
+                "misses": self.misses,
+                "rows_fetched": self.rows_fetched,
+            }
@@ -62,6 +62,40 @@ KCCI_COLLECTION_DAY = 'mon'
 KCCI_COLLECTION_HOUR_UTC = 5
 KCCI_COLLECTION_MINUTE = 30
 
+# BOK 통계표/항목 카탈로그: 매일 03:00 KST (18:00 UTC)
+BOK_CATALOG_REFRESH_HOUR_UTC = 18
+BOK_CATALOG_REFRESH_MINUTE = 0
+
+# BOK 시장 지수 프리페치 (자주 조회되는 시리즈를 ECOS 공표 직후 미리 조회해 캐시 예열)
+MARKET_PREFETCH_ENABLED = os.getenv("MARKET_PREFETCH_ENABLED", "true").lower() != "false"
+
+# 예열 대상 (hot set) - 프론트엔드 기본 화면과 같은 조회 조건
+# - items: 프론트엔드가 보내는 itemCode (None = 카테고리 기본 항목)
+# - cycle: 프론트엔드가 보내는 cycle (없으면 카테고리 기본 주기)
+# - days: 최근 N일 (UTC 기준 오늘까지), months: 현재월 포함 최근 N개월
+MARKET_PREFETCH_HOT_SET = [
+    # 환율: 기본 3개월 + 기간 버튼(1W/1M), 상단 티커(최근 7일)
+    {"category": "exchange", "items": ["USD", "EUR", "JPY", "CNY", "GBP"], "days": [7, 30, 90]},
+    {"category": "exchange-usd", "items": ["JPY", "EUR", "GBP"], "days": [90]},
+    # 금리/물가: 최근 12개월 (월별)
+    {"category": "interest", "items": ["BASE_RATE"], "cycle": "M", "months": [12]},
+    {"category": "inflation", "items": ["CPI_TOTAL"], "cycle": "M", "months": [12]},
+]
+
+# 일별 시리즈: 평일 09:10, 16:10 KST (00:10, 07:10 UTC) - 환율/금리 공표 직후
+MARKET_PREFETCH_DAILY_DAY_OF_WEEK = 'mon-fri'
+MARKET_PREFETCH_DAILY_HOURS_UTC = '0,7'
+MARKET_PREFETCH_DAILY_MINUTE = 10
+MARKET_PREFETCH_DAILY_TTL_HOURS = 18  # 다음 예열까지 유지 (16:10 → 익일 09:10)
+
+# 월/분기/연 시리즈: 매일 08:10 KST (23:10 UTC) - 08:00 통계 공표 직후
+MARKET_PREFETCH_PERIODIC_HOUR_UTC = 23
+MARKET_PREFETCH_PERIODIC_MINUTE = 10
+MARKET_PREFETCH_PERIODIC_TTL_HOURS = 25
+
+# 서버 시작 후 예열 시작까지 대기 (초) - 앱 시작을 막지 않도록 스케줄러 스레드에서 실행
+MARKET_PREFETCH_WARMUP_DELAY_SECONDS = 10
+
 # ============================================================
 # LOGGING CONFIGURATION
 # ============================================================
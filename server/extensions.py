@@ -34,6 +34,9 @@ def init_extensions(app):
     @app.after_request
     def add_no_cache_headers(response):
         """Add no-cache headers to all responses for development"""
+        # ETag 응답(예: /api/market/snapshot)은 no-store 대신 자체 Cache-Control 로 재검증(304) 허용
+        if response.headers.get('ETag'):
+            return response
         response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
         response.headers['Pragma'] = 'no-cache'
         response.headers['Expires'] = '0'
@@ -34,6 +34,7 @@ def get_global_alerts():
     - country: 국가 코드 필터 (예: US, KR)
     - category: 카테고리 필터 (예: Material Conflict)
     - min_articles: 최소 기사 수 필터
+    - event_root: CAMEO 루트 코드 필터 (쉼표 구분, 예: 14,18,19)
     - sort_by: 정렬 기준 (importance, date, tone, scale)
     """
     threshold = request.args.get('threshold', -5.0, type=float)
@@ -44,6 +45,7 @@ def get_global_alerts():
     category = request.args.get('category')
     min_articles = request.args.get('min_articles', type=int)
     sort_by = request.args.get('sort_by', 'date')
+    event_roots = [root.strip() for root in request.args.get('event_root', '').split(',') if root.strip()] or None
     
     try:
         # 날짜 범위가 지정된 경우
@@ -56,7 +58,8 @@ def get_global_alerts():
                 country=country,
                 category=category,
                 min_articles=min_articles,
-                sort_by=sort_by
+                sort_by=sort_by,
+                event_roots=event_roots
             )
         else:
             # 최신 데이터 가져오기 (캐싱 사용)
@@ -66,7 +69,8 @@ def get_global_alerts():
                 country=country,
                 category=category,
                 min_articles=min_articles,
-                sort_by=sort_by
+                sort_by=sort_by,
+                event_roots=event_roots
             )
         
         return jsonify(result)
@@ -3,6 +3,7 @@ GDELT 데이터 파싱 및 필터링 백엔드 모듈
 - GDELT Events CSV 파일에서 긴급 이벤트 추출
 - GoldsteinScale 기반 위험도 필터링
 - 자동 다운로드 및 데이터 관리
+- 다운로드 시 export 를 컬럼 캐시로 1회 변환, 알림/통계 조회는 메모리 맵으로 읽음 (gdelt_columnar)
 """
 
 import os
@@ -10,15 +11,22 @@ import gzip
 import csv
 import json
 import io
+import operator
 import zipfile
 import requests
 import shutil
+import time
+from contextlib import contextmanager
+from itertools import chain, compress, islice, repeat
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 import logging
+import numpy as np
 from dotenv import load_dotenv
 
+import gdelt_columnar
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -190,6 +198,23 @@ def find_latest_gdelt_file(base_path: Path = None) -> Optional[Path]:
     return None
 
 
+@contextmanager
+def _open_export(file_path: Path):
+    """export 파일을 텍스트 스트림으로 엽니다 (zip/gz/평문)"""
+    if file_path.suffix.lower() == '.zip':
+        with zipfile.ZipFile(file_path, 'r') as zf:
+            # ZIP 내부의 CSV 파일 찾기
+            csv_name = [name for name in zf.namelist() if name.endswith('.CSV')][0]
+            with zf.open(csv_name) as f:
+                yield io.TextIOWrapper(f, encoding='utf-8', errors='ignore')
+    elif file_path.suffix.lower() == '.gz':
+        with gzip.open(file_path, 'rt', encoding='utf-8', errors='ignore') as f:
+            yield f
+    else:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            yield f
+
+
 def parse_gdelt_events(
     file_path: Path,
     goldstein_threshold: float = -5.0,
@@ -197,6 +222,7 @@ def parse_gdelt_events(
 ) -> List[Dict]:
     """
     GDELT Events CSV 파일을 파싱하여 긴급 이벤트를 추출합니다.
+    (컬럼 캐시가 있으면 메모리 맵으로 읽고, 없으면 1회 변환)
     
     Args:
         file_path: GDELT CSV 파일 경로
@@ -206,153 +232,246 @@ def parse_gdelt_events(
     Returns:
         이벤트 리스트
     """
+    columns, rows = _select_events(file_path, goldstein_threshold, max_events)
+    if columns is None:
+        return []
+    
+    events = columns.to_events(rows)
+    logger.info(f"Parsed {len(events)} critical events from {file_path.name}")
+    return events
+
+
+def _select_events(file_path: Path, goldstein_threshold: float, max_events: int):
+    """
+    임계값 조건을 만족하는 행 선택 (dict 생성 없이)
+    
+    Returns:
+        (EventColumns 또는 None, 행 번호 배열)
+    """
     if not file_path or not file_path.exists():
         logger.error(f"File not found: {file_path}")
-        return []
+        return None, np.empty(0, dtype=np.int64)
     
-    events = []
+    columns = load_event_columns(file_path)
+    if columns is None:
+        return None, np.empty(0, dtype=np.int64)
+    return columns, columns.select(goldstein_threshold, max_events)
+
+
+# ============================================================================
+# 컬럼 캐시 (다운로드 시 1회 변환, 조회 시 메모리 맵)
+# ============================================================================
+
+def load_event_columns(file_path: Path) -> Optional[gdelt_columnar.EventColumns]:
+    """
+    export 파일의 컬럼 테이블을 가져옵니다.
+    저장된 컬럼 캐시가 있으면 메모리 맵으로 읽고, 없거나 읽을 수 없으면 export 를 변환합니다.
     
+    Returns:
+        EventColumns 또는 None (export 파싱 실패)
+    """
     try:
-        # 파일 열기 (압축 파일 처리)
-        if file_path.suffix.lower() == '.zip':
-            with zipfile.ZipFile(file_path, 'r') as zf:
-                # ZIP 내부의 CSV 파일 찾기
-                csv_name = [name for name in zf.namelist() if name.endswith('.CSV')][0]
-                with zf.open(csv_name) as f:
-                    content = io.TextIOWrapper(f, encoding='utf-8', errors='ignore')
-                    events = _parse_csv_content(content, goldstein_threshold, max_events)
-        elif file_path.suffix.lower() == '.gz':
-            with gzip.open(file_path, 'rt', encoding='utf-8', errors='ignore') as f:
-                events = _parse_csv_content(f, goldstein_threshold, max_events)
-        else:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                events = _parse_csv_content(f, goldstein_threshold, max_events)
+        columns = gdelt_columnar.load(gdelt_columnar.columnar_path(file_path))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable GDELT column cache for {file_path.name}: {e}")
+        columns = None
+    if columns is not None:
+        return columns
+    return convert_gdelt_file(file_path)
+
+
+def convert_gdelt_file(file_path: Path) -> Optional[gdelt_columnar.EventColumns]:
+    """
+    export 파일을 컬럼 캐시로 변환해 저장합니다 (<파일명>.cols/).
+    저장에 실패해도 변환한 컬럼 테이블은 반환합니다.
     
+    Returns:
+        EventColumns 또는 None (export 파싱 실패)
+    """
+    started = time.time()
+    try:
+        with _open_export(file_path) as content:
+            columns, source_rows = _build_event_columns(content)
     except Exception as e:
         logger.error(f"Error parsing GDELT file: {e}", exc_info=True)
-        return []
+        return None
     
-    logger.info(f"Parsed {len(events)} critical events from {file_path.name}")
-    return events
+    try:
+        gdelt_columnar.save(columns, gdelt_columnar.columnar_path(file_path),
+                            source_rows=source_rows, source_name=file_path.name)
+    except OSError as e:
+        logger.warning(f"Failed to save GDELT column cache for {file_path.name}: {e}")
+        return columns
+    
+    logger.info(f"Converted {file_path.name}: {len(columns)}/{source_rows} rows "
+                f"in {time.time() - started:.2f}s")
+    return columns
+
+
+# 컬럼 캐시로 옮기는 필드 (이름, export 컬럼 인덱스, 타입) - 나머지 44개 컬럼은 읽지 않음
+# - str: safe_str (앞뒤 공백 제거)
+# - float / int: safe_float / safe_int (빈 값, 변환 실패 → None)
+# - count: safe_int(..., 0)
+EVENT_SCHEMA = (
+    ('event_date', COL_SQLDATE, 'str'),
+    ('actor1', COL_ACTOR1NAME, 'str'),
+    ('actor1_country', COL_ACTOR1COUNTRYCODE, 'str'),
+    ('actor2', COL_ACTOR2NAME, 'str'),
+    ('actor2_country', COL_ACTOR2COUNTRYCODE, 'str'),
+    ('event_code', COL_EVENT_CODE, 'str'),
+    ('quad_class', COL_QUAD_CLASS, 'int'),
+    ('goldstein', COL_GOLDSTEIN_SCALE, 'float'),
+    ('num_mentions', COL_NUM_MENTIONS, 'count'),
+    ('num_sources', COL_NUM_SOURCES, 'count'),
+    ('num_articles', COL_NUM_ARTICLES, 'count'),
+    ('avg_tone', COL_AVG_TONE, 'float'),
+    ('location', COL_ACTION_GEO_FULLNAME, 'str'),
+    ('country_code', COL_ACTION_GEO_COUNTRYCODE, 'str'),
+    ('lat', COL_ACTION_GEO_LAT, 'float'),
+    ('lng', COL_ACTION_GEO_LONG, 'float'),
+    ('source_url', COL_SOURCEURL, 'str'),
+)
+
+MIN_EXPORT_COLUMNS = 61  # 최소 컬럼 수 (인덱스 0-60)
+PARSE_CHUNK_CHARS = 1 << 18  # 한 번에 읽어 필드로 나누는 분량 (readlines hint, 중간 문자열 목록 크기 제한)
+
+
+def _iter_field_chunks(content):
+    """
+    export 스트림을 행 묶음 단위로 읽어 EVENT_SCHEMA 컬럼만 골라 반환 (컬럼 수 부족 행 제외)
+    - 기본: 탭 수로 행마다 61개 필드를 맞춘 뒤, 묶음 전체를 한 번에 split 해서 컬럼 위치를 slice
+    - 따옴표로 시작하는 필드나 NUL 이 나오면 그 묶음부터 끝까지 csv.reader 로 처리 (기존 파서와 같은 결과)
+    
+    Yields:
+        (컬럼별 문자열 목록 리스트 - EVENT_SCHEMA 순서, 이 묶음에서 읽은 행 수)
+    """
+    indices = [index for _, index, _ in EVENT_SCHEMA]
+    last = MIN_EXPORT_COLUMNS - 1
+    
+    while True:
+        lines = content.readlines(PARSE_CHUNK_CHARS)
+        if not lines:
+            return
+        chunk = ''.join(lines)
+        if '\0' in chunk or chunk.startswith('"') or '\t"' in chunk or '\n"' in chunk:
+            break
+        
+        # 컬럼 수가 61개가 아닌 행: 부족하면 제외, 많으면 앞 61개만 (csv 행의 row[0..60] 과 같음)
+        tabs = list(map(str.count, lines, repeat('\t')))
+        if any(count != last for count in tabs):
+            chunk = '\n'.join(line.rstrip('\n') if count == last
+                              else '\t'.join(line.rstrip('\n').split('\t', MIN_EXPORT_COLUMNS)[:MIN_EXPORT_COLUMNS])
+                              for line, count in zip(lines, tabs) if count >= last)
+        
+        # 행 끝 개행도 필드 구분으로 취급 → 행마다 정확히 61개 필드 (마지막 행 개행 유무와 무관)
+        fields = chunk.rstrip('\n').replace('\n', '\t').split('\t') if chunk else []
+        yield [fields[index::MIN_EXPORT_COLUMNS] for index in indices], len(lines)
+    
+    # 따옴표 필드는 여러 줄에 걸칠 수 있으므로 남은 내용 전체를 csv.reader 로
+    project = operator.itemgetter(*indices)
+    reader = csv.reader(chain(lines, content), delimiter='\t')
+    while True:
+        records = list(islice(reader, len(lines)))
+        if not records:
+            return
+        projected = [project(row) for row in records if len(row) >= MIN_EXPORT_COLUMNS]
+        yield [list(column) for column in zip(*projected)] or [[] for _ in indices], len(records)
+
+
+def _typed_column(values, kind):
+    """
+    문자열 컬럼을 스키마 타입으로 변환
+    
+    Returns:
+        (값 배열/목록, 유효 여부 bool 배열 또는 None - 모두 유효)
+    """
+    if kind == 'str':
+        return list(map(str.strip, values)), None
+    
+    convert, dtype = (float, np.float64) if kind == 'float' else (int, np.int64)
+    try:
+        # 빈 값/변환 실패가 없으면 safe_float/safe_int 와 같은 값
+        return np.array(list(map(convert, values)), dtype=dtype), None
+    except ValueError:
+        pass
+    
+    # 빈 값이 섞인 경우: 값이 있는 행만 한 번에 변환, 그래도 실패하면 행마다 safe_float/safe_int
+    present = list(map(bool, map(str.strip, values)))
+    valid = np.array(present, dtype=np.bool_)
+    parsed = np.zeros(len(values), dtype=dtype)
+    try:
+        parsed[valid] = list(map(convert, compress(values, present)))
+    except ValueError:
+        default = 0 if kind == 'count' else None
+        converted = [(safe_float if kind == 'float' else safe_int)(value, default) for value in values]
+        valid = np.array([value is not None for value in converted], dtype=np.bool_)
+        parsed = np.array([0 if value is None else value for value in converted], dtype=dtype)
+    if kind == 'count':
+        # 빈 값은 0 (safe_int(..., 0)) 으로 유효
+        return parsed, None
+    return parsed, valid
 
 
-def _parse_csv_content(
-    content,
-    goldstein_threshold: float,
-    max_events: int
-) -> List[Dict]:
+def _build_event_columns(content):
     """
-    CSV 내용을 파싱하여 이벤트 추출
-    """
-    events = []
-    reader = csv.reader(content, delimiter='\t')
+    CSV 내용을 스키마 컬럼만 골라 타입별 배열로 변환 (행 단위 dict 없음)
+    임계값과 무관하게 제외되는 행(컬럼 수 부족, GoldsteinScale/위경도 없음)만 건너뜀
     
-    for row in reader:
-        if len(row) < 61:  # 최소 컬럼 수 확인
-            continue
+    Returns:
+        (EventColumns, 읽은 행 수)
+    """
+    numbers = {name: [] for name in gdelt_columnar.NUMERIC_COLUMNS}
+    strings = {name: [] for name, _, kind in EVENT_SCHEMA if kind == 'str'}
+    source_rows = 0
+    
+    # 묶음마다 타입 변환까지 끝내고 원본 문자열은 버림 (전체 필드 문자열을 동시에 들고 있지 않음)
+    for fields, rows_read in _iter_field_chunks(content):
+        source_rows += rows_read
+        values, valid = {}, {}
+        for (name, _, kind), raw in zip(EVENT_SCHEMA, fields):
+            values[name], valid[name] = _typed_column(raw, kind)
         
-        try:
-            # GoldsteinScale 확인
-            goldstein_scale = safe_float(row[COL_GOLDSTEIN_SCALE] if len(row) > COL_GOLDSTEIN_SCALE else '')
-            if goldstein_scale is None or goldstein_scale > goldstein_threshold:
-                continue
-            
-            # 위도/경도 확인
-            lat = safe_float(row[COL_ACTION_GEO_LAT] if len(row) > COL_ACTION_GEO_LAT else '')
-            lng = safe_float(row[COL_ACTION_GEO_LONG] if len(row) > COL_ACTION_GEO_LONG else '')
-            
-            if lat is None or lng is None:
-                continue
-            
-            # 기본 정보 추출
-            event_code = safe_str(row[COL_EVENT_CODE] if len(row) > COL_EVENT_CODE else '')
-            quad_class = safe_int(row[COL_QUAD_CLASS] if len(row) > COL_QUAD_CLASS else '')
-            event_date = safe_str(row[COL_SQLDATE] if len(row) > COL_SQLDATE else '')
-            
-            # 행위자 정보
-            actor1 = safe_str(row[COL_ACTOR1NAME] if len(row) > COL_ACTOR1NAME else '')
-            actor1_country = safe_str(row[COL_ACTOR1COUNTRYCODE] if len(row) > COL_ACTOR1COUNTRYCODE else '')
-            actor2 = safe_str(row[COL_ACTOR2NAME] if len(row) > COL_ACTOR2NAME else '')
-            actor2_country = safe_str(row[COL_ACTOR2COUNTRYCODE] if len(row) > COL_ACTOR2COUNTRYCODE else '')
-            
-            # 위치 정보
-            country_code = safe_str(row[COL_ACTION_GEO_COUNTRYCODE] if len(row) > COL_ACTION_GEO_COUNTRYCODE else '')
-            location = safe_str(row[COL_ACTION_GEO_FULLNAME] if len(row) > COL_ACTION_GEO_FULLNAME else '')
-            
-            # 분석 지표
-            num_sources = safe_int(row[COL_NUM_SOURCES] if len(row) > COL_NUM_SOURCES else '', 0)
-            num_mentions = safe_int(row[COL_NUM_MENTIONS] if len(row) > COL_NUM_MENTIONS else '', 0)
-            num_articles = safe_int(row[COL_NUM_ARTICLES] if len(row) > COL_NUM_ARTICLES else '', 0)
-            avg_tone = safe_float(row[COL_AVG_TONE] if len(row) > COL_AVG_TONE else '')
-            
-            # 출처
-            source_url = safe_str(row[COL_SOURCEURL] if len(row) > COL_SOURCEURL else '')
-            
-            # 카테고리 결정
-            category = get_event_category(event_code, quad_class)
-            
-            # 이벤트 이름 생성
-            name_parts = []
-            if actor1:
-                name_parts.append(actor1)
-            if actor2:
-                name_parts.append(actor2)
-            name = ' - '.join(name_parts) if name_parts else 'Event'
-            
-            # 이벤트 정보 추출 (프론트엔드 형식에 맞춤)
-            event = {
-                # 기본 정보
-                'name': name,
-                'event_date': event_date,
-                'event_code': event_code,
-                'category': category,
-                'quad_class': quad_class,
-                
-                # 행위자 정보
-                'actor1': actor1,
-                'actor1_country': actor1_country,
-                'actor2': actor2,
-                'actor2_country': actor2_country,
-                
-                # 위치 정보
-                'lat': lat,
-                'lng': lng,
-                'latitude': lat,  # 하위 호환성
-                'longitude': lng,  # 하위 호환성
-                'location': location,
-                'country_code': country_code,
-                
-                # 분석 지표
-                'scale': goldstein_scale,  # 프론트엔드가 기대하는 필드명
-                'goldstein_scale': goldstein_scale,  # 하위 호환성
-                'avg_tone': avg_tone,
-                'num_articles': num_articles,
-                'num_mentions': num_mentions,
-                'num_sources': num_sources,
-                
-                # 출처
-                'url': source_url,  # 프론트엔드가 기대하는 필드명
-                'source_url': source_url,  # 하위 호환성
-            }
-            
-            events.append(event)
-            
-            if len(events) >= max_events:
-                break
+        # GoldsteinScale / 위도 / 경도가 모두 있는 행만 유지
+        keep = np.ones(len(fields[0]), dtype=np.bool_)
+        for name in ('goldstein', 'lat', 'lng'):
+            if valid[name] is not None:
+                keep &= valid[name]
+        del fields
         
-        except (ValueError, IndexError) as e:
-            # 파싱 오류는 무시하고 계속 진행
-            logger.debug(f"Error parsing row: {e}")
-            continue
-    
-    return events
+        keep_list = None if keep.all() else keep.tolist()
+        for name, _, kind in EVENT_SCHEMA:
+            if kind == 'str':
+                strings[name].extend(values[name] if keep_list is None else compress(values[name], keep_list))
+            else:
+                numbers[name].append(values[name] if keep_list is None else values[name][keep])
+        for name in ('quad_class', 'avg_tone'):
+            numbers[f"{name}_valid"].append(np.ones(int(keep.sum()), dtype=np.bool_) if valid[name] is None
+                                            else valid[name][keep])
+    
+    numbers = {name: np.concatenate(parts) if parts else np.empty(0, dtype=gdelt_columnar.NUMERIC_COLUMNS[name])
+               for name, parts in numbers.items()}
+    
+    # 카테고리 (이벤트 코드, QuadClass 조합별 1회 계산)
+    # - 행별 (코드, QuadClass) 튜플 없이 정수 키 배열에서 np.unique
+    event_codes = strings['event_code']
+    code_of = {code: i for i, code in enumerate(dict.fromkeys(event_codes))}
+    code_ids = np.fromiter(map(code_of.__getitem__, event_codes), dtype=np.int64, count=len(event_codes))
+    code_list = list(code_of)
+    keys = np.stack([code_ids, numbers['quad_class'], numbers['quad_class_valid']], axis=1)
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    categories = np.array([get_event_category(code_list[code], quad if valid else None)
+                           for code, quad, valid in unique_keys.tolist()] or [''], dtype=object)
+    strings['category'] = categories[inverse.reshape(-1)].tolist() if len(inverse) else []
+    
+    return gdelt_columnar.EventColumns.from_columns(numbers, strings), source_rows
 
 
 def filter_events(
     events: List[Dict],
     country: Optional[str] = None,
     category: Optional[str] = None,
-    min_articles: Optional[int] = None
+    min_articles: Optional[int] = None,
+    event_roots: Optional[List[str]] = None
 ) -> List[Dict]:
     """
     이벤트 리스트를 필터링합니다.
@@ -362,6 +481,7 @@ def filter_events(
         country: 국가 코드 필터 (country_code, actor1_country, actor2_country 중 하나라도 일치)
         category: 카테고리 필터
         min_articles: 최소 기사 수 필터
+        event_roots: CAMEO 루트 코드 필터 (예: ["14", "19"], 이벤트 코드 앞 2자리)
         
     Returns:
         필터링된 이벤트 리스트
@@ -383,9 +503,52 @@ def filter_events(
     if min_articles is not None:
         filtered = [e for e in filtered if e.get('num_articles', 0) >= min_articles]
     
+    if event_roots:
+        roots = _normalize_event_roots(event_roots)
+        filtered = [e for e in filtered if e.get('event_code', '')[:2] in roots]
+    
     return filtered
 
 
+def _normalize_event_roots(event_roots) -> set:
+    """CAMEO 루트 코드 정규화 ("8" → "08")"""
+    return {str(root).strip().zfill(2) for root in event_roots if str(root).strip()}
+
+
+def _filter_rows(
+    columns: gdelt_columnar.EventColumns,
+    rows,
+    country: Optional[str] = None,
+    category: Optional[str] = None,
+    min_articles: Optional[int] = None,
+    event_roots: Optional[List[str]] = None
+):
+    """filter_events 와 같은 조건을 행 번호 배열에 마스크로 적용 (문자열 조건은 어휘 단위로 1회 평가)"""
+    mask = np.ones(len(rows), dtype=np.bool_)
+    
+    if country:
+        country_upper = country.upper()
+        
+        def matches(value):
+            return value.upper() == country_upper
+        
+        mask &= (columns.vocab_mask('country_code', matches, rows) |
+                 columns.vocab_mask('actor1_country', matches, rows) |
+                 columns.vocab_mask('actor2_country', matches, rows))
+    
+    if category:
+        mask &= columns.vocab_mask('category', lambda value: value == category, rows)
+    
+    if min_articles is not None:
+        mask &= columns.column('num_articles')[rows] >= min_articles
+    
+    if event_roots:
+        roots = _normalize_event_roots(event_roots)
+        mask &= columns.vocab_mask('event_code', lambda value: value[:2] in roots, rows)
+    
+    return rows[mask]
+
+
 def sort_events(
     events: List[Dict],
     sort_by: str = 'date'
@@ -434,6 +597,54 @@ def sort_events(
         return sorted(events, key=lambda x: x.get('event_date', ''), reverse=True)
 
 
+def _sort_key(columns: gdelt_columnar.EventColumns, rows, sort_by: str):
+    """
+    sort_events 와 같은 정렬 키 배열
+    
+    Returns:
+        (키 배열, 내림차순 여부)
+    """
+    if sort_by == 'importance':
+        return columns.column('num_articles')[rows] + columns.column('num_mentions')[rows], True
+    if sort_by == 'tone':
+        return columns.avg_tone_or_zero(rows), False
+    if sort_by == 'scale':
+        return np.asarray(columns.column('goldstein')[rows]), False
+    return np.array(columns.strings('event_date', rows), dtype=str), True
+
+
+def _materialize_alerts(selections, sort_by: str, max_alerts: int) -> List[Dict]:
+    """
+    파일별 선택 행을 합쳐 정렬한 뒤 상위 max_alerts 개만 이벤트 dict 로 변환
+    (sort_events + 슬라이싱과 같은 순서: 같은 키는 원래 순서 유지)
+    
+    Args:
+        selections: [(EventColumns, 행 번호 배열), ...] - 파일 순서
+    """
+    selections = [(columns, rows) for columns, rows in selections if len(rows)]
+    if not selections:
+        return []
+    
+    keys = [_sort_key(columns, rows, sort_by) for columns, rows in selections]
+    key = np.concatenate([k for k, _ in keys])
+    if keys[0][1]:
+        # 내림차순 안정 정렬 (문자열 키도 순위로 바꿔 부호 반전)
+        _, rank = np.unique(key, return_inverse=True)
+        order = np.argsort(-rank.reshape(-1), kind='stable')
+    else:
+        order = np.argsort(key, kind='stable')
+    order = order[:max_alerts]
+    
+    sources = np.repeat(np.arange(len(selections)), [len(rows) for _, rows in selections])[order]
+    rows = np.concatenate([rows for _, rows in selections])[order]
+    events = [None] * len(order)
+    for index, (columns, _) in enumerate(selections):
+        positions = np.flatnonzero(sources == index)
+        for position, event in zip(positions.tolist(), columns.to_events(rows[positions])):
+            events[position] = event
+    return events
+
+
 def get_critical_alerts(
     goldstein_threshold: float = -5.0,
     max_alerts: int = 1000,
@@ -441,15 +652,18 @@ def get_critical_alerts(
     country: Optional[str] = None,
     category: Optional[str] = None,
     min_articles: Optional[int] = None,
-    sort_by: str = 'date'
+    sort_by: str = 'date',
+    event_roots: Optional[List[str]] = None
 ) -> Dict:
     """
     긴급 알림 데이터를 가져옵니다.
+    필터/정렬은 컬럼 배열에서 처리하고, 응답에 실릴 행만 이벤트 dict 로 변환합니다.
     
     Args:
         goldstein_threshold: GoldsteinScale 임계값
         max_alerts: 최대 알림 수
         base_path: GDELT 데이터 경로
+        event_roots: CAMEO 루트 코드 필터 (예: ["14", "19"])
         
     Returns:
         알림 데이터 딕셔너리
@@ -465,18 +679,17 @@ def get_critical_alerts(
             'last_updated': None
         }
     
-    # 이벤트 파싱 (필터링 전에는 더 많이 가져오기)
-    parse_limit = max_alerts * 2 if (country or category or min_articles) else max_alerts
-    events = parse_gdelt_events(latest_file, goldstein_threshold, parse_limit)
-    
-    # 필터링 적용
-    events = filter_events(events, country=country, category=category, min_articles=min_articles)
+    # 임계값 조건 행 선택 (필터링 전에는 더 많이 가져오기)
+    parse_limit = max_alerts * 2 if (country or category or min_articles or event_roots) else max_alerts
+    columns, rows = _select_events(latest_file, goldstein_threshold, parse_limit)
     
-    # 정렬 적용
-    events = sort_events(events, sort_by=sort_by)
-    
-    # 최대 개수 제한
-    events = events[:max_alerts]
+    # 필터링 → 정렬 → 최대 개수 제한 후 이벤트 변환
+    selections = []
+    if columns is not None:
+        rows = _filter_rows(columns, rows, country=country, category=category,
+                            min_articles=min_articles, event_roots=event_roots)
+        selections.append((columns, rows))
+    events = _materialize_alerts(selections, sort_by, max_alerts)
     
     return {
         'alerts': events,
@@ -488,6 +701,7 @@ def get_critical_alerts(
             'country': country,
             'category': category,
             'min_articles': min_articles,
+            'event_roots': event_roots,
             'sort_by': sort_by
         }
     }
@@ -535,7 +749,8 @@ def get_alerts_by_date_range(
     country: Optional[str] = None,
     category: Optional[str] = None,
     min_articles: Optional[int] = None,
-    sort_by: str = 'date'
+    sort_by: str = 'date',
+    event_roots: Optional[List[str]] = None
 ) -> Dict:
     """
     날짜 범위 내의 긴급 알림을 가져옵니다.
@@ -546,6 +761,7 @@ def get_alerts_by_date_range(
         goldstein_threshold: GoldsteinScale 임계값
         max_alerts: 최대 알림 수
         base_path: GDELT 데이터 경로
+        event_roots: CAMEO 루트 코드 필터 (예: ["14", "19"])
         
     Returns:
         알림 데이터 딕셔너리
@@ -566,33 +782,26 @@ def get_alerts_by_date_range(
             'count': 0
         }
     
-    all_events = []
+    selections = []
     current_date = start_dt
     
-    # 날짜별로 파일 찾아서 파싱 (필터링 전에는 더 많이 가져오기)
-    parse_limit = max_alerts * 2 if (country or category or min_articles) else max_alerts
+    # 날짜별로 파일 찾아서 행 선택 (필터링 전에는 더 많이 가져오기)
+    parse_limit = max_alerts * 2 if (country or category or min_articles or event_roots) else max_alerts
     while current_date <= end_dt:
         date_str = current_date.strftime('%Y%m%d')
         file_path = find_gdelt_file_by_date(date_str, base_path)
         
         if file_path:
-            events = parse_gdelt_events(
-                file_path,
-                goldstein_threshold,
-                parse_limit
-            )
-            all_events.extend(events)
+            columns, rows = _select_events(file_path, goldstein_threshold, parse_limit)
+            if columns is not None:
+                rows = _filter_rows(columns, rows, country=country, category=category,
+                                    min_articles=min_articles, event_roots=event_roots)
+                selections.append((columns, rows))
         
         current_date += timedelta(days=1)
     
-    # 필터링 적용
-    all_events = filter_events(all_events, country=country, category=category, min_articles=min_articles)
-    
-    # 정렬 적용
-    all_events = sort_events(all_events, sort_by=sort_by)
-    
-    # 최대 개수 제한
-    all_events = all_events[:max_alerts]
+    # 날짜 전체 정렬 → 최대 개수 제한 후 이벤트 변환
+    all_events = _materialize_alerts(selections, sort_by, max_alerts)
     
     return {
         'alerts': all_events,
@@ -607,6 +816,7 @@ def get_alerts_by_date_range(
             'country': country,
             'category': category,
             'min_articles': min_articles,
+            'event_roots': event_roots,
             'sort_by': sort_by
         }
     }
@@ -642,7 +852,7 @@ def get_latest_gdelt_file_url() -> Optional[str]:
 
 def download_gdelt_file(file_url: str = None, base_path: Path = None) -> Optional[Path]:
     """
-    GDELT 파일을 다운로드합니다.
+    GDELT 파일을 다운로드합니다 (저장 후 컬럼 캐시로 변환).
     
     Args:
         file_url: 다운로드할 파일 URL (None이면 최신 파일 자동 감지)
@@ -680,9 +890,11 @@ def download_gdelt_file(file_url: str = None, base_path: Path = None) -> Optiona
         # 저장 경로
         save_path = date_dir / file_name
         
-        # 이미 파일이 있으면 스킵
+        # 이미 파일이 있으면 스킵 (컬럼 캐시가 없으면 변환만)
         if save_path.exists():
             logger.info(f"File already exists: {save_path}")
+            if not gdelt_columnar.columnar_path(save_path).exists():
+                convert_gdelt_file(save_path)
             return save_path
         
         # 파일 다운로드
@@ -695,6 +907,9 @@ def download_gdelt_file(file_url: str = None, base_path: Path = None) -> Optiona
             shutil.copyfileobj(response.raw, f)
         
         logger.info(f"Downloaded GDELT file: {save_path}")
+        
+        # 컬럼 캐시로 변환 (실패해도 조회 시 다시 변환)
+        convert_gdelt_file(save_path)
         return save_path
         
     except Exception as e:
@@ -795,6 +1010,48 @@ def update_gdelt_data() -> Dict:
 # Phase 3: 통계 및 집계 API
 # ============================================================================
 
+def _group_rows(codes, labels):
+    """
+    행별 어휘 코드를 표시 라벨 기준으로 묶음 (그룹 순서 = 첫 등장 순서)
+    
+    Returns:
+        (그룹 라벨 목록, 행별 그룹 번호 배열, 그룹별 행 수 배열)
+    """
+    label_ids = {}
+    label_of_code = np.array([label_ids.setdefault(label, len(label_ids)) for label in labels], dtype=np.int64)
+    names = list(label_ids)
+    uniques, first, inverse, counts = np.unique(
+        label_of_code[codes], return_index=True, return_inverse=True, return_counts=True
+    )
+    order = np.argsort(first, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return [names[label] for label in uniques[order].tolist()], rank[inverse.reshape(-1)], counts[order]
+
+
+def _group_sums(groups, values, num_groups):
+    """그룹별 합계 (행 순서대로 누적 - 기존 루프의 += 와 같은 값)"""
+    totals = np.zeros(num_groups, dtype=values.dtype)
+    np.add.at(totals, groups, values)
+    return totals.tolist()
+
+
+def _pair_counts(outer, inner, num_inner):
+    """
+    (outer 그룹, inner 코드) 쌍별 행 수 (첫 등장 순서)
+    
+    Returns:
+        [(outer, inner, count), ...]
+    """
+    if not len(outer):
+        return []
+    keys = outer.astype(np.int64) * num_inner + inner
+    uniques, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.argsort(first, kind='stable')
+    return [(key // num_inner, key % num_inner, count)
+            for key, count in zip(uniques[order].tolist(), counts[order].tolist())]
+
+
 def get_stats_by_country(
     goldstein_threshold: float = -5.0,
     max_alerts: int = 10000,
@@ -815,38 +1072,31 @@ def get_stats_by_country(
     if not latest_file:
         return {'error': 'No GDELT data file found', 'stats': {}}
     
-    events = parse_gdelt_events(latest_file, goldstein_threshold, max_alerts)
+    columns, rows = _select_events(latest_file, goldstein_threshold, max_alerts)
     
     country_stats = {}
-    for event in events:
-        country = event.get('country_code', 'UNKNOWN')
-        if not country:
-            country = 'UNKNOWN'
+    if columns is not None and len(rows):
+        country_labels = [code or 'UNKNOWN' for code in columns.vocab('country_code')]
+        countries, groups, counts = _group_rows(columns.codes('country_code')[rows], country_labels)
+        goldstein_sums = _group_sums(groups, columns.column('goldstein')[rows], len(countries))
+        tone_sums = _group_sums(groups, columns.avg_tone_or_zero(rows), len(countries))
+        article_sums = _group_sums(groups, columns.column('num_articles')[rows], len(countries))
         
-        if country not in country_stats:
+        for i, country in enumerate(countries):
+            count = int(counts[i])
             country_stats[country] = {
-                'count': 0,
-                'avg_goldstein': 0.0,
-                'avg_tone': 0.0,
-                'total_articles': 0,
+                'count': count,
+                'avg_goldstein': round(goldstein_sums[i] / count, 2),
+                'avg_tone': round(tone_sums[i] / count, 2),
+                'total_articles': article_sums[i],
                 'categories': {}
             }
         
-        stats = country_stats[country]
-        stats['count'] += 1
-        stats['avg_goldstein'] += event.get('goldstein_scale', 0)
-        stats['avg_tone'] += event.get('avg_tone', 0) or 0
-        stats['total_articles'] += event.get('num_articles', 0)
-        
-        category = event.get('category', 'Unknown')
-        stats['categories'][category] = stats['categories'].get(category, 0) + 1
-    
-    # 평균 계산
-    for country in country_stats:
-        stats = country_stats[country]
-        if stats['count'] > 0:
-            stats['avg_goldstein'] = round(stats['avg_goldstein'] / stats['count'], 2)
-            stats['avg_tone'] = round(stats['avg_tone'] / stats['count'], 2)
+        # 국가별 카테고리 분포
+        category_vocab = columns.vocab('category')
+        category_codes = columns.codes('category')[rows]
+        for group, code, count in _pair_counts(groups, category_codes, len(category_vocab)):
+            country_stats[countries[group]]['categories'][category_vocab[code]] = count
     
     # 정렬 (이벤트 수 기준)
     sorted_stats = dict(sorted(
@@ -858,7 +1108,7 @@ def get_stats_by_country(
     return {
         'stats': sorted_stats,
         'total_countries': len(sorted_stats),
-        'total_events': len(events),
+        'total_events': len(rows),
         'last_updated': datetime.now().isoformat()
     }
 
@@ -883,39 +1133,34 @@ def get_stats_by_category(
     if not latest_file:
         return {'error': 'No GDELT data file found', 'stats': {}}
     
-    events = parse_gdelt_events(latest_file, goldstein_threshold, max_alerts)
+    columns, rows = _select_events(latest_file, goldstein_threshold, max_alerts)
     
     category_stats = {}
-    for event in events:
-        category = event.get('category', 'Unknown')
+    if columns is not None and len(rows):
+        categories, groups, counts = _group_rows(columns.codes('category')[rows], columns.vocab('category'))
+        goldstein_sums = _group_sums(groups, columns.column('goldstein')[rows], len(categories))
+        tone_sums = _group_sums(groups, columns.avg_tone_or_zero(rows), len(categories))
+        article_sums = _group_sums(groups, columns.column('num_articles')[rows], len(categories))
         
-        if category not in category_stats:
+        for i, category in enumerate(categories):
+            count = int(counts[i])
             category_stats[category] = {
-                'count': 0,
-                'avg_goldstein': 0.0,
-                'avg_tone': 0.0,
-                'total_articles': 0,
-                'countries': set()
+                'count': count,
+                'avg_goldstein': round(goldstein_sums[i] / count, 2),
+                'avg_tone': round(tone_sums[i] / count, 2),
+                'total_articles': article_sums[i],
+                'countries': []
             }
         
-        stats = category_stats[category]
-        stats['count'] += 1
-        stats['avg_goldstein'] += event.get('goldstein_scale', 0)
-        stats['avg_tone'] += event.get('avg_tone', 0) or 0
-        stats['total_articles'] += event.get('num_articles', 0)
+        # 카테고리별 국가 목록 (빈 국가 코드 제외, 첫 등장 순서)
+        country_vocab = columns.vocab('country_code')
+        country_codes = columns.codes('country_code')[rows]
+        known = np.array([bool(code) for code in country_vocab], dtype=np.bool_)[country_codes]
+        for group, code, _ in _pair_counts(groups[known], country_codes[known], len(country_vocab)):
+            category_stats[categories[group]]['countries'].append(country_vocab[code])
         
-        country = event.get('country_code', '')
-        if country:
-            stats['countries'].add(country)
-    
-    # 평균 계산 및 set을 list로 변환
-    for category in category_stats:
-        stats = category_stats[category]
-        if stats['count'] > 0:
-            stats['avg_goldstein'] = round(stats['avg_goldstein'] / stats['count'], 2)
-            stats['avg_tone'] = round(stats['avg_tone'] / stats['count'], 2)
-        stats['countries'] = list(stats['countries'])
-        stats['num_countries'] = len(stats['countries'])
+        for stats in category_stats.values():
+            stats['num_countries'] = len(stats['countries'])
     
     # 정렬 (이벤트 수 기준)
     sorted_stats = dict(sorted(
@@ -927,7 +1172,7 @@ def get_stats_by_category(
     return {
         'stats': sorted_stats,
         'total_categories': len(sorted_stats),
-        'total_events': len(events),
+        'total_events': len(rows),
         'last_updated': datetime.now().isoformat()
     }
 
@@ -972,29 +1217,20 @@ def get_trends(
         file_path = find_gdelt_file_by_date(date_str, base_path)
         
         if file_path:
-            events = parse_gdelt_events(file_path, goldstein_threshold, 10000)
+            columns, rows = _select_events(file_path, goldstein_threshold, 10000)
             
-            if events:
+            if len(rows):
+                count = len(rows)
+                categories, _, counts = _group_rows(columns.codes('category')[rows], columns.vocab('category'))
                 daily_stats[date_str] = {
                     'date': current_date.strftime('%Y-%m-%d'),
-                    'count': len(events),
-                    'avg_goldstein': round(
-                        sum(e.get('goldstein_scale', 0) for e in events) / len(events),
-                        2
-                    ),
-                    'avg_tone': round(
-                        sum(e.get('avg_tone', 0) or 0 for e in events) / len(events),
-                        2
-                    ),
-                    'total_articles': sum(e.get('num_articles', 0) for e in events),
-                    'categories': {}
+                    'count': count,
+                    'avg_goldstein': round(sum(columns.column('goldstein')[rows].tolist()) / count, 2),
+                    'avg_tone': round(sum(columns.avg_tone_or_zero(rows).tolist()) / count, 2),
+                    'total_articles': int(columns.column('num_articles')[rows].sum()),
+                    # 카테고리별 분포
+                    'categories': dict(zip(categories, counts.tolist()))
                 }
-                
-                # 카테고리별 분포
-                for event in events:
-                    cat = event.get('category', 'Unknown')
-                    daily_stats[date_str]['categories'][cat] = \
-                        daily_stats[date_str]['categories'].get(cat, 0) + 1
         
         current_date += timedelta(days=1)
     
@@ -1054,7 +1290,8 @@ def get_cached_alerts(
     country: Optional[str] = None,
     category: Optional[str] = None,
     min_articles: Optional[int] = None,
-    sort_by: str = 'date'
+    sort_by: str = 'date',
+    event_roots: Optional[List[str]] = None
 ) -> Dict:
     """
     캐싱을 사용하는 get_critical_alerts 래퍼 함수
@@ -1066,7 +1303,8 @@ def get_cached_alerts(
         country=country,
         category=category,
         min_articles=min_articles,
-        sort_by=sort_by
+        sort_by=sort_by,
+        event_roots=','.join(sorted(_normalize_event_roots(event_roots))) if event_roots else None
     )
     
     if _is_cache_valid(cache_key):
@@ -1081,7 +1319,8 @@ def get_cached_alerts(
         country=country,
         category=category,
         min_articles=min_articles,
-        sort_by=sort_by
+        sort_by=sort_by,
+        event_roots=event_roots
     )
     
     _cache[cache_key] = result
@@ -0,0 +1,254 @@
+"""
+GDELT 이벤트 컬럼 저장 (다운로드 시 1회 변환, 조회 시 메모리 맵)
+- 15분 export (61개 컬럼 TSV) 에서 알림/통계 경로가 쓰는 필드만 타입별 배열로 보관
+- 임계값과 무관하게 버려지는 행(컬럼 수 부족, GoldsteinScale/위경도 없음)은 저장하지 않음, 나머지는 파일 순서 유지
+- 문자열 컬럼은 사전 인코딩 (행별 int32 코드 + UTF-8 어휘 blob/offsets) → 국가/카테고리 집계를 코드 배열로 처리
+- 저장 형식: <export 파일명>.cols/ 디렉토리에 columns.bin (컬럼별 8바이트 정렬 구간) + meta.json (버전, 레이아웃)
+  → 조회 시 파일 1개만 np.memmap 으로 매핑하고 컬럼은 그 위의 view (컬럼 수만큼 파일을 열지 않음)
+- 이벤트 dict 는 응답에 실릴 행에 대해서만 만듦 (EventColumns.to_events)
+"""
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_VERSION = 2
+COLUMNAR_SUFFIX = ".cols"
+DATA_FILE = "columns.bin"
+ALIGNMENT = 8  # 컬럼 시작 위치 정렬 (바이트)
+
+# 숫자 컬럼 (dtype) - *_valid 는 원본 값이 비어 있었는지 (None 복원용)
+NUMERIC_COLUMNS = {
+    "goldstein": np.float64,
+    "lat": np.float64,
+    "lng": np.float64,
+    "avg_tone": np.float64,
+    "avg_tone_valid": np.bool_,
+    "quad_class": np.int64,
+    "quad_class_valid": np.bool_,
+    "num_articles": np.int64,
+    "num_mentions": np.int64,
+    "num_sources": np.int64,
+}
+
+# 문자열 컬럼 (사전 인코딩)
+STRING_COLUMNS = (
+    "event_date", "event_code", "category",
+    "actor1", "actor1_country", "actor2", "actor2_country",
+    "country_code", "location", "source_url",
+)
+
+
+def columnar_path(export_path):
+    """export 파일에 대응하는 컬럼 디렉토리 경로"""
+    export_path = Path(export_path)
+    return export_path.with_name(export_path.name + COLUMNAR_SUFFIX)
+
+
+def _encode_strings(values):
+    """문자열 목록 → (행별 코드, 어휘 offsets, 어휘 UTF-8 blob)"""
+    # dict.fromkeys: 처음 나온 순서의 어휘 → 코드 조회는 dict.__getitem__ 을 map 으로 (행별 Python 함수 호출 없음)
+    vocab = {value: code for code, value in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(map(vocab.__getitem__, values), dtype=np.int32, count=len(values))
+    encoded = [v.encode('utf-8') for v in vocab]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return codes, offsets, blob
+
+
+class EventColumns:
+    """
+    GDELT 이벤트 컬럼 테이블 (행 = 저장된 이벤트, 파일 순서)
+
+    Usage:
+        columns = EventColumns.from_columns(numbers, strings)   # 변환 시
+        columns = load(columnar_path(export_path))              # 조회 시 (메모리 맵)
+        rows = columns.select(goldstein_threshold=-5.0, max_events=1000)
+        events = columns.to_events(rows)
+    """
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self._vocab = {}
+
+    @classmethod
+    def from_columns(cls, numbers, strings):
+        """
+        타입 변환이 끝난 컬럼에서 생성
+
+        Args:
+            numbers: NUMERIC_COLUMNS 이름 → 배열 (*_valid 포함)
+            strings: STRING_COLUMNS 이름 → 문자열 목록
+        """
+        arrays = {name: np.asarray(numbers[name], dtype=dtype) for name, dtype in NUMERIC_COLUMNS.items()}
+        for name in STRING_COLUMNS:
+            codes, offsets, blob = _encode_strings(strings[name])
+            arrays[f"{name}.codes"] = codes
+            arrays[f"{name}.offsets"] = offsets
+            arrays[f"{name}.vocab"] = blob
+        return cls(arrays)
+
+    def __len__(self):
+        return len(self.arrays["goldstein"])
+
+    def column(self, name):
+        return self.arrays[name]
+
+    def codes(self, name):
+        """문자열 컬럼의 행별 어휘 코드"""
+        return self.arrays[f"{name}.codes"]
+
+    def vocab(self, name):
+        """문자열 컬럼의 어휘 (코드 → 문자열), 처음 쓸 때 1회 디코딩"""
+        vocab = self._vocab.get(name)
+        if vocab is None:
+            offsets = self.arrays[f"{name}.offsets"].tolist()
+            blob = self.arrays[f"{name}.vocab"].tobytes()
+            vocab = [blob[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+            self._vocab[name] = vocab
+        return vocab
+
+    def strings(self, name, rows):
+        """rows 행의 문자열 값 목록"""
+        vocab = self.vocab(name)
+        return [vocab[code] for code in self.codes(name)[rows].tolist()]
+
+    def vocab_mask(self, name, predicate, rows):
+        """rows 행에 대해 문자열 컬럼 값이 predicate 를 만족하는지 (predicate 는 어휘 항목마다 1회 호출)"""
+        vocab = self.vocab(name)
+        matches = np.fromiter((bool(predicate(value)) for value in vocab), dtype=np.bool_, count=len(vocab))
+        return matches[self.codes(name)[rows]]
+
+    def avg_tone_or_zero(self, rows):
+        """avg_tone (없으면 0) - 기존 집계의 `event.get('avg_tone', 0) or 0` 과 같은 값"""
+        return np.where(self.arrays["avg_tone_valid"][rows], self.arrays["avg_tone"][rows], 0.0)
+
+    def select(self, goldstein_threshold, max_events):
+        """GoldsteinScale 이 임계값 초과가 아닌 행을 파일 순서로 최대 max_events 개 (행 번호 배열)"""
+        rows = np.flatnonzero(~(self.arrays["goldstein"] > goldstein_threshold))
+        # 기존 파서는 1건을 추가한 뒤 개수를 확인 → max_events 가 0 이하여도 1건
+        return rows[:max(max_events, 1)]
+
+    def to_events(self, rows):
+        """rows 행을 기존 파서와 같은 형식의 이벤트 dict 목록으로 변환"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return []
+        strings = {name: self.strings(name, rows) for name in STRING_COLUMNS}
+        numbers = {name: self.arrays[name][rows].tolist() for name in NUMERIC_COLUMNS}
+
+        events = []
+        for i in range(len(rows)):
+            actor1, actor2 = strings["actor1"][i], strings["actor2"][i]
+            name_parts = [part for part in (actor1, actor2) if part]
+            lat, lng = numbers["lat"][i], numbers["lng"][i]
+            goldstein = numbers["goldstein"][i]
+            source_url = strings["source_url"][i]
+            events.append({
+                'name': ' - '.join(name_parts) if name_parts else 'Event',
+                'event_date': strings["event_date"][i],
+                'event_code': strings["event_code"][i],
+                'category': strings["category"][i],
+                'quad_class': numbers["quad_class"][i] if numbers["quad_class_valid"][i] else None,
+                'actor1': actor1,
+                'actor1_country': strings["actor1_country"][i],
+                'actor2': actor2,
+                'actor2_country': strings["actor2_country"][i],
+                'lat': lat,
+                'lng': lng,
+                'latitude': lat,
+                'longitude': lng,
+                'location': strings["location"][i],
+                'country_code': strings["country_code"][i],
+                'scale': goldstein,
+                'goldstein_scale': goldstein,
+                'avg_tone': numbers["avg_tone"][i] if numbers["avg_tone_valid"][i] else None,
+                'num_articles': numbers["num_articles"][i],
+                'num_mentions': numbers["num_mentions"][i],
+                'num_sources': numbers["num_sources"][i],
+                'url': source_url,
+                'source_url': source_url,
+            })
+        return events
+
+
+def save(columns, path, source_rows=None, source_name=None):
+    """
+    컬럼 테이블을 디렉토리로 저장 (임시 디렉토리에 쓴 뒤 이름 변경)
+
+    Returns:
+        Path: 저장된 디렉토리
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir(parents=True)
+    try:
+        layout = {}
+        offset = 0
+        with open(tmp / DATA_FILE, "wb") as f:
+            for name, array in columns.arrays.items():
+                data = np.ascontiguousarray(array).tobytes()
+                layout[name] = {"dtype": np.asarray(array).dtype.str, "offset": offset, "length": len(array)}
+                padding = -len(data) % ALIGNMENT
+                f.write(data + b"\0" * padding)
+                offset += len(data) + padding
+        meta = {
+            "version": FORMAT_VERSION,
+            "rows": len(columns),
+            "source_rows": source_rows,
+            "source": source_name,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "size": offset,
+            "layout": layout,
+        }
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        if path.exists():
+            shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            # 동시에 변환한 다른 요청이 먼저 저장한 경우 그쪽을 사용
+            if not (path / "meta.json").exists():
+                raise
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return path
+
+
+def load(path):
+    """
+    저장된 컬럼 테이블을 메모리 맵으로 읽음 (파일 1개를 매핑하고 컬럼은 그 위의 view)
+
+    Returns:
+        EventColumns 또는 None (없거나, 형식 버전이 다르거나, 데이터 파일 크기가 맞지 않으면)
+    """
+    path = Path(path)
+    try:
+        with open(path / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        size = (path / DATA_FILE).stat().st_size
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != FORMAT_VERSION or size != meta.get("size"):
+        return None
+
+    # 0 바이트 파일은 메모리 맵 불가 (모든 컬럼이 빈 경우)
+    data = np.memmap(path / DATA_FILE, dtype=np.uint8, mode='r') if size else np.empty(0, dtype=np.uint8)
+    arrays = {}
+    for name, entry in meta["layout"].items():
+        dtype = np.dtype(entry["dtype"])
+        start = entry["offset"]
+        arrays[name] = data[start:start + entry["length"] * dtype.itemsize].view(dtype)
+    return EventColumns(arrays)
@@ -146,6 +146,7 @@ if __name__ == '__main__':
     print(f"  GDELT auto-update: Every 15 minutes")
     print(f"  News Intelligence: Every 1 hour")
     print(f"  KCCI: Every Monday at 14:30 KST (05:30 UTC)")
+    print(f"  BOK market prefetch: Weekdays 09:10/16:10 KST, daily 08:10 KST, on startup")
     print()
     print("=" * 60)
 
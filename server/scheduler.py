@@ -6,14 +6,18 @@ Jobs:
 - GDELT 데이터 업데이트 (15분마다)
 - News Intelligence 수집 (1시간마다)
 - KCCI 수집 (매주 월요일 14:30 KST)
+- BOK 통계표/항목 카탈로그 갱신 (매일 03:00 KST)
+- BOK 시장 지수 프리페치 (일별: 평일 09:10/16:10 KST, 월/분기/연: 매일 08:10 KST, 서버 시작 시 1회)
 """
 
 import logging
 import threading
 import time
+from datetime import datetime, timedelta
 
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 
 from extensions import scheduler
 from config import (
@@ -21,7 +25,19 @@ from config import (
     NEWS_INTELLIGENCE_INTERVAL_HOURS,
     KCCI_COLLECTION_DAY,
     KCCI_COLLECTION_HOUR_UTC,
-    KCCI_COLLECTION_MINUTE
+    KCCI_COLLECTION_MINUTE,
+    BOK_CATALOG_REFRESH_HOUR_UTC,
+    BOK_CATALOG_REFRESH_MINUTE,
+    MARKET_PREFETCH_ENABLED,
+    MARKET_PREFETCH_HOT_SET,
+    MARKET_PREFETCH_DAILY_DAY_OF_WEEK,
+    MARKET_PREFETCH_DAILY_HOURS_UTC,
+    MARKET_PREFETCH_DAILY_MINUTE,
+    MARKET_PREFETCH_DAILY_TTL_HOURS,
+    MARKET_PREFETCH_PERIODIC_HOUR_UTC,
+    MARKET_PREFETCH_PERIODIC_MINUTE,
+    MARKET_PREFETCH_PERIODIC_TTL_HOURS,
+    MARKET_PREFETCH_WARMUP_DELAY_SECONDS
 )
 
 logger = logging.getLogger(__name__)
@@ -176,6 +192,52 @@ def update_kcci_job():
         logger.error(f"Error in KCCI collection job: {e}", exc_info=True)
 
 
+# ============================================================
+# BOK Catalog Job
+# ============================================================
+
+def refresh_bok_catalog_job():
+    """매일 03:00 KST에 실행되는 BOK 통계표/항목 카탈로그 갱신 작업"""
+    try:
+        import bok_backend
+        
+        logger.info("Starting BOK catalog refresh...")
+        result = bok_backend.refresh_catalog()
+        if result.get('error'):
+            logger.info(f"BOK catalog refresh skipped: {result['error']}")
+        elif result.get('errors'):
+            logger.warning(f"BOK catalog refresh finished with {len(result['errors'])} errors: {result['errors'][:3]}")
+    except Exception as e:
+        logger.error(f"Error in BOK catalog refresh job: {e}", exc_info=True)
+
+
+# ============================================================
+# BOK Market Prefetch Job
+# ============================================================
+
+def prefetch_market_job(cycles=None, ttl_hours=MARKET_PREFETCH_DAILY_TTL_HOURS, reason='scheduled'):
+    """ECOS 공표 직후 자주 조회되는 시장 지수 시리즈를 미리 조회해 캐시를 채우고 시장 스냅샷을 갱신하는 작업"""
+    try:
+        import bok_prefetch
+        
+        logger.info(f"Starting BOK market prefetch ({reason}, cycles={cycles or 'all'})...")
+        result = bok_prefetch.run_prefetch(
+            MARKET_PREFETCH_HOT_SET,
+            cycles=cycles,
+            ttl_seconds=ttl_hours * 3600,
+            reason=reason
+        )
+        if result.get('errors'):
+            logger.warning(f"BOK market prefetch finished with {len(result['errors'])} errors: {result['errors'][:3]}")
+        
+        # 시장 스냅샷 조회 계획 전체도 같은 긴 TTL 로 예열하고 스냅샷 갱신 (바뀐 시리즈만 재계산)
+        # → 5분 TTL 재확인은 백그라운드에서 캐시만 읽어 재구성
+        import bok_snapshot
+        bok_snapshot.refresh_snapshot(prefetch_ttl=ttl_hours * 3600)
+    except Exception as e:
+        logger.error(f"Error in BOK market prefetch job: {e}", exc_info=True)
+
+
 # ============================================================
 # Scheduler Initialization
 # ============================================================
@@ -214,10 +276,63 @@ def init_scheduler():
         replace_existing=True
     )
     
+    # BOK 카탈로그: 매일 03:00 KST (18:00 UTC)에 실행
+    scheduler.add_job(
+        func=refresh_bok_catalog_job,
+        trigger=CronTrigger(
+            hour=BOK_CATALOG_REFRESH_HOUR_UTC,
+            minute=BOK_CATALOG_REFRESH_MINUTE
+        ),
+        id='bok_catalog_refresh_job',
+        name='Refresh BOK statistical-code catalog daily at 03:00 KST',
+        replace_existing=True
+    )
+    
+    if MARKET_PREFETCH_ENABLED:
+        # BOK 일별 시리즈 예열: 평일 09:10, 16:10 KST (00:10, 07:10 UTC)
+        scheduler.add_job(
+            func=prefetch_market_job,
+            trigger=CronTrigger(
+                day_of_week=MARKET_PREFETCH_DAILY_DAY_OF_WEEK,
+                hour=MARKET_PREFETCH_DAILY_HOURS_UTC,
+                minute=MARKET_PREFETCH_DAILY_MINUTE
+            ),
+            kwargs={'cycles': ['D'], 'ttl_hours': MARKET_PREFETCH_DAILY_TTL_HOURS},
+            id='bok_market_prefetch_daily_job',
+            name='Prefetch daily BOK market series on weekdays at 09:10/16:10 KST',
+            replace_existing=True
+        )
+        
+        # BOK 월/분기/연 시리즈 예열: 매일 08:10 KST (23:10 UTC)
+        scheduler.add_job(
+            func=prefetch_market_job,
+            trigger=CronTrigger(
+                hour=MARKET_PREFETCH_PERIODIC_HOUR_UTC,
+                minute=MARKET_PREFETCH_PERIODIC_MINUTE
+            ),
+            kwargs={'cycles': ['M', 'Q', 'A'], 'ttl_hours': MARKET_PREFETCH_PERIODIC_TTL_HOURS},
+            id='bok_market_prefetch_periodic_job',
+            name='Prefetch monthly/quarterly/annual BOK market series daily at 08:10 KST',
+            replace_existing=True
+        )
+        
+        # 서버 시작 예열: 스케줄러 스레드에서 1회 실행 (앱 시작을 막지 않음)
+        scheduler.add_job(
+            func=prefetch_market_job,
+            trigger=DateTrigger(run_date=datetime.now() + timedelta(seconds=MARKET_PREFETCH_WARMUP_DELAY_SECONDS)),
+            kwargs={'reason': 'startup'},
+            id='bok_market_prefetch_warmup_job',
+            name='Warm BOK market series cache after startup',
+            replace_existing=True
+        )
+    
     # 스케줄러 시작
     scheduler.start()
     
-    logger.info("Scheduler initialized with jobs: GDELT (15min), News (1hr), KCCI (Mon 14:30 KST)")
+    logger.info("Scheduler initialized with jobs: GDELT (15min), News (1hr), KCCI (Mon 14:30 KST), "
+                "BOK catalog (daily 03:00 KST)"
+                + (", BOK market prefetch (weekdays 09:10/16:10 KST, daily 08:10 KST, startup)"
+                   if MARKET_PREFETCH_ENABLED else ""))
 
 
 def run_initial_jobs():
@@ -0,0 +1,59 @@
+"""
+Integration Tests for Legacy Exchange Rates API
+Tests that concurrent identical /api/exchange-rates requests share one upstream call
+"""
+import pytest
+import threading
+from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.mark.integration
+class TestExchangeRatesAPI:
+    """Tests for /api/exchange-rates"""
+
+    def test_concurrent_requests_coalesced(self, app, monkeypatch):
+        import bok_backend
+
+        flight = bok_backend.SingleFlight()
+        monkeypatch.setattr(bok_backend, '_singleflight', flight)
+        calls = []
+        entered, release = threading.Event(), threading.Event()
+
+        def slow_get(url, timeout=None):
+            calls.append(url)
+            entered.set()
+            release.wait(5)
+            response = MagicMock()
+            response.json.return_value = {"StatisticSearch": {"list_total_count": 1,
+                                                              "row": [{"TIME": "20240102", "DATA_VALUE": "1300.5"}]}}
+            return response
+
+        statuses, bodies = [], []
+
+        def request():
+            response = app.test_client().get('/api/exchange-rates?itemCode=0000001&startDate=20240101&endDate=20240131')
+            statuses.append(response.status_code)
+            bodies.append(response.get_json())
+
+        with patch('bok.api.requests.get', slow_get):
+            leader = threading.Thread(target=request)
+            leader.start()
+            assert entered.wait(5)
+            waiters = [threading.Thread(target=request) for _ in range(4)]
+            for t in waiters:
+                t.start()
+            while flight.get_stats()["coalesced"] < 4:
+                threading.Event().wait(0.01)
+            release.set()
+            for t in [leader] + waiters:
+                t.join(5)
+
+        assert len(calls) == 1
+        assert statuses == [200] * 5
+        assert all(body == bodies[0] for body in bodies)
+        assert flight.get_stats()["coalesced_by_namespace"] == {"ExchangeRates": 4}
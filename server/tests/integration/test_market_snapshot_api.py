@@ -0,0 +1,42 @@
+"""
+Integration Tests for Market Snapshot API
+Tests for /api/market/snapshot ETag handling
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.mark.integration
+class TestMarketSnapshotAPI:
+    """Tests for /api/market/snapshot"""
+
+    def test_etag_revalidation(self, client, monkeypatch):
+        import bok_backend
+        import bok_snapshot
+
+        monkeypatch.setattr(bok_backend, 'BOK_MAPPING', {"money": bok_backend.BOK_MAPPING["money"]})
+        monkeypatch.setattr(bok_backend, '_observation_store', None)
+        monkeypatch.setattr(bok_snapshot, '_snapshot', bok_snapshot.MarketSnapshot())
+
+        def fake_get(url, timeout=None):
+            response = MagicMock()
+            response.json.return_value = {"StatisticSearch": {"list_total_count": 2, "row": [
+                {"TIME": "202401", "DATA_VALUE": "100.0"}, {"TIME": "202402", "DATA_VALUE": "101.0"}]}}
+            return response
+
+        with patch.object(bok_backend.requests, 'get', fake_get):
+            response = client.get('/api/market/snapshot')
+            etag = response.headers['ETag']
+            revalidated = client.get('/api/market/snapshot?refresh=true', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.get_json()["categories"]["money"]["items"]["M2"]["current"] == 101.0
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == etag
+        bok_backend.clear_api_cache()
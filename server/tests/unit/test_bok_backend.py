@@ -204,6 +204,70 @@ class TestAPICache:
         assert cache.get('key_2_9') == 'value_2_9'
 
 
+class TestAPICacheBudget:
+    """Tests for APICache LRU eviction, byte budget and namespace stats"""
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test least recently used entry is evicted first"""
+        from bok_backend import APICache
+
+        cache = APICache(max_entries=2)
+        cache.set('StatisticSearch:a', 1)
+        cache.set('StatisticSearch:b', 2)
+        cache.get('StatisticSearch:a')
+        cache.set('StatisticSearch:c', 3)
+
+        assert cache.get('StatisticSearch:b') is None
+        assert cache.get('StatisticSearch:a') == 1
+        assert cache.get_stats()['namespaces']['StatisticSearch']['evictions'] == 1
+
+    def test_byte_budget(self):
+        """Test entries are evicted to stay under the byte budget"""
+        from bok_backend import APICache
+
+        cache = APICache(max_bytes=250)
+        for i in range(5):
+            cache.set(f'k:{i}', 'x' * 98)
+
+        stats = cache.get_stats()
+        assert stats['total'] == 2
+        assert stats['bytes'] <= 250
+        assert cache.get('k:4') is not None
+
+        cache.set('k:big', 'x' * 1000)
+        assert cache.get('k:big') is None
+
+    def test_expired_entries_swept_without_access(self):
+        """Test expired entries are removed on later writes even if never read again"""
+        from bok_backend import APICache
+
+        now = [1000.0]
+        cache = APICache(clock=lambda: now[0])
+        cache.set('StatisticItemList:a', 'a', ttl=10)
+        cache.set('StatisticItemList:b', 'b', ttl=100)
+        now[0] += 50
+        cache.set('StatisticSearch:c', 'c', ttl=10)
+
+        assert 'StatisticItemList:a' not in cache.cache
+        assert cache.get('StatisticItemList:b') == 'b'
+        stats = cache.get_stats()
+        assert stats['namespaces']['StatisticItemList'] == {'hits': 1, 'misses': 0, 'evictions': 0, 'expirations': 1}
+
+    def test_overwrite_keeps_accounting(self):
+        """Test overwriting a key replaces its size and expiry"""
+        from bok_backend import APICache
+
+        now = [0.0]
+        cache = APICache(clock=lambda: now[0])
+        cache.set('k:a', 'x' * 10, ttl=5)
+        cache.set('k:a', 'x' * 20, ttl=50)
+        now[0] += 10
+        cache.cleanup_expired()
+
+        assert cache.get('k:a') == 'x' * 20
+        assert cache.get_stats()['bytes'] == 22
+
+
 class TestBOKDataParsing:
     """Tests for BOK API data parsing functions"""
     
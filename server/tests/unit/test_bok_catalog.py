@@ -0,0 +1,260 @@
+"""
+Unit Tests for ECOS Statistical-Code Catalog
+Tests for the n-gram index, catalog persistence and offline search-codes / item-list lookups
+"""
+import pytest
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+FIXTURE_PATH = Path(__file__).parent.parent / 'fixtures' / 'ecos_catalog.json'
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class RecordedECOS:
+    """tests/fixtures/ecos_catalog.json 의 응답을 페이지 단위로 돌려주는 가짜 ECOS"""
+
+    def __init__(self, fail_english=False):
+        with open(FIXTURE_PATH, encoding='utf-8') as f:
+            self.fixture = json.load(f)
+        self.fail_english = fail_english
+        self.calls = []
+
+    def __call__(self, url, timeout=None, allow_redirects=True):
+        parts = url.rstrip('/').split('/')
+        api = parts.index('api')
+        service, lang, start, end = parts[api + 1], parts[api + 4], int(parts[api + 5]), int(parts[api + 6])
+        self.calls.append((service, lang, parts[api + 7] if len(parts) > api + 7 else None))
+        if lang == 'en' and self.fail_english:
+            return FakeResponse({"RESULT": {"CODE": "ERROR-500", "MESSAGE": "server error"}})
+        if service == 'StatisticTableList':
+            recorded = self.fixture['StatisticTableList'][lang]
+        else:
+            stat_code = parts[api + 7]
+            if stat_code not in self.fixture['StatisticItemList']:
+                return FakeResponse({"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}})
+            recorded = self.fixture['StatisticItemList'][stat_code][lang]
+        block = recorded[service]
+        return FakeResponse({service: {"list_total_count": block['list_total_count'],
+                                       "row": block['row'][start - 1:end]}})
+
+
+def _offline(*args, **kwargs):
+    raise AssertionError("network access during catalog lookup")
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    import bok_backend
+    import bok_catalog
+
+    monkeypatch.setattr(bok_backend, '_stat_catalog', bok_catalog.StatCatalog(tmp_path / 'catalog.db'))
+    monkeypatch.setattr(bok_backend, '_rate_limiter', bok_backend.TokenBucketLimiter(rate=1000, capacity=100))
+    monkeypatch.setattr(bok_backend, '_singleflight', bok_backend.SingleFlight())
+    # 페이지 경계도 확인하도록 작은 페이지 크기 사용
+    monkeypatch.setattr(bok_backend, 'CATALOG_PAGE_SIZE', 10)
+    return bok_backend
+
+
+class TestNgramIndex:
+    """Tests for NgramIndex matching and ranking"""
+
+    def test_rank_order_is_exact_prefix_word_substring(self):
+        from bok_catalog import NgramIndex
+
+        index = NgramIndex()
+        index.add("국제 주요국 소비자물가지수")   # 0: 단어 접두
+        index.add("소비자물가지수")               # 1: 완전 일치
+        index.add("근원 생산자물가지수")          # 2: 불일치
+        index.add("소비자물가지수(특수분류)")     # 3: 접두
+        index.add("4.3.1.소비자물가지수")         # 4: 부분 일치
+
+        assert index.search("소비자물가지수") == [1, 3, 0, 4]
+
+    def test_ties_keep_catalog_order(self):
+        from bok_catalog import NgramIndex
+
+        index = NgramIndex()
+        for name in ("원/유로", "원/미국달러", "원/유로"):
+            index.add(name)
+
+        assert index.search("유로") == [0, 2]
+        assert index.search("") == [0, 1, 2]
+
+    def test_whitespace_and_case_insensitive(self):
+        from bok_catalog import NgramIndex
+
+        index = NgramIndex()
+        index.add("소비자물가지수", "Consumer Price Indices")
+
+        assert index.search("소비자 물가") == [0]
+        assert index.search("CONSUMER price") == [0]
+        assert index.search("가") == [0]
+        assert index.search("물가 수지") == []
+
+    def test_array_scan_matches_candidate_ranking(self):
+        """Test the NumPy scan used for broad queries ranks exactly like the per-candidate path"""
+        import random
+        from bok_catalog import NgramIndex
+
+        with open(FIXTURE_PATH, encoding='utf-8') as f:
+            fixture = json.load(f)
+        rows = fixture['StatisticTableList']['kr']['StatisticTableList']['row']
+        rows_en = fixture['StatisticTableList']['en']['StatisticTableList']['row']
+        names = [(r['STAT_NAME'], e['STAT_NAME']) for r, e in zip(rows, rows_en)] * 4
+
+        rng = random.Random(0)
+        queries = ["지수", "수", "e", "exchange", "주요국 통", "9.1", "a b", "4.1.1.1.생산자물가지수(기본분류)"]
+        for _ in range(30):
+            text = rng.choice(rng.choice(names))
+            start = rng.randrange(len(text))
+            queries.append(text[start:start + rng.randint(1, 6)])
+
+        scan, by_candidates = NgramIndex(), NgramIndex()
+        scan.SCAN_THRESHOLD, by_candidates.SCAN_THRESHOLD = -1, 10 ** 9
+        for kr, en in names:
+            scan.add(kr, en)
+            by_candidates.add(kr, en)
+
+        for q in queries:
+            # 타이핑 순서대로 (직전 질의 결과 재사용 경로 포함)
+            for n in range(1, len(q) + 1):
+                assert scan.search(q[:n]) == by_candidates.search(q[:n]), q[:n]
+
+
+class TestCatalogSearch:
+    """Tests for search_statistical_codes served from the catalog"""
+
+    def test_first_search_loads_catalog_then_stays_offline(self, backend):
+        fake = RecordedECOS()
+        with patch.object(backend.requests, 'get', fake):
+            result = backend.search_statistical_codes(stat_name="소비자물가")
+        # 25개 통계표 / 페이지 10 → 한글 3회 + 영문 3회
+        assert len(fake.calls) == 6
+
+        assert [r['STAT_CODE'] for r in result['row']] == ['901Y009', '901Y010', '902Y008']
+        assert result['catalog']['source'] == 'local'
+        assert result['catalog']['refreshed_at']
+
+        with patch.object(backend.requests, 'get', _offline):
+            english = backend.search_statistical_codes(stat_name="consumer price")
+            by_code = backend.search_statistical_codes(stat_code="731y")
+            typeahead = backend.search_statistical_codes(query="환율")
+
+        assert [r['STAT_CODE'] for r in english['row']] == ['901Y009', '901Y010', '902Y008']
+        assert [r['STAT_CODE'] for r in by_code['row']] == ['731Y001', '731Y002', '731Y003']
+        assert {r['STAT_CODE'] for r in typeahead['row']} == {'731Y001', '731Y002', '731Y003'}
+        assert english['row'][0]['STAT_NAME_EN'] == 'Consumer Price Indices'
+
+    def test_combined_filters_and_paging(self, backend):
+        with patch.object(backend.requests, 'get', RecordedECOS()):
+            result = backend.search_statistical_codes(stat_code="902Y", stat_name="국제", start_index=2, end_index=3)
+
+        assert result['list_total_count'] == 6
+        assert len(result['row']) == 2
+        assert all(r['STAT_CODE'].startswith('902Y') for r in result['row'])
+
+    def test_catalog_persists_across_instances(self, backend, tmp_path, monkeypatch):
+        import bok_catalog
+
+        with patch.object(backend.requests, 'get', RecordedECOS()):
+            before = backend.search_statistical_codes(query="gdp")
+
+        monkeypatch.setattr(backend, '_stat_catalog', bok_catalog.StatCatalog(tmp_path / 'catalog.db'))
+        with patch.object(backend.requests, 'get', _offline):
+            after = backend.search_statistical_codes(query="gdp")
+
+        assert after == before
+        assert [r['STAT_CODE'] for r in after['row']] == ['902Y016']
+
+    def test_ecos_error_falls_back_without_caching_catalog(self, backend):
+        def broken(url, timeout=None, allow_redirects=True):
+            return FakeResponse({"RESULT": {"CODE": "ERROR-100", "MESSAGE": "인증키가 유효하지 않습니다."}})
+
+        with patch.object(backend.requests, 'get', broken):
+            result = backend.search_statistical_codes(stat_name="환율")
+
+        assert result['result_code'] == 'ERROR-100'
+        assert not backend._stat_catalog.has_tables()
+
+
+class TestCatalogItems:
+    """Tests for get_statistic_item_list served from the catalog"""
+
+    def test_item_list_fetched_once_per_table(self, backend):
+        fake = RecordedECOS()
+        with patch.object(backend.requests, 'get', fake):
+            first = backend.get_statistic_item_list("731Y001", start_index=1, end_index=5)
+        assert [c[0] for c in fake.calls] == ['StatisticItemList'] * 4
+
+        with patch.object(backend.requests, 'get', _offline):
+            full = backend.get_statistic_item_list("731Y001", start_index=1, end_index=300)
+            euro = backend.get_statistic_item_list("731Y001", item_name="euro")
+
+        assert first['list_total_count'] == 11
+        assert len(first['row']) == 5
+        assert [r['ITEM_CODE'] for r in full['row']][:3] == ['0000001', '0000002', '0000003']
+        assert [r['ITEM_NAME'] for r in euro['row']] == ['원/유로']
+
+    def test_unknown_table_is_cached_as_empty(self, backend):
+        with patch.object(backend.requests, 'get', RecordedECOS()):
+            result = backend.get_statistic_item_list("999Y999")
+
+        assert result['list_total_count'] == 0
+        assert result['row'] == []
+
+    def test_english_failure_keeps_korean_catalog(self, backend):
+        with patch.object(backend.requests, 'get', RecordedECOS(fail_english=True)):
+            result = backend.get_statistic_item_list("901Y009", item_name="교통")
+
+        assert [r['ITEM_CODE'] for r in result['row']] == ['G']
+        assert 'ITEM_NAME_EN' not in result['row'][0]
+
+
+class TestCatalogRefresh:
+    """Tests for scheduled refresh and explicit import/export"""
+
+    def test_refresh_updates_stored_item_lists(self, backend):
+        with patch.object(backend.requests, 'get', RecordedECOS()):
+            backend.get_statistic_item_list("901Y009")
+            fake = RecordedECOS()
+            with patch.object(backend.requests, 'get', fake):
+                result = backend.refresh_catalog()
+
+        assert result['tables'] == 25
+        assert result['item_lists'] == 1
+        assert result['errors'] == []
+        assert ('StatisticItemList', 'kr', '901Y009') in fake.calls
+        assert backend.get_cache_stats()['catalog']['item_lists'] == 1
+
+    def test_export_import_roundtrip(self, backend, tmp_path):
+        import bok_catalog
+
+        with patch.object(backend.requests, 'get', RecordedECOS()):
+            backend.get_statistic_item_list("731Y001")
+            backend.search_statistical_codes(stat_name="환율")
+        exported = backend._stat_catalog.export_json(tmp_path / 'export.json')
+
+        other = bok_catalog.StatCatalog(tmp_path / 'other.db')
+        imported = other.import_json(tmp_path / 'export.json')
+
+        assert exported == imported == {"tables": 25, "item_lists": 1}
+        assert other.refreshed_at() == backend._stat_catalog.refreshed_at()
+        assert other.search_tables(query="won") == backend._stat_catalog.search_tables(query="won")
+        assert other.item_list("731Y001", item_name="달러") == backend._stat_catalog.item_list("731Y001", item_name="달러")
@@ -0,0 +1,149 @@
+"""
+Unit Tests for BOK Market Prefetch
+Tests for hot-set expansion, cache warming and warm/cold accounting of user requests
+"""
+import pytest
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+HOT_SET = [
+    {"category": "exchange", "items": ["USD", "EUR"], "days": [7, 90]},
+    {"category": "interest", "items": ["BASE_RATE"], "cycle": "M", "months": [12]},
+]
+
+
+class CountingECOS:
+    """StatisticSearch 요청마다 고정 row 를 돌려주는 ECOS 대역 (요청 URL 기록)"""
+
+    def __init__(self, value="1300.5", fail_items=()):
+        self.urls = []
+        self.value = value
+        self.fail_items = fail_items
+
+    def __call__(self, url, timeout=None):
+        self.urls.append(url)
+        response = MagicMock()
+        if url.rstrip('/').split('/')[-1] in self.fail_items:
+            response.json.return_value = {"RESULT": {"CODE": "ERROR-100", "MESSAGE": "인증키가 유효하지 않습니다."}}
+            return response
+        rows = [{"TIME": "20240102", "DATA_VALUE": self.value}]
+        response.json.return_value = {"StatisticSearch": {"list_total_count": len(rows), "row": rows}}
+        return response
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    import bok_backend
+
+    monkeypatch.setattr(bok_backend, '_observation_store', None)
+    monkeypatch.setattr(bok_backend, '_rate_limiter', bok_backend.TokenBucketLimiter(rate=1000, capacity=100))
+    monkeypatch.setattr(bok_backend, '_singleflight', bok_backend.SingleFlight())
+    monkeypatch.setattr(bok_backend, '_served_stats', bok_backend.ServedStats())
+    bok_backend.clear_api_cache()
+    yield bok_backend
+    bok_backend.clear_api_cache()
+
+
+@pytest.fixture
+def prefetch(backend, monkeypatch):
+    import bok_prefetch
+
+    monkeypatch.setattr(bok_prefetch, '_stats', bok_prefetch.PrefetchStats())
+    return bok_prefetch
+
+
+class TestPrefetchTargets:
+    """Tests for hot-set expansion"""
+
+    def test_windows_match_frontend_dates(self, prefetch):
+        targets = prefetch.prefetch_targets(HOT_SET, today=date(2024, 3, 15))
+
+        assert [(t.category, t.item_code, t.start_date, t.end_date) for t in targets] == [
+            ("exchange", "USD", "20240308", "20240315"),
+            ("exchange", "USD", "20231216", "20240315"),
+            ("exchange", "EUR", "20240308", "20240315"),
+            ("exchange", "EUR", "20231216", "20240315"),
+            # 현재월 포함 12개월 → 11개월 전 1일
+            ("interest", "BASE_RATE", "20230401", "20240315"),
+        ]
+        assert targets[-1].cycle == "M"
+        assert targets[0].cycle is None
+
+    def test_cycle_filter_uses_category_default(self, prefetch):
+        daily = prefetch.prefetch_targets(HOT_SET, today=date(2024, 1, 31), cycles=['D'])
+        periodic = prefetch.prefetch_targets(HOT_SET, today=date(2024, 1, 31), cycles=['M', 'Q', 'A'])
+
+        assert {t.category for t in daily} == {"exchange"}
+        assert [(t.category, t.start_date) for t in periodic] == [("interest", "20230201")]
+
+
+class TestPrefetchRun:
+    """Tests for run_prefetch and warm/cold accounting"""
+
+    def test_prefetched_windows_serve_users_warm(self, prefetch):
+        import bok_backend
+
+        fake = CountingECOS()
+        today = date.today()
+        with patch.object(bok_backend.requests, 'get', fake):
+            result = prefetch.run_prefetch(HOT_SET, today=today, reason="startup")
+            assert result["targets"] == result["warmed"] == 5
+            assert result["errors"] == []
+            assert len(fake.urls) == 5
+
+            # 프론트엔드와 같은 조건의 사용자 요청은 ECOS 호출 없이 응답
+            target = prefetch.prefetch_targets(HOT_SET, today=today)[1]
+            data = bok_backend.get_market_index("exchange", target.start_date, target.end_date, item_code="USD")
+            assert data["StatisticSearch"]["row"][0]["DATA_VALUE"] == "1300.5"
+            assert len(fake.urls) == 5
+
+            # 예열되지 않은 기간은 cold
+            bok_backend.get_market_index("exchange", "20240101", "20240110", item_code="JPY")
+            assert len(fake.urls) == 6
+
+        served = bok_backend.get_cache_stats()["served"]
+        assert served["warm"] == 1
+        assert served["cold"] == 1
+        assert served["by_category"] == {"exchange": {"warm": 1, "cold": 1}}
+
+        stats = prefetch.get_stats()
+        assert stats["runs"] == 1
+        assert stats["warmed"] == 5
+        assert stats["last_run"]["reason"] == "startup"
+
+    def test_prefetch_refreshes_cached_entries_with_ttl(self, prefetch):
+        import bok_backend
+
+        targets = prefetch.prefetch_targets(HOT_SET[:1], today=date(2024, 3, 15))
+        first = targets[0]
+        with patch.object(bok_backend.requests, 'get', CountingECOS(value="1300.5")):
+            bok_backend.get_market_index("exchange", first.start_date, first.end_date, item_code="USD")
+
+        # 예열은 캐시를 건너뛰고 새 값으로 덮어씀
+        fake = CountingECOS(value="1310.0")
+        with patch.object(bok_backend.requests, 'get', fake):
+            prefetch.run_prefetch(HOT_SET[:1], today=date(2024, 3, 15), ttl_seconds=3600)
+            assert len(fake.urls) == len(targets)
+            data = bok_backend.get_market_index("exchange", first.start_date, first.end_date, item_code="USD")
+
+        assert data["StatisticSearch"]["row"][0]["DATA_VALUE"] == "1310.0"
+        assert len(fake.urls) == len(targets)
+        entry = next(e for k, e in bok_backend._api_cache.cache.items() if k.startswith("StatisticSearch"))
+        assert entry.ttl == 3600
+
+    def test_errors_are_collected_per_series(self, prefetch):
+        import bok_backend
+
+        with patch.object(bok_backend.requests, 'get', CountingECOS(fail_items=("0000003",))):
+            result = prefetch.run_prefetch(HOT_SET[:1], today=date(2024, 3, 15))
+
+        assert result["warmed"] == 2
+        assert len(result["errors"]) == 2
+        assert all(e.startswith("exchange/EUR") for e in result["errors"])
+        assert prefetch.get_stats()["failed"] == 2
+        assert bok_backend.get_cache_stats()["served"]["cold"] == 0
@@ -0,0 +1,183 @@
+"""
+Unit Tests for Market Series
+Tests that array-based statistics match the row loop and rolling indicators are correct
+"""
+import pytest
+import math
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def _legacy_values(rows, sort=False):
+    """기존 calculate_statistics 의 행 단위 파싱 (기준 구현)"""
+    from bok_series import time_sort_key
+
+    parsed = []
+    for row in rows:
+        if isinstance(row, dict):
+            date_str, value_str = row.get('TIME', ''), row.get('DATA_VALUE', '')
+        elif isinstance(row, list) and len(row) >= 2:
+            date_str, value_str = str(row[0]), str(row[1])
+        else:
+            continue
+        if not date_str or not value_str:
+            continue
+        try:
+            value = float(value_str)
+        except (ValueError, TypeError):
+            continue
+        if value > 0:
+            parsed.append((date_str, value))
+    if sort:
+        parsed.sort(key=lambda x: time_sort_key(x[0]))
+    return [v for _, v in parsed]
+
+
+def _legacy_summary(values, previous_period=False):
+    current = values[-1]
+    if previous_period:
+        previous = values[-2] if len(values) >= 2 else current
+    else:
+        previous = values[0] if len(values) > 1 else current
+    change = current - previous
+    return {
+        "currency": "USD",
+        "high": round(max(values), 2),
+        "low": round(min(values), 2),
+        "average": round(sum(values) / len(values), 2),
+        "current": round(current, 2),
+        "previous": round(previous, 2),
+        "change": round(change, 2),
+        "changePercent": round((change / previous * 100) if previous != 0 else 0, 2),
+    }
+
+
+def _random_rows(rng, count):
+    rows = []
+    value = 1300.0
+    for i in range(count):
+        value *= 1 + rng.gauss(0, 0.004)
+        rows.append({"TIME": f"{2015 + i // 250}{(i // 21) % 12 + 1:02d}{i % 21 + 1:02d}",
+                     "DATA_VALUE": f"{value:.4f}"})
+    return rows
+
+
+class TestMarketSeriesParity:
+    """MarketSeries summary matches the previous row loop"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_daily_series(self, seed):
+        from bok_backend import calculate_statistics, calculate_statistics_previous_period
+
+        rows = _random_rows(random.Random(seed), 1500)
+        data = {"StatisticSearch": {"list_total_count": len(rows), "row": rows}}
+
+        assert calculate_statistics(data, "USD") == _legacy_summary(_legacy_values(rows))
+        assert calculate_statistics_previous_period(data, "USD") == \
+            _legacy_summary(_legacy_values(rows, sort=True), previous_period=True)
+
+    def test_invalid_and_mixed_rows(self):
+        from bok_backend import calculate_statistics
+
+        rows = [
+            {"TIME": "20240105", "DATA_VALUE": "1310.5"},
+            {"TIME": "20240102", "DATA_VALUE": ""},
+            {"TIME": "", "DATA_VALUE": "1200"},
+            {"TIME": "20240103", "DATA_VALUE": "-"},
+            {"TIME": "20240104", "DATA_VALUE": "0"},
+            {"TIME": "20240106", "DATA_VALUE": "-3.5"},
+            {"TIME": "20240107", "DATA_VALUE": "nan"},
+            ["20240108", "1320.25"],
+            ["20240109", None],
+            "broken",
+            {"TIME": "20240110", "DATA_VALUE": " 1305 "},
+        ]
+        data = {"StatisticSearch": {"row": rows}}
+
+        assert calculate_statistics(data, "USD") == _legacy_summary(_legacy_values(rows))
+
+    @pytest.mark.parametrize("times", [
+        ["2024Q3", "2023Q4", "2024Q1", "2024Q2"],
+        ["202403", "202401", "202402"],
+        ["2024", "2022", "2023"],
+        ["2024Q1", "202401", "2023", "20230105"],
+    ])
+    def test_sorted_by_time_for_every_cycle(self, times):
+        from bok_series import MarketSeries, time_sort_key
+
+        rows = [{"TIME": t, "DATA_VALUE": str(10 + i)} for i, t in enumerate(times)]
+        series = MarketSeries.from_rows(rows, sort=True)
+
+        assert list(series.times) == sorted(times, key=time_sort_key)
+        assert series.values.tolist() == _legacy_values(rows, sort=True)
+
+    def test_sort_keys_match_time_sort_key(self):
+        from bok_series import _sort_keys, time_sort_key
+
+        for times in (["20240105", "20230101"], ["2024Q3", "2023Q4"], ["2024", "abcd"],
+                      [" 2024", "2023 "], ["2024Qa", "2024Q1"], ["202401", "2024X1"], ["서울12", "서울11"]):
+            assert _sort_keys(times).tolist() == [time_sort_key(t) for t in times]
+
+    def test_errors_preserved(self):
+        from bok_backend import calculate_statistics
+
+        assert calculate_statistics({"error": "x"}) == {"error": "x"}
+        assert calculate_statistics({"StatisticSearch": {"row": []}}) == {"error": "No data available"}
+        assert calculate_statistics({"StatisticSearch": {"row": [{"TIME": "2024", "DATA_VALUE": "-1"}]}}) == \
+            {"error": "No valid data values found"}
+
+
+class TestIndicators:
+    """Tests for rolling indicators"""
+
+    def test_indicators_match_python_reference(self):
+        from bok_series import MarketSeries
+
+        rows = _random_rows(random.Random(7), 300)
+        series = MarketSeries.from_rows(rows, cycle='D')
+        values = _legacy_values(rows)
+        indicators = series.indicators()
+
+        for window in (5, 20, 60):
+            assert indicators["movingAverage"][str(window)] == round(sum(values[-window:]) / window, 2)
+        returns = [(b - a) / a * 100 for a, b in zip(values, values[1:])]
+        assert indicators["volatility"]["20"] == round(statistics.stdev(returns[-20:]), 2)
+        assert indicators["percentRank"] == round(sum(v <= values[-1] for v in values) / len(values) * 100, 2)
+
+        peak, drawdowns = 0.0, []
+        for v in values:
+            peak = max(peak, v)
+            drawdowns.append((v / peak - 1) * 100)
+        assert indicators["drawdown"] == round(drawdowns[-1], 2)
+        assert indicators["maxDrawdown"] == round(min(drawdowns), 2)
+
+    def test_short_series_returns_none_for_long_windows(self):
+        from bok_series import MarketSeries
+
+        rows = [{"TIME": f"2024{m:02d}", "DATA_VALUE": str(100 + m)} for m in range(1, 5)]
+        indicators = MarketSeries.from_rows(rows, cycle='M').indicators()
+
+        assert indicators["movingAverage"] == {"3": 103.0, "6": None, "12": None}
+        assert indicators["volatility"] == {"12": None}
+        assert indicators["drawdown"] == 0.0
+
+    def test_multi_item_stats(self):
+        from bok_backend import calculate_statistics, calculate_statistics_multi
+
+        rng = random.Random(3)
+        results = {key: {"name": key, "data": {"StatisticSearch": {"row": _random_rows(rng, 100)}}}
+                   for key in ("USD", "EUR")}
+        results["JPY"] = {"name": "JPY", "data": {"error": "HTTP Error 500"}}
+
+        stats = calculate_statistics_multi(results, cycle='D', indicators=True)
+
+        assert list(stats) == ["USD", "EUR", "JPY"]
+        expected = calculate_statistics(results["USD"]["data"], currency_code="USD")
+        assert {k: v for k, v in stats["USD"]["stats"].items() if k != "indicators"} == expected
+        assert not math.isnan(stats["EUR"]["stats"]["indicators"]["volatility"]["20"])
+        assert stats["JPY"]["stats"] == {"error": "HTTP Error 500"}
@@ -0,0 +1,203 @@
+"""
+Unit Tests for Market Snapshot
+Tests for the shared fetch plan, snapshot payloads and incremental ETag-stable rebuilds
+"""
+import pytest
+import json
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class SeriesECOS:
+    """항목 코드별 관측값을 돌려주는 ECOS 대역 (series 를 바꿔 신규 관측값 공표를 흉내)"""
+
+    def __init__(self):
+        self.calls = []
+        self.series = {
+            "0000001": [("20240311", "1320.5"), ("20240312", "1318.0"), ("20240313", "1325.0")],
+            "0000003": [("20240312", "1440.0"), ("20240313", "1445.5")],
+        }
+
+    def __call__(self, url, timeout=None):
+        item_code = url.rstrip('/').split('/')[-1]
+        self.calls.append(item_code)
+        observations = self.series.get(item_code, [("202401", "100.0"), ("202402", "101.0")])
+        rows = [{"TIME": t, "DATA_VALUE": v} for t, v in observations]
+        response = MagicMock()
+        response.json.return_value = {"StatisticSearch": {"list_total_count": len(rows), "row": rows}}
+        return response
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    import bok_backend
+
+    mapping = bok_backend.BOK_MAPPING
+    monkeypatch.setattr(bok_backend, 'BOK_MAPPING', {
+        "exchange": {**mapping["exchange"], "items": {k: mapping["exchange"]["items"][k] for k in ("USD", "EUR")}},
+        "money": mapping["money"],
+    })
+    monkeypatch.setattr(bok_backend, '_observation_store', None)
+    monkeypatch.setattr(bok_backend, '_rate_limiter', bok_backend.TokenBucketLimiter(rate=1000, capacity=100))
+    monkeypatch.setattr(bok_backend, '_singleflight', bok_backend.SingleFlight())
+    bok_backend.clear_api_cache()
+    yield bok_backend
+    bok_backend.clear_api_cache()
+
+
+class TestSnapshotPlan:
+    """Tests for build_plan"""
+
+    def test_plan_covers_mapping_with_cycle_windows(self):
+        import bok_backend
+        from bok_snapshot import build_plan
+
+        plan = build_plan(today=date(2024, 3, 15))
+        by_category = {}
+        for spec in plan:
+            by_category.setdefault(spec.category, []).append(spec)
+
+        assert not set(by_category) & set(bok_backend.INTERNATIONAL_CATEGORIES)
+        assert [s.item_key for s in by_category["exchange"]] == list(bok_backend.BOK_MAPPING["exchange"]["items"])
+        assert [s.item_key for s in by_category["inflation"]] == ["CPI_TOTAL", "CPI_FRESH", "CPI_INDUSTRIAL"]
+        # 항목 코드가 정해지지 않은 항목 제외
+        assert "ppi" not in by_category and "employment" not in by_category
+
+        assert (by_category["exchange"][0].start_date, by_category["exchange"][0].end_date) == ("20231216", "20240315")
+        assert by_category["money"][0].start_date == "20220401"
+        assert by_category["gdp"][0].start_date == "20140401"
+
+
+class TestSnapshotBuild:
+    """Tests for MarketSnapshot"""
+
+    def test_payload_has_latest_change_and_sparkline(self, backend):
+        from bok_snapshot import MarketSnapshot
+
+        with patch.object(backend.requests, 'get', SeriesECOS()):
+            current = MarketSnapshot().get()
+
+        body = json.loads(current["json"])
+        assert body["series"] == 5
+        assert body["errors"] == 0
+        usd = body["categories"]["exchange"]["items"]["USD"]
+        assert usd["time"] == "20240313"
+        assert usd["current"] == 1325.0
+        assert usd["previous"] == 1318.0
+        assert usd["change"] == 7.0
+        assert usd["high"] == 1325.0
+        assert usd["sparkline"] == [1320.5, 1318.0, 1325.0]
+        assert body["categories"]["money"]["cycle"] == "M"
+
+    def test_unchanged_series_keep_etag_and_payloads(self, backend):
+        from bok_snapshot import MarketSnapshot
+
+        snapshot = MarketSnapshot()
+        fake = SeriesECOS()
+        with patch.object(backend.requests, 'get', fake):
+            first = snapshot.get()
+            backend.clear_api_cache()
+            second = snapshot.get(force=True)
+
+            assert second["etag"] == first["etag"]
+            assert second["json"] is first["json"]
+            assert snapshot.get_stats()["recomputed_series"] == 5
+
+            # USD 에 새 관측값 공표 → USD 만 재계산, ETag 변경
+            fake.series["0000001"].append(("20240314", "1330.0"))
+            backend.clear_api_cache()
+            third = snapshot.get(force=True)
+
+        stats = snapshot.get_stats()
+        assert third["etag"] != first["etag"]
+        assert stats["recomputed_series"] == 6
+        assert stats["reused_series"] == 9
+        assert stats["changed_builds"] == 2
+        assert json.loads(third["json"])["categories"]["exchange"]["items"]["USD"]["current"] == 1330.0
+
+    def test_cached_within_ttl(self, backend):
+        from bok_snapshot import MarketSnapshot
+
+        now = [1000.0]
+        snapshot = MarketSnapshot(ttl=300, clock=lambda: now[0])
+        fake = SeriesECOS()
+        with patch.object(backend.requests, 'get', fake):
+            first = snapshot.get()
+            calls = len(fake.calls)
+            now[0] += 299
+            assert snapshot.get() is first
+            assert len(fake.calls) == calls
+            assert snapshot.revalidation is None
+
+        assert snapshot.get_stats()["hits"] == 1
+
+    def test_stale_snapshot_served_while_rebuilding_in_background(self, backend):
+        import threading
+        from bok_snapshot import MarketSnapshot
+
+        now = [1000.0]
+        snapshot = MarketSnapshot(ttl=300, clock=lambda: now[0])
+        fake = SeriesECOS()
+        release = threading.Event()
+
+        def slow_ecos(url, timeout=None):
+            release.wait(5)
+            return fake(url, timeout)
+
+        with patch.object(backend.requests, 'get', fake):
+            first = snapshot.get()
+        backend.clear_api_cache()
+        fake.series["0000001"].append(("20240314", "1330.0"))
+
+        with patch.object(backend.requests, 'get', slow_ecos):
+            now[0] += 301
+            # 재구성이 ECOS 에서 막혀 있어도 이전 스냅샷을 바로 반환, 재구성은 1회만
+            assert snapshot.get() is first
+            revalidation = snapshot.revalidation
+            assert snapshot.get() is first
+            assert snapshot.revalidation is revalidation
+            assert snapshot.get_stats()["revalidating"]
+            release.set()
+            revalidation.join(5)
+
+        refreshed = snapshot.get()
+        stats = snapshot.get_stats()
+        assert refreshed["etag"] != first["etag"]
+        assert refreshed["checked_at"] == 1301.0
+        assert (stats["stale_hits"], stats["builds"], stats["revalidating"]) == (2, 2, False)
+        assert json.loads(refreshed["json"])["categories"]["exchange"]["items"]["USD"]["current"] == 1330.0
+
+    def test_refresh_warms_plan_with_prefetch_ttl(self, backend, monkeypatch):
+        import bok_snapshot
+
+        monkeypatch.setattr(bok_snapshot, '_snapshot', bok_snapshot.MarketSnapshot(max_workers=2))
+        fake = SeriesECOS()
+        served = backend.get_cache_stats()["served"]
+        with patch.object(backend.requests, 'get', fake):
+            bok_snapshot.refresh_snapshot(prefetch_ttl=3600)
+            calls = len(fake.calls)
+            bok_snapshot._snapshot.rebuild()
+
+        # 계획 전체가 긴 TTL 로 캐시됨 → 이후 재구성은 ECOS 호출 없음, 사용자 warm/cold 집계 제외
+        assert calls == 5
+        assert len(fake.calls) == calls
+        ttls = {e.ttl for k, e in backend._api_cache.cache.items() if k.startswith("StatisticSearch")}
+        assert ttls == {3600}
+        assert backend.get_cache_stats()["served"]["cold"] == served["cold"]
+
+    def test_failed_series_reported_per_item(self, backend):
+        from bok_snapshot import MarketSnapshot
+
+        fake = SeriesECOS()
+        fake.series["0000003"] = []
+        with patch.object(backend.requests, 'get', fake):
+            body = json.loads(MarketSnapshot().get()["json"])
+
+        assert body["errors"] == 1
+        assert body["categories"]["exchange"]["items"]["EUR"]["error"]
+        assert body["categories"]["exchange"]["items"]["USD"]["current"] == 1325.0
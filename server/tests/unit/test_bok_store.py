@@ -0,0 +1,176 @@
+"""
+Unit Tests for ECOS Observation Store
+Tests for period helpers, gap calculation and delta fetching in get_bok_statistics
+"""
+import pytest
+from datetime import date
+from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+TODAY = date(2026, 1, 15)
+
+
+def _monthly_rows(start, end, last_published=None):
+    """YYYYMM 구간의 가짜 ECOS row (last_published 이후는 미공표)"""
+    rows = []
+    year, month = int(start[:4]), int(start[4:])
+    while f"{year:04d}{month:02d}" <= end:
+        time_str = f"{year:04d}{month:02d}"
+        if last_published is None or time_str <= last_published:
+            rows.append({"STAT_CODE": "901Y009", "ITEM_CODE1": "0", "TIME": time_str,
+                         "DATA_VALUE": str(100 + year - 2020 + month / 100)})
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return rows
+
+
+class FakeECOS:
+    """URL 을 해석해 월별 row 를 돌려주는 requests.get 대역"""
+
+    def __init__(self, last_published=None):
+        self.last_published = last_published
+        self.requests = []
+
+    def __call__(self, url, timeout=None):
+        parts = url.split('/')
+        start_index, end_index = int(parts[-7]), int(parts[-6])
+        start, end = parts[-3], parts[-2]
+        self.requests.append((start, end))
+        rows = _monthly_rows(start, end, self.last_published)
+        response = MagicMock()
+        if not rows:
+            response.json.return_value = {"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}}
+        else:
+            response.json.return_value = {"StatisticSearch": {"list_total_count": len(rows),
+                                                              "row": rows[start_index - 1:end_index]}}
+        return response
+
+
+@pytest.fixture
+def store_backend(tmp_path, monkeypatch):
+    import bok_backend
+    import bok_store
+
+    store = bok_store.ObservationStore(tmp_path / 'ecos.db', today=lambda: TODAY)
+    monkeypatch.setattr(bok_backend, '_observation_store', store)
+    monkeypatch.setattr(bok_backend, '_rate_limiter', bok_backend.RateLimiter(min_interval=0))
+    bok_backend.clear_api_cache()
+    yield bok_backend, store
+    bok_backend.clear_api_cache()
+
+
+def _fetch(backend, start_date, end_date):
+    backend.clear_api_cache()
+    return backend.get_bok_statistics("901Y009", "0", "M", start_date, end_date)
+
+
+class TestPeriodHelpers:
+    """Tests for period conversion and range subtraction"""
+
+    @pytest.mark.parametrize("cycle,time_str", [
+        ("D", "20240229"), ("M", "202412"), ("Q", "2024Q3"), ("A", "2024"), ("Y", "2024"),
+    ])
+    def test_period_round_trip(self, cycle, time_str):
+        from bok_store import period_of_time, format_period
+
+        assert format_period(period_of_time(time_str, cycle), cycle) == time_str
+
+    def test_period_of_date_matches_cycle_format(self):
+        from bok_store import period_of_date, period_of_time
+
+        d = date(2024, 8, 20)
+        assert period_of_date(d, "M") == period_of_time("202408", "M")
+        assert period_of_date(d, "Q") == period_of_time("2024Q3", "Q")
+
+    def test_subtract_ranges(self):
+        from bok_store import subtract_ranges
+
+        assert subtract_ranges(1, 10, []) == [(1, 10)]
+        assert subtract_ranges(1, 10, [(1, 10)]) == []
+        assert subtract_ranges(1, 10, [(3, 4), (7, 8)]) == [(1, 2), (5, 6), (9, 10)]
+        assert subtract_ranges(5, 10, [(0, 6), (12, 20)]) == [(7, 10)]
+
+
+class TestDeltaFetch:
+    """Tests for get_bok_statistics backed by the observation store"""
+
+    def test_repeat_request_served_from_disk(self, store_backend):
+        backend, store = store_backend
+        fake = FakeECOS()
+        with patch.object(backend.requests, 'get', fake):
+            first = _fetch(backend, "20230101", "20231231")
+            second = _fetch(backend, "20230101", "20231231")
+
+        assert fake.requests == [("202301", "202312")]
+        assert first == second
+        assert first["StatisticSearch"]["list_total_count"] == 12
+
+    def test_shifted_range_fetches_only_tail(self, store_backend):
+        backend, store = store_backend
+        fake = FakeECOS()
+        with patch.object(backend.requests, 'get', fake):
+            _fetch(backend, "20230101", "20231231")
+            shifted = _fetch(backend, "20230301", "20240331")
+
+        assert fake.requests == [("202301", "202312"), ("202401", "202403")]
+        assert shifted["StatisticSearch"]["row"] == _monthly_rows("202303", "202403")
+
+    def test_gap_between_stored_ranges(self, store_backend):
+        backend, store = store_backend
+        fake = FakeECOS()
+        with patch.object(backend.requests, 'get', fake):
+            _fetch(backend, "20220101", "20220630")
+            _fetch(backend, "20221001", "20221231")
+            merged = _fetch(backend, "20220101", "20221231")
+
+        assert fake.requests[-1] == ("202207", "202209")
+        assert merged["StatisticSearch"]["row"] == _monthly_rows("202201", "202212")
+
+    def test_unpublished_tail_is_refetched(self, store_backend):
+        backend, store = store_backend
+        fake = FakeECOS(last_published="202508")
+        with patch.object(backend.requests, 'get', fake):
+            _fetch(backend, "20250101", "20251231")
+            fake.last_published = "202509"
+            updated = _fetch(backend, "20250101", "20251231")
+
+        # 202508 이후는 미공표 + 최근 구간이므로 확정하지 않고 다시 조회
+        assert fake.requests[1] == ("202509", "202512")
+        assert updated["StatisticSearch"]["row"][-1]["TIME"] == "202509"
+
+    def test_store_survives_restart(self, store_backend, tmp_path, monkeypatch):
+        backend, store = store_backend
+        import bok_store
+
+        fake = FakeECOS()
+        with patch.object(backend.requests, 'get', fake):
+            expected = _fetch(backend, "20210101", "20211231")
+            monkeypatch.setattr(backend, '_observation_store',
+                                bok_store.ObservationStore(tmp_path / 'ecos.db', today=lambda: TODAY))
+            restarted = _fetch(backend, "20210101", "20211231")
+
+        assert len(fake.requests) == 1
+        assert restarted == expected
+
+    def test_no_data_error_preserved(self, store_backend):
+        backend, store = store_backend
+        fake = FakeECOS(last_published="200001")
+        with patch.object(backend.requests, 'get', fake):
+            result = _fetch(backend, "20240101", "20241231")
+
+        assert result["result_code"] == "INFO-200"
+
+    def test_explicit_end_index_bypasses_store(self, store_backend):
+        backend, store = store_backend
+        fake = FakeECOS()
+        with patch.object(backend.requests, 'get', fake):
+            backend.get_bok_statistics("901Y009", "0", "M", "20230101", "20231231", end_index=5)
+            backend.get_bok_statistics("901Y009", "0", "M", "20230101", "20231231", end_index=5, use_cache=False)
+
+        assert len(fake.requests) == 2
+        assert store.stats()["observations"] == 0
@@ -0,0 +1,327 @@
+"""
+Unit Tests for GDELT Column Cache
+Tests that the projected parser, columnar reads and vectorized alert filters match the row parser
+on recorded exports, and that downloads convert once
+"""
+import pytest
+import csv
+import io
+import shutil
+import zipfile
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "gdelt"
+DAY1 = "20250101000000.export.CSV"
+DAY2 = "20250102001500.export.CSV.zip"
+DAY3 = "20250103000000.export.CSV"  # 따옴표 필드, CRLF 줄바꿈
+
+
+def _legacy_parse(file_path, goldstein_threshold, max_events):
+    """기존 _parse_csv_content 의 행 단위 파싱 (기준 구현)"""
+    import gdelt_backend as g
+
+    if file_path.suffix.lower() == '.zip':
+        with zipfile.ZipFile(file_path) as zf:
+            text = zf.read(zf.namelist()[0]).decode('utf-8', errors='ignore')
+    else:
+        text = file_path.read_text(encoding='utf-8', errors='ignore')
+
+    events = []
+    for row in csv.reader(io.StringIO(text), delimiter='\t'):
+        if len(row) < 61:
+            continue
+        goldstein = g.safe_float(row[g.COL_GOLDSTEIN_SCALE])
+        if goldstein is None or goldstein > goldstein_threshold:
+            continue
+        lat, lng = g.safe_float(row[g.COL_ACTION_GEO_LAT]), g.safe_float(row[g.COL_ACTION_GEO_LONG])
+        if lat is None or lng is None:
+            continue
+        event_code = g.safe_str(row[g.COL_EVENT_CODE])
+        quad_class = g.safe_int(row[g.COL_QUAD_CLASS])
+        actor1, actor2 = g.safe_str(row[g.COL_ACTOR1NAME]), g.safe_str(row[g.COL_ACTOR2NAME])
+        source_url = g.safe_str(row[g.COL_SOURCEURL])
+        events.append({
+            'name': ' - '.join(p for p in (actor1, actor2) if p) or 'Event',
+            'event_date': g.safe_str(row[g.COL_SQLDATE]),
+            'event_code': event_code,
+            'category': g.get_event_category(event_code, quad_class),
+            'quad_class': quad_class,
+            'actor1': actor1,
+            'actor1_country': g.safe_str(row[g.COL_ACTOR1COUNTRYCODE]),
+            'actor2': actor2,
+            'actor2_country': g.safe_str(row[g.COL_ACTOR2COUNTRYCODE]),
+            'lat': lat, 'lng': lng, 'latitude': lat, 'longitude': lng,
+            'location': g.safe_str(row[g.COL_ACTION_GEO_FULLNAME]),
+            'country_code': g.safe_str(row[g.COL_ACTION_GEO_COUNTRYCODE]),
+            'scale': goldstein, 'goldstein_scale': goldstein,
+            'avg_tone': g.safe_float(row[g.COL_AVG_TONE]),
+            'num_articles': g.safe_int(row[g.COL_NUM_ARTICLES], 0),
+            'num_mentions': g.safe_int(row[g.COL_NUM_MENTIONS], 0),
+            'num_sources': g.safe_int(row[g.COL_NUM_SOURCES], 0),
+            'url': source_url, 'source_url': source_url,
+        })
+        if len(events) >= max_events:
+            break
+    return events
+
+
+def _legacy_group_stats(events, key, members):
+    """기존 get_stats_by_country / get_stats_by_category 의 dict 누적 루프"""
+    stats = {}
+    for event in events:
+        group = event.get(key) or 'UNKNOWN'
+        entry = stats.setdefault(group, {'count': 0, 'avg_goldstein': 0.0, 'avg_tone': 0.0,
+                                         'total_articles': 0, members: {}})
+        entry['count'] += 1
+        entry['avg_goldstein'] += event.get('goldstein_scale', 0)
+        entry['avg_tone'] += event.get('avg_tone', 0) or 0
+        entry['total_articles'] += event.get('num_articles', 0)
+        member = event['category'] if members == 'categories' else event['country_code']
+        if member:
+            entry[members][member] = entry[members].get(member, 0) + 1
+    for entry in stats.values():
+        entry['avg_goldstein'] = round(entry['avg_goldstein'] / entry['count'], 2)
+        entry['avg_tone'] = round(entry['avg_tone'] / entry['count'], 2)
+    return dict(sorted(stats.items(), key=lambda x: x[1]['count'], reverse=True))
+
+
+@pytest.fixture
+def gdelt_base(tmp_path):
+    """fixtures 를 data/gdelt 구조 (default/events/YYYYMMDD/) 로 복사"""
+    for name in (DAY1, DAY2, DAY3):
+        date_dir = tmp_path / "default" / "events" / name[:8]
+        date_dir.mkdir(parents=True)
+        shutil.copy(FIXTURES / name, date_dir / name)
+    return tmp_path
+
+
+def _export(base, name):
+    return base / "default" / "events" / name[:8] / name
+
+
+class TestColumnarParity:
+    """Tests that columnar reads match the row parser"""
+
+    @pytest.mark.parametrize("name", [DAY1, DAY2, DAY3])
+    @pytest.mark.parametrize("threshold,max_events", [(-5.0, 1000), (-5.0, 7), (0.0, 1000), (10.0, 1000), (-9.5, 3)])
+    def test_events_identical(self, gdelt_base, name, threshold, max_events):
+        import gdelt_backend
+
+        path = _export(gdelt_base, name)
+        expected = _legacy_parse(path, threshold, max_events)
+        # 첫 호출은 변환, 두 번째 호출은 저장된 컬럼 캐시에서 읽음
+        first = gdelt_backend.parse_gdelt_events(path, threshold, max_events)
+        second = gdelt_backend.parse_gdelt_events(path, threshold, max_events)
+
+        assert expected
+        assert first == expected
+        assert second == expected
+        assert [list(e) for e in second] == [list(e) for e in expected]
+
+    def test_edge_rows(self, gdelt_base):
+        import gdelt_backend
+
+        events = gdelt_backend.parse_gdelt_events(_export(gdelt_base, DAY1), 10.0, 1000)
+        by_id = {e['url'].rsplit('-', 1)[-1]: e for e in events}
+
+        assert '3.html' not in by_id and '5.html' not in by_id
+        assert by_id['7.html']['quad_class'] is None
+        assert by_id['7.html']['category'] == "Material Conflict"
+        assert by_id['8.html']['category'] == "Unknown"
+        assert by_id['9.html']['avg_tone'] is None
+        assert by_id['11.html']['num_articles'] == 0
+        assert by_id['12.html']['actor1'] == "SEOUL"
+        assert by_id['14.html']['name'] == "Event"
+        assert by_id['15.html']['location'].startswith("Zürich")
+        assert by_id['99.html']['goldstein_scale'] == -7.5
+
+    @pytest.mark.parametrize("name", [DAY1, DAY3])
+    @pytest.mark.parametrize("chunk_chars", [1, 700, 5000])
+    def test_chunk_boundaries(self, gdelt_base, monkeypatch, name, chunk_chars):
+        import gdelt_backend
+
+        # 묶음이 작으면 짧은 행/따옴표 행이 중간 묶음에서 처음 나옴
+        monkeypatch.setattr(gdelt_backend, 'PARSE_CHUNK_CHARS', chunk_chars)
+        path = _export(gdelt_base, name)
+        with gdelt_backend._open_export(path) as content:
+            columns, source_rows = gdelt_backend._build_event_columns(content)
+
+        assert source_rows == len(path.read_text(encoding='utf-8').splitlines())
+        assert columns.to_events(columns.select(10.0, 1000)) == _legacy_parse(path, 10.0, 1000)
+
+    def test_quoted_fields_follow_csv_rules(self, gdelt_base):
+        import gdelt_backend
+
+        events = gdelt_backend.parse_gdelt_events(_export(gdelt_base, DAY3), 10.0, 1000)
+        by_id = {e['url'].rsplit('-', 1)[-1]: e for e in events}
+
+        assert by_id['2.html']['actor1'] == "HAMAS"
+        assert by_id['4.html']['location'] == "Aden, Adan, Yemen"
+        assert by_id['6.html']['actor2'] == 'AL "SHABAAB"'
+        assert all(not e['url'].endswith('\r') for e in events)
+
+    def test_stats_match_row_loops(self, gdelt_base):
+        import gdelt_backend
+
+        events = _legacy_parse(_export(gdelt_base, DAY3), -5.0, 10000)
+        by_country = gdelt_backend.get_stats_by_country(base_path=gdelt_base)
+        by_category = gdelt_backend.get_stats_by_category(base_path=gdelt_base)
+
+        assert by_country['total_events'] == by_category['total_events'] == len(events)
+        assert by_country['stats'] == _legacy_group_stats(events, 'country_code', 'categories')
+        assert list(by_country['stats']) == list(_legacy_group_stats(events, 'country_code', 'categories'))
+
+        expected = _legacy_group_stats(events, 'category', 'countries')
+        assert list(by_category['stats']) == list(expected)
+        for category, stats in by_category['stats'].items():
+            countries = expected[category].pop('countries')
+            assert stats.pop('countries') == list(countries)
+            assert stats.pop('num_countries') == len(countries)
+            assert stats == expected[category]
+
+    def test_trends_match_row_loop(self, gdelt_base):
+        import gdelt_backend
+
+        trends = gdelt_backend.get_trends('2024-12-31', '2025-01-02', base_path=gdelt_base)['trends']
+
+        assert list(trends) == ['20250101', '20250102']
+        for name in (DAY1, DAY2):
+            events = _legacy_parse(_export(gdelt_base, name), -5.0, 10000)
+            day = trends[name[:8]]
+            assert day['count'] == len(events)
+            assert day['avg_goldstein'] == round(sum(e['goldstein_scale'] for e in events) / len(events), 2)
+            assert day['avg_tone'] == round(sum(e['avg_tone'] or 0 for e in events) / len(events), 2)
+            assert day['total_articles'] == sum(e['num_articles'] for e in events)
+            categories = {}
+            for e in events:
+                categories[e['category']] = categories.get(e['category'], 0) + 1
+            assert list(day['categories'].items()) == list(categories.items())
+
+
+FILTERS = [
+    {},
+    {'country': 'ks'},
+    {'country': 'USA'},
+    {'category': 'Material Conflict'},
+    {'min_articles': 10},
+    {'event_roots': ['19', '14']},
+    {'event_roots': ['8'], 'min_articles': 0},
+    {'country': 'UKR', 'category': 'Material Conflict', 'event_roots': ['18', '19']},
+]
+
+
+def _legacy_alerts(paths, threshold, max_alerts, sort_by, **filters):
+    """기존 get_critical_alerts / get_alerts_by_date_range 의 parse → filter_events → sort_events"""
+    import gdelt_backend
+
+    parse_limit = max_alerts * 2 if any(filters.values()) else max_alerts
+    events = [e for path in paths for e in _legacy_parse(path, threshold, parse_limit)]
+    events = gdelt_backend.filter_events(events, **filters)
+    return gdelt_backend.sort_events(events, sort_by=sort_by)[:max_alerts]
+
+
+class TestAlertFilters:
+    """Tests that vectorized filter/sort masks match filter_events + sort_events"""
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    @pytest.mark.parametrize("sort_by", ['date', 'importance', 'tone', 'scale', 'unknown'])
+    @pytest.mark.parametrize("max_alerts", [5, 1000])
+    def test_latest_alerts_identical(self, gdelt_base, filters, sort_by, max_alerts):
+        import gdelt_backend
+
+        result = gdelt_backend.get_critical_alerts(goldstein_threshold=0.0, max_alerts=max_alerts,
+                                                   base_path=gdelt_base, sort_by=sort_by, **filters)
+
+        expected = _legacy_alerts([_export(gdelt_base, DAY3)], 0.0, max_alerts, sort_by, **filters)
+        assert result['alerts'] == expected
+        assert result['count'] == len(expected)
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    @pytest.mark.parametrize("sort_by", ['date', 'importance', 'tone'])
+    def test_date_range_alerts_identical(self, gdelt_base, filters, sort_by):
+        import gdelt_backend
+
+        result = gdelt_backend.get_alerts_by_date_range('2025-01-01', '2025-01-03', max_alerts=20,
+                                                        base_path=gdelt_base, sort_by=sort_by, **filters)
+
+        paths = [_export(gdelt_base, name) for name in (DAY1, DAY2, DAY3)]
+        assert result['alerts'] == _legacy_alerts(paths, -5.0, 20, sort_by, **filters)
+        assert result['filters']['event_roots'] == filters.get('event_roots')
+
+    def test_dicts_built_only_for_returned_rows(self, gdelt_base):
+        import gdelt_backend
+        import gdelt_columnar
+
+        built = []
+        to_events = gdelt_columnar.EventColumns.to_events
+
+        def counting_to_events(columns, rows):
+            built.append(len(rows))
+            return to_events(columns, rows)
+
+        with patch.object(gdelt_columnar.EventColumns, 'to_events', counting_to_events):
+            result = gdelt_backend.get_alerts_by_date_range('2025-01-01', '2025-01-03', max_alerts=4,
+                                                            base_path=gdelt_base, sort_by='importance',
+                                                            event_roots=['19'])
+
+        assert result['count'] == 4
+        assert sum(built) == 4
+        assert all(e['event_code'].startswith('19') for e in result['alerts'])
+
+
+class TestColumnCache:
+    """Tests for conversion and memory-mapped loads"""
+
+    def test_cache_is_memory_mapped(self, gdelt_base):
+        import numpy as np
+        import gdelt_backend
+        import gdelt_columnar
+
+        path = _export(gdelt_base, DAY1)
+        gdelt_backend.convert_gdelt_file(path)
+        cache_dir = gdelt_columnar.columnar_path(path)
+        columns = gdelt_columnar.load(cache_dir)
+
+        assert cache_dir.name == DAY1 + ".cols"
+        assert isinstance(columns.column('goldstein'), np.memmap)
+        # 컬럼 수 부족(1), GoldsteinScale 없음(1), 위도 없음(1) 행은 저장하지 않음
+        assert len(columns) == 47
+        # 캐시 디렉토리는 export 검색 대상이 아님
+        assert gdelt_backend.find_gdelt_file_by_date('20250101', gdelt_base) == path
+
+    def test_unreadable_cache_is_rebuilt(self, gdelt_base):
+        import gdelt_backend
+        import gdelt_columnar
+
+        path = _export(gdelt_base, DAY1)
+        expected = gdelt_backend.parse_gdelt_events(path, -5.0, 1000)
+        cache_dir = gdelt_columnar.columnar_path(path)
+        data_file = cache_dir / gdelt_columnar.DATA_FILE
+        data_file.write_bytes(data_file.read_bytes()[:100])
+
+        assert gdelt_backend.parse_gdelt_events(path, -5.0, 1000) == expected
+        assert gdelt_columnar.load(cache_dir) is not None
+
+    def test_download_converts_once(self, tmp_path):
+        import gdelt_backend
+        import gdelt_columnar
+
+        response = MagicMock()
+        response.raw = io.BytesIO((FIXTURES / DAY2).read_bytes())
+        url = f"{gdelt_backend.GDELT_BASE_URL}/{DAY2}"
+        with patch.object(gdelt_backend.requests, 'get', return_value=response) as get:
+            saved = gdelt_backend.download_gdelt_file(url, base_path=tmp_path)
+            assert gdelt_backend.download_gdelt_file(url, base_path=tmp_path) == saved
+
+        assert get.call_count == 1
+        assert saved == _export(tmp_path, DAY2)
+        assert gdelt_columnar.load(gdelt_columnar.columnar_path(saved)) is not None
+        # 컬럼 캐시만 있어도 조회 결과는 같음 (export 를 다시 읽지 않음)
+        with patch.object(gdelt_backend, '_open_export', side_effect=AssertionError("re-parsed")):
+            events = gdelt_backend.parse_gdelt_events(saved, -5.0, 1000)
+        assert events == _legacy_parse(saved, -5.0, 1000)
@@ -0,0 +1,162 @@
+"""
+Unit Tests for Parallel Market Index Fetching
+Tests for TokenBucketLimiter and get_market_index_multi
+"""
+import pytest
+import copy
+import threading
+import time
+from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class SlowECOS:
+    """항목 코드별 row 를 지연 후 돌려주는 requests.get 대역 (failing 항목은 HTTP 500)"""
+
+    def __init__(self, delay=0.05, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url, timeout=None):
+        import requests
+
+        item_code = url.rstrip('/').split('/')[-1]
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        response = MagicMock()
+        if item_code in self.failing:
+            error = requests.exceptions.HTTPError("500 Server Error")
+            error.response = MagicMock(status_code=500)
+            response.raise_for_status.side_effect = error
+        rows = [{"TIME": f"202401{d:02d}", "ITEM_CODE1": item_code, "DATA_VALUE": f"{1300 + d}.5"}
+                for d in range(2, 6)]
+        response.json.return_value = {"StatisticSearch": {"list_total_count": len(rows), "row": rows}}
+        return response
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    import bok_backend
+
+    monkeypatch.setattr(bok_backend, '_observation_store', None)
+    monkeypatch.setattr(bok_backend, '_rate_limiter', bok_backend.TokenBucketLimiter(rate=1000, capacity=100))
+    bok_backend.clear_api_cache()
+    yield bok_backend
+    bok_backend.clear_api_cache()
+
+
+class TestTokenBucketLimiter:
+    """Tests for TokenBucketLimiter"""
+
+    def test_burst_then_steady_rate(self):
+        from bok_backend import TokenBucketLimiter
+
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            limiter.wait_if_needed()
+        assert clock.sleeps == []
+
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+        assert clock.sleeps == [0.5, 0.5]
+        assert limiter.get_stats()["throttled"] == 2
+
+    def test_refills_up_to_capacity(self):
+        from bok_backend import TokenBucketLimiter
+
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+        limiter.wait_if_needed()
+        clock.now += 100
+        assert limiter.get_stats()["tokens"] == 2
+
+    def test_concurrent_callers_never_exceed_quota(self):
+        from bok_backend import TokenBucketLimiter
+
+        limiter = TokenBucketLimiter(rate=50, capacity=5)
+        stamps = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.wait_if_needed()
+            with lock:
+                stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(15)]
+        started = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 버스트 5건 이후 10건은 50/s → 최소 0.2초
+        assert max(stamps) - started >= 0.18
+
+
+class TestMarketIndexMulti:
+    """Tests for get_market_index_multi"""
+
+    def test_parallel_matches_serial(self, backend):
+        items = ["USD", "EUR", "JPY", "CNY", "GBP", "CHF"]
+        fake = SlowECOS()
+        with patch.object(backend.requests, 'get', fake):
+            serial = backend.get_market_index_multi("exchange", "20240101", "20240131", item_codes=items,
+                                                    max_workers=1)
+            backend.clear_api_cache()
+            parallel = backend.get_market_index_multi("exchange", "20240101", "20240131", item_codes=items,
+                                                      max_workers=6)
+
+        assert parallel == serial
+        assert list(parallel) == items
+        assert fake.max_active > 1
+
+    def test_partial_failure_reported_per_item(self, backend):
+        fake = SlowECOS(delay=0, failing={"0000003"})
+        with patch.object(backend.requests, 'get', fake):
+            result = backend.get_market_index_multi("exchange", "20240101", "20240131",
+                                                    item_codes=["USD", "EUR", "JPY"])
+
+        assert "error" in result["EUR"]["data"]
+        assert result["EUR"]["name"] == backend.BOK_MAPPING["exchange"]["items"]["EUR"]["name"]
+        assert result["USD"]["data"]["StatisticSearch"]["list_total_count"] == 4
+        assert result["JPY"]["data"]["StatisticSearch"]["list_total_count"] == 4
+
+    def test_does_not_mutate_mapping(self, backend):
+        before = copy.deepcopy(backend.BOK_MAPPING)
+        item_list = {"row": [
+            {"ITEM_CODE": "KR", "ITEM_NAME": "한국", "CYCLE": "M"},
+            {"ITEM_CODE": "US", "ITEM_NAME": "미국", "CYCLE": "M"},
+            {"ITEM_CODE": "JP", "ITEM_NAME": "일본", "CYCLE": "Q"},
+        ]}
+        with patch.object(backend, 'get_statistic_item_list', return_value=item_list), \
+                patch.object(backend.requests, 'get', SlowECOS(delay=0)):
+            result = backend.get_market_index_multi("cpi-international", "20240101", "20240131", cycle="M")
+
+        assert list(result) == ["KR", "US"]
+        assert backend.BOK_MAPPING == before
@@ -0,0 +1,135 @@
+"""
+Unit Tests for BOK Request Coalescing
+Tests for SingleFlight and coalesced get_bok_statistics / get_market_index calls
+"""
+import pytest
+import threading
+from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class GatedECOS:
+    """release 될 때까지 응답을 붙잡고 있는 느린 ECOS 대역 (호출 수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, url, timeout=None):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(5)
+        rows = [{"TIME": "20240102", "DATA_VALUE": "1300.5"}, {"TIME": "20240103", "DATA_VALUE": "1301.5"}]
+        response = MagicMock()
+        response.json.return_value = {"StatisticSearch": {"list_total_count": len(rows), "row": rows}}
+        return response
+
+
+def run_concurrently(fn, waiters, upstream, flight):
+    """leader 가 upstream 에 들어간 뒤 waiters 개 호출을 추가로 띄우고, 모두 대기 중일 때 응답을 풀어줌"""
+    results = []
+    before = flight.get_stats()["coalesced"]
+    leader = threading.Thread(target=lambda: results.append(fn()))
+    leader.start()
+    assert upstream.entered.wait(5)
+    threads = [threading.Thread(target=lambda: results.append(fn())) for _ in range(waiters)]
+    for t in threads:
+        t.start()
+    while flight.get_stats()["coalesced"] - before < waiters:
+        threading.Event().wait(0.01)
+    upstream.release.set()
+    for t in [leader] + threads:
+        t.join(5)
+    return results
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    import bok_backend
+
+    monkeypatch.setattr(bok_backend, '_observation_store', None)
+    monkeypatch.setattr(bok_backend, '_rate_limiter', bok_backend.TokenBucketLimiter(rate=1000, capacity=100))
+    monkeypatch.setattr(bok_backend, '_singleflight', bok_backend.SingleFlight())
+    bok_backend.clear_api_cache()
+    yield bok_backend
+    bok_backend.clear_api_cache()
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight"""
+
+    def test_sequential_calls_run_separately(self):
+        from bok_backend import SingleFlight
+
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.get_stats()["leaders"] == 2
+        assert flight.get_stats()["in_flight"] == 0
+
+    def test_error_shared_with_waiters(self):
+        from bok_backend import SingleFlight
+
+        flight = SingleFlight()
+        entered, release = threading.Event(), threading.Event()
+        errors = []
+
+        def failing():
+            entered.set()
+            release.wait(5)
+            raise RuntimeError("ecos down")
+
+        def call():
+            try:
+                flight.do("StatisticSearch:x", failing)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        entered.wait(5)
+        waiters = [threading.Thread(target=call) for _ in range(3)]
+        for t in waiters:
+            t.start()
+        while flight.get_stats()["coalesced"] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in [leader] + waiters:
+            t.join(5)
+
+        assert errors == ["ecos down"] * 4
+        stats = flight.get_stats()
+        assert (stats["errors"], stats["coalesced_by_namespace"]) == (1, {"StatisticSearch": 3})
+        assert flight.do("StatisticSearch:x", lambda: "ok") == "ok"
+
+
+class TestCoalescedFetch:
+    """Concurrent identical calls hit ECOS exactly once"""
+
+    def test_get_bok_statistics(self, backend):
+        upstream = GatedECOS()
+        with patch.object(backend.requests, 'get', upstream):
+            results = run_concurrently(
+                lambda: backend.get_bok_statistics("731Y001", "0000001", "D", "20240101", "20240131"),
+                waiters=8, upstream=upstream, flight=backend._singleflight)
+
+        assert upstream.calls == 1
+        assert len(results) == 9
+        assert all(r == results[0] for r in results)
+        assert results[0]["StatisticSearch"]["list_total_count"] == 2
+
+    def test_get_market_index(self, backend):
+        upstream = GatedECOS()
+        with patch.object(backend.requests, 'get', upstream):
+            results = run_concurrently(
+                lambda: backend.get_market_index("exchange", "20240101", "20240131", item_code="USD"),
+                waiters=5, upstream=upstream, flight=backend._singleflight)
+
+        assert upstream.calls == 1
+        assert len(results) == 6
+        assert backend.get_cache_stats()["singleflight"]["coalesced_by_namespace"] == {"MarketIndex": 5}